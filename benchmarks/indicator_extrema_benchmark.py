@@ -0,0 +1,253 @@
+"""
+Benchmark for vectorized extrema detection and level clustering.
+
+Compares the per-bar loops previously used by the support/resistance
+calculators and the breakout, pullback and pattern detectors against the
+shared numpy implementation in ``long_analyst.indicators.extrema``:
+- Verifies both produce identical output on the same data
+- Reports per-call latency and speedup
+"""
+
+import time
+import statistics
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+import sys
+sys.path.append('src')
+from long_analyst.indicators.extrema import find_extrema, cluster_levels
+
+
+@dataclass
+class ExtremaBenchmarkResult:
+    """Benchmark result data class."""
+    test_name: str
+    loop_ms: float
+    vectorized_ms: float
+    speedup: float
+    outputs_match: bool
+
+
+# Reference implementations: the original per-bar loops
+
+def loop_local_maxima(prices: pd.Series, window: int) -> List[float]:
+    maxima = []
+    for i in range(window, len(prices) - window):
+        window_data = prices.iloc[i-window:i+window+1]
+        if prices.iloc[i] == window_data.max():
+            maxima.append(prices.iloc[i])
+    return maxima
+
+
+def loop_local_minima(prices: pd.Series, window: int) -> List[float]:
+    minima = []
+    for i in range(window, len(prices) - window):
+        window_data = prices.iloc[i-window:i+window+1]
+        if prices.iloc[i] == window_data.min():
+            minima.append(prices.iloc[i])
+    return minima
+
+
+def loop_cluster_anchored(levels: List[float], threshold: float) -> Dict[float, int]:
+    if not levels:
+        return {}
+    sorted_levels = sorted(levels)
+    clusters = {}
+    current_cluster = [sorted_levels[0]]
+    cluster_center = sorted_levels[0]
+    for level in sorted_levels[1:]:
+        if abs(level - cluster_center) / cluster_center <= threshold:
+            current_cluster.append(level)
+        else:
+            clusters[sum(current_cluster) / len(current_cluster)] = len(current_cluster)
+            current_cluster = [level]
+            cluster_center = level
+    clusters[sum(current_cluster) / len(current_cluster)] = len(current_cluster)
+    return clusters
+
+
+def loop_cluster_chained(levels: List[float], threshold: float) -> List[float]:
+    if not levels:
+        return []
+    levels = sorted(levels)
+    clusters = []
+    current_cluster = [levels[0]]
+    for level in levels[1:]:
+        if abs(level - current_cluster[-1]) / current_cluster[-1] <= threshold:
+            current_cluster.append(level)
+        else:
+            clusters.append(np.mean(current_cluster))
+            current_cluster = [level]
+    clusters.append(np.mean(current_cluster))
+    return clusters
+
+
+def loop_rolling_candidates(highs: pd.Series, lows: pd.Series) -> Tuple[List[float], List[float]]:
+    resistance = []
+    for i in range(1, len(highs) - 1):
+        if highs.iloc[i] >= highs.iloc[i-1] and highs.iloc[i] >= highs.iloc[i+1]:
+            resistance.append(highs.iloc[i])
+    support = []
+    for i in range(1, len(lows) - 1):
+        if lows.iloc[i] <= lows.iloc[i-1] and lows.iloc[i] <= lows.iloc[i+1]:
+            support.append(lows.iloc[i])
+    return resistance, support
+
+
+def loop_breakout_highs(recent_highs: pd.Series) -> List[int]:
+    return [i for i in range(2, len(recent_highs) - 2)
+            if (recent_highs.iloc[i] > recent_highs.iloc[i-1] and
+                recent_highs.iloc[i] > recent_highs.iloc[i+1] and
+                recent_highs.iloc[i] > recent_highs.iloc[i-2] and
+                recent_highs.iloc[i] > recent_highs.iloc[i+2])]
+
+
+def loop_swing_lows(lows: pd.Series) -> List[int]:
+    return [i for i in range(5, len(lows) - 5)
+            if (lows.iloc[i] < lows.iloc[i-1] and lows.iloc[i] < lows.iloc[i+1] and
+                lows.iloc[i] < lows.iloc[i-2] and lows.iloc[i] < lows.iloc[i+2] and
+                lows.iloc[i] < lows.iloc[i-3] and lows.iloc[i] < lows.iloc[i+3])]
+
+
+def loop_double_bottom_lows(lows: pd.Series) -> List[int]:
+    # The detector compares against i+1 twice; the vectorized call keeps that
+    return [i for i in range(5, len(lows) - 5)
+            if (lows.iloc[i] < lows.iloc[i-1] and lows.iloc[i] < lows.iloc[i+1] and
+                lows.iloc[i] < lows.iloc[i-2] and lows.iloc[i] < lows.iloc[i+1])]
+
+
+def _same(left, right) -> bool:
+    if isinstance(left, dict):
+        return list(left.items()) == list(right.items())
+    return [float(x) for x in left] == [float(x) for x in right]
+
+
+class ExtremaBenchmark:
+    """Benchmark suite for extrema detection."""
+
+    def __init__(self, bars: int = 5000, repeats: int = 5):
+        """Initialize benchmark."""
+        self.bars = bars
+        self.repeats = repeats
+        self.results: List[ExtremaBenchmarkResult] = []
+
+        np.random.seed(42)
+        close = 50000 + np.cumsum(np.random.normal(0, 100, bars))
+        # Rounded prices produce ties, which exercise the >= / == paths
+        self.high = pd.Series(np.round(close + np.random.uniform(0, 100, bars), -1))
+        self.low = pd.Series(np.round(close - np.random.uniform(0, 100, bars), -1))
+
+    def _time(self, func: Callable) -> Tuple[float, object]:
+        timings = []
+        output = None
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            output = func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings), output
+
+    def run_case(self, test_name: str, loop_func: Callable, vectorized_func: Callable) -> ExtremaBenchmarkResult:
+        """Time both implementations and compare their output."""
+        loop_ms, expected = self._time(loop_func)
+        vectorized_ms, actual = self._time(vectorized_func)
+
+        if isinstance(expected, tuple):
+            outputs_match = all(_same(e, a) for e, a in zip(expected, actual))
+        else:
+            outputs_match = _same(expected, actual)
+
+        result = ExtremaBenchmarkResult(
+            test_name=test_name,
+            loop_ms=loop_ms,
+            vectorized_ms=vectorized_ms,
+            speedup=loop_ms / vectorized_ms if vectorized_ms > 0 else float('inf'),
+            outputs_match=outputs_match
+        )
+        self.results.append(result)
+        return result
+
+    def run_all(self) -> List[ExtremaBenchmarkResult]:
+        """Run every benchmark case."""
+        high, low = self.high, self.low
+        high_values, low_values = high.to_numpy(), low.to_numpy()
+
+        self.run_case(
+            "local_maxima (window=5)",
+            lambda: loop_local_maxima(high, 5),
+            lambda: list(high_values[find_extrema(high_values, 5, kind="max", skipna=True)])
+        )
+        self.run_case(
+            "local_minima (window=5)",
+            lambda: loop_local_minima(low, 5),
+            lambda: list(low_values[find_extrema(low_values, 5, kind="min", skipna=True)])
+        )
+
+        rolling_highs = high.rolling(window=20).max()
+        rolling_lows = low.rolling(window=20).min()
+        rolling_high_values, rolling_low_values = rolling_highs.to_numpy(), rolling_lows.to_numpy()
+        self.run_case(
+            "rolling support/resistance candidates",
+            lambda: loop_rolling_candidates(rolling_highs, rolling_lows),
+            lambda: (list(rolling_high_values[find_extrema(rolling_high_values, 1, kind="max")]),
+                     list(rolling_low_values[find_extrema(rolling_low_values, 1, kind="min")]))
+        )
+
+        levels = loop_local_maxima(high, 5) + loop_local_minima(low, 5)
+        self.run_case(
+            "cluster_levels (anchored)",
+            lambda: loop_cluster_anchored(levels, 0.002),
+            lambda: {sum(list(c)) / len(c): len(c) for c in cluster_levels(levels, 0.002)}
+        )
+        self.run_case(
+            "cluster_levels (chained)",
+            lambda: loop_cluster_chained(levels, 0.002),
+            lambda: [np.mean(c) for c in cluster_levels(levels, 0.002, chained=True)]
+        )
+
+        recent_highs = high.rolling(window=5, center=True).max().dropna()
+        recent_high_values = recent_highs.to_numpy()
+        self.run_case(
+            "breakout resistance highs",
+            lambda: loop_breakout_highs(recent_highs),
+            lambda: find_extrema(recent_high_values, 2, kind="max", strict=True)
+        )
+        self.run_case(
+            "pattern swing lows",
+            lambda: loop_swing_lows(low),
+            lambda: find_extrema(low_values, 3, kind="min", strict=True, margin=5)
+        )
+        self.run_case(
+            "double bottom lows",
+            lambda: loop_double_bottom_lows(low),
+            lambda: find_extrema(low_values, 2, kind="min", strict=True, right_window=1, margin=5)
+        )
+
+        return self.results
+
+    def print_summary(self):
+        """Print benchmark summary."""
+        print("\n" + "=" * 80)
+        print(f"EXTREMA BENCHMARK ({self.bars} bars, median of {self.repeats} runs)")
+        print("=" * 80)
+        print(f"{'Test':<40}{'Loop (ms)':>10}{'Numpy (ms)':>12}{'Speedup':>10}{'Match':>8}")
+        for result in self.results:
+            print(f"{result.test_name:<40}{result.loop_ms:>10.2f}{result.vectorized_ms:>12.3f}"
+                  f"{result.speedup:>9.0f}x{str(result.outputs_match):>8}")
+
+
+def main():
+    """Main benchmark execution function."""
+    benchmark = ExtremaBenchmark()
+    benchmark.run_all()
+    benchmark.print_summary()
+
+    mismatches = [result.test_name for result in benchmark.results if not result.outputs_match]
+    if mismatches:
+        raise SystemExit(f"Output mismatch in: {', '.join(mismatches)}")
+
+
+if __name__ == "__main__":
+    main()
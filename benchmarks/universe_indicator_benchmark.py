@@ -0,0 +1,151 @@
+"""
+Benchmark for cross-symbol indicator calculation.
+
+Compares looping ``IndicatorEngine`` calculators over one DataFrame per
+symbol against ``IndicatorEngine.calculate_universe`` on an aligned
+(symbols x bars) panel:
+- Verifies both produce identical indicator series for every symbol
+- Reports universe-wide scan latency and speedup for several universe sizes
+"""
+
+import asyncio
+import time
+import statistics
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+import sys
+sys.path.append('src')
+from long_analyst.indicators.indicator_engine import IndicatorEngine, IndicatorConfig
+from long_analyst.indicators.universe import UniversePanel
+
+
+INDICATORS = ['rsi', 'macd', 'bollinger_bands', 'atr']
+
+
+@dataclass
+class UniverseBenchmarkResult:
+    """Benchmark result data class."""
+    symbols: int
+    bars: int
+    loop_ms: float
+    panel_build_ms: float
+    universe_ms: float
+    speedup: float
+    outputs_match: bool
+
+
+def generate_frames(symbols: int, bars: int, seed: int = 42) -> Dict[str, pd.DataFrame]:
+    """Generate random-walk OHLCV frames sharing one index."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start='2024-01-01', periods=bars, freq='1h')
+    close = 1000 + np.cumsum(rng.normal(0, 5, (symbols, bars)), axis=1)
+    spread = rng.uniform(0, 5, (2, symbols, bars))
+    return {
+        f"SYM{i}/USDT": pd.DataFrame({
+            'open': close[i],
+            'high': close[i] + spread[0, i],
+            'low': close[i] - spread[1, i],
+            'close': close[i],
+            'volume': rng.uniform(100, 1000, bars)
+        }, index=index)
+        for i in range(symbols)
+    }
+
+
+def _results_match(expected: Dict[str, Dict], actual: Dict[str, Dict]) -> bool:
+    """Compare indicator series of both paths for every symbol."""
+    for symbol, results in expected.items():
+        for name, result in results.items():
+            for key, value in result.values.items():
+                if isinstance(value, pd.Series) and not np.array_equal(
+                        value.to_numpy(float), actual[symbol][name].values[key].to_numpy(float),
+                        equal_nan=True):
+                    return False
+    return True
+
+
+class UniverseBenchmark:
+    """Benchmark per-symbol loops against the universe panel."""
+
+    def __init__(self, repeats: int = 3):
+        self.repeats = repeats
+        self.engine = IndicatorEngine(IndicatorConfig(
+            enable_redis_cache=False,
+            enable_memory_cache=False,
+            default_executor='inline'
+        ))
+        self.results: List[UniverseBenchmarkResult] = []
+
+    async def _loop(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+        return {
+            symbol: {name: await self.engine.calculators[name].calculate(frame) for name in INDICATORS}
+            for symbol, frame in frames.items()
+        }
+
+    async def _time(self, coroutine_function, *args):
+        timings = []
+        output = None
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            output = await coroutine_function(*args)
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings), output
+
+    async def run_case(self, symbols: int, bars: int) -> UniverseBenchmarkResult:
+        """Time both paths on one universe size and compare their output."""
+        frames = generate_frames(symbols, bars)
+        loop_ms, expected = await self._time(self._loop, frames)
+
+        start = time.perf_counter()
+        panel = UniversePanel.from_frames(frames)
+        panel_build_ms = (time.perf_counter() - start) * 1000
+        universe_ms, actual = await self._time(self.engine.calculate_universe, INDICATORS, panel)
+
+        result = UniverseBenchmarkResult(
+            symbols=symbols,
+            bars=bars,
+            loop_ms=loop_ms,
+            panel_build_ms=panel_build_ms,
+            universe_ms=universe_ms,
+            speedup=loop_ms / universe_ms if universe_ms > 0 else float('inf'),
+            outputs_match=_results_match(expected, actual)
+        )
+        self.results.append(result)
+        return result
+
+    async def run_all(self) -> List[UniverseBenchmarkResult]:
+        """Run every benchmark case."""
+        for symbols, bars in [(50, 500), (200, 500), (500, 1000)]:
+            await self.run_case(symbols, bars)
+        return self.results
+
+    def print_summary(self):
+        """Print benchmark summary."""
+        print("\n" + "=" * 80)
+        print(f"UNIVERSE INDICATOR BENCHMARK ({', '.join(INDICATORS)}; median of {self.repeats} runs)")
+        print("=" * 80)
+        print(f"{'Symbols':>8}{'Bars':>8}{'Loop (ms)':>12}{'Build (ms)':>12}{'Panel (ms)':>12}"
+              f"{'Speedup':>10}{'Match':>8}")
+        for result in self.results:
+            print(f"{result.symbols:>8}{result.bars:>8}{result.loop_ms:>12.1f}{result.panel_build_ms:>12.1f}"
+                  f"{result.universe_ms:>12.1f}{result.speedup:>9.1f}x{str(result.outputs_match):>8}")
+        print("Speedup compares the per-symbol loop with calculate_universe on a prebuilt panel")
+
+
+def main():
+    """Main benchmark execution function."""
+    benchmark = UniverseBenchmark()
+    asyncio.run(benchmark.run_all())
+    benchmark.print_summary()
+
+    mismatches = [f"{result.symbols}x{result.bars}" for result in benchmark.results if not result.outputs_match]
+    if mismatches:
+        raise SystemExit(f"Output mismatch in: {', '.join(mismatches)}")
+
+
+if __name__ == "__main__":
+    main()
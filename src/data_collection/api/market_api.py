@@ -5,16 +5,32 @@ This module provides RESTful API endpoints for accessing market data,
 including OHLCV data, order book data, trade data, and ticker data.
 """
 
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import List, Optional, Dict, Any, Callable, Tuple
 from datetime import datetime, timedelta
-from fastapi import APIRouter, HTTPException, Query, Depends
+from functools import partial
+import numpy as np
+from fastapi import APIRouter, HTTPException, Query, Depends, Header
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
+from sqlalchemy import func, select
 
 from ..core.data_collector import DataCollector
 from ..core.exchange_manager import ExchangeManager
+from ..core.logger import get_logger
 from ..models.market_data import OHLCVData, OrderBookData, TradeData, TickerData
 from ..models.database import get_timescaledb_session
+from ..storage.read_through import ReadThroughCache
 from ..utils.helpers import format_timestamp, normalize_symbol
+from ..utils.columnar import (
+    ARROW_STREAM_MEDIA_TYPE, NUMPY_COLUMNS_MEDIA_TYPE, PYARROW_AVAILABLE,
+    encode_arrow_stream, encode_numpy_columns, fetch_columns, negotiate_media_type
+)
+
+logger = get_logger(__name__)
+
+# Response header listing the requested symbols that could not be served
+FAILED_SYMBOLS_HEADER = "X-Failed-Symbols"
 
 
 # Pydantic models for API requests/responses
@@ -24,7 +40,8 @@ class OHLCVRequest(BaseModel):
     timeframe: str = Field("1h", description="Timeframe (1m, 5m, 15m, 30m, 1h, 4h, 1d)")
     start_time: Optional[datetime] = Field(None, description="Start time")
     end_time: Optional[datetime] = Field(None, description="End time")
-    limit: int = Field(100, description="Maximum number of records", ge=1, le=1000)
+    limit: int = Field(100, description="Maximum number of records (above 1000 requires a columnar Accept type)",
+                       ge=1, le=100000)
 
 
 class OrderBookRequest(BaseModel):
@@ -103,12 +120,19 @@ class MarketStatsResponse(BaseModel):
     data_types: List[str]
 
 
+# Largest OHLCV page served as JSON; bulk pulls must use a columnar format
+MAX_JSON_OHLCV_LIMIT = 1000
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+
 # Create router
 market_router = APIRouter(prefix="/api/v1/market", tags=["market-data"])
 
 # Initialize dependencies
 data_collector = None
 exchange_manager = None
+read_cache = None
 
 
 def get_data_collector():
@@ -127,6 +151,323 @@ def get_exchange_manager():
     return exchange_manager
 
 
+def get_read_cache():
+    """Get read-through cache instance."""
+    global read_cache
+    if read_cache is None:
+        read_cache = ReadThroughCache()
+    return read_cache
+
+
+def _format_time(value: Optional[datetime]) -> str:
+    """Format an optional datetime for use in cache keys."""
+    return value.isoformat() if value else ""
+
+
+def _ohlcv_to_dict(record: Any) -> Dict[str, Any]:
+    """Convert an OHLCV record or result row to a cacheable response dictionary."""
+    return {
+        'timestamp': record.timestamp.isoformat(),
+        'open': record.open,
+        'high': record.high,
+        'low': record.low,
+        'close': record.close,
+        'volume': record.volume,
+        'exchange': record.exchange,
+        'symbol': record.symbol,
+        'timeframe': record.timeframe
+    }
+
+
+
+def _orderbook_to_dict(record: OrderBookData) -> Dict[str, Any]:
+    """Convert an order book record to a cacheable response dictionary."""
+    return {
+        'timestamp': record.timestamp.isoformat(),
+        'bids': record.bids,
+        'asks': record.asks,
+        'best_bid': record.best_bid,
+        'best_ask': record.best_ask,
+        'spread': record.spread,
+        'spread_percent': record.spread_percent,
+        'mid_price': record.mid_price,
+        'exchange': record.exchange,
+        'symbol': record.symbol
+    }
+
+
+def _ticker_to_dict(record: TickerData) -> Dict[str, Any]:
+    """Convert a ticker record to a cacheable response dictionary."""
+    return {
+        'timestamp': record.timestamp.isoformat(),
+        'last': record.last,
+        'bid': record.bid,
+        'ask': record.ask,
+        'high': record.high,
+        'low': record.low,
+        'volume': record.volume,
+        'change': record.change,
+        'change_percent': record.change_percent,
+        'exchange': record.exchange,
+        'symbol': record.symbol
+    }
+
+
+def _trade_to_dict(record: TradeData) -> Dict[str, Any]:
+    """Convert a trade record to a cacheable response dictionary."""
+    return {
+        'timestamp': record.timestamp.isoformat(),
+        'price': record.price,
+        'amount': record.amount,
+        'side': record.side,
+        'exchange': record.exchange,
+        'symbol': record.symbol,
+        'trade_id': record.trade_id
+    }
+
+
+def _load_ohlcv(exchange: str, symbol: str, timeframe: str, start_time: Optional[datetime],
+                end_time: Optional[datetime], limit: int) -> List[Dict[str, Any]]:
+    """Query OHLCV records from the database."""
+    session = get_timescaledb_session()
+    try:
+        query = session.query(OHLCVData).filter(
+            OHLCVData.exchange == exchange,
+            OHLCVData.symbol == symbol,
+            OHLCVData.timeframe == timeframe
+        )
+
+        # Apply time filters
+        if start_time:
+            query = query.filter(OHLCVData.timestamp >= start_time)
+        if end_time:
+            query = query.filter(OHLCVData.timestamp <= end_time)
+
+        # Apply limit and order
+        query = query.order_by(OHLCVData.timestamp.desc()).limit(limit)
+
+        return [_ohlcv_to_dict(record) for record in query.all()]
+    finally:
+        session.close()
+
+
+def _load_ohlcv_columns(exchange: str, symbol: str, timeframe: str, start_time: Optional[datetime],
+                        end_time: Optional[datetime], limit: int) -> Dict[str, np.ndarray]:
+    """Read OHLCV rows from the cursor directly into column arrays."""
+    session = get_timescaledb_session()
+    try:
+        statement = select(
+            func.extract('epoch', OHLCVData.timestamp),
+            OHLCVData.open, OHLCVData.high, OHLCVData.low, OHLCVData.close, OHLCVData.volume
+        ).where(
+            OHLCVData.exchange == exchange,
+            OHLCVData.symbol == symbol,
+            OHLCVData.timeframe == timeframe
+        )
+
+        # Apply time filters
+        if start_time:
+            statement = statement.where(OHLCVData.timestamp >= start_time)
+        if end_time:
+            statement = statement.where(OHLCVData.timestamp <= end_time)
+
+        # Apply limit and order
+        statement = statement.order_by(OHLCVData.timestamp.desc()).limit(limit)
+
+        columns = fetch_columns(session, statement, OHLCV_COLUMNS)
+        # Epoch seconds to integer milliseconds
+        columns['timestamp'] = np.rint(columns['timestamp'] * 1000).astype(np.int64)
+        return columns
+    finally:
+        session.close()
+
+
+def _encode_ohlcv_columns(encode: Callable[..., bytes], metadata: Dict[str, Any], exchange: str,
+                          symbol: str, timeframe: str, start_time: Optional[datetime], end_time: Optional[datetime], limit: int) -> bytes:
+    """Query OHLCV columns and encode them with ``encode``."""
+    columns = _load_ohlcv_columns(exchange, symbol, timeframe, start_time, end_time, limit)
+    return encode(columns, metadata)
+
+
+def _load_latest_orderbook(exchange: str, symbol: str) -> Optional[Dict[str, Any]]:
+    """Query the latest order book from the database."""
+    session = get_timescaledb_session()
+    try:
+        orderbook_records = OrderBookData.get_latest(session, exchange, symbol, 1)
+        if not orderbook_records:
+            return None
+
+        return _orderbook_to_dict(orderbook_records[0])
+    finally:
+        session.close()
+
+
+def _load_trades(exchange: str, symbol: str, start_time: Optional[datetime],
+                 end_time: Optional[datetime], limit: int) -> List[Dict[str, Any]]:
+    """Query trade records from the database."""
+    session = get_timescaledb_session()
+    try:
+        query = session.query(TradeData).filter(
+            TradeData.exchange == exchange,
+            TradeData.symbol == symbol
+        )
+
+        # Apply time filters
+        if start_time:
+            query = query.filter(TradeData.timestamp >= start_time)
+        if end_time:
+            query = query.filter(TradeData.timestamp <= end_time)
+
+        # Apply limit and order
+        query = query.order_by(TradeData.timestamp.desc()).limit(limit)
+
+        return [_trade_to_dict(record) for record in query.all()]
+    finally:
+        session.close()
+
+
+def _load_latest_ticker(exchange: str, symbol: str) -> Optional[Dict[str, Any]]:
+    """Query the latest ticker from the database."""
+    session = get_timescaledb_session()
+    try:
+        ticker_records = TickerData.get_latest(session, exchange, symbol, 1)
+        if not ticker_records:
+            return None
+
+        return _ticker_to_dict(ticker_records[0])
+    finally:
+        session.close()
+
+
+def _load_latest_ohlcv_many(exchange: str, symbols: List[str], timeframe: str,
+                            limit: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Query the latest candles of several symbols in one statement."""
+    session = get_timescaledb_session()
+    try:
+        row_number = func.row_number().over(
+            partition_by=OHLCVData.symbol,
+            order_by=OHLCVData.timestamp.desc()
+        ).label('row_number')
+
+        ranked = select(
+            OHLCVData.timestamp, OHLCVData.open, OHLCVData.high, OHLCVData.low,
+            OHLCVData.close, OHLCVData.volume, OHLCVData.exchange, OHLCVData.symbol,
+            OHLCVData.timeframe, row_number
+        ).where(
+            OHLCVData.exchange == exchange,
+            OHLCVData.symbol.in_(symbols),
+            OHLCVData.timeframe == timeframe
+        ).subquery()
+
+        query = select(ranked).where(ranked.c.row_number <= limit).order_by(
+            ranked.c.symbol, ranked.c.timestamp.desc()
+        )
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for row in session.execute(query):
+            results.setdefault(row.symbol, []).append(_ohlcv_to_dict(row))
+        return results
+    finally:
+        session.close()
+
+
+def _load_latest_orderbooks(exchange: str, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Query the latest order book of several symbols with one DISTINCT ON query."""
+    session = get_timescaledb_session()
+    try:
+        records = session.query(OrderBookData).filter(
+            OrderBookData.exchange == exchange,
+            OrderBookData.symbol.in_(symbols)
+        ).order_by(
+            OrderBookData.symbol, OrderBookData.timestamp.desc()
+        ).distinct(OrderBookData.symbol).all()
+
+        return {record.symbol: _orderbook_to_dict(record) for record in records}
+    finally:
+        session.close()
+
+
+def _load_latest_tickers(exchange: str, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Query the latest ticker of several symbols with one DISTINCT ON query."""
+    session = get_timescaledb_session()
+    try:
+        records = session.query(TickerData).filter(
+            TickerData.exchange == exchange,
+            TickerData.symbol.in_(symbols)
+        ).order_by(
+            TickerData.symbol, TickerData.timestamp.desc()
+        ).distinct(TickerData.symbol).all()
+
+        return {record.symbol: _ticker_to_dict(record) for record in records}
+    finally:
+        session.close()
+
+
+def _parse_symbols(symbols: str, exchange: str) -> Dict[str, str]:
+    """Map requested symbols to their normalized form."""
+    symbol_list = [s.strip() for s in symbols.split(",") if s.strip()]
+    if not symbol_list:
+        raise HTTPException(status_code=400, detail="No symbols provided")
+    return {symbol: normalize_symbol(symbol, exchange) for symbol in symbol_list}
+
+
+async def _load_many_isolated(cache: ReadThroughCache, keys: Dict[str, str],
+                              batch_loader: Callable[[List[str]], Dict[str, Any]],
+                              loader: Callable[[str], Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Load several symbols through the cache, isolating failures per symbol.
+
+    The batched load is tried first. If it fails, every symbol is loaded on its
+    own so that one bad symbol does not fail the others. Returns the loaded
+    values and the symbols that could not be loaded.
+    """
+    try:
+        return await cache.get_or_load_many(keys, batch_loader), []
+    except Exception as e:
+        logger.warning(f"Batched load failed, loading {len(keys)} symbols individually: {e}")
+
+    outcomes = await asyncio.gather(
+        *(cache.get_or_load(key, partial(loader, symbol)) for symbol, key in keys.items()),
+        return_exceptions=True
+    )
+
+    results: Dict[str, Any] = {}
+    failed: List[str] = []
+    for symbol, outcome in zip(keys, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning(f"Failed to load {keys[symbol]}: {outcome}")
+            failed.append(symbol)
+        else:
+            results[symbol] = outcome
+    return results, failed
+
+
+def _build_multi_response(response: Response, symbol_map: Dict[str, str], values: Dict[str, Any],
+                          failed: List[str], build: Callable[[str, Any], Any]) -> Dict[str, Any]:
+    """
+    Build the per-symbol response, skipping symbols that fail.
+
+    Symbols without data are omitted. Symbols whose load or conversion failed
+    are omitted too and listed in the ``X-Failed-Symbols`` header.
+    """
+    results: Dict[str, Any] = {}
+    failed_symbols = [symbol for symbol, normalized in symbol_map.items() if normalized in failed]
+
+    for symbol, normalized in symbol_map.items():
+        if normalized in failed or not values.get(normalized):
+            continue
+        try:
+            results[symbol] = build(normalized, values[normalized])
+        except Exception as e:
+            # Continue with other symbols if one fails
+            logger.warning(f"Failed to build response for {symbol}: {e}")
+            failed_symbols.append(symbol)
+
+    if failed_symbols:
+        response.headers[FAILED_SYMBOLS_HEADER] = ",".join(failed_symbols)
+    return results
+
+
 @market_router.get("/exchanges", response_model=List[str])
 async def get_exchanges():
     """Get list of available exchanges."""
@@ -150,50 +491,62 @@ async def get_exchange_symbols(exchange: str):
         raise HTTPException(status_code=500, detail=f"Failed to get symbols for {exchange}: {str(e)}")
 
 
-@market_router.post("/ohlcv", response_model=List[OHLCVResponse])
-async def get_ohlcv_data(request: OHLCVRequest):
-    """Get OHLCV data."""
-    session = get_timescaledb_session()
+@market_router.post("/ohlcv", response_model=List[OHLCVResponse],
+                     responses={200: {"content": {ARROW_STREAM_MEDIA_TYPE: {}, NUMPY_COLUMNS_MEDIA_TYPE: {}}}})
+async def get_ohlcv_data(request: OHLCVRequest, accept: Optional[str] = Header(None)):
+    """
+    Get OHLCV data.
 
-    try:
-        # Build query
-        query = session.query(OHLCVData).filter(
-            OHLCVData.exchange == request.exchange,
-            OHLCVData.symbol == normalize_symbol(request.symbol, request.exchange),
-            OHLCVData.timeframe == request.timeframe
+    Responds with JSON by default. Bulk queries can request columnar output via
+    the Accept header: an Arrow IPC stream or raw NumPy column buffers.
+    """
+    symbol = normalize_symbol(request.symbol, request.exchange)
+    media_type = negotiate_media_type(accept)
+
+    if media_type is not None:
+        return await _get_ohlcv_columnar(request, symbol, media_type)
+
+    if request.limit > MAX_JSON_OHLCV_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"JSON responses are limited to {MAX_JSON_OHLCV_LIMIT} records; "
+                   f"request {ARROW_STREAM_MEDIA_TYPE} or {NUMPY_COLUMNS_MEDIA_TYPE} for bulk data"
         )
 
-        # Apply time filters
-        if request.start_time:
-            query = query.filter(OHLCVData.timestamp >= request.start_time)
-        if request.end_time:
-            query = query.filter(OHLCVData.timestamp <= request.end_time)
+    cache = get_read_cache()
 
-        # Apply limit and order
-        query = query.order_by(OHLCVData.timestamp.desc()).limit(request.limit)
+    try:
+        cache_key = (f"api:ohlcv:{request.exchange}:{symbol}:{request.timeframe}:"
+                     f"{_format_time(request.start_time)}:{_format_time(request.end_time)}:{request.limit}")
+        ohlcv_records = await cache.get_or_load(cache_key, partial(
+            _load_ohlcv, request.exchange, symbol, request.timeframe,
+            request.start_time, request.end_time, request.limit
+        ))
 
-        # Execute query
-        ohlcv_records = query.all()
-        session.close()
+        return [OHLCVResponse(**record) for record in ohlcv_records]
 
-        # Convert to response format
-        return [
-            OHLCVResponse(
-                timestamp=record.timestamp,
-                open=record.open,
-                high=record.high,
-                low=record.low,
-                close=record.close,
-                volume=record.volume,
-                exchange=record.exchange,
-                symbol=record.symbol,
-                timeframe=record.timeframe
-            )
-            for record in ohlcv_records
-        ]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get OHLCV data: {str(e)}")
+
+
+async def _get_ohlcv_columnar(request: OHLCVRequest, symbol: str, media_type: str) -> Response:
+    """Serve an OHLCV query as columnar binary."""
+    if media_type == ARROW_STREAM_MEDIA_TYPE and not PYARROW_AVAILABLE:
+        raise HTTPException(status_code=406, detail="Arrow responses are not available: pyarrow is not installed")
+
+    encode = encode_arrow_stream if media_type == ARROW_STREAM_MEDIA_TYPE else encode_numpy_columns
+    metadata = {'exchange': request.exchange, 'symbol': symbol, 'timeframe': request.timeframe}
+
+    try:
+        # Query and encoding both run in the executor, off the event loop
+        content = await asyncio.get_running_loop().run_in_executor(None, partial(
+            _encode_ohlcv_columns, encode, metadata, request.exchange, symbol, request.timeframe,
+            request.start_time, request.end_time, request.limit
+        ))
+
+        return Response(content=content, media_type=media_type)
 
     except Exception as e:
-        session.close()
         raise HTTPException(status_code=500, detail=f"Failed to get OHLCV data: {str(e)}")
 
 
@@ -205,160 +558,120 @@ async def get_latest_ohlcv(
     limit: int = Query(10, description="Number of latest records", ge=1, le=100)
 ):
     """Get latest OHLCV data."""
-    session = get_timescaledb_session()
+    cache = get_read_cache()
+    symbol = normalize_symbol(symbol, exchange)
 
     try:
-        # Get latest records
-        ohlcv_records = OHLCVData.get_latest(
-            session, exchange, normalize_symbol(symbol, exchange), limit
-        )
-        session.close()
+        cache_key = f"api:ohlcv_latest:{exchange}:{symbol}:{timeframe}:{limit}"
+        ohlcv_records = await cache.get_or_load(cache_key, partial(
+            _load_ohlcv, exchange, symbol, timeframe, None, None, limit
+        ))
 
-        # Convert to response format
-        return [
-            OHLCVResponse(
-                timestamp=record.timestamp,
-                open=record.open,
-                high=record.high,
-                low=record.low,
-                close=record.close,
-                volume=record.volume,
-                exchange=record.exchange,
-                symbol=record.symbol,
-                timeframe=record.timeframe
-            )
-            for record in ohlcv_records
-        ]
+        return [OHLCVResponse(**record) for record in ohlcv_records]
 
     except Exception as e:
-        session.close()
         raise HTTPException(status_code=500, detail=f"Failed to get latest OHLCV data: {str(e)}")
 
 
+@market_router.get("/ohlcv/multi", response_model=Dict[str, List[OHLCVResponse]])
+async def get_multi_ohlcv(
+    response: Response,
+    exchange: str = Query(..., description="Exchange name"),
+    symbols: str = Query(..., description="Comma-separated list of symbols"),
+    timeframe: str = Query("1h", description="Timeframe"),
+    limit: int = Query(10, description="Number of latest records per symbol", ge=1, le=100)
+):
+    """Get latest OHLCV data for multiple symbols."""
+    symbol_map = _parse_symbols(symbols, exchange)
+    cache = get_read_cache()
+
+    try:
+        # Shares cache entries with /ohlcv/latest; misses are ranked per symbol in one query
+        candles, failed = await _load_many_isolated(
+            cache,
+            {normalized: f"api:ohlcv_latest:{exchange}:{normalized}:{timeframe}:{limit}"
+             for normalized in symbol_map.values()},
+            partial(_load_latest_ohlcv_many, exchange, timeframe=timeframe, limit=limit),
+            partial(_load_ohlcv, exchange, timeframe=timeframe, start_time=None, end_time=None, limit=limit)
+        )
+
+        return _build_multi_response(
+            response, symbol_map, candles, failed,
+            lambda normalized, records: [OHLCVResponse(**record) for record in records]
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get multi OHLCV data: {str(e)}")
+
+
 @market_router.post("/orderbook", response_model=OrderBookResponse)
 async def get_orderbook_data(request: OrderBookRequest):
     """Get current order book data."""
-    session = get_timescaledb_session()
+    cache = get_read_cache()
+    symbol = normalize_symbol(request.symbol, request.exchange)
 
     try:
-        # Get latest order book
-        orderbook_records = OrderBookData.get_latest(
-            session, request.exchange, normalize_symbol(request.symbol, request.exchange), 1
+        # Same key the order book collector writes to
+        orderbook = await cache.get_or_load(
+            f"orderbook:{request.exchange}:{symbol}",
+            partial(_load_latest_orderbook, request.exchange, symbol)
         )
-        session.close()
 
-        if not orderbook_records:
+        if not orderbook:
             raise HTTPException(status_code=404, detail="No order book data found")
 
-        orderbook = orderbook_records[0]
-
-        return OrderBookResponse(
-            timestamp=orderbook.timestamp,
-            bids=orderbook.bids,
-            asks=orderbook.asks,
-            best_bid=orderbook.best_bid,
-            best_ask=orderbook.best_ask,
-            spread=orderbook.spread,
-            spread_percent=orderbook.spread_percent,
-            mid_price=orderbook.mid_price,
-            exchange=orderbook.exchange,
-            symbol=orderbook.symbol
-        )
+        return OrderBookResponse(**{**orderbook, 'exchange': request.exchange, 'symbol': symbol})
 
     except HTTPException:
         raise
     except Exception as e:
-        session.close()
         raise HTTPException(status_code=500, detail=f"Failed to get order book data: {str(e)}")
 
 
 @market_router.get("/orderbook/multi", response_model=Dict[str, OrderBookResponse])
 async def get_multi_orderbook(
+    response: Response,
     exchange: str = Query(..., description="Exchange name"),
     symbols: str = Query(..., description="Comma-separated list of symbols")
 ):
     """Get order book data for multiple symbols."""
-    symbol_list = [s.strip() for s in symbols.split(",") if s.strip()]
-    if not symbol_list:
-        raise HTTPException(status_code=400, detail="No symbols provided")
-
-    session = get_timescaledb_session()
-    results = {}
+    symbol_map = _parse_symbols(symbols, exchange)
+    cache = get_read_cache()
 
     try:
-        for symbol in symbol_list:
-            try:
-                orderbook_records = OrderBookData.get_latest(
-                    session, exchange, normalize_symbol(symbol, exchange), 1
-                )
-
-                if orderbook_records:
-                    orderbook = orderbook_records[0]
-                    results[symbol] = OrderBookResponse(
-                        timestamp=orderbook.timestamp,
-                        bids=orderbook.bids,
-                        asks=orderbook.asks,
-                        best_bid=orderbook.best_bid,
-                        best_ask=orderbook.best_ask,
-                        spread=orderbook.spread,
-                        spread_percent=orderbook.spread_percent,
-                        mid_price=orderbook.mid_price,
-                        exchange=orderbook.exchange,
-                        symbol=orderbook.symbol
-                    )
-            except Exception as e:
-                # Continue with other symbols if one fails
-                continue
+        # One MGET for all symbols, one DISTINCT ON query for the misses
+        orderbooks, failed = await _load_many_isolated(
+            cache,
+            {normalized: f"orderbook:{exchange}:{normalized}" for normalized in symbol_map.values()},
+            partial(_load_latest_orderbooks, exchange),
+            partial(_load_latest_orderbook, exchange)
+        )
 
-        session.close()
-        return results
+        return _build_multi_response(
+            response, symbol_map, orderbooks, failed,
+            lambda normalized, orderbook: OrderBookResponse(**{**orderbook, 'exchange': exchange, 'symbol': normalized})
+        )
 
     except Exception as e:
-        session.close()
         raise HTTPException(status_code=500, detail=f"Failed to get multi order book data: {str(e)}")
 
 
 @market_router.post("/trades", response_model=List[TradeResponse])
 async def get_trades_data(request: TradesRequest):
     """Get trades data."""
-    session = get_timescaledb_session()
+    cache = get_read_cache()
+    symbol = normalize_symbol(request.symbol, request.exchange)
 
     try:
-        # Build query
-        query = session.query(TradeData).filter(
-            TradeData.exchange == request.exchange,
-            TradeData.symbol == normalize_symbol(request.symbol, request.exchange)
-        )
+        cache_key = (f"api:trades:{request.exchange}:{symbol}:"
+                     f"{_format_time(request.start_time)}:{_format_time(request.end_time)}:{request.limit}")
+        trade_records = await cache.get_or_load(cache_key, partial(
+            _load_trades, request.exchange, symbol, request.start_time, request.end_time, request.limit
+        ))
 
-        # Apply time filters
-        if request.start_time:
-            query = query.filter(TradeData.timestamp >= request.start_time)
-        if request.end_time:
-            query = query.filter(TradeData.timestamp <= request.end_time)
-
-        # Apply limit and order
-        query = query.order_by(TradeData.timestamp.desc()).limit(request.limit)
-
-        # Execute query
-        trade_records = query.all()
-        session.close()
-
-        # Convert to response format
-        return [
-            TradeResponse(
-                timestamp=record.timestamp,
-                price=record.price,
-                amount=record.amount,
-                side=record.side,
-                exchange=record.exchange,
-                symbol=record.symbol,
-                trade_id=record.trade_id
-            )
-            for record in trade_records
-        ]
+        return [TradeResponse(**record) for record in trade_records]
 
     except Exception as e:
-        session.close()
         raise HTTPException(status_code=500, detail=f"Failed to get trades data: {str(e)}")
 
 
@@ -400,85 +713,52 @@ async def get_latest_trades(
 @market_router.post("/ticker", response_model=TickerResponse)
 async def get_ticker_data(request: TickerRequest):
     """Get current ticker data."""
-    session = get_timescaledb_session()
+    cache = get_read_cache()
+    symbol = normalize_symbol(request.symbol, request.exchange)
 
     try:
-        # Get latest ticker
-        ticker_records = TickerData.get_latest(
-            session, request.exchange, normalize_symbol(request.symbol, request.exchange), 1
+        # Same key RedisStorage.cache_ticker_data writes to
+        ticker = await cache.get_or_load(
+            f"ticker:{request.exchange}:{symbol}",
+            partial(_load_latest_ticker, request.exchange, symbol)
         )
-        session.close()
 
-        if not ticker_records:
+        if not ticker:
             raise HTTPException(status_code=404, detail="No ticker data found")
 
-        ticker = ticker_records[0]
-
-        return TickerResponse(
-            timestamp=ticker.timestamp,
-            last=ticker.last,
-            bid=ticker.bid,
-            ask=ticker.ask,
-            high=ticker.high,
-            low=ticker.low,
-            volume=ticker.volume,
-            change=ticker.change,
-            change_percent=ticker.change_percent,
-            exchange=ticker.exchange,
-            symbol=ticker.symbol
-        )
+        return TickerResponse(**{**ticker, 'exchange': request.exchange, 'symbol': symbol})
 
     except HTTPException:
         raise
     except Exception as e:
-        session.close()
         raise HTTPException(status_code=500, detail=f"Failed to get ticker data: {str(e)}")
 
 
 @market_router.get("/ticker/multi", response_model=Dict[str, TickerResponse])
 async def get_multi_ticker(
+    response: Response,
     exchange: str = Query(..., description="Exchange name"),
     symbols: str = Query(..., description="Comma-separated list of symbols")
 ):
     """Get ticker data for multiple symbols."""
-    symbol_list = [s.strip() for s in symbols.split(",") if s.strip()]
-    if not symbol_list:
-        raise HTTPException(status_code=400, detail="No symbols provided")
-
-    session = get_timescaledb_session()
-    results = {}
+    symbol_map = _parse_symbols(symbols, exchange)
+    cache = get_read_cache()
 
     try:
-        for symbol in symbol_list:
-            try:
-                ticker_records = TickerData.get_latest(
-                    session, exchange, normalize_symbol(symbol, exchange), 1
-                )
-
-                if ticker_records:
-                    ticker = ticker_records[0]
-                    results[symbol] = TickerResponse(
-                        timestamp=ticker.timestamp,
-                        last=ticker.last,
-                        bid=ticker.bid,
-                        ask=ticker.ask,
-                        high=ticker.high,
-                        low=ticker.low,
-                        volume=ticker.volume,
-                        change=ticker.change,
-                        change_percent=ticker.change_percent,
-                        exchange=ticker.exchange,
-                        symbol=ticker.symbol
-                    )
-            except Exception as e:
-                # Continue with other symbols if one fails
-                continue
+        # One MGET for all symbols, one DISTINCT ON query for the misses
+        tickers, failed = await _load_many_isolated(
+            cache,
+            {normalized: f"ticker:{exchange}:{normalized}" for normalized in symbol_map.values()},
+            partial(_load_latest_tickers, exchange),
+            partial(_load_latest_ticker, exchange)
+        )
 
-        session.close()
-        return results
+        return _build_multi_response(
+            response, symbol_map, tickers, failed,
+            lambda normalized, ticker: TickerResponse(**{**ticker, 'exchange': exchange, 'symbol': normalized})
+        )
 
     except Exception as e:
-        session.close()
         raise HTTPException(status_code=500, detail=f"Failed to get multi ticker data: {str(e)}")
 
 
@@ -97,6 +97,17 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_CONNECTIONS: int = Field(default=1000, env="MAX_CONCURRENT_CONNECTIONS")
     REQUEST_TIMEOUT: int = Field(default=100, env="REQUEST_TIMEOUT")
     CACHE_TTL: int = Field(default=300, env="CACHE_TTL")
+    API_CACHE_TTL: int = Field(default=5, env="API_CACHE_TTL")
+
+    # Storage Write Path
+    WRITE_BATCH_SIZE: int = Field(default=5000, env="WRITE_BATCH_SIZE")
+    WRITE_FLUSH_INTERVAL: float = Field(default=1.0, env="WRITE_FLUSH_INTERVAL")
+    WRITE_MAX_BUFFERED_ROWS: int = Field(default=50000, env="WRITE_MAX_BUFFERED_ROWS")
+    WRITE_MAX_RETRIES: int = Field(default=3, env="WRITE_MAX_RETRIES")
+    WRITE_RETRY_BACKOFF: float = Field(default=0.5, env="WRITE_RETRY_BACKOFF")
+    WRITE_DEAD_LETTER_BATCHES: int = Field(default=100, env="WRITE_DEAD_LETTER_BATCHES")
+    # Deletes rows duplicating an upsert key so the unique index can be built
+    WRITE_MIGRATE_UPSERT_INDEXES: bool = Field(default=False, env="WRITE_MIGRATE_UPSERT_INDEXES")
 
     # Quality Control
     DATA_QUALITY_THRESHOLD: float = Field(default=0.999, env="DATA_QUALITY_THRESHOLD")
@@ -8,15 +8,16 @@ multiple cryptocurrency exchanges with automatic scheduling and error handling.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Union, Callable
+from typing import Dict, List, Optional, Any, Union, Callable, Awaitable
 from datetime import datetime, timedelta
+from functools import partial
 import uuid
 from dataclasses import dataclass
 
 from .exchange_manager import ExchangeManager
 from .data_processor import DataProcessor
 from ..config.settings import get_settings
-from ..models.database import get_timescaledb_session, get_session
+from ..models.database import get_session
 from ..models.market_data import MarketData, OHLCVData, OrderBookData, TradeData, TickerData
 from ..utils.metrics import MetricsCollector
 from ..utils.validation import DataValidator, ValidationReport
@@ -24,6 +25,7 @@ from ..utils.helpers import format_timestamp, normalize_symbol, get_timeframe_se
 from ..collectors.orderbook_collector import OrderBookCollector
 from ..collectors.trades_collector import TradesCollector
 from ..storage.redis import RedisStorage
+from ..storage.batch_writer import BatchWriter
 
 
 @dataclass
@@ -52,6 +54,12 @@ class DataCollector:
         self.metrics = MetricsCollector()
         self.validator = DataValidator()
         self.redis = RedisStorage()
+        self.batch_writer = BatchWriter()
+        # Candles are re-fetched while open, so store them idempotently
+        self.batch_writer.register_upsert(
+            OHLCVData, OHLCVData.natural_key,
+            compare_columns=['open', 'high', 'low', 'close', 'volume']
+        )
 
         # Collection tasks
         self.tasks: Dict[str, CollectionTask] = {}
@@ -102,6 +110,10 @@ class DataCollector:
         # Start metrics cleanup
         await self.metrics.start_cleanup_task()
 
+        # Start bulk write path
+        await self.batch_writer.start()
+        await self._check_upsert_indexes()
+
         # Start scheduler
         await self.start_scheduler()
 
@@ -161,6 +173,9 @@ class DataCollector:
         # Stop quality monitoring
         await self.stop_quality_monitoring()
 
+        # Flush buffered rows
+        await self.batch_writer.stop()
+
         self.logger.info("Data collection system stopped")
 
     async def initialize_default_tasks(self):
@@ -274,6 +289,21 @@ class DataCollector:
             del self.tasks[task_id]
             self.logger.info(f"Removed collection task: {task_id}")
 
+    async def _check_upsert_indexes(self):
+        """Verify the natural-key unique indexes, migrating only when enabled."""
+        try:
+            if self.settings.WRITE_MIGRATE_UPSERT_INDEXES:
+                await self.batch_writer.ensure_upsert_indexes(deduplicate=True)
+
+            missing = await self.batch_writer.missing_upsert_indexes()
+            if missing:
+                self.logger.warning(
+                    f"Tables without a natural-key unique index, upserts into them will fail: "
+                    f"{', '.join(missing)}. Set WRITE_MIGRATE_UPSERT_INDEXES=true to deduplicate and index them."
+                )
+        except Exception as e:
+            self.logger.error(f"Failed to check natural-key indexes: {e}")
+
     async def start_scheduler(self):
         """Start the task scheduler."""
         async def scheduler():
@@ -413,9 +443,13 @@ class DataCollector:
         limit = task.parameters.get('limit', 100)
 
         try:
+            # Only request candles from the last stored one onwards; it is
+            # re-fetched because it may still have been open when stored
+            last_timestamp = await self.redis.get_last_timestamp(exchange, symbol, timeframe)
+
             # Fetch OHLCV data
             ohlcv_data = await self.exchange_manager.get_ohlcv(
-                exchange, symbol, timeframe, limit=limit
+                exchange, symbol, timeframe, since=last_timestamp, limit=limit
             )
 
             if not ohlcv_data:
@@ -431,8 +465,12 @@ class DataCollector:
                     ohlcv_data, exchange, symbol, timeframe
                 )
 
-                # Store in database
-                await self._store_ohlcv_data(processed_data)
+                # Store in database; the cursor only advances once the candles are committed
+                await self._store_ohlcv_data(
+                    processed_data,
+                    on_flushed=partial(self.redis.cache_last_timestamp,
+                                       exchange, symbol, timeframe, ohlcv_data[-1][0])
+                )
 
                 # Record metrics
                 self.metrics.record_data_quality(
@@ -583,61 +621,32 @@ class DataCollector:
             self.logger.error(f"Failed to collect ticker data for {exchange}/{symbol}: {e}")
             return None
 
-    async def _store_ohlcv_data(self, ohlcv_data: List[OHLCVData]):
-        """Store OHLCV data in database."""
+    async def _store_ohlcv_data(self, ohlcv_data: List[OHLCVData],
+                                on_flushed: Optional[Callable[[], Awaitable[Any]]] = None):
+        """Queue OHLCV data for bulk insert, awaiting ``on_flushed`` once it is committed."""
         try:
-            session = get_timescaledb_session()
-            try:
-                for ohlcv in ohlcv_data:
-                    session.add(ohlcv)
-                session.commit()
-                session.close()
-            except Exception as e:
-                session.rollback()
-                raise e
+            await self.batch_writer.write(ohlcv_data, on_flushed=on_flushed)
         except Exception as e:
             self.logger.error(f"Failed to store OHLCV data: {e}")
 
     async def _store_orderbook_data(self, orderbook_data: OrderBookData):
-        """Store order book data in database."""
+        """Queue order book data for bulk insert."""
         try:
-            session = get_timescaledb_session()
-            try:
-                session.add(orderbook_data)
-                session.commit()
-                session.close()
-            except Exception as e:
-                session.rollback()
-                raise e
+            await self.batch_writer.write(orderbook_data)
         except Exception as e:
             self.logger.error(f"Failed to store order book data: {e}")
 
     async def _store_trades_data(self, trades_data: List[TradeData]):
-        """Store trades data in database."""
+        """Queue trades data for bulk insert."""
         try:
-            session = get_timescaledb_session()
-            try:
-                for trade in trades_data:
-                    session.add(trade)
-                session.commit()
-                session.close()
-            except Exception as e:
-                session.rollback()
-                raise e
+            await self.batch_writer.write(trades_data)
         except Exception as e:
             self.logger.error(f"Failed to store trades data: {e}")
 
     async def _store_ticker_data(self, ticker_data: TickerData):
-        """Store ticker data in database."""
+        """Queue ticker data for bulk insert."""
         try:
-            session = get_timescaledb_session()
-            try:
-                session.add(ticker_data)
-                session.commit()
-                session.close()
-            except Exception as e:
-                session.rollback()
-                raise e
+            await self.batch_writer.write(ticker_data)
         except Exception as e:
             self.logger.error(f"Failed to store ticker data: {e}")
 
@@ -701,6 +710,7 @@ class DataCollector:
             'active_tasks': len([t for t in self.tasks.values() if t.is_active]),
             'running_tasks': len(self.running_tasks),
             'statistics': self.stats.copy(),
+            'storage': self.batch_writer.get_stats(),
             'exchanges': self.exchange_manager.get_exchange_status if self.exchange_manager else {},
             'tasks': [
                 {
@@ -75,9 +75,15 @@ class OHLCVData(TimescaleBase, TimeSeriesBaseModel):
     is_complete = Column(Boolean, default=True)
     last_update = Column(DateTime(timezone=True), default=func.now())
 
+    # Natural key of a candle; re-fetched candles are upserted on it
+    natural_key = ('exchange', 'symbol', 'timeframe', 'timestamp')
+
     # Indexes
     __table_args__ = (
-        Index('idx_ohlcv_exchange_symbol_timeframe', 'exchange', 'symbol', 'timeframe'),
+        # Unique index includes the hypertable time column, as TimescaleDB requires.
+        # It also covers (exchange, symbol, timeframe) prefix lookups.
+        Index('uq_ohlcv_exchange_symbol_timeframe_timestamp',
+              'exchange', 'symbol', 'timeframe', 'timestamp', unique=True),
         Index('idx_ohlcv_timestamp', 'timestamp'),
         Index('idx_ohlcv_symbol_timeframe_timestamp', 'symbol', 'timeframe', 'timestamp'),
         # TimescaleDB hypertable will be created on timestamp
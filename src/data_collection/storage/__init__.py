@@ -6,7 +6,11 @@ including TimescaleDB for time-series data and Redis for caching.
 """
 
 from .redis import RedisStorage
+from .batch_writer import BatchWriter
+from .read_through import ReadThroughCache
 
 __all__ = [
-    'RedisStorage'
+    'RedisStorage',
+    'BatchWriter',
+    'ReadThroughCache'
 ]
\ No newline at end of file
@@ -0,0 +1,515 @@
+"""
+Buffered bulk writer for time-series data.
+
+This module provides an asynchronous write path for TimescaleDB: collectors
+hand ORM records to per-table bounded buffers, which are flushed in bulk on
+size or time by a single dedicated writer thread so that database I/O never
+blocks the event loop. Failed flushes are retried with backoff and batches
+that keep failing are kept in a bounded dead-letter queue. Callers that need
+to know when their rows are committed pass an ``on_flushed`` callback.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Index, Table, delete, func, insert, inspect, or_, select, tuple_
+from sqlalchemy.sql import Select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..config.settings import get_settings
+from ..models.database import get_timescaledb_session
+
+
+@dataclass
+class UpsertSpec:
+    """Conflict handling for a table written in upsert mode."""
+    key_columns: Sequence[str]
+    compare_columns: Sequence[str]
+    table: Optional[Table] = None
+
+
+@dataclass
+class TableBuffer:
+    """Pending rows for a single table."""
+    table: Table
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    space_available: asyncio.Condition = field(default_factory=asyncio.Condition)
+    oldest_at: Optional[float] = None
+
+
+@dataclass
+class FlushTicket:
+    """Completion callback for the rows of one write() call."""
+    remaining: int
+    callback: Callable[[], Awaitable[Any]]
+
+
+class BatchWriter:
+    """
+    Bulk writer with per-table bounded buffers.
+
+    Rows are flushed when a table buffer reaches ``batch_size`` or when its
+    oldest row has waited ``flush_interval`` seconds. Each flush is a single
+    multi-row INSERT executed on the writer thread. Writers wait when a buffer
+    holds ``max_buffered_rows`` rows, which pushes back on collectors instead of
+    growing memory without bound.
+
+    Tables registered with :meth:`register_upsert` are written with
+    ``INSERT ... ON CONFLICT DO UPDATE`` on their natural key, and an existing
+    row is only rewritten when one of the compared columns actually changed.
+
+    A failed flush is retried up to ``max_retries`` times with exponential
+    backoff. Batches that still fail are moved to a bounded dead-letter queue
+    that can be drained with :meth:`drain_dead_letters` or put back with
+    :meth:`requeue_dead_letters`.
+    """
+
+    def __init__(self,
+                 session_factory: Callable[[], Session] = get_timescaledb_session,
+                 batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None,
+                 max_buffered_rows: Optional[int] = None,
+                 max_retries: Optional[int] = None,
+                 retry_backoff: Optional[float] = None,
+                 dead_letter_batches: Optional[int] = None):
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.WRITE_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.WRITE_FLUSH_INTERVAL
+        self.max_buffered_rows = max(max_buffered_rows or settings.WRITE_MAX_BUFFERED_ROWS, self.batch_size)
+        self.max_retries = settings.WRITE_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_backoff = settings.WRITE_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.logger = logging.getLogger(__name__)
+
+        self._buffers: Dict[str, TableBuffer] = {}
+        self._upserts: Dict[str, UpsertSpec] = {}
+        # id(row) -> ticket of the write() call the row belongs to
+        self._row_tickets: Dict[int, FlushTicket] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._dead_letters: Deque[Tuple[str, List[Dict[str, Any]]]] = deque(
+            maxlen=dead_letter_batches or settings.WRITE_DEAD_LETTER_BATCHES
+        )
+        # Created inside the running loop (start() or the first flush)
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self.stats = {
+            'rows_written': 0,
+            'rows_failed': 0,
+            'flushes': 0,
+            'failed_flushes': 0,
+            'retried_flushes': 0,
+            'rows_dead_lettered': 0,
+            'backpressure_waits': 0,
+            'last_flush_ms': 0.0
+        }
+
+    async def start(self):
+        """Start the background flush loop."""
+        if self._flush_task is None or self._flush_task.done():
+            self._stopping = False
+            self._flush_event = asyncio.Event()
+            if self._flush_lock is None:
+                self._flush_lock = asyncio.Lock()
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="batch-writer")
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            self.logger.info(f"Batch writer started (batch_size={self.batch_size}, "
+                             f"flush_interval={self.flush_interval}s)")
+
+    async def stop(self):
+        """Flush remaining rows and stop the writer."""
+        if self._flush_task:
+            # Let an in-flight flush finish rather than cancelling it mid-write
+            self._stopping = True
+            self._flush_event.set()
+            await self._flush_task
+            self._flush_task = None
+
+        await self.flush()
+
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        self.logger.info("Batch writer stopped")
+
+    def register_upsert(self, model: Any, key_columns: Sequence[str],
+                        compare_columns: Optional[Sequence[str]] = None):
+        """Write a model's table in upsert mode keyed on ``key_columns``."""
+        table = model.__table__
+        if compare_columns is None:
+            compare_columns = [
+                column.key for column in table.columns
+                if column.key not in key_columns and not column.primary_key
+            ]
+        self._upserts[table.name] = UpsertSpec(tuple(key_columns), tuple(compare_columns), table)
+
+    async def missing_upsert_indexes(self) -> List[str]:
+        """
+        Return the upsert tables that lack a unique index on their natural key.
+
+        ``create_all()`` does not add indexes to tables that already exist, and
+        ``ON CONFLICT`` fails without a unique index on the key.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._find_missing_upsert_indexes)
+
+    async def ensure_upsert_indexes(self, deduplicate: bool = False) -> List[str]:
+        """
+        Create the natural-key unique index of every upsert table that lacks it.
+
+        This is an explicit migration step. A table holding rows that duplicate
+        a key is skipped with a warning unless ``deduplicate`` is set, in which
+        case those rows are deleted first, keeping the most recently updated
+        one. Returns the names of the indexes that were created.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(self._create_upsert_indexes, deduplicate))
+
+    async def write(self, records: Any, on_flushed: Optional[Callable[[], Awaitable[Any]]] = None):
+        """
+        Queue one ORM record or a list of records for bulk insert.
+
+        ``on_flushed`` is awaited once every queued row has been committed; it
+        is not called for rows that end up in the dead-letter queue.
+        """
+        if records is None:
+            return
+        if not isinstance(records, (list, tuple)):
+            records = [records]
+
+        ticket = None
+        if on_flushed is not None:
+            if not records:
+                await on_flushed()
+                return
+            ticket = FlushTicket(len(records), on_flushed)
+
+        for record in records:
+            table = record.__table__
+            buffer = self._buffers.get(table.name)
+            if buffer is None:
+                buffer = TableBuffer(table=table)
+                self._buffers[table.name] = buffer
+
+            if len(buffer.rows) >= self.max_buffered_rows:
+                self.stats['backpressure_waits'] += 1
+                if self._flush_task is None:
+                    # No flush loop running, write synchronously with the caller
+                    await self._flush_buffer(buffer)
+                else:
+                    self._flush_event.set()
+                    async with buffer.space_available:
+                        await buffer.space_available.wait_for(
+                            lambda: len(buffer.rows) < self.max_buffered_rows
+                        )
+
+            if not buffer.rows:
+                buffer.oldest_at = time.monotonic()
+            row = self._to_row(record)
+            if ticket is not None:
+                self._row_tickets[id(row)] = ticket
+            buffer.rows.append(row)
+
+            if len(buffer.rows) >= self.batch_size and self._flush_event is not None:
+                self._flush_event.set()
+
+    async def flush(self):
+        """Flush every non-empty buffer."""
+        for buffer in list(self._buffers.values()):
+            if buffer.rows:
+                await self._flush_buffer(buffer)
+
+    def drain_dead_letters(self) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Remove and return the batches that exhausted their retries as (table name, rows)."""
+        batches = list(self._dead_letters)
+        self._dead_letters.clear()
+        return batches
+
+    async def requeue_dead_letters(self) -> int:
+        """Put dead-lettered rows back into their table buffers, returning the row count."""
+        requeued = 0
+        for table_name, rows in self.drain_dead_letters():
+            buffer = self._buffers[table_name]
+            if not buffer.rows:
+                buffer.oldest_at = time.monotonic()
+            buffer.rows.extend(rows)
+            requeued += len(rows)
+
+        if requeued and self._flush_event is not None:
+            self._flush_event.set()
+        return requeued
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics."""
+        return {
+            **self.stats,
+            'buffered_rows': {name: len(buffer.rows) for name, buffer in self._buffers.items()},
+            'dead_letter_batches': len(self._dead_letters)
+        }
+
+    async def _flush_loop(self):
+        """Flush buffers that are full or have waited long enough."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+
+            try:
+                now = time.monotonic()
+                for buffer in list(self._buffers.values()):
+                    if not buffer.rows:
+                        continue
+                    if (len(buffer.rows) >= self.batch_size or
+                            now - buffer.oldest_at >= self.flush_interval):
+                        await self._flush_buffer(buffer)
+            except Exception as e:
+                self.logger.error(f"Batch writer flush loop error: {e}")
+
+    async def _flush_buffer(self, buffer: TableBuffer):
+        """Hand the buffered rows of one table to the writer thread."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            while buffer.rows:
+                rows = buffer.rows[:self.batch_size]
+                del buffer.rows[:self.batch_size]
+                buffer.oldest_at = time.monotonic() if buffer.rows else None
+
+                async with buffer.space_available:
+                    buffer.space_available.notify_all()
+
+                await self._write_batch(buffer.table, rows)
+
+    async def _write_batch(self, table: Table, rows: List[Dict[str, Any]]) -> bool:
+        """Write one batch, retrying with backoff and dead-lettering it if every attempt fails."""
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats['retried_flushes'] += 1
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+            start_time = time.perf_counter()
+            try:
+                await loop.run_in_executor(self._executor, self._insert_rows, table, rows)
+                self.stats['rows_written'] += len(rows)
+                self.stats['flushes'] += 1
+                await self._complete_tickets(rows)
+                return True
+            except Exception as e:
+                self.stats['failed_flushes'] += 1
+                self.logger.warning(f"Failed to write {len(rows)} rows to {table.name} "
+                                    f"(attempt {attempt + 1}/{self.max_retries + 1}): {e}")
+            finally:
+                self.stats['last_flush_ms'] = (time.perf_counter() - start_time) * 1000
+
+        if len(self._dead_letters) == self._dead_letters.maxlen:
+            # The oldest dead-lettered batch is dropped for good
+            dropped = self._dead_letters[0][1]
+            self.stats['rows_failed'] += len(dropped)
+            for row in dropped:
+                self._row_tickets.pop(id(row), None)
+        self._dead_letters.append((table.name, rows))
+        self.stats['rows_dead_lettered'] += len(rows)
+        self.logger.error(f"Moved {len(rows)} rows for {table.name} to the dead-letter queue "
+                          f"after {self.max_retries + 1} failed attempts")
+        return False
+
+    async def _complete_tickets(self, rows: List[Dict[str, Any]]):
+        """Run the callbacks of writes whose rows are now all committed."""
+        if not self._row_tickets:
+            return
+
+        for row in rows:
+            ticket = self._row_tickets.pop(id(row), None)
+            if ticket is None:
+                continue
+            ticket.remaining -= 1
+            if ticket.remaining == 0:
+                try:
+                    await ticket.callback()
+                except Exception as e:
+                    self.logger.error(f"Flush callback failed: {e}")
+
+    def _unindexed_upserts(self, inspector: Any) -> List[UpsertSpec]:
+        """Upsert specs whose existing table has no unique index on the key."""
+        unindexed = []
+        for spec in self._upserts.values():
+            table = spec.table
+            if not inspector.has_table(table.name):
+                continue
+
+            existing = [index['column_names'] for index in inspector.get_indexes(table.name)
+                        if index.get('unique')]
+            existing += [constraint['column_names']
+                         for constraint in inspector.get_unique_constraints(table.name)]
+            if not any(set(columns) == set(spec.key_columns) for columns in existing):
+                unindexed.append(spec)
+        return unindexed
+
+    def _find_missing_upsert_indexes(self) -> List[str]:
+        """Inspect the upsert tables on the writer thread."""
+        session = self.session_factory()
+        try:
+            return [spec.table.name for spec in self._unindexed_upserts(inspect(session.connection()))]
+        finally:
+            session.close()
+
+    def _create_upsert_indexes(self, deduplicate: bool) -> List[str]:
+        """Add missing natural-key unique indexes on the writer thread."""
+        session = self.session_factory()
+        try:
+            connection = session.connection()
+            created = []
+            for spec in self._unindexed_upserts(inspect(connection)):
+                table = spec.table
+                key = set(spec.key_columns)
+                index = next(
+                    (index for index in table.indexes
+                     if index.unique and {column.key for column in index.columns} == key),
+                    None
+                )
+                if index is None:
+                    index = Index(f"uq_{table.name}_{'_'.join(spec.key_columns)}",
+                                  *(table.c[column] for column in spec.key_columns), unique=True)
+
+                duplicates = self._duplicate_keys(table, spec.key_columns)
+                duplicate_count = session.execute(
+                    select(func.count()).select_from(duplicates.subquery())
+                ).scalar()
+                if duplicate_count:
+                    if not deduplicate:
+                        self.logger.warning(f"Not creating {index.name}: {duplicate_count} rows in {table.name} "
+                                            f"duplicate a ({', '.join(spec.key_columns)}) key")
+                        continue
+                    self.logger.warning(f"Deleting {duplicate_count} rows from {table.name} that duplicate "
+                                        f"a ({', '.join(spec.key_columns)}) key")
+                    self._delete_duplicate_keys(session, table, duplicates)
+
+                index.create(connection)
+                created.append(index.name)
+                self.logger.info(f"Created unique index {index.name} on {table.name}")
+
+            session.commit()
+            return created
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @staticmethod
+    def _duplicate_keys(table: Table, key_columns: Sequence[str]) -> Select:
+        """Select the primary keys of rows sharing a key with a more recently updated row."""
+        primary_key = list(table.primary_key.columns)
+        if not primary_key:
+            raise ValueError(f"Cannot deduplicate {table.name} without a primary key")
+
+        order_by = [table.c[name].desc().nulls_last()
+                    for name in ('last_update', 'received_at') if name in table.c]
+        order_by += [column.desc() for column in primary_key]
+        ranked = select(
+            *primary_key,
+            func.row_number().over(
+                partition_by=[table.c[column] for column in key_columns], order_by=order_by
+            ).label('duplicate_rank')
+        ).subquery()
+
+        return select(*(ranked.c[column.key] for column in primary_key)).where(ranked.c.duplicate_rank > 1)
+
+    @staticmethod
+    def _delete_duplicate_keys(session: Session, table: Table, duplicates: Select) -> int:
+        """Delete the rows selected by ``duplicates``."""
+        primary_key = list(table.primary_key.columns)
+        if len(primary_key) == 1:
+            condition = primary_key[0].in_(duplicates)
+        else:
+            condition = tuple_(*primary_key).in_(duplicates)
+        return session.execute(delete(table).where(condition)).rowcount
+
+    def _insert_rows(self, table: Table, rows: List[Dict[str, Any]]):
+        """Execute a bulk insert on the writer thread."""
+        session = self.session_factory()
+        try:
+            upsert = self._upserts.get(table.name)
+            if upsert:
+                rows = self._dedupe_rows(rows, upsert.key_columns)
+
+            for batch in self._group_by_columns(rows):
+                if upsert:
+                    statement = self._upsert_statement(session, table, upsert, batch[0].keys())
+                else:
+                    statement = insert(table)
+                session.execute(statement, batch)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @staticmethod
+    def _upsert_statement(session: Session, table: Table, upsert: UpsertSpec, columns: Sequence[str]):
+        """Build an ON CONFLICT DO UPDATE statement that skips unchanged rows."""
+        dialect = session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            statement = postgresql.insert(table)
+        elif dialect == 'sqlite':
+            statement = sqlite.insert(table)
+        else:
+            raise ValueError(f"Upsert is not supported for dialect: {dialect}")
+
+        excluded = statement.excluded
+        update_columns = [
+            column for column in columns
+            if column not in upsert.key_columns and not table.c[column].primary_key
+        ]
+        changed = [
+            table.c[column].is_distinct_from(excluded[column])
+            for column in upsert.compare_columns if column in columns
+        ]
+
+        return statement.on_conflict_do_update(
+            index_elements=[table.c[column] for column in upsert.key_columns],
+            set_={column: excluded[column] for column in update_columns},
+            where=or_(*changed) if changed else None
+        )
+
+    @staticmethod
+    def _dedupe_rows(rows: Sequence[Dict[str, Any]], key_columns: Sequence[str]) -> List[Dict[str, Any]]:
+        """Keep the latest row per key, as one statement may not update a row twice."""
+        latest: Dict[tuple, Dict[str, Any]] = {}
+        for row in rows:
+            latest[tuple(row.get(column) for column in key_columns)] = row
+        return list(latest.values())
+
+    @staticmethod
+    def _group_by_columns(rows: Sequence[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split rows into groups sharing the same column set, as executemany requires."""
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(frozenset(row), []).append(row)
+        return list(groups.values())
+
+    @staticmethod
+    def _to_row(record: Any) -> Dict[str, Any]:
+        """Convert an ORM record into a column mapping, leaving defaults to the database."""
+        row = {}
+        for column in record.__table__.columns:
+            value = getattr(record, column.key, None)
+            if value is None and (column.default is not None or column.server_default is not None):
+                continue
+            row[column.key] = value
+        return row
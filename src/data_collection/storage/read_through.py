@@ -0,0 +1,136 @@
+"""
+Read-through cache for API queries.
+
+This module provides a Redis-first lookup for API handlers: cache hits are
+served directly, misses run the database loader in a worker thread and
+populate the cache, and identical concurrent misses share a single load.
+"""
+
+import asyncio
+import logging
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from ..config.settings import get_settings
+from .redis import RedisStorage
+
+
+class ReadThroughCache:
+    """Redis read-through cache with request coalescing."""
+
+    def __init__(self, redis: Optional[RedisStorage] = None, default_ttl: Optional[int] = None):
+        self.settings = get_settings()
+        self.logger = logging.getLogger(__name__)
+        self.redis = redis or RedisStorage()
+        self.default_ttl = default_ttl or self.settings.API_CACHE_TTL
+
+        # Loads in progress, keyed by cache key
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'load_errors': 0
+        }
+
+    async def get_or_load(self, key: str, loader: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+        """
+        Return the cached value for ``key``, loading it on a miss.
+
+        ``loader`` is a blocking callable (typically a database query) and is
+        executed in a worker thread. Its result must be JSON serializable.
+        Empty results are returned but not cached.
+        """
+        cached = await self.redis.get_json(key)
+        if cached is not None:
+            self.stats['hits'] += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(inflight)
+
+        # The load runs in its own task so that a cancelled caller (e.g. a
+        # disconnected client) does not cancel it for the other waiters
+        task = asyncio.get_running_loop().create_task(self._load(key, loader, ttl))
+        task.add_done_callback(partial(self._load_done, key))
+        self._inflight[key] = task
+        self.stats['misses'] += 1
+
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, loader: Callable[[], Any], ttl: Optional[int]) -> Any:
+        """Run ``loader`` in the default executor and populate the cache."""
+        try:
+            value = await asyncio.get_running_loop().run_in_executor(None, loader)
+        except Exception:
+            self.stats['load_errors'] += 1
+            raise
+
+        if value:
+            await self.redis.set_json(key, value, ttl or self.default_ttl)
+        return value
+
+    def _load_done(self, key: str, task: asyncio.Task):
+        """Forget a finished load and mark its exception as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def get_or_load_many(self, keys: Dict[str, str],
+                               loader: Callable[[List[str]], Dict[str, Any]],
+                               ttl: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Batched lookup for many items.
+
+        ``keys`` maps item ids to cache keys. All keys are read with one MGET;
+        ``loader`` is called once, in a worker thread, with the ids that missed
+        and returns a mapping of id to value. Loaded values are written back in
+        one pipelined round trip.
+        """
+        if not keys:
+            return {}
+
+        item_ids = list(keys)
+        cached_values = await self.redis.get_json_many([keys[item_id] for item_id in item_ids])
+
+        results: Dict[str, Any] = {}
+        missing: List[str] = []
+        for item_id, value in zip(item_ids, cached_values):
+            if value is not None:
+                results[item_id] = value
+            else:
+                missing.append(item_id)
+
+        self.stats['hits'] += len(results)
+        if not missing:
+            return results
+
+        self.stats['misses'] += len(missing)
+        try:
+            loaded = await asyncio.get_running_loop().run_in_executor(None, partial(loader, missing))
+        except Exception:
+            self.stats['load_errors'] += 1
+            raise
+
+        to_cache = {keys[item_id]: value for item_id, value in loaded.items() if value and item_id in keys}
+        await self.redis.set_json_many(to_cache, ttl or self.default_ttl)
+
+        results.update(loaded)
+        return results
+
+    async def invalidate(self, key: str):
+        """Drop a cached entry."""
+        await self.redis.delete(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.stats['hits'] + self.stats['misses'] + self.stats['coalesced']
+        return {
+            **self.stats,
+            'inflight': len(self._inflight),
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0
+        }
@@ -114,6 +114,41 @@ class RedisStorage:
         except Exception as e:
             self.logger.error(f"Redis SET JSON failed for key {key}: {e}")
 
+    async def get_json_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple JSON values from Redis in one round trip."""
+        if not keys:
+            return []
+
+        try:
+            if not self.redis:
+                await self.initialize()
+
+            values = await self.redis.mget(keys)
+            return [json.loads(value) if value else None for value in values]
+        except Exception as e:
+            self.logger.error(f"Redis MGET JSON failed for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+    async def set_json_many(self, data: Dict[str, Any], ttl: Optional[int] = None):
+        """Set multiple JSON values in Redis in one pipelined round trip."""
+        if not data:
+            return
+
+        try:
+            if not self.redis:
+                await self.initialize()
+
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in data.items():
+                    json_data = json.dumps(value, default=str)
+                    if ttl:
+                        pipe.setex(key, ttl, json_data)
+                    else:
+                        pipe.set(key, json_data)
+                await pipe.execute()
+        except Exception as e:
+            self.logger.error(f"Redis pipelined SET JSON failed for {len(data)} keys: {e}")
+
     async def get_hash(self, key: str) -> Optional[Dict[str, str]]:
         """Get hash data from Redis."""
         try:
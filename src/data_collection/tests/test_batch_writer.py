@@ -0,0 +1,327 @@
+"""
+Tests for the BatchWriter class.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+from sqlalchemy import create_engine, Column, Integer, Float, String, Index, func, inspect, select, text
+from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from ..storage.batch_writer import BatchWriter
+
+
+SampleBase = declarative_base()
+
+
+class SampleRow(SampleBase):
+    """Minimal time-series table for write path tests."""
+
+    __tablename__ = 'sample_rows'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    symbol = Column(String(20), nullable=False)
+    price = Column(Float, nullable=False)
+    source = Column(String(20), default='test')
+
+
+class SampleCandle(SampleBase):
+    """Candle table with a natural-key unique index."""
+
+    __tablename__ = 'sample_candles'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    symbol = Column(String(20), nullable=False)
+    timestamp = Column(Integer, nullable=False)
+    close = Column(Float, nullable=False)
+    note = Column(String(20))
+
+    __table_args__ = (
+        Index('uq_sample_candles_symbol_timestamp', 'symbol', 'timestamp', unique=True),
+    )
+
+
+@pytest.fixture
+def session_factory():
+    """Create an in-memory database shared across threads."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SampleBase.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def count_rows(session_factory) -> int:
+    session = session_factory()
+    try:
+        return session.execute(select(func.count()).select_from(SampleRow)).scalar()
+    finally:
+        session.close()
+
+
+class TestBatchWriter:
+    """Test cases for BatchWriter."""
+
+    @pytest.mark.asyncio
+    async def test_flush_on_stop(self, session_factory):
+        """Test buffered rows are written when the writer stops."""
+        writer = BatchWriter(session_factory, batch_size=100, flush_interval=60)
+        await writer.start()
+
+        await writer.write([SampleRow(symbol="BTC/USDT", price=50000.0 + i) for i in range(10)])
+        assert count_rows(session_factory) == 0
+
+        await writer.stop()
+
+        assert count_rows(session_factory) == 10
+        assert writer.stats['rows_written'] == 10
+        assert writer.stats['flushes'] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_on_batch_size(self, session_factory):
+        """Test a full batch is flushed without waiting for the interval."""
+        writer = BatchWriter(session_factory, batch_size=5, flush_interval=60)
+        await writer.start()
+
+        await writer.write([SampleRow(symbol="ETH/USDT", price=3000.0) for _ in range(5)])
+        for _ in range(50):
+            if writer.stats['rows_written'] == 5:
+                break
+            await asyncio.sleep(0.01)
+
+        assert count_rows(session_factory) == 5
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_flush_on_interval(self, session_factory):
+        """Test a partial batch is flushed after the flush interval."""
+        writer = BatchWriter(session_factory, batch_size=100, flush_interval=0.05)
+        await writer.start()
+
+        await writer.write(SampleRow(symbol="BTC/USDT", price=50000.0))
+        await asyncio.sleep(0.3)
+
+        assert count_rows(session_factory) == 1
+        await writer.stop()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_bounds_buffer(self, session_factory):
+        """Test writers are held back once the buffer is full."""
+        writer = BatchWriter(session_factory, batch_size=10, flush_interval=60, max_buffered_rows=20)
+        await writer.start()
+
+        await writer.write([SampleRow(symbol="BTC/USDT", price=1.0) for _ in range(100)])
+        assert all(size <= 20 for size in writer.get_stats()['buffered_rows'].values())
+
+        await writer.stop()
+        assert count_rows(session_factory) == 100
+
+    @pytest.mark.asyncio
+    async def test_defaults_left_to_database(self, session_factory):
+        """Test columns with defaults are omitted when unset."""
+        writer = BatchWriter(session_factory, batch_size=100, flush_interval=60)
+
+        await writer.write([SampleRow(symbol="BTC/USDT", price=1.0),
+                            SampleRow(symbol="BTC/USDT", price=2.0, source="binance")])
+        await writer.flush()
+
+        session = session_factory()
+        try:
+            sources = sorted(row.source for row in session.query(SampleRow).all())
+        finally:
+            session.close()
+        assert sources == ["binance", "test"]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_dead_lettered(self):
+        """Test rows that keep failing are retried, then kept in the dead-letter queue."""
+        def broken_factory():
+            raise RuntimeError("database unavailable")
+
+        writer = BatchWriter(broken_factory, batch_size=100, flush_interval=60,
+                             max_retries=2, retry_backoff=0.001)
+        await writer.write(SampleRow(symbol="BTC/USDT", price=1.0))
+        await writer.flush()
+
+        assert writer.stats['failed_flushes'] == 3
+        assert writer.stats['retried_flushes'] == 2
+        assert writer.stats['rows_dead_lettered'] == 1
+        assert writer.stats['rows_failed'] == 0
+
+        dead_letters = writer.drain_dead_letters()
+        assert [(name, len(rows)) for name, rows in dead_letters] == [('sample_rows', 1)]
+        assert writer.get_stats()['dead_letter_batches'] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, session_factory):
+        """Test a transient database error does not lose rows."""
+        failures = [RuntimeError("connection reset")]
+
+        def flaky_factory():
+            if failures:
+                raise failures.pop()
+            return session_factory()
+
+        writer = BatchWriter(flaky_factory, batch_size=100, flush_interval=60, retry_backoff=0.001)
+        await writer.write([SampleRow(symbol="BTC/USDT", price=float(i)) for i in range(3)])
+        await writer.flush()
+
+        assert count_rows(session_factory) == 3
+        assert writer.stats['retried_flushes'] == 1
+        assert writer.stats['rows_dead_lettered'] == 0
+
+    @pytest.mark.asyncio
+    async def test_requeue_dead_letters(self, session_factory):
+        """Test dead-lettered rows can be written once the database recovers."""
+        available = []
+
+        def factory():
+            if not available:
+                raise RuntimeError("database unavailable")
+            return session_factory()
+
+        writer = BatchWriter(factory, batch_size=100, flush_interval=60, max_retries=0)
+        await writer.write(SampleRow(symbol="BTC/USDT", price=1.0))
+        await writer.flush()
+        assert count_rows(session_factory) == 0
+
+        available.append(True)
+        assert await writer.requeue_dead_letters() == 1
+        await writer.flush()
+
+        assert count_rows(session_factory) == 1
+
+    @pytest.mark.asyncio
+    async def test_on_flushed_waits_for_commit(self, session_factory):
+        """Test the flush callback runs only after every row of the write is committed."""
+        flushed = []
+
+        async def on_flushed():
+            flushed.append(count_rows(session_factory))
+
+        writer = BatchWriter(session_factory, batch_size=2, flush_interval=60)
+        await writer.write([SampleRow(symbol="BTC/USDT", price=float(i)) for i in range(3)],
+                           on_flushed=on_flushed)
+        assert flushed == []
+
+        await writer.flush()
+        assert flushed == [3]
+
+    @pytest.mark.asyncio
+    async def test_on_flushed_skipped_for_dead_letters(self):
+        """Test the flush callback does not run when the rows could not be written."""
+        def broken_factory():
+            raise RuntimeError("database unavailable")
+
+        on_flushed = AsyncMock()
+        writer = BatchWriter(broken_factory, batch_size=100, flush_interval=60, max_retries=0)
+        await writer.write(SampleRow(symbol="BTC/USDT", price=1.0), on_flushed=on_flushed)
+        await writer.flush()
+
+        on_flushed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ensure_upsert_indexes_on_existing_table(self):
+        """Test the natural-key index is only built over duplicates when deduplication is requested."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE sample_candles (id INTEGER PRIMARY KEY, symbol VARCHAR(20) NOT NULL, "
+                "timestamp INTEGER NOT NULL, close FLOAT NOT NULL, note VARCHAR(20))"
+            ))
+            connection.execute(text(
+                "INSERT INTO sample_candles (id, symbol, timestamp, close) VALUES "
+                "(1, 'BTC/USDT', 1, 100.0), (2, 'BTC/USDT', 1, 101.0), (3, 'BTC/USDT', 2, 102.0)"
+            ))
+        factory = sessionmaker(bind=engine)
+
+        writer = BatchWriter(factory, batch_size=100, flush_interval=60)
+        writer.register_upsert(SampleCandle, ['symbol', 'timestamp'])
+
+        assert await writer.missing_upsert_indexes() == ['sample_candles']
+        assert await writer.ensure_upsert_indexes() == []
+        assert await writer.missing_upsert_indexes() == ['sample_candles']
+
+        assert await writer.ensure_upsert_indexes(deduplicate=True) == ['uq_sample_candles_symbol_timestamp']
+        assert await writer.missing_upsert_indexes() == []
+        assert await writer.ensure_upsert_indexes(deduplicate=True) == []
+        assert any(index['unique'] for index in inspect(engine).get_indexes('sample_candles'))
+
+        await writer.write(SampleCandle(symbol="BTC/USDT", timestamp=1, close=105.0))
+        await writer.flush()
+
+        session = factory()
+        try:
+            rows = session.execute(
+                select(SampleCandle.id, SampleCandle.timestamp, SampleCandle.close).order_by(SampleCandle.timestamp)
+            ).all()
+        finally:
+            session.close()
+        assert [(row.id, row.timestamp, row.close) for row in rows] == [(2, 1, 105.0), (3, 2, 102.0)]
+
+    @pytest.mark.asyncio
+    async def test_ensure_upsert_indexes_without_duplicates(self):
+        """Test a table without duplicate keys is indexed without deleting anything."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE sample_candles (id INTEGER PRIMARY KEY, symbol VARCHAR(20) NOT NULL, "
+                "timestamp INTEGER NOT NULL, close FLOAT NOT NULL, note VARCHAR(20))"
+            ))
+            connection.execute(text(
+                "INSERT INTO sample_candles (id, symbol, timestamp, close) VALUES "
+                "(1, 'BTC/USDT', 1, 100.0), (2, 'BTC/USDT', 2, 101.0)"
+            ))
+
+        writer = BatchWriter(sessionmaker(bind=engine), batch_size=100, flush_interval=60)
+        writer.register_upsert(SampleCandle, ['symbol', 'timestamp'])
+
+        assert await writer.ensure_upsert_indexes() == ['uq_sample_candles_symbol_timestamp']
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM sample_candles")).scalar() == 2
+
+    @pytest.mark.asyncio
+    async def test_upsert_updates_changed_rows_only(self, session_factory):
+        """Test upsert mode rewrites a candle only when compared columns change."""
+        writer = BatchWriter(session_factory, batch_size=100, flush_interval=60)
+        writer.register_upsert(SampleCandle, ('symbol', 'timestamp'), compare_columns=['close'])
+
+        await writer.write([SampleCandle(symbol="BTC/USDT", timestamp=1, close=100.0, note="first"),
+                            SampleCandle(symbol="BTC/USDT", timestamp=2, close=200.0, note="first")])
+        await writer.flush()
+
+        # Candle 1 unchanged, candle 2 still open and changed, candle 3 new
+        await writer.write([SampleCandle(symbol="BTC/USDT", timestamp=1, close=100.0, note="second"),
+                            SampleCandle(symbol="BTC/USDT", timestamp=2, close=210.0, note="second"),
+                            SampleCandle(symbol="BTC/USDT", timestamp=3, close=300.0, note="second")])
+        await writer.flush()
+
+        session = session_factory()
+        try:
+            rows = {row.timestamp: (row.close, row.note) for row in session.query(SampleCandle).all()}
+        finally:
+            session.close()
+
+        assert rows == {1: (100.0, "first"), 2: (210.0, "second"), 3: (300.0, "second")}
+        assert writer.stats['rows_failed'] == 0
+
+    @pytest.mark.asyncio
+    async def test_upsert_dedupes_within_batch(self, session_factory):
+        """Test repeated keys in one batch keep the latest row."""
+        writer = BatchWriter(session_factory, batch_size=100, flush_interval=60)
+        writer.register_upsert(SampleCandle, ('symbol', 'timestamp'))
+
+        await writer.write([SampleCandle(symbol="ETH/USDT", timestamp=1, close=1.0),
+                            SampleCandle(symbol="ETH/USDT", timestamp=1, close=2.0)])
+        await writer.flush()
+
+        session = session_factory()
+        try:
+            closes = [row.close for row in session.query(SampleCandle).all()]
+        finally:
+            session.close()
+
+        assert closes == [2.0]
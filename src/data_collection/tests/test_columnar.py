@@ -0,0 +1,105 @@
+"""
+Tests for columnar market data encodings.
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime, timezone
+from sqlalchemy import create_engine, Column, Integer, Float, DateTime, func, select
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from ..utils.columnar import (
+    ARROW_STREAM_MEDIA_TYPE, NUMPY_COLUMNS_MEDIA_TYPE, PYARROW_AVAILABLE,
+    decode_numpy_columns, encode_arrow_stream, encode_numpy_columns, fetch_columns,
+    negotiate_media_type
+)
+
+
+SampleBase = declarative_base()
+
+
+class SampleCandle(SampleBase):
+    """Minimal candle table for cursor-to-column tests."""
+
+    __tablename__ = 'sample_candles'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    timestamp = Column(DateTime, nullable=False)
+    close = Column(Float, nullable=False)
+    volume = Column(Float, nullable=False)
+
+
+@pytest.fixture
+def session():
+    """Create an in-memory database with a few candles."""
+    engine = create_engine("sqlite://")
+    SampleBase.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        SampleCandle(timestamp=datetime(2024, 1, 1, hour), close=100.0 + hour, volume=10.0 * hour)
+        for hour in range(5)
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def columns():
+    """Create sample OHLCV columns."""
+    return {
+        'timestamp': np.array([1704067200000, 1704070800000], dtype=np.int64),
+        'close': np.array([42000.5, 42100.25]),
+        'volume': np.array([12.5, 8.0])
+    }
+
+
+class TestColumnar:
+    """Test cases for columnar encodings."""
+
+    def test_fetch_columns_reads_in_chunks(self, session):
+        """Test cursor rows are gathered into contiguous columns across chunks."""
+        statement = select(SampleCandle.close, SampleCandle.volume).order_by(SampleCandle.timestamp)
+
+        result = fetch_columns(session, statement, ['close', 'volume'], chunk_size=2)
+
+        np.testing.assert_array_equal(result['close'], [100.0, 101.0, 102.0, 103.0, 104.0])
+        np.testing.assert_array_equal(result['volume'], [0.0, 10.0, 20.0, 30.0, 40.0])
+        assert result['close'].flags['C_CONTIGUOUS']
+
+    def test_fetch_columns_empty_result(self, session):
+        """Test an empty result yields empty columns."""
+        statement = select(SampleCandle.close).where(SampleCandle.close < 0)
+
+        result = fetch_columns(session, statement, ['close'])
+
+        assert result['close'].shape == (0,)
+
+    def test_numpy_columns_round_trip(self, columns):
+        """Test the binary column format decodes to the original arrays."""
+        payload = encode_numpy_columns(columns, {'symbol': 'BTC/USDT'})
+        decoded = decode_numpy_columns(payload)
+
+        assert decoded['metadata'] == {'symbol': 'BTC/USDT'}
+        for name, values in columns.items():
+            np.testing.assert_array_equal(decoded['columns'][name], values)
+            assert decoded['columns'][name].dtype == values.dtype
+
+    def test_negotiate_media_type(self):
+        """Test Accept header negotiation."""
+        assert negotiate_media_type(None) is None
+        assert negotiate_media_type("application/json") is None
+        assert negotiate_media_type(f"application/json;q=0.5, {NUMPY_COLUMNS_MEDIA_TYPE}") == NUMPY_COLUMNS_MEDIA_TYPE
+        assert negotiate_media_type(f"{ARROW_STREAM_MEDIA_TYPE}; q=1") == ARROW_STREAM_MEDIA_TYPE
+
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+    def test_arrow_stream_round_trip(self, columns):
+        """Test the Arrow IPC stream decodes to the original columns."""
+        import pyarrow as pa
+
+        payload = encode_arrow_stream(columns, {'symbol': 'BTC/USDT'})
+        table = pa.ipc.open_stream(payload).read_all()
+
+        assert table.column_names == list(columns)
+        np.testing.assert_array_equal(table.column('close').to_numpy(), columns['close'])
+        assert table.schema.metadata[b'symbol'] == b'BTC/USDT'
@@ -184,6 +184,8 @@ class TestDataCollector:
 
         # Mock data storage
         data_collector._store_ohlcv_data = AsyncMock()
+        data_collector.redis = AsyncMock()
+        data_collector.redis.get_last_timestamp.return_value = 1640991600000
 
         # Mock validation
         data_collector.validator.validate_ohlcv = MagicMock(return_value=MagicMock(
@@ -208,10 +210,18 @@ class TestDataCollector:
         # Verify the data was collected and processed
         assert result == ohlcv_data
         data_collector.exchange_manager.get_ohlcv.assert_called_once_with(
-            "binance", "BTC/USDT", "1h", limit=100
+            "binance", "BTC/USDT", "1h", since=1640991600000, limit=100
         )
         data_collector.data_processor.process_ohlcv.assert_called_once()
-        data_collector._store_ohlcv_data.assert_called_once_with(processed_data)
+        data_collector._store_ohlcv_data.assert_called_once()
+        assert data_collector._store_ohlcv_data.call_args[0][0] == processed_data
+
+        # The cursor only advances once the writer reports the rows as committed
+        data_collector.redis.cache_last_timestamp.assert_not_called()
+        await data_collector._store_ohlcv_data.call_args[1]['on_flushed']()
+        data_collector.redis.cache_last_timestamp.assert_called_once_with(
+            "binance", "BTC/USDT", "1h", 1640995260000
+        )
 
     @pytest.mark.asyncio
     async def test_collect_orderbook_data(self, data_collector):
@@ -359,6 +369,8 @@ class TestDataCollector:
         """Test error handling during data collection."""
         # Mock exchange manager to raise an error
         data_collector.exchange_manager.get_ohlcv = AsyncMock(side_effect=Exception("Network error"))
+        data_collector.redis = AsyncMock()
+        data_collector.redis.get_last_timestamp.return_value = None
 
         # Create and execute task
         task = CollectionTask(
@@ -388,6 +400,8 @@ class TestDataCollector:
         ]
 
         data_collector.exchange_manager.get_ohlcv = AsyncMock(return_value=ohlcv_data)
+        data_collector.redis = AsyncMock()
+        data_collector.redis.get_last_timestamp.return_value = None
 
         # Mock validation to return low quality score
         data_collector.validator.validate_ohlcv = MagicMock(return_value=MagicMock(
@@ -411,6 +425,7 @@ class TestDataCollector:
 
         # Should return None due to low quality
         assert result is None
+        data_collector.redis.cache_last_timestamp.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_collection_status(self, data_collector):
@@ -458,6 +473,8 @@ class TestDataCollector:
         data_collector.exchange_manager.get_ohlcv = AsyncMock(return_value=ohlcv_data)
         data_collector.data_processor.process_ohlcv = AsyncMock(return_value=[MagicMock()])
         data_collector._store_ohlcv_data = AsyncMock()
+        data_collector.redis = AsyncMock()
+        data_collector.redis.get_last_timestamp.return_value = None
         data_collector.validator.validate_ohlcv = MagicMock(return_value=MagicMock(
             overall_score=0.99,
             accuracy_score=0.99,
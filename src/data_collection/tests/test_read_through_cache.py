@@ -0,0 +1,175 @@
+"""
+Tests for the ReadThroughCache class.
+"""
+
+import pytest
+import asyncio
+import threading
+import time
+
+from ..storage.read_through import ReadThroughCache
+
+
+class FakeRedis:
+    """In-memory stand-in for RedisStorage JSON helpers."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.round_trips = 0
+
+    async def get_json(self, key):
+        return self.data.get(key)
+
+    async def set_json(self, key, data, ttl=None):
+        self.data[key] = data
+        self.ttls[key] = ttl
+
+    async def get_json_many(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    async def set_json_many(self, data, ttl=None):
+        if data:
+            self.round_trips += 1
+        for key, value in data.items():
+            await self.set_json(key, value, ttl)
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def cache():
+    """Create a cache backed by the in-memory Redis."""
+    return ReadThroughCache(redis=FakeRedis(), default_ttl=5)
+
+
+class TestReadThroughCache:
+    """Test cases for ReadThroughCache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_loader(self, cache):
+        """Test cached values are served without touching the database."""
+        cache.redis.data["ticker:binance:BTC/USDT"] = {"last": 50000.0}
+
+        def loader():
+            raise AssertionError("loader should not run on a cache hit")
+
+        result = await cache.get_or_load("ticker:binance:BTC/USDT", loader)
+
+        assert result == {"last": 50000.0}
+        assert cache.stats['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_populates_cache(self, cache):
+        """Test a miss loads from the database in a worker thread and caches the result."""
+        main_thread = threading.get_ident()
+        loader_threads = []
+
+        def loader():
+            loader_threads.append(threading.get_ident())
+            return [{"close": 1.0}]
+
+        result = await cache.get_or_load("api:ohlcv:key", loader, ttl=30)
+
+        assert result == [{"close": 1.0}]
+        assert cache.redis.data["api:ohlcv:key"] == [{"close": 1.0}]
+        assert cache.redis.ttls["api:ohlcv:key"] == 30
+        assert loader_threads and loader_threads[0] != main_thread
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_are_coalesced(self, cache):
+        """Test identical concurrent queries share one database load."""
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return [{"price": 1.0}]
+
+        results = await asyncio.gather(*(cache.get_or_load("api:trades:key", loader) for _ in range(10)))
+
+        assert len(calls) == 1
+        assert all(result == [{"price": 1.0}] for result in results)
+        assert cache.stats['coalesced'] == 9
+
+    @pytest.mark.asyncio
+    async def test_empty_result_not_cached(self, cache):
+        """Test empty results are returned but not cached."""
+        result = await cache.get_or_load("orderbook:binance:BTC/USDT", lambda: None)
+
+        assert result is None
+        assert "orderbook:binance:BTC/USDT" not in cache.redis.data
+
+    @pytest.mark.asyncio
+    async def test_loader_error_propagates_to_waiters(self, cache):
+        """Test a failed load raises for every coalesced request."""
+        def loader():
+            time.sleep(0.05)
+            raise RuntimeError("database unavailable")
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("api:ohlcv:key", loader) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert cache.stats['load_errors'] == 1
+        assert not cache._inflight
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_waiters(self, cache):
+        """Test the shared load survives the request that started it being cancelled."""
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return [{"price": 1.0}]
+
+        first = asyncio.ensure_future(cache.get_or_load("api:trades:key", loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.get_or_load("api:trades:key", loader))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        result = await waiter
+
+        assert first.cancelled()
+        assert result == [{"price": 1.0}]
+        assert len(calls) == 1
+        assert cache.redis.data["api:trades:key"] == [{"price": 1.0}]
+        assert not cache._inflight
+
+    @pytest.mark.asyncio
+    async def test_many_loads_only_misses_in_one_call(self, cache):
+        """Test batched lookups read all keys at once and load misses together."""
+        cache.redis.data["ticker:binance:BTC/USDT"] = {"last": 1.0}
+        loader_calls = []
+
+        def loader(symbols):
+            loader_calls.append(list(symbols))
+            return {symbol: {"last": 2.0} for symbol in symbols if symbol != "DOGE/USDT"}
+
+        keys = {symbol: f"ticker:binance:{symbol}" for symbol in ["BTC/USDT", "ETH/USDT", "SOL/USDT", "DOGE/USDT"]}
+        results = await cache.get_or_load_many(keys, loader)
+
+        assert loader_calls == [["ETH/USDT", "SOL/USDT", "DOGE/USDT"]]
+        assert results == {"BTC/USDT": {"last": 1.0}, "ETH/USDT": {"last": 2.0}, "SOL/USDT": {"last": 2.0}}
+        assert cache.redis.data["ticker:binance:SOL/USDT"] == {"last": 2.0}
+        assert "ticker:binance:DOGE/USDT" not in cache.redis.data
+        assert cache.redis.round_trips == 2
+
+    @pytest.mark.asyncio
+    async def test_many_all_hits_skip_loader(self, cache):
+        """Test batched lookups do not touch the database when everything is cached."""
+        cache.redis.data.update({"orderbook:binance:A": {"mid_price": 1.0}, "orderbook:binance:B": {"mid_price": 2.0}})
+
+        def loader(symbols):
+            raise AssertionError("loader should not run when all keys hit")
+
+        results = await cache.get_or_load_many({"A": "orderbook:binance:A", "B": "orderbook:binance:B"}, loader)
+
+        assert results == {"A": {"mid_price": 1.0}, "B": {"mid_price": 2.0}}
+        assert cache.stats['hits'] == 2
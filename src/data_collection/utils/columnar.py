@@ -0,0 +1,135 @@
+"""
+Columnar encodings for bulk market data responses.
+
+This module reads query results straight into contiguous NumPy column
+buffers and serializes them either as an Arrow IPC stream (when pyarrow is
+installed) or as a compact self-describing binary format that only needs
+NumPy to decode.
+"""
+
+import json
+import logging
+import struct
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+NUMPY_COLUMNS_MEDIA_TYPE = "application/x-numpy-columns"
+
+# Little-endian uint32 holding the length of the JSON header
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+def fetch_columns(session, statement, names: List[str], chunk_size: int = 10000,
+                  dtype: Any = np.float64) -> Dict[str, np.ndarray]:
+    """
+    Execute a select of numeric columns and return one contiguous array per column.
+
+    Rows are pulled from the cursor in chunks and converted a chunk at a time,
+    so no ORM or per-row response objects are created.
+
+    Args:
+        session: SQLAlchemy session
+        statement: Select statement whose columns match ``names``
+        names: Output column names, in select order
+        chunk_size: Number of rows fetched per cursor round trip
+        dtype: NumPy dtype of the returned columns
+
+    Returns:
+        Dictionary of column name to 1-D array
+    """
+    result = session.execute(statement)
+    blocks = []
+    try:
+        while True:
+            rows = result.fetchmany(chunk_size)
+            if not rows:
+                break
+            blocks.append(np.asarray(rows, dtype=dtype).reshape(len(rows), len(names)))
+    finally:
+        result.close()
+
+    if blocks:
+        matrix = np.concatenate(blocks) if len(blocks) > 1 else blocks[0]
+    else:
+        matrix = np.empty((0, len(names)), dtype=dtype)
+
+    return {name: np.ascontiguousarray(matrix[:, index]) for index, name in enumerate(names)}
+
+
+def negotiate_media_type(accept: Optional[str]) -> Optional[str]:
+    """Return the columnar media type requested in an Accept header, if any."""
+    if not accept:
+        return None
+
+    requested = [part.split(";")[0].strip().lower() for part in accept.split(",")]
+    for media_type in (ARROW_STREAM_MEDIA_TYPE, NUMPY_COLUMNS_MEDIA_TYPE):
+        if media_type in requested:
+            return media_type
+    return None
+
+
+def encode_arrow_stream(columns: Dict[str, np.ndarray], metadata: Optional[Dict[str, str]] = None) -> bytes:
+    """Serialize columns as a single-batch Arrow IPC stream."""
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required for Arrow responses")
+
+    batch = pa.RecordBatch.from_arrays(
+        [pa.array(values) for values in columns.values()],
+        names=list(columns)
+    )
+    if metadata:
+        batch = batch.replace_schema_metadata(metadata)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_numpy_columns(columns: Dict[str, np.ndarray], metadata: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Serialize columns as a length-prefixed JSON header followed by raw buffers.
+
+    The header lists each column's name, dtype and length in buffer order;
+    buffers are little-endian and written back to back.
+    """
+    arrays = {name: np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+              for name, values in columns.items()}
+    header = json.dumps({
+        'columns': [
+            {'name': name, 'dtype': values.dtype.str, 'length': len(values)}
+            for name, values in arrays.items()
+        ],
+        'metadata': metadata or {}
+    }).encode("utf-8")
+
+    parts = [_HEADER_LENGTH.pack(len(header)), header]
+    parts.extend(values.tobytes() for values in arrays.values())
+    return b"".join(parts)
+
+
+def decode_numpy_columns(payload: bytes) -> Dict[str, Any]:
+    """Decode :func:`encode_numpy_columns` output into zero-copy arrays and metadata."""
+    (header_length,) = _HEADER_LENGTH.unpack_from(payload, 0)
+    offset = _HEADER_LENGTH.size
+    header = json.loads(payload[offset:offset + header_length].decode("utf-8"))
+    offset += header_length
+
+    columns = {}
+    for column in header['columns']:
+        dtype = np.dtype(column['dtype'])
+        columns[column['name']] = np.frombuffer(payload, dtype=dtype, count=column['length'], offset=offset)
+        offset += dtype.itemsize * column['length']
+
+    return {'columns': columns, 'metadata': header['metadata']}
@@ -0,0 +1,403 @@
+"""
+Binary codec for indicator results.
+
+Encodes the nested structures held by ``IndicatorResult`` (pandas Series and
+indexes, numpy arrays, scalars, containers, registered enums and dataclasses)
+into a compact tagged binary format. Numeric arrays are written as raw
+little-endian buffers, so results round-trip exactly and can be shared
+between processes through Redis.
+
+Layout: ``MAGIC (3s) | version (B) | flags (B)`` followed by the body, which
+is zlib-compressed when ``FLAG_COMPRESSED`` is set.
+"""
+
+import dataclasses
+import datetime
+import struct
+import zlib
+from enum import Enum
+from typing import Any, Dict, Type
+
+import numpy as np
+import pandas as pd
+
+
+MAGIC = b"IRC"
+VERSION = 1
+FLAG_COMPRESSED = 0x01
+
+_HEADER = struct.Struct("<3sBB")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+# Type tags
+_NONE = b"N"
+_TRUE = b"T"
+_FALSE = b"F"
+_INT = b"i"
+_BIG_INT = b"I"
+_FLOAT = b"f"
+_STR = b"s"
+_BYTES = b"b"
+_LIST = b"l"
+_TUPLE = b"t"
+_DICT = b"d"
+_ARRAY = b"a"
+_OBJECT_ARRAY = b"o"
+_NUMPY_SCALAR = b"g"
+_SERIES = b"S"
+_DATAFRAME = b"D"
+_RANGE_INDEX = b"R"
+_INDEX = b"X"
+_TIMESTAMP = b"P"
+_DATETIME = b"z"
+_ENUM = b"e"
+_DATACLASS = b"c"
+
+_registered_types: Dict[str, Type] = {}
+
+
+class CodecError(ValueError):
+    """Raised when a value cannot be encoded or a payload cannot be decoded."""
+
+
+def register_codec_type(cls: Type) -> Type:
+    """
+    Allow an enum or dataclass to be encoded by the codec.
+
+    Types are resolved by qualified name on decode, so only registered
+    classes can ever be instantiated from a payload. Usable as a decorator.
+    """
+    if not (issubclass(cls, Enum) or dataclasses.is_dataclass(cls)):
+        raise TypeError(f"Only enums and dataclasses can be registered: {cls!r}")
+    _registered_types[cls.__qualname__] = cls
+    return cls
+
+
+def encode(value: Any, compress: bool = True, compression_threshold: int = 1024,
+           compression_level: int = 1) -> bytes:
+    """
+    Encode a value into a binary payload.
+
+    Args:
+        value: Value to encode
+        compress: Whether to zlib-compress large bodies
+        compression_threshold: Minimum body size in bytes before compressing
+        compression_level: zlib compression level
+
+    Returns:
+        Encoded payload
+    """
+    parts = []
+    _encode_value(value, parts)
+    body = b"".join(parts)
+
+    flags = 0
+    if compress and len(body) >= compression_threshold:
+        body = zlib.compress(body, compression_level)
+        flags |= FLAG_COMPRESSED
+
+    return _HEADER.pack(MAGIC, VERSION, flags) + body
+
+
+def decode(payload: bytes) -> Any:
+    """
+    Decode a payload produced by :func:`encode`.
+
+    Args:
+        payload: Encoded payload
+
+    Returns:
+        Decoded value
+
+    Raises:
+        CodecError: If the payload is truncated or malformed
+    """
+    if len(payload) < _HEADER.size:
+        raise CodecError("Payload too short")
+
+    magic, version, flags = _HEADER.unpack_from(payload, 0)
+    if magic != MAGIC or version != VERSION:
+        raise CodecError(f"Unsupported payload header: {magic!r} v{version}")
+
+    try:
+        body = memoryview(payload)[_HEADER.size:]
+        if flags & FLAG_COMPRESSED:
+            body = memoryview(zlib.decompress(body))
+
+        value, offset = _decode_value(body, 0)
+    except CodecError:
+        raise
+    except (struct.error, zlib.error, ValueError, TypeError, KeyError, IndexError) as e:
+        raise CodecError(f"Malformed payload: {e}") from e
+    if offset != len(body):
+        raise CodecError("Trailing bytes after payload body")
+    return value
+
+
+def _encode_str(value: str, parts: list) -> None:
+    data = value.encode("utf-8")
+    parts.append(_U32.pack(len(data)))
+    parts.append(data)
+
+
+def _encode_array(array: np.ndarray, parts: list) -> None:
+    if array.dtype.hasobject:
+        parts.append(_OBJECT_ARRAY)
+        _encode_value(array.shape, parts)
+        _encode_value(array.ravel().tolist(), parts)
+        return
+
+    dtype = array.dtype.newbyteorder("<") if array.dtype.byteorder == ">" else array.dtype
+    data = array.astype(dtype, copy=False).tobytes(order="C")
+
+    parts.append(_ARRAY)
+    _encode_str(dtype.str, parts)
+    _encode_value(array.shape, parts)
+    parts.append(_U32.pack(len(data)))
+    parts.append(data)
+
+
+def _encode_index(index: pd.Index, parts: list) -> None:
+    if isinstance(index, pd.RangeIndex):
+        parts.append(_RANGE_INDEX)
+        _encode_value((index.start, index.stop, index.step, index.name), parts)
+        return
+
+    parts.append(_INDEX)
+    _encode_value(index.name, parts)
+    if isinstance(index, pd.DatetimeIndex):
+        # Naive UTC datetime64 values keep their unit; the zone is stored alongside
+        _encode_str("datetime", parts)
+        _encode_value(str(index.tz) if index.tz is not None else None, parts)
+        _encode_value(index.freqstr, parts)
+        _encode_array((index.tz_convert(None) if index.tz is not None else index).to_numpy(), parts)
+    else:
+        _encode_str(str(index.dtype), parts)
+        _encode_array(np.asarray(index), parts)
+
+
+def _encode_value(value: Any, parts: list) -> None:
+    # Order matters: bool before int, numpy scalars before float/int
+    if value is None:
+        parts.append(_NONE)
+    elif value is True:
+        parts.append(_TRUE)
+    elif value is False:
+        parts.append(_FALSE)
+    elif isinstance(value, np.generic):
+        parts.append(_NUMPY_SCALAR)
+        _encode_array(np.asarray(value), parts)
+    elif isinstance(value, Enum):
+        _check_registered(type(value))
+        parts.append(_ENUM)
+        _encode_str(type(value).__qualname__, parts)
+        _encode_value(value.value, parts)
+    elif isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            parts.append(_INT)
+            parts.append(_I64.pack(value))
+        else:
+            parts.append(_BIG_INT)
+            _encode_str(str(value), parts)
+    elif isinstance(value, float):
+        parts.append(_FLOAT)
+        parts.append(_F64.pack(value))
+    elif isinstance(value, str):
+        parts.append(_STR)
+        _encode_str(value, parts)
+    elif isinstance(value, (bytes, bytearray)):
+        parts.append(_BYTES)
+        parts.append(_U32.pack(len(value)))
+        parts.append(bytes(value))
+    elif isinstance(value, pd.Series):
+        parts.append(_SERIES)
+        _encode_value(value.name, parts)
+        _encode_str(str(value.dtype), parts)
+        _encode_index(value.index, parts)
+        if isinstance(value.dtype, np.dtype):
+            _encode_array(value.to_numpy(), parts)
+        else:
+            _encode_array(value.to_numpy(dtype=object), parts)
+    elif isinstance(value, pd.DataFrame):
+        parts.append(_DATAFRAME)
+        _encode_index(value.index, parts)
+        _encode_value(list(value.columns), parts)
+        _encode_value([value.iloc[:, i] for i in range(value.shape[1])], parts)
+    elif isinstance(value, pd.Index):
+        _encode_index(value, parts)
+    elif isinstance(value, pd.Timestamp):
+        parts.append(_TIMESTAMP)
+        _encode_value(str(value.tz) if value.tz is not None else None, parts)
+        _encode_array(np.asarray((value.tz_convert(None) if value.tz is not None else value).to_datetime64()), parts)
+    elif isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        parts.append(_DATETIME)
+        _encode_str(type(value).__name__, parts)
+        _encode_str(value.isoformat(), parts)
+    elif isinstance(value, np.ndarray):
+        _encode_array(value, parts)
+    elif isinstance(value, list):
+        parts.append(_LIST)
+        parts.append(_U32.pack(len(value)))
+        for item in value:
+            _encode_value(item, parts)
+    elif isinstance(value, tuple):
+        parts.append(_TUPLE)
+        parts.append(_U32.pack(len(value)))
+        for item in value:
+            _encode_value(item, parts)
+    elif isinstance(value, dict):
+        parts.append(_DICT)
+        parts.append(_U32.pack(len(value)))
+        for key, item in value.items():
+            _encode_value(key, parts)
+            _encode_value(item, parts)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        _check_registered(type(value))
+        parts.append(_DATACLASS)
+        _encode_str(type(value).__qualname__, parts)
+        _encode_value({field.name: getattr(value, field.name) for field in dataclasses.fields(value)}, parts)
+    else:
+        raise CodecError(f"Cannot encode value of type {type(value).__name__}")
+
+
+def _check_registered(cls: Type) -> None:
+    if _registered_types.get(cls.__qualname__) is not cls:
+        raise CodecError(f"Type {cls.__qualname__} is not registered with the codec")
+
+
+def _read_span(body: memoryview, offset: int, length: int) -> memoryview:
+    if offset + length > len(body):
+        raise CodecError("Truncated payload")
+    return body[offset:offset + length]
+
+
+def _read_str(body: memoryview, offset: int):
+    (length,) = _U32.unpack_from(body, offset)
+    offset += _U32.size
+    return str(_read_span(body, offset, length), "utf-8"), offset + length
+
+
+def _decode_value(body: memoryview, offset: int):
+    tag = bytes(_read_span(body, offset, 1))
+    offset += 1
+
+    if tag == _NONE:
+        return None, offset
+    if tag == _TRUE:
+        return True, offset
+    if tag == _FALSE:
+        return False, offset
+    if tag == _INT:
+        return _I64.unpack_from(body, offset)[0], offset + _I64.size
+    if tag == _BIG_INT:
+        text, offset = _read_str(body, offset)
+        return int(text), offset
+    if tag == _FLOAT:
+        return _F64.unpack_from(body, offset)[0], offset + _F64.size
+    if tag == _STR:
+        return _read_str(body, offset)
+    if tag == _BYTES:
+        (length,) = _U32.unpack_from(body, offset)
+        offset += _U32.size
+        return bytes(_read_span(body, offset, length)), offset + length
+    if tag in (_LIST, _TUPLE):
+        (length,) = _U32.unpack_from(body, offset)
+        offset += _U32.size
+        items = []
+        for _ in range(length):
+            item, offset = _decode_value(body, offset)
+            items.append(item)
+        return (items if tag == _LIST else tuple(items)), offset
+    if tag == _DICT:
+        (length,) = _U32.unpack_from(body, offset)
+        offset += _U32.size
+        result = {}
+        for _ in range(length):
+            key, offset = _decode_value(body, offset)
+            result[key], offset = _decode_value(body, offset)
+        return result, offset
+    if tag == _ARRAY:
+        dtype, offset = _read_str(body, offset)
+        shape, offset = _decode_value(body, offset)
+        (length,) = _U32.unpack_from(body, offset)
+        offset += _U32.size
+        array = np.frombuffer(_read_span(body, offset, length), dtype=np.dtype(dtype)).reshape(shape).copy()
+        return array, offset + length
+    if tag == _OBJECT_ARRAY:
+        shape, offset = _decode_value(body, offset)
+        items, offset = _decode_value(body, offset)
+        array = np.empty(len(items), dtype=object)
+        array[:] = items
+        return array.reshape(shape), offset
+    if tag == _NUMPY_SCALAR:
+        array, offset = _decode_value(body, offset)
+        return array[()], offset
+    if tag == _SERIES:
+        name, offset = _decode_value(body, offset)
+        dtype, offset = _read_str(body, offset)
+        index, offset = _decode_value(body, offset)
+        values, offset = _decode_value(body, offset)
+        if values.dtype == object and dtype != "object":
+            values = pd.array(values, dtype=dtype)
+        return pd.Series(values, index=index, name=name, copy=False), offset
+    if tag == _DATAFRAME:
+        index, offset = _decode_value(body, offset)
+        columns, offset = _decode_value(body, offset)
+        series, offset = _decode_value(body, offset)
+        frame = pd.concat(series, axis=1) if series else pd.DataFrame(index=index)
+        frame.columns = columns
+        frame.index = index
+        return frame, offset
+    if tag == _RANGE_INDEX:
+        (start, stop, step, name), offset = _decode_value(body, offset)
+        return pd.RangeIndex(start, stop, step, name=name), offset
+    if tag == _INDEX:
+        name, offset = _decode_value(body, offset)
+        dtype, offset = _read_str(body, offset)
+        if dtype == "datetime":
+            tz, offset = _decode_value(body, offset)
+            freq, offset = _decode_value(body, offset)
+            values, offset = _decode_value(body, offset)
+            index = pd.DatetimeIndex(values, name=name)
+            if tz:
+                index = index.tz_localize("UTC").tz_convert(tz)
+            if freq:
+                index.freq = freq
+            return index, offset
+        values, offset = _decode_value(body, offset)
+        return pd.Index(values, dtype=dtype, name=name), offset
+    if tag == _TIMESTAMP:
+        tz, offset = _decode_value(body, offset)
+        value, offset = _decode_value(body, offset)
+        timestamp = pd.Timestamp(value[()])
+        return (timestamp.tz_localize("UTC").tz_convert(tz) if tz else timestamp), offset
+    if tag == _DATETIME:
+        kind, offset = _read_str(body, offset)
+        text, offset = _read_str(body, offset)
+        parser = {"datetime": datetime.datetime, "date": datetime.date, "time": datetime.time}[kind]
+        return parser.fromisoformat(text), offset
+    if tag == _ENUM:
+        name, offset = _read_str(body, offset)
+        value, offset = _decode_value(body, offset)
+        return _resolve_type(name)(value), offset
+    if tag == _DATACLASS:
+        name, offset = _read_str(body, offset)
+        fields, offset = _decode_value(body, offset)
+        cls = _resolve_type(name)
+        init_fields = {field.name for field in dataclasses.fields(cls) if field.init}
+        instance = cls(**{key: value for key, value in fields.items() if key in init_fields})
+        for key, value in fields.items():
+            if key not in init_fields:
+                object.__setattr__(instance, key, value)
+        return instance, offset
+
+    raise CodecError(f"Unknown type tag {tag!r}")
+
+
+def _resolve_type(name: str) -> Type:
+    cls = _registered_types.get(name)
+    if cls is None:
+        raise CodecError(f"Type {name} is not registered with the codec")
+    return cls
@@ -0,0 +1,390 @@
+"""
+Compute Executor for Long Analyst Agent.
+
+This module moves CPU-bound indicator and detector work off the event loop.
+Work is routed per task name to one of three backends:
+
+- ``inline``: run on the event loop (cheap calculations)
+- ``thread``: thread pool, for numpy/pandas kernels that release the GIL
+- ``process``: process pool, for heavy Python loops; OHLCV data is handed
+  to workers through shared memory instead of being pickled per task
+
+Every dispatch is bounded by a timeout so a slow calculation cannot stall
+the caller indefinitely. Timed out thread tasks are cancelled at their next
+await point and timed out process tasks have their worker pool recycled, so
+abandoned work does not keep running in the background.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class ExecutorType(Enum):
+    """Execution backends for compute tasks."""
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass
+class SharedFrame:
+    """Descriptor of an OHLCV DataFrame stored in a shared memory block."""
+    shm_name: str
+    shape: tuple
+    columns: List[str]
+    index_kind: str  # "datetime", "numeric" or "range"
+    index_name: Optional[str] = None
+    index_dtype: Optional[str] = None
+    index_freq: Optional[str] = None
+
+
+class _TaskHandle:
+    """Cancellation handle for a coroutine running on a worker thread's loop."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self.cancelled = False
+
+    def attach(self, loop: asyncio.AbstractEventLoop, task: asyncio.Task) -> None:
+        with self._lock:
+            if self.cancelled:
+                task.cancel()
+            self._loop, self._task = loop, task
+
+    def detach(self) -> None:
+        with self._lock:
+            self._loop = self._task = None
+
+    def cancel(self) -> None:
+        """Cancel the task at its next await point (or before it starts)."""
+        with self._lock:
+            self.cancelled = True
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+
+
+def _run_coroutine(handle: Optional[_TaskHandle], coroutine_function: Callable, *args) -> Any:
+    """Run an async callable to completion on a private, closed-after-use loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        task = loop.create_task(coroutine_function(*args))
+        if handle is not None:
+            handle.attach(loop, task)
+        return loop.run_until_complete(task)
+    finally:
+        if handle is not None:
+            handle.detach()
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+def _attach_frame(frame: SharedFrame) -> pd.DataFrame:
+    """Rebuild a DataFrame from shared memory (copying out of the block)."""
+    block = shared_memory.SharedMemory(name=frame.shm_name)
+    try:
+        matrix = np.ndarray(frame.shape, dtype=np.float64, buffer=block.buf).copy()
+    finally:
+        block.close()
+
+    columns = matrix[:len(frame.columns)]
+    if frame.index_kind == "range":
+        index = pd.RangeIndex(frame.shape[1], name=frame.index_name)
+    else:
+        raw_index = matrix[len(frame.columns)]
+        if frame.index_kind == "datetime":
+            index = pd.DatetimeIndex(raw_index.view(np.int64).view(frame.index_dtype), name=frame.index_name)
+            if frame.index_freq:
+                index.freq = frame.index_freq
+        else:
+            index = pd.Index(raw_index.astype(frame.index_dtype), name=frame.index_name)
+
+    return pd.DataFrame(dict(zip(frame.columns, columns)), index=index)
+
+
+def _calculate_in_process(calculator_payload: bytes, frame: SharedFrame,
+                          parameters: Optional[Dict[str, Any]]) -> Any:
+    """Process pool entry point: run a pickled, configured calculator on shared data."""
+    calculator = pickle.loads(calculator_payload)
+    return _run_coroutine(None, calculator.calculate, _attach_frame(frame), parameters)
+
+
+def _default_start_method() -> str:
+    """Prefer forkserver; forking a threaded parent can deadlock the child."""
+    methods = multiprocessing.get_all_start_methods()
+    return "forkserver" if "forkserver" in methods else "spawn"
+
+
+class ComputeExecutor:
+    """
+    Routes CPU-bound work to inline, thread or process execution.
+
+    Routing is decided per task name (for example an indicator name), falling
+    back to the default backend. Process routing is only used for indicator
+    calculators, which are pickled with their configuration into worker
+    processes; calculators that cannot be pickled run on threads instead.
+    """
+
+    def __init__(self, default_executor: ExecutorType = ExecutorType.THREAD,
+                 routing: Optional[Dict[str, ExecutorType]] = None,
+                 max_thread_workers: int = 8, max_process_workers: int = 0,
+                 timeout_ms: Optional[float] = None,
+                 timeouts_ms: Optional[Dict[str, float]] = None,
+                 process_start_method: Optional[str] = None):
+        """Initialize the compute executor."""
+        self.logger = logging.getLogger(__name__)
+        self.default_executor = ExecutorType(default_executor)
+        self.routing = {name: ExecutorType(kind) for name, kind in (routing or {}).items()}
+        self.max_thread_workers = max_thread_workers
+        self.max_process_workers = max_process_workers or os.cpu_count() or 1
+        self.timeout_ms = timeout_ms
+        self.timeouts_ms = dict(timeouts_ms or {})
+        self.process_start_method = process_start_method or _default_start_method()
+
+        # Pools are created on first use
+        self.thread_pool: Optional[ThreadPoolExecutor] = None
+        self.process_pool: Optional[ProcessPoolExecutor] = None
+        self.process_pool_failed = False
+
+        # Metrics
+        self.tasks_by_executor = {kind.value: 0 for kind in ExecutorType}
+        self.timeouts = 0
+        self.process_pool_recycles = 0
+        self.failures = 0
+        self.total_task_time_ms = 0.0
+
+    def get_executor_type(self, name: str) -> ExecutorType:
+        """Get the backend a task name is routed to."""
+        kind = self.routing.get(name, self.default_executor)
+        if kind is ExecutorType.PROCESS and self.process_pool_failed:
+            return ExecutorType.THREAD
+        return kind
+
+    def _get_timeout(self, name: str) -> Optional[float]:
+        timeout_ms = self.timeouts_ms.get(name, self.timeout_ms)
+        return timeout_ms / 1000 if timeout_ms else None
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self.thread_pool is None:
+            self.thread_pool = ThreadPoolExecutor(
+                max_workers=self.max_thread_workers, thread_name_prefix="compute"
+            )
+        return self.thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self.process_pool is None:
+            self.process_pool = ProcessPoolExecutor(
+                max_workers=self.max_process_workers,
+                mp_context=multiprocessing.get_context(self.process_start_method)
+            )
+        return self.process_pool
+
+    def _recycle_process_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Stop a pool whose worker is stuck on timed out work; the next task starts a fresh one."""
+        if self.process_pool is not pool:
+            return
+        self.process_pool = None
+        self.process_pool_recycles += 1
+        # ProcessPoolExecutor has no public way to stop running work
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False)
+
+    async def _dispatch(self, name: str, kind: ExecutorType, awaitable,
+                        on_cancel: Optional[Callable[[], None]] = None) -> Any:
+        """Await a task under the timeout for its name and record metrics."""
+        start_time = time.time()
+        self.tasks_by_executor[kind.value] += 1
+        try:
+            return await asyncio.wait_for(awaitable, self._get_timeout(name))
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            if on_cancel is not None:
+                on_cancel()
+            raise asyncio.TimeoutError(f"{name} exceeded {self._get_timeout(name) * 1000:.0f}ms on {kind.value} executor")
+        except asyncio.CancelledError:
+            if on_cancel is not None:
+                on_cancel()
+            raise
+        except Exception:
+            self.failures += 1
+            raise
+        finally:
+            self.total_task_time_ms += (time.time() - start_time) * 1000
+
+    async def run(self, name: str, coroutine_function: Callable, *args) -> Any:
+        """
+        Run an async callable on the inline or thread backend.
+
+        Args:
+            name: Task name used for routing and timeouts
+            coroutine_function: Async callable doing CPU-bound work
+            *args: Arguments for the callable
+
+        Returns:
+            The callable's result
+        """
+        kind = self.get_executor_type(name)
+        if kind is ExecutorType.INLINE:
+            return await self._dispatch(name, kind, coroutine_function(*args))
+
+        # Process routing needs a picklable calculator; other tasks use threads
+        handle = _TaskHandle()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_thread_pool(), _run_coroutine, handle, coroutine_function, *args)
+        return await self._dispatch(name, ExecutorType.THREAD, future, on_cancel=handle.cancel)
+
+    async def run_calculator(self, name: str, calculator: Any, data: pd.DataFrame,
+                             parameters: Optional[Dict[str, Any]] = None,
+                             shared_frame: Optional[SharedFrame] = None) -> Any:
+        """
+        Run an indicator calculator on its routed backend.
+
+        Args:
+            name: Indicator name used for routing and timeouts
+            calculator: Calculator instance with an async ``calculate``
+            data: Market data as DataFrame
+            parameters: Calculation parameters
+            shared_frame: Shared memory copy of ``data`` for the process backend
+
+        Returns:
+            Indicator result
+        """
+        if self.get_executor_type(name) is not ExecutorType.PROCESS:
+            return await self.run(name, calculator.calculate, data, parameters)
+
+        try:
+            calculator_payload = pickle.dumps(calculator)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Calculator for {name} is not picklable, running on threads: {e}")
+            return await self._run_on_thread(name, calculator, data, parameters)
+
+        owns_frame = shared_frame is None
+        if owns_frame:
+            shared_frame = self.share_frame(data)
+            if shared_frame is None:
+                return await self._run_on_thread(name, calculator, data, parameters)
+
+        pool = None
+        try:
+            pool = self._get_process_pool()
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(pool, _calculate_in_process, calculator_payload, shared_frame, parameters)
+            return await self._dispatch(
+                name, ExecutorType.PROCESS, future, on_cancel=lambda: self._recycle_process_pool(pool)
+            )
+        except asyncio.TimeoutError:
+            # TimeoutError subclasses OSError on Python 3.11+
+            raise
+        except (BrokenProcessPool, OSError) as e:
+            if pool is not None and pool is not self.process_pool:
+                # Broken by a recycle after another task timed out, not unavailable
+                return await self._run_on_thread(name, calculator, data, parameters)
+            self.logger.warning(f"Process pool unavailable, falling back to threads: {e}")
+            self.process_pool_failed = True
+            return await self._run_on_thread(name, calculator, data, parameters)
+        finally:
+            if owns_frame:
+                self.release_frame(shared_frame)
+
+    async def _run_on_thread(self, name: str, calculator: Any, data: pd.DataFrame,
+                             parameters: Optional[Dict[str, Any]]) -> Any:
+        handle = _TaskHandle()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_thread_pool(), _run_coroutine, handle,
+                                      calculator.calculate, data, parameters)
+        return await self._dispatch(name, ExecutorType.THREAD, future, on_cancel=handle.cancel)
+
+    def share_frame(self, data: pd.DataFrame) -> Optional[SharedFrame]:
+        """
+        Copy the numeric columns and index of a DataFrame into shared memory.
+
+        Returns:
+            Descriptor for worker processes, or None if the data is not numeric
+        """
+        numeric = data.select_dtypes(include=[np.number])
+        if numeric.shape[1] != data.shape[1]:
+            return None
+
+        index = data.index
+        if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+            index_kind, index_dtype, index_row = "range", None, None
+        elif isinstance(index, pd.DatetimeIndex) and index.tz is None:
+            index_kind, index_dtype = "datetime", str(index.dtype)
+            index_row = index.asi8.view(np.float64)
+        elif pd.api.types.is_numeric_dtype(index):
+            index_kind, index_dtype = "numeric", str(index.dtype)
+            index_row = index.to_numpy(dtype=np.float64)
+        else:
+            return None
+
+        rows = data.shape[1] + (0 if index_row is None else 1)
+        shape = (rows, len(data))
+        block = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+        matrix = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+        for i, column in enumerate(data.columns):
+            matrix[i] = data[column].to_numpy(dtype=np.float64)
+        if index_row is not None:
+            matrix[-1] = index_row
+        del matrix
+        block.close()
+
+        return SharedFrame(
+            shm_name=block.name,
+            shape=shape,
+            columns=list(data.columns),
+            index_kind=index_kind,
+            index_name=index.name,
+            index_dtype=index_dtype,
+            index_freq=index.freqstr if index_kind == "datetime" else None
+        )
+
+    def release_frame(self, shared_frame: Optional[SharedFrame]) -> None:
+        """Free a shared memory block created by ``share_frame``."""
+        if shared_frame is None:
+            return
+        try:
+            block = shared_memory.SharedMemory(name=shared_frame.shm_name)
+            block.close()
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor statistics."""
+        return {
+            "default_executor": self.default_executor.value,
+            "routing": {name: kind.value for name, kind in self.routing.items()},
+            "tasks_by_executor": dict(self.tasks_by_executor),
+            "timeouts": self.timeouts,
+            "process_pool_recycles": self.process_pool_recycles,
+            "failures": self.failures,
+            "total_task_time_ms": self.total_task_time_ms,
+            "process_pool_available": not self.process_pool_failed
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pools."""
+        if self.thread_pool is not None:
+            self.thread_pool.shutdown(wait=wait)
+            self.thread_pool = None
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=wait)
+            self.process_pool = None
@@ -0,0 +1,132 @@
+"""
+Vectorized Extrema and Level Clustering for Long Analyst Agent.
+
+This module provides the array primitives behind support/resistance and
+swing-point detection: local extrema found with windowed numpy reductions
+instead of per-bar slicing, and sort-and-sweep clustering of price levels.
+Both reproduce the comparisons of the original per-bar loops exactly, so
+callers can switch without changing their output.
+"""
+
+from typing import List, Sequence, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+ArrayLike = Union[np.ndarray, Sequence[float]]
+
+
+def _window_reduce(reducer: np.ufunc, values: np.ndarray, start: int, stop: int, width: int) -> np.ndarray:
+    """Reduce ``values[i:i+width]`` for every ``i`` in ``[start, stop)``."""
+    windows = sliding_window_view(values[start:stop + width - 1], width)
+    return reducer.reduce(windows, axis=1)
+
+
+def find_extrema(values: ArrayLike, window: int, kind: str = "max", strict: bool = False,
+                 right_window: int = None, margin: int = None, skipna: bool = False) -> np.ndarray:
+    """
+    Find local extrema positions in a 1-D array.
+
+    Position ``i`` is a local maximum when ``values[i]`` is at least (or, if
+    ``strict``, greater than) every value in ``values[i-window:i]`` and
+    ``values[i+1:i+right_window+1]``; minima are the mirror image. Any NaN
+    neighbour disqualifies a position, matching element-wise comparisons.
+    With ``skipna`` a position qualifies when it equals the NaN-skipping
+    extreme of its whole window (pandas ``max()``/``min()`` semantics).
+
+    Args:
+        values: Price series or array
+        window: Number of neighbours to the left (and right, by default)
+        kind: "max" or "min"
+        strict: Require strictly greater/smaller than all neighbours
+        right_window: Number of neighbours to the right, defaults to ``window``
+        margin: Positions closer than this to either end are skipped,
+            defaults to the larger of the two windows
+        skipna: Ignore NaN neighbours (non-strict only)
+
+    Returns:
+        Ascending integer positions of the extrema
+    """
+    if kind not in ("max", "min"):
+        raise ValueError(f"Unknown extrema kind: {kind}")
+
+    values = np.asarray(values)
+    left = window
+    right = window if right_window is None else right_window
+    margin = max(left, right) if margin is None else margin
+    if margin < max(left, right):
+        raise ValueError("margin must cover both windows")
+
+    start, stop = margin, len(values) - margin
+    if stop <= start:
+        return np.empty(0, dtype=np.intp)
+
+    center = values[start:stop]
+    is_max = kind == "max"
+
+    if skipna:
+        if strict:
+            raise ValueError("skipna is only supported for non-strict extrema")
+        reducer = np.fmax if is_max else np.fmin
+        extreme = _window_reduce(reducer, values, start - left, stop - left, left + right + 1)
+        mask = center == extreme
+    else:
+        reducer = np.maximum if is_max else np.minimum
+        if strict:
+            beats = np.greater if is_max else np.less
+        else:
+            beats = np.greater_equal if is_max else np.less_equal
+
+        mask = np.ones(len(center), dtype=bool)
+        if left:
+            mask &= beats(center, _window_reduce(reducer, values, start - left, stop - left, left))
+        if right:
+            mask &= beats(center, _window_reduce(reducer, values, start + 1, stop + 1, right))
+
+    return np.flatnonzero(mask) + start
+
+
+def cluster_levels(levels: ArrayLike, threshold: float, chained: bool = False) -> List[np.ndarray]:
+    """
+    Group nearby price levels with a sort-and-sweep pass.
+
+    Levels are sorted and swept once. A level joins the current cluster while
+    its relative distance to the reference level is within ``threshold``;
+    the reference is the first level of the cluster, or the previous level
+    when ``chained``.
+
+    Args:
+        levels: Price levels in any order
+        threshold: Maximum relative distance within a cluster
+        chained: Measure distance to the previous level instead of the first
+
+    Returns:
+        Clusters as ascending arrays, in ascending order
+    """
+    ordered = np.sort(np.asarray(levels, dtype=np.float64))
+    if len(ordered) == 0:
+        return []
+
+    if chained:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            within = np.abs(ordered[1:] - ordered[:-1]) / ordered[:-1] <= threshold
+        return np.split(ordered, np.flatnonzero(~within) + 1)
+
+    # Binary search for each cluster end, then settle rounding at the boundary
+    # with the exact relative-distance test
+    values = ordered.tolist()
+    size = len(values)
+    clusters = []
+    start = 0
+    while start < size:
+        anchor = values[start]
+        stop = max(int(np.searchsorted(ordered, anchor * (1 + threshold), side="right")), start + 1)
+        while stop < size and abs(values[stop] - anchor) / anchor <= threshold:
+            stop += 1
+        while stop > start + 1 and not abs(values[stop - 1] - anchor) / anchor <= threshold:
+            stop -= 1
+        clusters.append(ordered[start:stop])
+        start = stop
+
+    return clusters
@@ -8,14 +8,15 @@ optimized for long signal detection with caching and parallel processing.
 import asyncio
 import json
 import logging
-from typing import Dict, List, Optional, Any, Union, Type
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Any, Union, Type
+from dataclasses import dataclass, field
 from enum import Enum
 import time
 import hashlib
+import sys
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 import redis.asyncio as redis
 from functools import lru_cache
@@ -23,9 +24,14 @@ from functools import lru_cache
 from ..models.market_data import MarketData, Timeframe
 from ..utils.performance_monitor import PerformanceMonitor
 from ..utils.indicators import IndicatorCalculator
-from .support_resistance import SupportResistanceCalculator, PatternRecognitionCalculator
+from .streaming import StreamingIndicatorEngine
+from .executor import ComputeExecutor, ExecutorType
+from .universe import UniversePanel
+from . import codec
+from . import universe
 
 
+@codec.register_codec_type
 class IndicatorType(Enum):
     """Types of technical indicators."""
     TREND = "trend"
@@ -36,6 +42,7 @@ class IndicatorType(Enum):
     PATTERN = "pattern"
 
 
+@codec.register_codec_type
 class IndicatorCategory(Enum):
     """Categories of indicators for long signal optimization."""
     PRIMARY = "primary"      # Core indicators for long signals
@@ -54,6 +61,16 @@ class IndicatorConfig:
     cache_ttl_seconds: int = 300
     enable_parallel_processing: bool = True
 
+    # Execution settings: "inline", "thread" or "process" per indicator
+    default_executor: str = "thread"
+    executor_routing: Dict[str, str] = field(default_factory=lambda: {
+        'support_resistance': 'process',
+        'pattern_recognition': 'process'
+    })
+    max_process_workers: int = 0  # 0 uses the CPU count
+    process_start_method: Optional[str] = None  # None prefers forkserver, else spawn
+    indicator_timeouts_ms: Dict[str, int] = field(default_factory=dict)
+
     # Indicator settings
     rsi_long_threshold: tuple = (30, 60)  # Optimal RSI range for long entries
     rsi_oversold_threshold: int = 30
@@ -74,8 +91,13 @@ class IndicatorConfig:
     redis_url: str = "redis://localhost:6379"
     enable_memory_cache: bool = True
     memory_cache_size: int = 1000
+    memory_cache_max_bytes: int = 256 * 1024 * 1024
+    cache_fingerprint_rows: int = 32
+    cache_compression: bool = True
+    cache_compression_threshold: int = 1024
 
 
+@codec.register_codec_type
 @dataclass
 class IndicatorResult:
     """Result of indicator calculation."""
@@ -114,14 +136,20 @@ class IndicatorCache:
             except Exception as e:
                 self.logger.warning(f"Failed to initialize Redis cache: {e}")
 
-        # Initialize memory cache
-        self.memory_cache = {}
+        # Initialize memory cache (LRU order, oldest first)
+        self.memory_cache: "OrderedDict[str, tuple]" = OrderedDict()
         self.memory_cache_size = config.memory_cache_size
+        self.memory_cache_max_bytes = config.memory_cache_max_bytes
+        self.memory_cache_bytes = 0
 
         # Cache statistics
         self.cache_hits = 0
         self.cache_misses = 0
         self.cache_errors = 0
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.evictions = 0
+        self.expirations = 0
 
     def _generate_cache_key(self, indicator_name: str, data_hash: str, parameters: Dict[str, Any]) -> str:
         """Generate cache key for indicator calculation."""
@@ -130,77 +158,198 @@ class IndicatorCache:
         return hashlib.md5(key_data.encode()).hexdigest()
 
     def _get_data_hash(self, data: pd.DataFrame) -> str:
-        """Generate hash for data to detect changes."""
-        # Use last few rows and data shape for hash
-        sample_size = min(10, len(data))
-        sample_data = data.tail(sample_size).to_string()
-        shape_info = f"{data.shape[0]}_{data.shape[1]}"
-        hash_input = f"{shape_info}:{sample_data}"
-        return hashlib.md5(hash_input.encode()).hexdigest()
+        """
+        Fingerprint data from its raw buffers to detect changes.
+
+        Combines the shape, the last timestamp and a hash of the tail of the
+        column buffers, which tells appended or revised candles apart without
+        formatting the frame to text.
+        """
+        tail_rows = min(self.config.cache_fingerprint_rows, len(data))
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{data.shape[0]}_{data.shape[1]}:{','.join(map(str, data.columns))}".encode())
+
+        if tail_rows:
+            index = data.index
+            if isinstance(index, pd.DatetimeIndex):
+                digest.update(index.asi8[-tail_rows:].tobytes())
+            elif not isinstance(index, pd.RangeIndex):
+                digest.update(repr(index[-1]).encode())
+
+            # Slice the tail before converting so only those rows are materialized
+            tail = data.iloc[-tail_rows:]
+            for column in tail.columns:
+                values = tail[column].to_numpy()
+                if values.dtype == object:
+                    digest.update(repr(values.tolist()).encode())
+                else:
+                    digest.update(np.ascontiguousarray(values).tobytes())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def _estimate_size(result: IndicatorResult) -> int:
+        """Estimate memory held by a cached result in bytes."""
+        def value_size(value: Any) -> int:
+            if isinstance(value, (pd.Series, pd.DataFrame)):
+                return int(np.sum(value.memory_usage(index=True, deep=False)))
+            if isinstance(value, np.ndarray):
+                return value.nbytes
+            if isinstance(value, dict):
+                return sys.getsizeof(value) + sum(value_size(item) for item in value.values())
+            if isinstance(value, (list, tuple)):
+                return sys.getsizeof(value) + sum(value_size(item) for item in value)
+            return sys.getsizeof(value)
+
+        return sys.getsizeof(result) + value_size(result.values) + value_size(result.metadata)
+
+    def _memory_get(self, cache_key: str) -> Optional[IndicatorResult]:
+        """Look up the memory tier, refreshing LRU order on hit."""
+        entry = self.memory_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        result, expires_at, size = entry
+        if time.time() >= expires_at:
+            del self.memory_cache[cache_key]
+            self.memory_cache_bytes -= size
+            self.expirations += 1
+            return None
+
+        self.memory_cache.move_to_end(cache_key)
+        return result
+
+    def _memory_put(self, cache_key: str, result: IndicatorResult) -> None:
+        """Insert into the memory tier, evicting least recently used entries."""
+        if not self.config.enable_memory_cache or self.memory_cache_size <= 0:
+            return
+
+        size = self._estimate_size(result)
+        if size > self.memory_cache_max_bytes:
+            return
+
+        previous = self.memory_cache.pop(cache_key, None)
+        if previous is not None:
+            self.memory_cache_bytes -= previous[2]
+
+        self.memory_cache[cache_key] = (result, time.time() + self.config.cache_ttl_seconds, size)
+        self.memory_cache_bytes += size
+
+        while (len(self.memory_cache) > self.memory_cache_size or
+               self.memory_cache_bytes > self.memory_cache_max_bytes):
+            _, (_, _, evicted_size) = self.memory_cache.popitem(last=False)
+            self.memory_cache_bytes -= evicted_size
+            self.evictions += 1
+
+    def _encode(self, result: IndicatorResult) -> bytes:
+        """Serialize a result for the Redis tier."""
+        return codec.encode(
+            result,
+            compress=self.config.cache_compression,
+            compression_threshold=self.config.cache_compression_threshold
+        )
 
     async def get(self, indicator_name: str, data: pd.DataFrame, parameters: Dict[str, Any]) -> Optional[IndicatorResult]:
         """Get cached indicator result."""
+        results = await self.get_many({indicator_name: parameters}, data)
+        return results.get(indicator_name)
+
+    async def get_many(self, requests: Dict[str, Dict[str, Any]],
+                       data: pd.DataFrame) -> Dict[str, IndicatorResult]:
+        """
+        Get cached results for several indicators of the same data.
+
+        The data is fingerprinted once and all memory-tier misses are fetched
+        from Redis in a single round trip.
+
+        Args:
+            requests: Parameters keyed by indicator name
+            data: Market data as DataFrame
+
+        Returns:
+            Cached results keyed by indicator name (misses omitted)
+        """
+        results = {}
         try:
             data_hash = self._get_data_hash(data)
-            cache_key = self._generate_cache_key(indicator_name, data_hash, parameters)
+            pending = {}
 
             # Check memory cache first
-            if cache_key in self.memory_cache:
-                cached_result = self.memory_cache[cache_key]
-                # Check if still valid based on TTL
-                if time.time() - cached_result.timestamp < self.config.cache_ttl_seconds:
-                    self.cache_hits += 1
-                    return cached_result
+            for indicator_name, parameters in requests.items():
+                cache_key = self._generate_cache_key(indicator_name, data_hash, parameters or {})
+                cached_result = self._memory_get(cache_key)
+                if cached_result is not None:
+                    self.memory_hits += 1
+                    results[indicator_name] = cached_result
                 else:
-                    # Remove expired entry
-                    del self.memory_cache[cache_key]
+                    pending[indicator_name] = cache_key
 
             # Check Redis cache
-            if self.redis_client:
+            if pending and self.redis_client:
                 try:
-                    cached_data = await self.redis_client.get(cache_key)
-                    if cached_data:
-                        result_dict = json.loads(cached_data)
-                        # Reconstruct IndicatorResult
-                        result = IndicatorResult(**result_dict)
-                        self.cache_hits += 1
+                    cached_payloads = await self.redis_client.mget(list(pending.values()))
+                    for (indicator_name, cache_key), payload in zip(pending.items(), cached_payloads):
+                        if not payload:
+                            continue
+                        try:
+                            result = codec.decode(payload)
+                        except codec.CodecError as e:
+                            self.logger.warning(f"Discarding undecodable cache entry for {indicator_name}: {e}")
+                            self.cache_errors += 1
+                            continue
+
+                        self.redis_hits += 1
+                        results[indicator_name] = result
 
                         # Update memory cache
-                        if len(self.memory_cache) < self.memory_cache_size:
-                            self.memory_cache[cache_key] = result
-
-                        return result
+                        self._memory_put(cache_key, result)
                 except Exception as e:
                     self.logger.warning(f"Redis cache error: {e}")
                     self.cache_errors += 1
 
-            self.cache_misses += 1
-            return None
+            self.cache_hits += len(results)
+            self.cache_misses += len(requests) - len(results)
+            return results
 
         except Exception as e:
             self.logger.error(f"Cache retrieval error: {e}")
             self.cache_errors += 1
-            return None
+            return results
+
+    async def set(self, result: IndicatorResult, data: pd.DataFrame, parameters: Dict[str, Any],
+                  indicator_name: str = None) -> bool:
+        """Set cached indicator result, keyed like ``get`` when ``indicator_name`` is given."""
+        return await self.set_many({indicator_name or result.indicator_name: (result, parameters)}, data)
+
+    async def set_many(self, entries: Dict[str, tuple], data: pd.DataFrame) -> bool:
+        """
+        Cache results for several indicators of the same data.
+
+        Args:
+            entries: ``(result, parameters)`` keyed by indicator name
+            data: Market data the results were calculated from
 
-    async def set(self, result: IndicatorResult, data: pd.DataFrame, parameters: Dict[str, Any]) -> bool:
-        """Set cached indicator result."""
+        Returns:
+            True if all entries were stored in every enabled tier
+        """
         try:
             data_hash = self._get_data_hash(data)
-            cache_key = self._generate_cache_key(result.indicator_name, data_hash, parameters)
+            keyed_results = {
+                self._generate_cache_key(indicator_name, data_hash, parameters or {}): result
+                for indicator_name, (result, parameters) in entries.items()
+            }
 
             # Store in memory cache
-            if len(self.memory_cache) < self.memory_cache_size:
-                self.memory_cache[cache_key] = result
+            for cache_key, result in keyed_results.items():
+                self._memory_put(cache_key, result)
 
             # Store in Redis cache
             if self.redis_client:
                 try:
-                    result_dict = asdict(result)
-                    await self.redis_client.setex(
-                        cache_key,
-                        self.config.cache_ttl_seconds,
-                        json.dumps(result_dict, default=str)
-                    )
+                    async with self.redis_client.pipeline(transaction=False) as pipe:
+                        for cache_key, result in keyed_results.items():
+                            pipe.setex(cache_key, self.config.cache_ttl_seconds, self._encode(result))
+                        await pipe.execute()
                     return True
                 except Exception as e:
                     self.logger.warning(f"Redis cache set error: {e}")
@@ -220,9 +369,15 @@ class IndicatorCache:
         return {
             "memory_cache_size": len(self.memory_cache),
             "memory_cache_max_size": self.memory_cache_size,
+            "memory_cache_bytes": self.memory_cache_bytes,
+            "memory_cache_max_bytes": self.memory_cache_max_bytes,
             "cache_hits": self.cache_hits,
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
             "cache_misses": self.cache_misses,
             "cache_errors": self.cache_errors,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
             "hit_rate": hit_rate,
             "redis_enabled": self.redis_client is not None
         }
@@ -255,6 +410,54 @@ class IndicatorCalculatorBase(ABC):
         """Get default parameters for the indicator."""
         return {}
 
+    async def calculate_panel(self, panel: UniversePanel,
+                              parameters: Dict[str, Any] = None) -> Dict[str, IndicatorResult]:
+        """
+        Calculate indicator values for every symbol of a universe panel.
+
+        The default runs ``calculate`` once per symbol on the frame rebuilt
+        from the panel; calculators with vectorized panel kernels override
+        it. Symbols whose calculation fails are left out.
+        """
+        if not self.validate_panel(panel):
+            raise ValueError("Invalid universe panel")
+
+        results = {}
+        for position, symbol in enumerate(panel.symbols):
+            try:
+                results[symbol] = await self.calculate(panel.frame(position), parameters)
+            except Exception as e:
+                self.logger.warning(f"Skipping {symbol} in {self.name} panel calculation: {e}")
+        return results
+
+    def validate_panel(self, panel: UniversePanel) -> bool:
+        """Validate a universe panel."""
+        return panel.shape[0] > 0 and panel.shape[1] > 0
+
+    def _panel_results(self, panel: UniversePanel, parameters: Dict[str, Any], start_time: float,
+                       values: Callable[[int], Dict[str, Any]], quality_scores: np.ndarray,
+                       metadata: Callable[[int], Dict[str, Any]]) -> Dict[str, IndicatorResult]:
+        """Build per-symbol results; calculation time is amortized over the panel."""
+        timestamp = time.time()
+        calculation_time_ms = (timestamp - start_time) * 1000 / max(len(panel.symbols), 1)
+        data_points = panel.bar_counts()
+
+        return {
+            symbol: IndicatorResult(
+                indicator_name=self.name,
+                indicator_type=self.indicator_type,
+                category=self.category,
+                values=values(i),
+                parameters=parameters,
+                timestamp=timestamp,
+                calculation_time_ms=calculation_time_ms,
+                data_points_used=int(data_points[i]),
+                quality_score=float(quality_scores[i]),
+                metadata=metadata(i)
+            )
+            for i, symbol in enumerate(panel.symbols)
+        }
+
 
 class RSICalculator(IndicatorCalculatorBase):
     """RSI calculator optimized for long signals."""
@@ -354,6 +557,44 @@ class RSICalculator(IndicatorCalculatorBase):
 
         return (completeness + valid_range) / 2
 
+    async def calculate_panel(self, panel: UniversePanel,
+                              parameters: Dict[str, Any] = None) -> Dict[str, IndicatorResult]:
+        """Calculate RSI for every symbol of a universe panel."""
+        start_time = time.time()
+        if parameters is None:
+            parameters = self.get_default_parameters()
+        if not self.validate_panel(panel):
+            raise ValueError("Invalid universe panel")
+
+        rsi_values = universe.rsi(panel.close, parameters.get('period', 14))
+        long_signals = universe.select_signals(
+            [(rsi_values >= 30) & (rsi_values <= 60),
+             (rsi_values < 30) & (rsi_values >= 20),
+             rsi_values < 20,
+             (rsi_values > 60) & (rsi_values <= 70)],
+            [0.8, 0.9, 1.0, 0.4],
+            rsi_values.shape
+        )
+        bars = panel.bar_counts()
+        completeness = universe.valid_ratio(~np.isnan(rsi_values), bars)
+        quality_scores = (completeness + universe.valid_ratio((rsi_values >= 0) & (rsi_values <= 100), bars)) / 2
+        current_rsi = rsi_values[:, -1]
+
+        return self._panel_results(
+            panel, parameters, start_time,
+            lambda i: {
+                'rsi': panel.row(rsi_values, i),
+                'long_signals': panel.row(long_signals, i),
+                'current_rsi': current_rsi[i]
+            },
+            quality_scores,
+            lambda i: {
+                'description': 'RSI optimized for long signal detection',
+                'long_optimization': True,
+                'optimal_range': (30, 60)
+            }
+        )
+
 
 class MACDCalculator(IndicatorCalculatorBase):
     """MACD calculator optimized for trend following."""
@@ -431,7 +672,7 @@ class MACDCalculator(IndicatorCalculatorBase):
 
         # Bullish crossover (MACD crosses above signal)
         macd_above_signal = macd_data['macd'] > macd_data['signal']
-        crossover = macd_above_signal & ~macd_above_signal.shift(1).fillna(False)
+        crossover = macd_above_signal & ~macd_above_signal.shift(1, fill_value=False)
         signals[crossover] = 1.0
 
         # MACD above zero line (bullish trend)
@@ -468,6 +709,56 @@ class MACDCalculator(IndicatorCalculatorBase):
 
         return (completeness + valid_values) / 2
 
+    async def calculate_panel(self, panel: UniversePanel,
+                              parameters: Dict[str, Any] = None) -> Dict[str, IndicatorResult]:
+        """Calculate MACD for every symbol of a universe panel."""
+        start_time = time.time()
+        if parameters is None:
+            parameters = self.get_default_parameters()
+        if not self.validate_panel(panel):
+            raise ValueError("Invalid universe panel")
+
+        macd_data = universe.macd(panel.close, parameters.get('fast', 12),
+                                  parameters.get('slow', 26), parameters.get('signal', 9))
+        macd_line, signal_line, histogram = macd_data['macd'], macd_data['signal'], macd_data['histogram']
+
+        # Bullish crossover: above the signal line now, not on the previous bar
+        macd_above_signal = macd_line > signal_line
+        previous_above = np.zeros_like(macd_above_signal)
+        previous_above[:, 1:] = macd_above_signal[:, :-1]
+        long_signals = universe.select_signals(
+            [macd_above_signal & ~previous_above,
+             macd_line > 0,
+             histogram > universe.shift(histogram)],
+            [1.0, 0.6, 0.7],
+            macd_line.shape
+        )
+
+        # Completeness and valid values are the same ratio for MACD
+        quality_scores = universe.valid_ratio(~np.isnan(macd_line), panel.bar_counts())
+        current = {name: series[:, -1] for name, series in macd_data.items()}
+
+        max_histogram = np.fmax.reduce(np.abs(histogram), axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            trend_strength = np.where(max_histogram > 0,
+                                      np.fmin(1.0, np.abs(current['histogram']) / max_histogram), 0.0)
+
+        return self._panel_results(
+            panel, parameters, start_time,
+            lambda i: {
+                **{name: panel.row(series, i) for name, series in macd_data.items()},
+                'long_signals': panel.row(long_signals, i),
+                'current_macd': current['macd'][i],
+                'current_signal': current['signal'][i],
+                'current_histogram': current['histogram'][i]
+            },
+            quality_scores,
+            lambda i: {
+                'description': 'MACD optimized for long trend following',
+                'trend_strength': float(trend_strength[i])
+            }
+        )
+
 
 class BollingerBandsCalculator(IndicatorCalculatorBase):
     """Bollinger Bands calculator for volatility analysis."""
@@ -591,6 +882,149 @@ class BollingerBandsCalculator(IndicatorCalculatorBase):
 
         return (completeness + valid_ratio) / 2
 
+    async def calculate_panel(self, panel: UniversePanel,
+                              parameters: Dict[str, Any] = None) -> Dict[str, IndicatorResult]:
+        """Calculate Bollinger Bands for every symbol of a universe panel."""
+        start_time = time.time()
+        if parameters is None:
+            parameters = self.get_default_parameters()
+        if not self.validate_panel(panel):
+            raise ValueError("Invalid universe panel")
+
+        close = panel.close
+        bb_data = universe.bollinger_bands(close, parameters.get('period', 20), parameters.get('std_dev', 2.0))
+        upper, middle, lower = bb_data['upper'], bb_data['middle'], bb_data['lower']
+
+        long_signals = universe.select_signals(
+            [close <= lower * 1.05,
+             close < lower,
+             (close > lower) & (close <= middle)],
+            [0.8, 1.0, 0.6],
+            close.shape
+        )
+
+        current_price = close[:, -1]
+        current_position = np.select(
+            [current_price > upper[:, -1],
+             current_price > middle[:, -1],
+             current_price > lower[:, -1]],
+            ['above_upper', 'upper_half', 'lower_half'],
+            'below_lower'
+        )
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bandwidth = (upper[:, -1] - lower[:, -1]) / middle[:, -1]
+
+        bars = panel.bar_counts()
+        completeness = universe.valid_ratio(~np.isnan(upper), bars)
+        quality_scores = (completeness + universe.valid_ratio((upper > middle) & (middle > lower), bars)) / 2
+
+        return self._panel_results(
+            panel, parameters, start_time,
+            lambda i: {
+                **{name: panel.row(series, i) for name, series in bb_data.items()},
+                'long_signals': panel.row(long_signals, i),
+                'current_position': str(current_position[i])
+            },
+            quality_scores,
+            lambda i: {
+                'description': 'Bollinger Bands for volatility-based long signals',
+                'bandwidth': bandwidth[i]
+            }
+        )
+
+
+class ATRCalculator(IndicatorCalculatorBase):
+    """ATR calculator for volatility filtering and stop placement."""
+
+    def __init__(self):
+        """Initialize ATR calculator."""
+        super().__init__("ATR", IndicatorType.VOLATILITY, IndicatorCategory.FILTER)
+        self.calculator = IndicatorCalculator()
+
+    async def calculate(self, data: pd.DataFrame, parameters: Dict[str, Any] = None) -> IndicatorResult:
+        """Calculate ATR values."""
+        start_time = time.time()
+
+        try:
+            # Set default parameters
+            if parameters is None:
+                parameters = self.get_default_parameters()
+
+            period = parameters.get('period', 14)
+
+            # Validate inputs
+            if not self.validate_data(data):
+                raise ValueError("Invalid input data")
+
+            # Calculate ATR
+            atr_values = self.calculator.atr(data, period)
+            atr_percent = atr_values / data['close'] * 100
+
+            result = IndicatorResult(
+                indicator_name=self.name,
+                indicator_type=self.indicator_type,
+                category=self.category,
+                values={
+                    'atr': atr_values,
+                    'atr_percent': atr_percent,
+                    'current_atr': atr_values.iloc[-1] if len(atr_values) > 0 else None
+                },
+                parameters=parameters,
+                timestamp=time.time(),
+                calculation_time_ms=(time.time() - start_time) * 1000,
+                data_points_used=len(data),
+                quality_score=1.0 - (atr_values.isna().sum() / len(atr_values)),
+                metadata={
+                    'description': 'Average True Range for volatility-based stops and filters',
+                    'current_atr_percent': atr_percent.iloc[-1] if len(atr_percent) > 0 else None
+                }
+            )
+
+            return result
+
+        except Exception as e:
+            self.logger.error(f"Error calculating ATR: {e}")
+            raise
+
+    def get_default_parameters(self) -> Dict[str, Any]:
+        """Get default ATR parameters."""
+        return {
+            'period': 14
+        }
+
+    def validate_data(self, data: pd.DataFrame) -> bool:
+        """Validate input data has the price range columns."""
+        return super().validate_data(data) and {'high', 'low', 'close'}.issubset(data.columns)
+
+    async def calculate_panel(self, panel: UniversePanel,
+                              parameters: Dict[str, Any] = None) -> Dict[str, IndicatorResult]:
+        """Calculate ATR for every symbol of a universe panel."""
+        start_time = time.time()
+        if parameters is None:
+            parameters = self.get_default_parameters()
+        if not self.validate_panel(panel):
+            raise ValueError("Invalid universe panel")
+        if panel.high is None or panel.low is None:
+            raise ValueError("ATR needs high and low prices in the panel")
+
+        atr_values = universe.atr(panel.high, panel.low, panel.close, parameters.get('period', 14))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            atr_percent = atr_values / panel.close * 100
+        return self._panel_results(
+            panel, parameters, start_time,
+            lambda i: {
+                'atr': panel.row(atr_values, i),
+                'atr_percent': panel.row(atr_percent, i),
+                'current_atr': atr_values[i, -1]
+            },
+            universe.valid_ratio(~np.isnan(atr_values), panel.bar_counts()),
+            lambda i: {
+                'description': 'Average True Range for volatility-based stops and filters',
+                'current_atr_percent': atr_percent[i, -1]
+            }
+        )
+
 
 class IndicatorEngine:
     """
@@ -609,12 +1043,23 @@ class IndicatorEngine:
         # Initialize cache
         self.cache = IndicatorCache(config)
 
-        # Initialize thread pool for parallel processing
-        self.executor = ThreadPoolExecutor(max_workers=config.max_concurrent_calculations)
+        # Initialize executor layer for CPU-bound calculations
+        self.executor = ComputeExecutor(
+            default_executor=ExecutorType(config.default_executor),
+            routing={name: ExecutorType(kind) for name, kind in config.executor_routing.items()},
+            max_thread_workers=config.max_concurrent_calculations,
+            max_process_workers=config.max_process_workers,
+            timeout_ms=config.calculation_timeout_ms,
+            timeouts_ms=config.indicator_timeouts_ms,
+            process_start_method=config.process_start_method
+        )
 
         # Initialize indicator calculators
         self.calculators = self._init_calculators()
 
+        # Incremental indicator states for live candle updates
+        self.streaming = StreamingIndicatorEngine()
+
         # Metrics
         self.total_calculations = 0
         self.total_calculation_time = 0.0
@@ -626,12 +1071,18 @@ class IndicatorEngine:
 
     def _init_calculators(self) -> Dict[str, IndicatorCalculatorBase]:
         """Initialize all indicator calculators."""
+        # Imported here because support_resistance builds on this module's base classes
+        from .support_resistance import SupportResistanceCalculator, PatternRecognitionCalculator
+
         calculators = {
             # Primary indicators
             'rsi': RSICalculator(),
             'macd': MACDCalculator(),
             'bollinger_bands': BollingerBandsCalculator(),
 
+            # Filter indicators
+            'atr': ATRCalculator(),
+
             # Support and resistance indicators
             'support_resistance': SupportResistanceCalculator(),
             'pattern_recognition': PatternRecognitionCalculator(),
@@ -640,7 +1091,6 @@ class IndicatorEngine:
         # Add more calculators in the future
         # calculators['stochastic'] = StochasticCalculator()
         # calculators['adx'] = ADXCalculator()
-        # calculators['atr'] = ATRCalculator()
         # calculators['obv'] = OBVCalculator()
 
         return calculators
@@ -658,8 +1108,6 @@ class IndicatorEngine:
         Returns:
             Indicator result or None if calculation failed
         """
-        start_time = time.time()
-
         try:
             # Check cache first
             cached_result = await self.cache.get(indicator_name, data, parameters or {})
@@ -667,34 +1115,10 @@ class IndicatorEngine:
                 self.cache_hits += 1
                 return cached_result
 
-            # Get calculator
-            calculator = self.calculators.get(indicator_name.lower())
-            if not calculator:
-                raise ValueError(f"Unknown indicator: {indicator_name}")
-
-            # Validate data
-            if not self._validate_data(data):
-                raise ValueError("Invalid market data")
-
-            # Calculate indicator
-            result = await calculator.calculate(data, parameters)
+            result = await self._calculate_uncached(indicator_name, data, parameters)
 
             # Cache result
-            await self.cache.set(result, data, parameters or {})
-
-            # Update metrics
-            self.total_calculations += 1
-            calculation_time = (time.time() - start_time) * 1000
-            self.total_calculation_time += calculation_time
-            self.average_calculation_time = (
-                self.total_calculation_time / self.total_calculations
-            )
-
-            self.cache_misses += 1
-
-            # Record performance metrics
-            self.performance_monitor.record_metric("calculation_time", calculation_time)
-            self.performance_monitor.record_metric("indicator_calculated", indicator_name)
+            await self.cache.set(result, data, parameters or {}, indicator_name)
 
             return result
 
@@ -703,11 +1127,50 @@ class IndicatorEngine:
             self.performance_monitor.record_error(f"indicator_calculation_error: {indicator_name}")
             return None
 
+    async def _calculate_uncached(self, indicator_name: str, data: pd.DataFrame,
+                                  parameters: Dict[str, Any] = None,
+                                  shared_frame=None) -> IndicatorResult:
+        """Run an indicator calculator on its executor and record metrics, bypassing the cache."""
+        start_time = time.time()
+
+        # Get calculator
+        calculator = self.calculators.get(indicator_name.lower())
+        if not calculator:
+            raise ValueError(f"Unknown indicator: {indicator_name}")
+
+        # Validate data
+        if not self._validate_data(data):
+            raise ValueError("Invalid market data")
+
+        # Calculate indicator off the event loop
+        result = await self.executor.run_calculator(
+            indicator_name.lower(), calculator, data, parameters, shared_frame
+        )
+
+        # Update metrics
+        self.total_calculations += 1
+        calculation_time = (time.time() - start_time) * 1000
+        self.total_calculation_time += calculation_time
+        self.average_calculation_time = (
+            self.total_calculation_time / self.total_calculations
+        )
+
+        self.cache_misses += 1
+
+        # Record performance metrics
+        self.performance_monitor.record_metric("calculation_time", calculation_time)
+        self.performance_monitor.record_metric("indicator_calculated", indicator_name)
+
+        return result
+
     async def batch_calculate(self, indicators: List[str], data: pd.DataFrame,
                             parameters: Dict[str, Dict[str, Any]] = None) -> Dict[str, IndicatorResult]:
         """
         Calculate multiple indicators in parallel.
 
+        Cached results for all indicators are fetched in one cache round trip
+        and freshly calculated results are written back in one pipeline.
+
         Args:
             indicators: List of indicator names
             data: Market data as DataFrame
@@ -719,36 +1182,165 @@ class IndicatorEngine:
         if parameters is None:
             parameters = {}
 
-        # Create calculation tasks
-        tasks = []
-        for indicator in indicators:
-            indicator_params = parameters.get(indicator)
-            task = self.calculate(indicator, data, indicator_params)
-            tasks.append(task)
+        # Serve everything we can from the cache
+        indicator_results = await self.cache.get_many(
+            {indicator: parameters.get(indicator) or {} for indicator in indicators}, data
+        )
+        self.cache_hits += len(indicator_results)
+        missing = [indicator for indicator in indicators if indicator not in indicator_results]
 
-        # Execute tasks concurrently
-        if self.config.enable_parallel_processing:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-        else:
-            results = []
-            for task in tasks:
-                try:
-                    result = await task
-                    results.append(result)
-                except Exception as e:
-                    results.append(e)
+        # Share the data once with worker processes if any indicator needs them
+        shared_frame = None
+        if any(self.executor.get_executor_type(indicator.lower()) is ExecutorType.PROCESS
+               for indicator in missing):
+            shared_frame = self.executor.share_frame(data)
+
+        try:
+            # Create calculation tasks
+            tasks = []
+            for indicator in missing:
+                indicator_params = parameters.get(indicator)
+                task = self._calculate_uncached(indicator, data, indicator_params, shared_frame)
+                tasks.append(task)
+
+            # Execute tasks concurrently
+            if self.config.enable_parallel_processing:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            else:
+                results = []
+                for task in tasks:
+                    try:
+                        result = await task
+                        results.append(result)
+                    except Exception as e:
+                        results.append(e)
+        finally:
+            self.executor.release_frame(shared_frame)
 
         # Process results
-        indicator_results = {}
+        calculated = {}
         for i, result in enumerate(results):
-            indicator_name = indicators[i]
+            indicator_name = missing[i]
             if isinstance(result, Exception):
                 self.logger.error(f"Error in batch calculation for {indicator_name}: {result}")
                 self.performance_monitor.record_error(f"batch_calculation_error: {indicator_name}")
             elif result is not None:
                 indicator_results[indicator_name] = result
+                calculated[indicator_name] = (result, parameters.get(indicator_name) or {})
+
+        if calculated:
+            await self.cache.set_many(calculated, data)
+
+        return {name: indicator_results[name] for name in indicators if name in indicator_results}
+
+    async def calculate_universe(self, indicators: List[str], panel: UniversePanel,
+                                 parameters: Dict[str, Dict[str, Any]] = None
+                                 ) -> Dict[str, Dict[str, IndicatorResult]]:
+        """
+        Calculate indicators for a whole universe of symbols in one pass.
+
+        Each indicator runs once over the aligned (symbols x bars) panel and
+        every per-symbol result holds Series views into the panel-wide
+        arrays. Symbols failing the data quality checks are left out.
+        Results bypass the indicator cache, which is keyed per frame.
+
+        Args:
+            indicators: Indicator names; rsi, macd, bollinger_bands and atr use
+                vectorized panel kernels, others run per symbol
+            panel: Aligned universe panel
+            parameters: Parameters for each indicator
+
+        Returns:
+            Dictionary mapping symbols to indicator names to results
+        """
+        start_time = time.time()
+        if parameters is None:
+            parameters = {}
+
+        # Apply the per-frame data checks to every row at once
+        valid_counts = (~np.isnan(panel.close)).sum(axis=1)
+        missing_ratio = 1.0 - universe.valid_ratio(~np.isnan(panel.close), panel.bar_counts())
+        usable = (valid_counts >= self.config.min_data_points) & (missing_ratio <= self.config.max_missing_data_ratio)
+        if not usable.all():
+            skipped = [symbol for symbol, ok in zip(panel.symbols, usable) if not ok]
+            self.logger.warning(f"Skipping {len(skipped)} symbols with insufficient data: {skipped[:10]}")
+        if not usable.any():
+            return {}
+
+        names = []
+        tasks = []
+        for indicator in indicators:
+            calculator = self.calculators.get(indicator.lower())
+            if calculator is None:
+                self.logger.error(f"Unknown indicator: {indicator}")
+                continue
+            names.append(indicator)
+            tasks.append(self.executor.run(indicator.lower(), calculator.calculate_panel,
+                                           panel, parameters.get(indicator)))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        universe_results = {symbol: {} for symbol, ok in zip(panel.symbols, usable) if ok}
+        for indicator_name, result in zip(names, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error in universe calculation for {indicator_name}: {result}")
+                self.performance_monitor.record_error(f"universe_calculation_error: {indicator_name}")
+                continue
+            for symbol, symbol_results in universe_results.items():
+                if symbol in result:
+                    symbol_results[indicator_name] = result[symbol]
+
+        calculation_time = (time.time() - start_time) * 1000
+        self.total_calculations += len(names)
+        self.performance_monitor.record_metric("universe_calculation_time", calculation_time)
+        self.performance_monitor.record_metric("universe_symbols", len(universe_results))
+
+        return universe_results
+
+    async def warm_up_streaming(self, symbol: str, timeframe: Union[str, Timeframe], data: pd.DataFrame,
+                                indicators: List[str] = None,
+                                parameters: Dict[str, Dict[str, Any]] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Seed streaming indicator states for a series from historical candles.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            data: Market data as DataFrame, oldest to newest
+            indicators: Streaming indicators to track, all by default
+            parameters: Parameters for each indicator
+
+        Returns:
+            Latest streaming values keyed by indicator
+        """
+        start_time = time.time()
+        values = self.streaming.warm_up(symbol, timeframe, data, indicators, parameters)
+        self.performance_monitor.record_metric("streaming_warm_up_time", (time.time() - start_time) * 1000)
+        return values
+
+    async def update_streaming(self, symbol: str, timeframe: Union[str, Timeframe],
+                               candle: Any) -> Dict[str, Dict[str, float]]:
+        """
+        Advance streaming indicator states by one closed candle in O(1).
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            candle: Closed candle (``OHLCVData`` or mapping of OHLCV fields)
+
+        Returns:
+            Latest streaming values keyed by indicator
+        """
+        start_time = time.time()
+        try:
+            values = self.streaming.update(symbol, timeframe, candle)
+        except Exception as e:
+            self.logger.error(f"Error updating streaming indicators for {symbol}: {e}")
+            self.performance_monitor.increment_counter("streaming_update_errors", tags={"symbol": symbol})
+            return self.streaming.get_values(symbol, timeframe)
 
-        return indicator_results
+        self.performance_monitor.record_metric("streaming_update_time", (time.time() - start_time) * 1000)
+        return values
 
     async def calculate_long_signals(self, data: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -966,6 +1558,8 @@ class IndicatorEngine:
             "total_calculations": self.total_calculations,
             "average_calculation_time_ms": self.average_calculation_time,
             "cache_stats": cache_stats,
+            "streaming_stats": self.streaming.get_stats(),
+            "executor_stats": self.executor.get_stats(),
             "available_indicators": len(self.calculators),
             "uptime_seconds": time.time() - self.performance_monitor.start_time,
             "error_rate": self.performance_monitor.get_error_rate()
@@ -1006,7 +1600,7 @@ class IndicatorEngine:
         """Shutdown the indicator engine."""
         self.logger.info("Shutting down indicator engine")
 
-        # Shutdown thread pool
+        # Shutdown worker pools
         self.executor.shutdown(wait=True)
 
         # Close Redis connection
@@ -0,0 +1,173 @@
+"""
+Indicator Dependency Graph for Long Analyst Agent.
+
+Moving averages, true range, rolling deviations and rolling extremes are
+shared by many indicators and detectors. This module models them as nodes
+of a small dependency graph over one OHLCV frame: each node is evaluated
+lazily, at most once, and every consumer in a recognition pass reuses the
+same series instead of running its own rolling-window pass.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+# Intermediate nodes behind each indicator name a detector can declare in
+# get_required_indicators(); used to warm the graph before detectors run
+INDICATOR_DEPENDENCIES: Dict[str, List[Tuple]] = {
+    'sma': [('sma', 'close', 20), ('sma', 'close', 50)],
+    'ema': [('ema', 'close', 12), ('ema', 'close', 26)],
+    'macd': [('ema', 'close', 12), ('ema', 'close', 26)],
+    'bollinger_bands': [('sma', 'close', 20), ('std', 'close', 20)],
+    'atr': [('sma', 'true_range', 14)],
+    'adx': [('sma', 'true_range', 14)],
+    'stochastic': [('rolling_min', 'low', 14, False), ('rolling_max', 'high', 14, False)],
+}
+
+# Centered swing-point extremes read by every signal detector; warmed on
+# every prepare() rather than declared as an indicator
+SWING_POINT_NODES: List[Tuple] = [('rolling_min', 'low', 5, True), ('rolling_max', 'high', 5, True)]
+
+
+class IndicatorGraph:
+    """
+    Memoized intermediate indicator series over one OHLCV frame.
+
+    Nodes are keyed by ``(operation, source, *parameters)``. A source is a
+    column of the frame or a derived series (``range``, ``true_range``),
+    which is itself a node. Returned series are shared between consumers
+    and must not be modified in place.
+    """
+
+    DERIVED_SOURCES = ('range', 'true_range')
+
+    def __init__(self, data: pd.DataFrame):
+        """Initialize the graph over an OHLCV frame."""
+        self.data = data
+        self._nodes: Dict[Hashable, pd.Series] = {}
+        self._lock = threading.RLock()
+
+        # Metrics
+        self.computed = 0
+        self.reused = 0
+
+    def _node(self, key: Hashable, compute: Callable[[], pd.Series]) -> pd.Series:
+        """Return a memoized node, computing it on first use."""
+        with self._lock:
+            series = self._nodes.get(key)
+            if series is None:
+                series = compute()
+                self._nodes[key] = series
+                self.computed += 1
+            else:
+                self.reused += 1
+            return series
+
+    def has_source(self, source: Any) -> bool:
+        """Check whether a name is a column or derived series of this graph."""
+        return source in self.DERIVED_SOURCES or source in self.data.columns
+
+    def holds(self, data: Union[pd.Series, pd.DataFrame]) -> bool:
+        """Check whether a series is a column of this graph's frame, not just a same-named one, or a frame is that frame."""
+        if isinstance(data, pd.DataFrame):
+            return data is self.data or (
+                len(data.columns) > 0 and all(self.holds(data[column]) for column in data.columns)
+            )
+        series = data
+        if series.name not in self.data.columns or len(series) != len(self.data):
+            return False
+        column = self.data[series.name]
+        if series is column or len(series) == 0:
+            return True
+        index = self.data.index
+        if series.index[0] != index[0] or series.index[-1] != index[-1]:
+            return False
+        last, expected = series.iloc[-1], column.iloc[-1]
+        return last == expected or (last != last and expected != expected)
+
+    def source(self, source: str) -> pd.Series:
+        """Get a frame column or a derived series."""
+        if source == 'range':
+            return self._node(('range',), lambda: self.data['high'] - self.data['low'])
+        if source == 'true_range':
+            return self.true_range()
+        return self.data[source]
+
+    def shift(self, source: str, periods: int = 1) -> pd.Series:
+        """Shifted series (previous values for ``periods=1``)."""
+        return self._node(('shift', source, periods), lambda: self.source(source).shift(periods))
+
+    def true_range(self) -> pd.Series:
+        """True range; the first bar falls back to high - low."""
+        def compute() -> pd.Series:
+            previous_close = self.shift('close')
+            high_close = np.abs(self.data['high'] - previous_close)
+            low_close = np.abs(self.data['low'] - previous_close)
+            return np.fmax(self.source('range'), np.fmax(high_close, low_close))
+
+        return self._node(('true_range',), compute)
+
+    def sma(self, source: str, period: int) -> pd.Series:
+        """Simple moving average."""
+        return self._node(('sma', source, period), lambda: self.source(source).rolling(window=period).mean())
+
+    def ema(self, source: str, period: int) -> pd.Series:
+        """Exponential moving average (span ``period``, ``adjust=False``)."""
+        return self._node(('ema', source, period),
+                          lambda: self.source(source).ewm(span=period, adjust=False).mean())
+
+    def std(self, source: str, period: int) -> pd.Series:
+        """Rolling sample standard deviation."""
+        return self._node(('std', source, period), lambda: self.source(source).rolling(window=period).std())
+
+    def rolling_max(self, source: str, window: int, center: bool = False) -> pd.Series:
+        """Rolling maximum."""
+        return self._node(('rolling_max', source, window, center),
+                          lambda: self.source(source).rolling(window=window, center=center).max())
+
+    def rolling_min(self, source: str, window: int, center: bool = False) -> pd.Series:
+        """Rolling minimum."""
+        return self._node(('rolling_min', source, window, center),
+                          lambda: self.source(source).rolling(window=window, center=center).min())
+
+    def atr(self, period: int = 14) -> pd.Series:
+        """Average true range."""
+        return self.sma('true_range', period)
+
+    def evaluate(self, key: Tuple) -> pd.Series:
+        """Evaluate a node from its key, e.g. ``('sma', 'close', 20)``."""
+        operation, *arguments = key
+        if operation in ('range', 'true_range'):
+            return self.source(operation)
+        return getattr(self, operation)(*arguments)
+
+    def prepare(self, indicator_names: Iterable[str]) -> int:
+        """
+        Evaluate the intermediate nodes behind the given indicators.
+
+        Swing-point extremes shared by the signal detectors are always
+        evaluated as well.
+
+        Args:
+            indicator_names: Indicator names, e.g. from get_required_indicators()
+
+        Returns:
+            Number of nodes evaluated or already present
+        """
+        keys = {key for name in indicator_names for key in INDICATOR_DEPENDENCIES.get(name, [])}
+        keys.update(SWING_POINT_NODES)
+        for key in keys:
+            if self.has_source(key[1]):
+                self.evaluate(key)
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get graph statistics."""
+        return {
+            'nodes': len(self._nodes),
+            'computed': self.computed,
+            'reused': self.reused
+        }
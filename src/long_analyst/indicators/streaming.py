@@ -0,0 +1,813 @@
+"""
+Streaming Technical Indicators for Long Analyst Agent.
+
+This module provides stateful, incremental versions of the indicators in
+``utils.indicators.IndicatorCalculator``. Each streaming indicator keeps the
+running state of its batch counterpart and advances it in O(1) per candle,
+so a live feed no longer has to recompute the full pandas series on every tick.
+
+The running state replicates the arithmetic used by pandas' rolling and
+exponentially weighted kernels (Kahan-compensated rolling sums/means,
+Welford rolling variance, ``ewm(adjust=False)``), which keeps streaming
+results bit-for-bit equal to the batch path once warmed up from the same
+history.
+"""
+
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+import pandas as pd
+
+
+NaN = float('nan')
+
+# Mirrors pandas' ill-conditioning threshold for the rolling variance kernel
+_INV_COND_TOL = float(np.finfo(np.float64).eps) * 1e3
+
+
+def _div(numerator: float, denominator: float) -> float:
+    """Divide with IEEE semantics (inf/nan on zero) like numpy arrays do."""
+    try:
+        return numerator / denominator
+    except ZeroDivisionError:
+        if numerator != numerator or numerator == 0:
+            return NaN
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+
+
+def _nanmax(*values: float) -> float:
+    """Maximum ignoring NaN values, NaN if all values are NaN."""
+    result = NaN
+    for value in values:
+        if value == value and (result != result or value > result):
+            result = value
+    return result
+
+
+def _zsqrt(value: float) -> float:
+    """Square root clipping negative values to zero (pandas ``zsqrt``)."""
+    if value != value:
+        return NaN
+    if value < 0:
+        return 0.0
+    return math.sqrt(value)
+
+
+class _RollingMean:
+    """Running equivalent of ``Series.rolling(window).mean()``."""
+
+    __slots__ = ('window', '_values', '_nobs', '_neg_ct', '_sum',
+                 '_compensation_add', '_compensation_remove', '_same_count', '_prev_value')
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values = deque()
+        self._nobs = 0
+        self._neg_ct = 0
+        self._sum = 0.0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._same_count = 0
+        self._prev_value = NaN
+
+    def update(self, value: float) -> float:
+        """Push a value and return the mean of the current window."""
+        if len(self._values) == self.window:
+            old = self._values.popleft()
+            if old == old:
+                self._nobs -= 1
+                y = -old - self._compensation_remove
+                t = self._sum + y
+                self._compensation_remove = t - self._sum - y
+                self._sum = t
+                if math.copysign(1.0, old) < 0:
+                    self._neg_ct -= 1
+
+        self._values.append(value)
+        if value == value:
+            self._nobs += 1
+            y = value - self._compensation_add
+            t = self._sum + y
+            self._compensation_add = t - self._sum - y
+            self._sum = t
+            if math.copysign(1.0, value) < 0:
+                self._neg_ct += 1
+
+            if value == self._prev_value:
+                self._same_count += 1
+            else:
+                self._same_count = 1
+            self._prev_value = value
+
+        nobs = self._nobs
+        if nobs >= self.window and nobs > 0:
+            if self._same_count >= nobs:
+                return self._prev_value
+            result = self._sum / nobs
+            if self._neg_ct == 0 and result < 0:
+                return 0.0
+            if self._neg_ct == nobs and result > 0:
+                return 0.0
+            return result
+        return NaN
+
+
+class _RollingSum:
+    """Running equivalent of ``Series.rolling(window).sum()``."""
+
+    __slots__ = ('window', '_values', '_nobs', '_sum', '_compensation_add',
+                 '_compensation_remove', '_same_count', '_prev_value')
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values = deque()
+        self._nobs = 0
+        self._sum = 0.0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._same_count = 0
+        self._prev_value = NaN
+
+    def update(self, value: float) -> float:
+        """Push a value and return the sum of the current window."""
+        if len(self._values) == self.window:
+            old = self._values.popleft()
+            if old == old:
+                self._nobs -= 1
+                y = -old - self._compensation_remove
+                t = self._sum + y
+                self._compensation_remove = t - self._sum - y
+                self._sum = t
+
+        self._values.append(value)
+        if value == value:
+            self._nobs += 1
+            y = value - self._compensation_add
+            t = self._sum + y
+            self._compensation_add = t - self._sum - y
+            self._sum = t
+
+            if value == self._prev_value:
+                self._same_count += 1
+            else:
+                self._same_count = 1
+            self._prev_value = value
+
+        if self._nobs >= self.window:
+            if self._same_count >= self._nobs:
+                return self._prev_value * self._nobs
+            return self._sum
+        return NaN
+
+
+class _RollingVariance:
+    """Running equivalent of ``Series.rolling(window).var()`` (ddof=1)."""
+
+    __slots__ = ('window', 'ddof', '_values', '_nobs', '_mean', '_ssqdm',
+                 '_compensation_add', '_compensation_remove', '_unstable')
+
+    def __init__(self, window: int, ddof: int = 1):
+        self.window = window
+        self.ddof = ddof
+        self._values = deque()
+        self._nobs = 0.0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._unstable = False
+
+    def _add(self, value: float) -> None:
+        if value != value:
+            return
+        prev_m2 = self._ssqdm
+        self._nobs += 1
+        prev_mean = self._mean - self._compensation_add
+        y = value - self._compensation_add
+        t = y - self._mean
+        self._compensation_add = t + self._mean - y
+        self._mean = self._mean + t / self._nobs
+        self._ssqdm = self._ssqdm + (value - prev_mean) * (value - self._mean)
+        if prev_m2 * _INV_COND_TOL > self._ssqdm:
+            self._unstable = True
+
+    def _remove(self, value: float) -> None:
+        if value != value:
+            return
+        prev_m2 = self._ssqdm
+        self._nobs -= 1
+        if self._nobs:
+            prev_mean = self._mean - self._compensation_remove
+            y = value - self._compensation_remove
+            t = y - self._mean
+            self._compensation_remove = t + self._mean - y
+            self._mean = self._mean - t / self._nobs
+            self._ssqdm = self._ssqdm - (value - prev_mean) * (value - self._mean)
+            if prev_m2 * _INV_COND_TOL > self._ssqdm:
+                self._unstable = True
+        else:
+            self._mean = 0.0
+            self._ssqdm = 0.0
+            self._unstable = False
+
+    def update(self, value: float) -> float:
+        """Push a value and return the variance of the current window."""
+        if len(self._values) == self.window:
+            self._remove(self._values.popleft())
+        self._values.append(value)
+        self._add(value)
+
+        if self._unstable:
+            # Recompute from the window, as pandas does after cancellation
+            self._nobs = self._mean = self._ssqdm = 0.0
+            self._compensation_add = self._compensation_remove = 0.0
+            for window_value in self._values:
+                self._add(window_value)
+            self._unstable = False
+
+        if self._nobs >= max(self.window, 1) and self._nobs > self.ddof:
+            return self._ssqdm / (self._nobs - self.ddof)
+        return NaN
+
+
+class _RollingExtreme:
+    """Running ``rolling(window).max()``/``min()`` using a monotonic deque."""
+
+    __slots__ = ('window', 'is_max', '_candidates', '_valid', '_index')
+
+    def __init__(self, window: int, is_max: bool):
+        self.window = window
+        self.is_max = is_max
+        self._candidates = deque()  # (index, value), monotonic in value
+        self._valid = deque()  # indices of non-NaN values inside the window
+        self._index = -1
+
+    def update(self, value: float) -> float:
+        """Push a value and return the extreme of the current window."""
+        self._index += 1
+        window_start = self._index - self.window + 1
+
+        while self._candidates and self._candidates[0][0] < window_start:
+            self._candidates.popleft()
+        while self._valid and self._valid[0] < window_start:
+            self._valid.popleft()
+
+        if value == value:
+            self._valid.append(self._index)
+            if self.is_max:
+                while self._candidates and value >= self._candidates[-1][1]:
+                    self._candidates.pop()
+            else:
+                while self._candidates and value <= self._candidates[-1][1]:
+                    self._candidates.pop()
+            self._candidates.append((self._index, value))
+
+        if not self._candidates or len(self._valid) < self.window:
+            return NaN
+        return self._candidates[0][1]
+
+
+class _ExponentialMean:
+    """Running equivalent of ``Series.ewm(span=span, adjust=False).mean()``."""
+
+    __slots__ = ('span', '_com', '_old_wt_factor', '_new_wt', '_weighted', '_old_wt', '_nobs')
+
+    def __init__(self, span: int):
+        self.span = span
+        self._com = (span - 1) / 2
+        alpha = 1. / (1. + self._com)
+        self._old_wt_factor = 1. - alpha
+        self._new_wt = alpha
+        self._weighted = None
+        self._old_wt = 1.
+        self._nobs = 0
+
+    def update(self, value: float) -> float:
+        """Push a value and return the current exponential mean."""
+        is_observation = value == value
+
+        if self._weighted is None:
+            self._weighted = value
+            self._nobs = int(is_observation)
+        else:
+            self._nobs += is_observation
+            weighted = self._weighted
+            if weighted == weighted:
+                self._old_wt *= self._old_wt_factor
+                if is_observation:
+                    if weighted != value:
+                        if self._com == 1:
+                            self._new_wt = 1. - self._old_wt
+                        weighted = self._old_wt * weighted + self._new_wt * value
+                        weighted /= (self._old_wt + self._new_wt)
+                    self._old_wt = 1.
+            elif is_observation:
+                weighted = value
+            self._weighted = weighted
+
+        return self._weighted if self._nobs >= 1 else NaN
+
+
+class _CumulativeSum:
+    """Running equivalent of ``Series.cumsum()`` (NaN skipped, not propagated)."""
+
+    __slots__ = ('_total',)
+
+    def __init__(self):
+        self._total = None
+
+    def update(self, value: float) -> float:
+        """Push a value and return the cumulative sum."""
+        is_observation = value == value
+        step = value if is_observation else 0.0
+        self._total = step if self._total is None else self._total + step
+        return self._total if is_observation else NaN
+
+
+class StreamingIndicator(ABC):
+    """Base class for O(1) incremental indicator calculators."""
+
+    name: str = ""
+    fields: Tuple[str, ...] = ('close',)
+
+    def __init__(self, parameters: Dict[str, Any] = None):
+        """Initialize the streaming indicator."""
+        self.parameters = {**self.get_default_parameters(), **(parameters or {})}
+        self.values: Dict[str, float] = {}
+        self.count = 0
+
+    def get_default_parameters(self) -> Dict[str, Any]:
+        """Get default parameters for the indicator."""
+        return {}
+
+    @abstractmethod
+    def _step(self, *bar: float) -> Dict[str, float]:
+        """Advance the running state by one bar of ``fields`` values."""
+        pass
+
+    def update(self, candle: Any) -> Dict[str, float]:
+        """
+        Advance the indicator by one closed candle.
+
+        Args:
+            candle: ``OHLCVData``, mapping or row exposing the required fields
+
+        Returns:
+            Latest indicator values keyed like the batch calculator output
+        """
+        self.values = self._step(*(_candle_field(candle, field) for field in self.fields))
+        self.count += 1
+        return self.values
+
+    def warm_up(self, data: pd.DataFrame) -> Dict[str, float]:
+        """
+        Feed a block of historical candles through the running state.
+
+        Args:
+            data: OHLCV DataFrame ordered oldest to newest
+
+        Returns:
+            Indicator values after the last historical candle
+        """
+        columns = [data[field].to_numpy(dtype=np.float64).tolist() for field in self.fields]
+        step = self._step
+        values = self.values
+        for bar in zip(*columns):
+            values = step(*bar)
+        self.values = values
+        self.count += len(data)
+        return self.values
+
+    @property
+    def is_ready(self) -> bool:
+        """Check whether all outputs are populated (past the warm-up window)."""
+        return bool(self.values) and all(value == value for value in self.values.values())
+
+
+def _candle_field(candle: Any, field: str) -> float:
+    """Read an OHLCV field from a candle-like object."""
+    if isinstance(candle, dict):
+        return float(candle[field])
+    return float(getattr(candle, field))
+
+
+class StreamingRSI(StreamingIndicator):
+    """Incremental RSI matching ``IndicatorCalculator.rsi``."""
+
+    name = "rsi"
+    fields = ('close',)
+
+    def __init__(self, parameters: Dict[str, Any] = None):
+        super().__init__(parameters)
+        period = self.parameters['period']
+        self._prev_close = None
+        self._gain = _RollingMean(period)
+        self._loss = _RollingMean(period)
+
+    def get_default_parameters(self) -> Dict[str, Any]:
+        return {'period': 14}
+
+    def _step(self, close: float) -> Dict[str, float]:
+        delta = NaN if self._prev_close is None else close - self._prev_close
+        self._prev_close = close
+
+        gain = self._gain.update(delta if delta > 0 else 0.0)
+        loss = self._loss.update(-(delta if delta < 0 else 0.0))
+        rs = _div(gain, loss)
+        return {'rsi': 100 - _div(100, 1 + rs)}
+
+
+class StreamingMACD(StreamingIndicator):
+    """Incremental MACD matching ``IndicatorCalculator.macd``."""
+
+    name = "macd"
+    fields = ('close',)
+
+    def __init__(self, parameters: Dict[str, Any] = None):
+        super().__init__(parameters)
+        self._fast = _ExponentialMean(self.parameters['fast'])
+        self._slow = _ExponentialMean(self.parameters['slow'])
+        self._signal = _ExponentialMean(self.parameters['signal'])
+
+    def get_default_parameters(self) -> Dict[str, Any]:
+        return {'fast': 12, 'slow': 26, 'signal': 9}
+
+    def _step(self, close: float) -> Dict[str, float]:
+        macd_line = self._fast.update(close) - self._slow.update(close)
+        signal_line = self._signal.update(macd_line)
+        return {
+            'macd': macd_line,
+            'signal': signal_line,
+            'histogram': macd_line - signal_line
+        }
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    """Incremental Bollinger Bands matching ``IndicatorCalculator.bollinger_bands``."""
+
+    name = "bollinger_bands"
+    fields = ('close',)
+
+    def __init__(self, parameters: Dict[str, Any] = None):
+        super().__init__(parameters)
+        period = self.parameters['period']
+        self._mean = _RollingMean(period)
+        self._variance = _RollingVariance(period)
+
+    def get_default_parameters(self) -> Dict[str, Any]:
+        return {'period': 20, 'std_dev': 2.0}
+
+    def _step(self, close: float) -> Dict[str, float]:
+        middle = self._mean.update(close)
+        std = _zsqrt(self._variance.update(close))
+        upper = middle + (std * self.parameters['std_dev'])
+        lower = middle - (std * self.parameters['std_dev'])
+        return {
+            'upper': upper,
+            'middle': middle,
+            'lower': lower,
+            'width': upper - lower
+        }
+
+
+class StreamingStochastic(StreamingIndicator):
+    """Incremental Stochastic Oscillator matching ``IndicatorCalculator.stochastic``."""
+
+    name = "stochastic"
+    fields = ('high', 'low', 'close')
+
+    def __init__(self, parameters: Dict[str, Any] = None):
+        super().__init__(parameters)
+        k_period = self.parameters['k_period']
+        self._lowest = _RollingExtreme(k_period, is_max=False)
+        self._highest = _RollingExtreme(k_period, is_max=True)
+        self._d = _RollingMean(self.parameters['d_period'])
+
+    def get_default_parameters(self) -> Dict[str, Any]:
+        return {'k_period': 14, 'd_period': 3}
+
+    def _step(self, high: float, low: float, close: float) -> Dict[str, float]:
+        low_min = self._lowest.update(low)
+        high_max = self._highest.update(high)
+        k_percent = 100 * _div(close - low_min, high_max - low_min)
+        return {'k': k_percent, 'd': self._d.update(k_percent)}
+
+
+class StreamingATR(StreamingIndicator):
+    """Incremental Average True Range matching ``IndicatorCalculator.atr``."""
+
+    name = "atr"
+    fields = ('high', 'low', 'close')
+
+    def __init__(self, parameters: Dict[str, Any] = None):
+        super().__init__(parameters)
+        self._prev_close = None
+        self._mean = _RollingMean(self.parameters['period'])
+
+    def get_default_parameters(self) -> Dict[str, Any]:
+        return {'period': 14}
+
+    def _true_range(self, high: float, low: float, close: float) -> float:
+        prev_close = NaN if self._prev_close is None else self._prev_close
+        self._prev_close = close
+        return _nanmax(high - low, abs(high - prev_close), abs(low - prev_close))
+
+    def _step(self, high: float, low: float, close: float) -> Dict[str, float]:
+        return {'atr': self._mean.update(self._true_range(high, low, close))}
+
+
+class StreamingADX(StreamingIndicator):
+    """Incremental Average Directional Index matching ``IndicatorCalculator.adx``."""
+
+    name = "adx"
+    fields = ('high', 'low', 'close')
+
+    def __init__(self, parameters: Dict[str, Any] = None):
+        super().__init__(parameters)
+        period = self.parameters['period']
+        self._prev_high = None
+        self._prev_low = None
+        self._plus_dm = _RollingMean(period)
+        self._minus_dm = _RollingMean(period)
+        self._atr = StreamingATR({'period': period})
+        self._dx = _RollingMean(period)
+
+    def get_default_parameters(self) -> Dict[str, Any]:
+        return {'period': 14}
+
+    def _step(self, high: float, low: float, close: float) -> Dict[str, float]:
+        high_diff = NaN if self._prev_high is None else high - self._prev_high
+        low_diff = NaN if self._prev_low is None else low - self._prev_low
+        self._prev_high = high
+        self._prev_low = low
+
+        plus_dm = self._plus_dm.update(
+            high_diff if (high_diff > 0 and high_diff > low_diff) else 0.0
+        )
+        minus_dm = self._minus_dm.update(
+            low_diff if (low_diff > 0 and low_diff > high_diff) else 0.0
+        )
+        atr = self._atr._step(high, low, close)['atr']
+
+        plus_di = 100 * _div(plus_dm, atr)
+        minus_di = 100 * _div(minus_dm, atr)
+        dx = _div(100 * abs(plus_di - minus_di), plus_di + minus_di)
+
+        return {
+            'adx': self._dx.update(dx),
+            'plus_di': plus_di,
+            'minus_di': minus_di
+        }
+
+
+class StreamingOBV(StreamingIndicator):
+    """Incremental On-Balance Volume matching ``IndicatorCalculator.obv``."""
+
+    name = "obv"
+    fields = ('close', 'volume')
+
+    def __init__(self, parameters: Dict[str, Any] = None):
+        super().__init__(parameters)
+        self._prev_close = NaN
+        self._total = _CumulativeSum()
+
+    def _step(self, close: float, volume: float) -> Dict[str, float]:
+        if close > self._prev_close:
+            flow = volume
+        elif close < self._prev_close:
+            flow = -volume
+        else:
+            flow = 0.0
+        self._prev_close = close
+        return {'obv': self._total.update(flow)}
+
+
+class StreamingMFI(StreamingIndicator):
+    """Incremental Money Flow Index matching ``IndicatorCalculator.mfi``."""
+
+    name = "mfi"
+    fields = ('high', 'low', 'close', 'volume')
+
+    def __init__(self, parameters: Dict[str, Any] = None):
+        super().__init__(parameters)
+        period = self.parameters['period']
+        self._prev_typical = NaN
+        self._positive = _RollingSum(period)
+        self._negative = _RollingSum(period)
+
+    def get_default_parameters(self) -> Dict[str, Any]:
+        return {'period': 14}
+
+    def _step(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        typical_price = (high + low + close) / 3
+        money_flow = typical_price * volume
+
+        positive_mf = self._positive.update(money_flow if typical_price > self._prev_typical else 0.0)
+        negative_mf = self._negative.update(money_flow if typical_price < self._prev_typical else 0.0)
+        self._prev_typical = typical_price
+
+        money_ratio = _div(positive_mf, negative_mf)
+        return {'mfi': 100 - _div(100, 1 + money_ratio)}
+
+
+class StreamingVWAP(StreamingIndicator):
+    """Incremental cumulative VWAP matching ``IndicatorCalculator.vwap``."""
+
+    name = "vwap"
+    fields = ('high', 'low', 'close', 'volume')
+
+    def __init__(self, parameters: Dict[str, Any] = None):
+        super().__init__(parameters)
+        self._price_volume = _CumulativeSum()
+        self._volume = _CumulativeSum()
+
+    def _step(self, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        typical_price = (high + low + close) / 3
+        cumulative_pv = self._price_volume.update(typical_price * volume)
+        cumulative_volume = self._volume.update(volume)
+        return {'vwap': _div(cumulative_pv, cumulative_volume)}
+
+
+STREAMING_INDICATORS: Dict[str, Type[StreamingIndicator]] = {
+    'rsi': StreamingRSI,
+    'macd': StreamingMACD,
+    'bollinger_bands': StreamingBollingerBands,
+    'stochastic': StreamingStochastic,
+    'atr': StreamingATR,
+    'adx': StreamingADX,
+    'obv': StreamingOBV,
+    'mfi': StreamingMFI,
+    'vwap': StreamingVWAP,
+}
+
+
+SeriesKey = Tuple[str, str]
+StateKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+class StreamingIndicatorEngine:
+    """
+    Registry of streaming indicator states.
+
+    States are kept per (symbol, timeframe) series and per
+    (indicator, parameters) within a series, so the same indicator with
+    different parameters can be tracked side by side.
+    """
+
+    def __init__(self, default_indicators: Optional[List[str]] = None):
+        """Initialize the streaming engine."""
+        self.logger = logging.getLogger(__name__)
+        self.default_indicators = default_indicators or list(STREAMING_INDICATORS.keys())
+        self.series: Dict[SeriesKey, Dict[StateKey, StreamingIndicator]] = {}
+        self.last_timestamps: Dict[SeriesKey, float] = {}
+
+        # Metrics
+        self.total_updates = 0
+        self.total_warm_ups = 0
+        self.skipped_updates = 0
+
+    @staticmethod
+    def _series_key(symbol: str, timeframe: Union[str, Enum]) -> SeriesKey:
+        return symbol, timeframe.value if isinstance(timeframe, Enum) else str(timeframe)
+
+    @staticmethod
+    def _state_key(indicator: str, parameters: Dict[str, Any]) -> StateKey:
+        return indicator, tuple(sorted(parameters.items()))
+
+    @staticmethod
+    def _label(indicator: StreamingIndicator) -> str:
+        """Name results by indicator, adding parameters when not the defaults."""
+        if indicator.parameters == indicator.get_default_parameters():
+            return indicator.name
+        params = ",".join(f"{key}={value}" for key, value in sorted(indicator.parameters.items()))
+        return f"{indicator.name}({params})"
+
+    def register(self, symbol: str, timeframe: Union[str, Enum], indicator: str,
+                 parameters: Dict[str, Any] = None) -> StreamingIndicator:
+        """
+        Get or create the streaming state for an indicator on a series.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            indicator: Indicator name (see ``STREAMING_INDICATORS``)
+            parameters: Indicator parameters, defaults when omitted
+
+        Returns:
+            The streaming indicator state
+        """
+        indicator_class = STREAMING_INDICATORS.get(indicator.lower())
+        if indicator_class is None:
+            raise ValueError(f"Unknown streaming indicator: {indicator}")
+
+        states = self.series.setdefault(self._series_key(symbol, timeframe), {})
+        state = indicator_class(parameters)
+        state_key = self._state_key(state.name, state.parameters)
+        if state_key not in states:
+            states[state_key] = state
+        return states[state_key]
+
+    def warm_up(self, symbol: str, timeframe: Union[str, Enum], data: pd.DataFrame,
+                indicators: List[str] = None,
+                parameters: Dict[str, Dict[str, Any]] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Build fresh streaming states for a series from historical candles.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            data: OHLCV history ordered oldest to newest
+            indicators: Indicators to track, all supported ones by default
+            parameters: Parameters for each indicator
+
+        Returns:
+            Latest values keyed by indicator label
+        """
+        parameters = parameters or {}
+        series_key = self._series_key(symbol, timeframe)
+        self.series.pop(series_key, None)
+        self.last_timestamps.pop(series_key, None)
+
+        for indicator in indicators or self.default_indicators:
+            state = self.register(symbol, timeframe, indicator, parameters.get(indicator))
+            state.warm_up(data)
+
+        if len(data) > 0 and 'timestamp' in data.columns:
+            self.last_timestamps[series_key] = float(data['timestamp'].iloc[-1])
+
+        self.total_warm_ups += 1
+        return self.get_values(symbol, timeframe)
+
+    def update(self, symbol: str, timeframe: Union[str, Enum], candle: Any) -> Dict[str, Dict[str, float]]:
+        """
+        Advance every tracked indicator of a series by one closed candle.
+
+        Candles whose timestamp is not newer than the last applied one are
+        ignored, so re-delivered candles do not corrupt the running state.
+        A candle missing a required field raises before any state advances.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            candle: ``OHLCVData``, mapping or row with OHLCV fields
+
+        Returns:
+            Latest values keyed by indicator label
+        """
+        series_key = self._series_key(symbol, timeframe)
+        states = self.series.get(series_key)
+        if not states:
+            for indicator in self.default_indicators:
+                self.register(symbol, timeframe, indicator)
+            states = self.series[series_key]
+
+        timestamp = candle.get('timestamp') if isinstance(candle, dict) else getattr(candle, 'timestamp', None)
+        if timestamp is not None:
+            last_timestamp = self.last_timestamps.get(series_key)
+            if last_timestamp is not None and float(timestamp) <= last_timestamp:
+                self.skipped_updates += 1
+                return self.get_values(symbol, timeframe)
+
+        # Read every required field before touching any state, so a malformed
+        # candle leaves the series untouched and a corrected retry is accepted
+        fields = {field for state in states.values() for field in state.fields}
+        bar = {field: _candle_field(candle, field) for field in fields}
+
+        for state in states.values():
+            state.update(bar)
+
+        if timestamp is not None:
+            self.last_timestamps[series_key] = float(timestamp)
+        self.total_updates += 1
+        return self.get_values(symbol, timeframe)
+
+    def get_values(self, symbol: str, timeframe: Union[str, Enum]) -> Dict[str, Dict[str, float]]:
+        """Get latest values of all indicators tracked for a series."""
+        states = self.series.get(self._series_key(symbol, timeframe), {})
+        return {self._label(state): dict(state.values) for state in states.values()}
+
+    def remove(self, symbol: str, timeframe: Union[str, Enum] = None) -> int:
+        """Drop streaming states for a symbol (optionally a single timeframe)."""
+        keys = [key for key in self.series
+                if key[0] == symbol and (timeframe is None or key == self._series_key(symbol, timeframe))]
+        for key in keys:
+            del self.series[key]
+            self.last_timestamps.pop(key, None)
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get streaming engine statistics."""
+        return {
+            "tracked_series": len(self.series),
+            "tracked_states": sum(len(states) for states in self.series.values()),
+            "total_updates": self.total_updates,
+            "total_warm_ups": self.total_warm_ups,
+            "skipped_updates": self.skipped_updates,
+            "timestamp": time.time()
+        }
@@ -14,12 +14,14 @@ import time
 import pandas as pd
 import numpy as np
 from scipy import signal
-from scipy.stats import linregress
 
 from .indicator_engine import IndicatorCalculatorBase, IndicatorType, IndicatorCategory, IndicatorResult
+from .codec import register_codec_type
+from .extrema import find_extrema, cluster_levels
 from ..utils.indicators import IndicatorCalculator
 
 
+@register_codec_type
 class LevelType(Enum):
     """Types of support/resistance levels."""
     SUPPORT = "support"
@@ -30,6 +32,7 @@ class LevelType(Enum):
     TRENDLINE = "trendline"
 
 
+@register_codec_type
 class PatternType(Enum):
     """Types of chart patterns."""
     HEAD_AND_SHOULDERS = "head_and_shoulders"
@@ -42,6 +45,7 @@ class PatternType(Enum):
     CUP_AND_HANDLE = "cup_and_handle"
 
 
+@register_codec_type
 class StrengthLevel(Enum):
     """Strength levels for support/resistance."""
     WEAK = 1
@@ -50,6 +54,7 @@ class StrengthLevel(Enum):
     VERY_STRONG = 4
 
 
+@register_codec_type
 @dataclass
 class SupportResistanceLevel:
     """Individual support/resistance level."""
@@ -69,6 +74,7 @@ class SupportResistanceLevel:
             self.metadata = {}
 
 
+@register_codec_type
 @dataclass
 class ChartPattern:
     """Chart pattern detection result."""
@@ -90,6 +96,15 @@ class ChartPattern:
             self.metadata = {}
 
 
+@dataclass
+class PivotIndex:
+    """Peaks and troughs located once for a multi-window pattern scan."""
+    data: pd.DataFrame  # Largest scan window; pivot indices are positions in it
+    peaks: List[Dict[str, Any]]
+    troughs: List[Dict[str, Any]]
+    window_sizes: List[int]  # Ascending
+
+
 class SupportResistanceCalculator(IndicatorCalculatorBase):
     """Advanced support and resistance calculator."""
 
@@ -340,55 +355,20 @@ class SupportResistanceCalculator(IndicatorCalculatorBase):
 
     def _find_local_maxima(self, prices: pd.Series, window: int) -> List[float]:
         """Find local maxima in price series."""
-        maxima = []
-
-        for i in range(window, len(prices) - window):
-            window_data = prices.iloc[i-window:i+window+1]
-            if prices.iloc[i] == window_data.max():
-                maxima.append(prices.iloc[i])
-
-        return maxima
+        values = prices.to_numpy()
+        return list(values[find_extrema(values, window, kind="max", skipna=True)])
 
     def _find_local_minima(self, prices: pd.Series, window: int) -> List[float]:
         """Find local minima in price series."""
-        minima = []
-
-        for i in range(window, len(prices) - window):
-            window_data = prices.iloc[i-window:i+window+1]
-            if prices.iloc[i] == window_data.min():
-                minima.append(prices.iloc[i])
-
-        return minima
+        values = prices.to_numpy()
+        return list(values[find_extrema(values, window, kind="min", skipna=True)])
 
     def _cluster_levels(self, levels: List[float], threshold: float) -> Dict[float, int]:
         """Cluster nearby price levels."""
-        if not levels:
-            return {}
-
-        # Sort levels
-        sorted_levels = sorted(levels)
         clusters = {}
-
-        current_cluster = [sorted_levels[0]]
-        cluster_center = sorted_levels[0]
-
-        for level in sorted_levels[1:]:
-            # Check if this level belongs to current cluster
-            if abs(level - cluster_center) / cluster_center <= threshold:
-                current_cluster.append(level)
-            else:
-                # Finalize current cluster
-                avg_price = sum(current_cluster) / len(current_cluster)
-                clusters[avg_price] = len(current_cluster)
-
-                # Start new cluster
-                current_cluster = [level]
-                cluster_center = level
-
-        # Add final cluster
-        if current_cluster:
-            avg_price = sum(current_cluster) / len(current_cluster)
-            clusters[avg_price] = len(current_cluster)
+        for cluster in cluster_levels(levels, threshold):
+            members = list(cluster)
+            clusters[sum(members) / len(members)] = len(members)
 
         return clusters
 
@@ -536,10 +516,7 @@ class PatternRecognitionCalculator(IndicatorCalculatorBase):
                 raise ValueError("Invalid parameters")
 
             # Detect various patterns
-            patterns = []
-            patterns.extend(self._detect_head_and_shoulders(data, min_pattern_length, max_pattern_length))
-            patterns.extend(self._detect_double_tops_bottoms(data, min_pattern_length, max_pattern_length))
-            patterns.extend(self._detect_triangles(data, min_pattern_length, max_pattern_length))
+            patterns = self._scan_patterns(data, min_pattern_length, max_pattern_length)
 
             # Filter patterns by confidence
             high_confidence_patterns = [p for p in patterns if p.confidence >= 0.7]
@@ -585,138 +562,190 @@ class PatternRecognitionCalculator(IndicatorCalculatorBase):
             'enable_volume_confirmation': True
         }
 
-    def _detect_head_and_shoulders(self, data: pd.DataFrame, min_length: int, max_length: int) -> List[ChartPattern]:
+    def _build_pivot_index(self, data: pd.DataFrame, min_length: int, max_length: int) -> Optional[PivotIndex]:
+        """Find peaks and troughs once over the largest scan window."""
+        window_sizes = list(range(min_length, min(max_length, len(data)), 10))
+        if not window_sizes:
+            return None
+
+        scan_data = data.tail(window_sizes[-1])
+        return PivotIndex(
+            data=scan_data,
+            peaks=self._find_peaks(scan_data['high']),
+            troughs=self._find_troughs(scan_data['low']),
+            window_sizes=window_sizes
+        )
+
+    def _scan_patterns(self, data: pd.DataFrame, min_length: int, max_length: int) -> List[ChartPattern]:
+        """
+        Evaluate all pattern templates over all window sizes in one pass.
+
+        Pivots are located once; each candidate formation is evaluated in the
+        smallest window that contains it, and trend lines for every window come
+        from one set of suffix sums.
+
+        Args:
+            data: OHLCV data
+            min_length: Smallest window size
+            max_length: Upper bound of window sizes
+
+        Returns:
+            Detected patterns with overlapping duplicates removed
+        """
+        pivots = self._build_pivot_index(data, min_length, max_length)
+        if pivots is None:
+            return []
+
+        patterns = []
+        patterns.extend(self._detect_head_and_shoulders(pivots))
+        patterns.extend(self._detect_double_tops_bottoms(pivots))
+        patterns.extend(self._detect_triangles(pivots))
+
+        return self._deduplicate_patterns(patterns)
+
+    def _pivot_window(self, pivots: PivotIndex, points: List[Dict[str, Any]]) -> Optional[Tuple[pd.DataFrame, List[Dict[str, Any]]]]:
+        """
+        Get the smallest window containing a formation.
+
+        Returns:
+            Window data and the points re-indexed to it, or None if the
+            formation starts outside the largest window
+        """
+        # A pivot on the first bar of a window is not a peak of that window
+        scan_length = len(pivots.data)
+        for window_size in pivots.window_sizes:
+            offset = scan_length - window_size
+            if points[0]['index'] > offset:
+                window_points = [dict(point, index=point['index'] - offset) for point in points]
+                return pivots.data.iloc[offset:], window_points
+        return None
+
+    def _detect_head_and_shoulders(self, pivots: PivotIndex) -> List[ChartPattern]:
         """Detect head and shoulders patterns."""
         patterns = []
+        peaks = pivots.peaks
 
-        # Look for patterns in different window sizes
-        for window_size in range(min_length, min(max_length, len(data)), 10):
-            if len(data) < window_size:
+        # Left shoulder, head, right shoulder structure over consecutive peaks
+        for i in range(len(peaks) - 2):
+            left_shoulder, head, right_shoulder = peaks[i], peaks[i + 1], peaks[i + 2]
+
+            # Head should be higher than shoulders
+            if not (head['price'] > left_shoulder['price'] and
+                    head['price'] > right_shoulder['price'] and
+                    abs(left_shoulder['price'] - right_shoulder['price']) / left_shoulder['price'] < 0.05):  # Shoulders roughly equal
+                continue
+
+            window = self._pivot_window(pivots, [left_shoulder, head, right_shoulder])
+            if window is None:
                 continue
+            window_data, (left_shoulder, head, right_shoulder) = window
 
-            # Get recent data window
-            window_data = data.tail(window_size)
-
-            # Find peaks and troughs
-            peaks = self._find_peaks(window_data['high'])
-            troughs = self._find_troughs(window_data['low'])
-
-            if len(peaks) >= 3 and len(troughs) >= 2:
-                # Check for head and shoulders pattern
-                # Left shoulder, head, right shoulder structure
-                for i in range(len(peaks) - 2):
-                    left_shoulder = peaks[i]
-                    head = peaks[i + 1]
-                    right_shoulder = peaks[i + 2]
-
-                    # Head should be higher than shoulders
-                    if (head['price'] > left_shoulder['price'] and
-                        head['price'] > right_shoulder['price'] and
-                        abs(left_shoulder['price'] - right_shoulder['price']) / left_shoulder['price'] < 0.05):  # Shoulders roughly equal
-
-                        # Calculate pattern confidence
-                        confidence = self._calculate_hs_confidence(window_data, left_shoulder, head, right_shoulder)
-
-                        if confidence >= 0.7:
-                            pattern = ChartPattern(
-                                pattern_type=PatternType.HEAD_AND_SHOULDERS,
-                                pattern_direction="bearish",
-                                confidence=confidence,
-                                start_time=left_shoulder['time'],
-                                end_time=right_shoulder['time'],
-                                price_levels=[left_shoulder['price'], head['price'], right_shoulder['price']],
-                                volume_confirmation=self._check_volume_confirmation(window_data, left_shoulder['index'], right_shoulder['index']),
-                                breakout_level=min(left_shoulder['price'], right_shoulder['price']),
-                                target_price=head['price'] - (head['price'] - min(left_shoulder['price'], right_shoulder['price'])),
-                                stop_loss=head['price'] + (head['price'] - min(left_shoulder['price'], right_shoulder['price'])) * 0.1,
-                                metadata={'left_shoulder': left_shoulder, 'head': head, 'right_shoulder': right_shoulder}
-                            )
-                            patterns.append(pattern)
+            # Need at least two troughs between the window's peaks
+            if len([t for t in pivots.troughs if t['index'] > len(pivots.data) - len(window_data)]) < 2:
+                continue
+
+            # Calculate pattern confidence
+            confidence = self._calculate_hs_confidence(window_data, left_shoulder, head, right_shoulder)
+
+            if confidence >= 0.7:
+                pattern = ChartPattern(
+                    pattern_type=PatternType.HEAD_AND_SHOULDERS,
+                    pattern_direction="bearish",
+                    confidence=confidence,
+                    start_time=left_shoulder['time'],
+                    end_time=right_shoulder['time'],
+                    price_levels=[left_shoulder['price'], head['price'], right_shoulder['price']],
+                    volume_confirmation=self._check_volume_confirmation(window_data, left_shoulder['index'], right_shoulder['index']),
+                    breakout_level=min(left_shoulder['price'], right_shoulder['price']),
+                    target_price=head['price'] - (head['price'] - min(left_shoulder['price'], right_shoulder['price'])),
+                    stop_loss=head['price'] + (head['price'] - min(left_shoulder['price'], right_shoulder['price'])) * 0.1,
+                    metadata={'left_shoulder': left_shoulder, 'head': head, 'right_shoulder': right_shoulder}
+                )
+                patterns.append(pattern)
 
         return patterns
 
-    def _detect_double_tops_bottoms(self, data: pd.DataFrame, min_length: int, max_length: int) -> List[ChartPattern]:
+    def _detect_double_tops_bottoms(self, pivots: PivotIndex) -> List[ChartPattern]:
         """Detect double top and double bottom patterns."""
         patterns = []
 
-        for window_size in range(min_length, min(max_length, len(data)), 10):
-            if len(data) < window_size:
+        # Double top detection
+        peaks = pivots.peaks
+        for i in range(len(peaks) - 1):
+            # Check if peaks are at similar level
+            if not (abs(peaks[i]['price'] - peaks[i + 1]['price']) / peaks[i]['price'] < 0.02 and
+                    peaks[i + 1]['index'] - peaks[i]['index'] >= 5):  # Minimum distance between peaks
                 continue
 
-            window_data = data.tail(window_size)
-            peaks = self._find_peaks(window_data['high'])
-            troughs = self._find_troughs(window_data['low'])
-
-            # Double top detection
-            if len(peaks) >= 2:
-                for i in range(len(peaks) - 1):
-                    peak1 = peaks[i]
-                    peak2 = peaks[i + 1]
-
-                    # Check if peaks are at similar level
-                    if (abs(peak1['price'] - peak2['price']) / peak1['price'] < 0.02 and
-                        peak2['index'] - peak1['index'] >= 5):  # Minimum distance between peaks
-
-                        confidence = self._calculate_double_pattern_confidence(window_data, peak1, peak2)
-
-                        if confidence >= 0.7:
-                            pattern = ChartPattern(
-                                pattern_type=PatternType.DOUBLE_TOP,
-                                pattern_direction="bearish",
-                                confidence=confidence,
-                                start_time=peak1['time'],
-                                end_time=peak2['time'],
-                                price_levels=[peak1['price'], peak2['price']],
-                                volume_confirmation=self._check_volume_confirmation(window_data, peak1['index'], peak2['index']),
-                                breakout_level=min(peak1['price'], peak2['price']),
-                                target_price=min(peak1['price'], peak2['price']) - (max(peak1['price'], peak2['price']) - min(peak1['price'], peak2['price'])) * 0.1,
-                                stop_loss=max(peak1['price'], peak2['price']) + (max(peak1['price'], peak2['price']) - min(peak1['price'], peak2['price'])) * 0.05,
-                                metadata={'peak1': peak1, 'peak2': peak2}
-                            )
-                            patterns.append(pattern)
-
-            # Double bottom detection (similar logic for troughs)
-            if len(troughs) >= 2:
-                for i in range(len(troughs) - 1):
-                    trough1 = troughs[i]
-                    trough2 = troughs[i + 1]
-
-                    if (abs(trough1['price'] - trough2['price']) / trough1['price'] < 0.02 and
-                        trough2['index'] - trough1['index'] >= 5):
-
-                        confidence = self._calculate_double_pattern_confidence(window_data, trough1, trough2)
-
-                        if confidence >= 0.7:
-                            pattern = ChartPattern(
-                                pattern_type=PatternType.DOUBLE_BOTTOM,
-                                pattern_direction="bullish",  # Bullish signal
-                                confidence=confidence,
-                                start_time=trough1['time'],
-                                end_time=trough2['time'],
-                                price_levels=[trough1['price'], trough2['price']],
-                                volume_confirmation=self._check_volume_confirmation(window_data, trough1['index'], trough2['index']),
-                                breakout_level=max(trough1['price'], trough2['price']),
-                                target_price=max(trough1['price'], trough2['price']) + (max(trough1['price'], trough2['price']) - min(trough1['price'], trough2['price'])) * 0.1,
-                                stop_loss=min(trough1['price'], trough2['price']) - (max(trough1['price'], trough2['price']) - min(trough1['price'], trough2['price'])) * 0.05,
-                                metadata={'trough1': trough1, 'trough2': trough2}
-                            )
-                            patterns.append(pattern)
+            window = self._pivot_window(pivots, [peaks[i], peaks[i + 1]])
+            if window is None:
+                continue
+            window_data, (peak1, peak2) = window
+
+            confidence = self._calculate_double_pattern_confidence(window_data, peak1, peak2)
+
+            if confidence >= 0.7:
+                pattern = ChartPattern(
+                    pattern_type=PatternType.DOUBLE_TOP,
+                    pattern_direction="bearish",
+                    confidence=confidence,
+                    start_time=peak1['time'],
+                    end_time=peak2['time'],
+                    price_levels=[peak1['price'], peak2['price']],
+                    volume_confirmation=self._check_volume_confirmation(window_data, peak1['index'], peak2['index']),
+                    breakout_level=min(peak1['price'], peak2['price']),
+                    target_price=min(peak1['price'], peak2['price']) - (max(peak1['price'], peak2['price']) - min(peak1['price'], peak2['price'])) * 0.1,
+                    stop_loss=max(peak1['price'], peak2['price']) + (max(peak1['price'], peak2['price']) - min(peak1['price'], peak2['price'])) * 0.05,
+                    metadata={'peak1': peak1, 'peak2': peak2}
+                )
+                patterns.append(pattern)
+
+        # Double bottom detection (similar logic for troughs)
+        troughs = pivots.troughs
+        for i in range(len(troughs) - 1):
+            if not (abs(troughs[i]['price'] - troughs[i + 1]['price']) / troughs[i]['price'] < 0.02 and
+                    troughs[i + 1]['index'] - troughs[i]['index'] >= 5):
+                continue
+
+            window = self._pivot_window(pivots, [troughs[i], troughs[i + 1]])
+            if window is None:
+                continue
+            window_data, (trough1, trough2) = window
+
+            confidence = self._calculate_double_pattern_confidence(window_data, trough1, trough2)
+
+            if confidence >= 0.7:
+                pattern = ChartPattern(
+                    pattern_type=PatternType.DOUBLE_BOTTOM,
+                    pattern_direction="bullish",  # Bullish signal
+                    confidence=confidence,
+                    start_time=trough1['time'],
+                    end_time=trough2['time'],
+                    price_levels=[trough1['price'], trough2['price']],
+                    volume_confirmation=self._check_volume_confirmation(window_data, trough1['index'], trough2['index']),
+                    breakout_level=max(trough1['price'], trough2['price']),
+                    target_price=max(trough1['price'], trough2['price']) + (max(trough1['price'], trough2['price']) - min(trough1['price'], trough2['price'])) * 0.1,
+                    stop_loss=min(trough1['price'], trough2['price']) - (max(trough1['price'], trough2['price']) - min(trough1['price'], trough2['price'])) * 0.05,
+                    metadata={'trough1': trough1, 'trough2': trough2}
+                )
+                patterns.append(pattern)
 
         return patterns
 
-    def _detect_triangles(self, data: pd.DataFrame, min_length: int, max_length: int) -> List[ChartPattern]:
+    def _detect_triangles(self, pivots: PivotIndex) -> List[ChartPattern]:
         """Detect triangle patterns (ascending, descending, symmetrical)."""
         patterns = []
+        scan_data = pivots.data
 
-        for window_size in range(min_length, min(max_length, len(data)), 10):
-            if len(data) < window_size:
-                continue
-
-            window_data = data.tail(window_size)
+        # Trend lines and volume slopes for every window size at once
+        upper_trendlines = self._find_trendlines(scan_data['high'], pivots.window_sizes, descending=True)
+        lower_trendlines = self._find_trendlines(scan_data['low'], pivots.window_sizes, ascending=True)
+        volume_slopes = (self._window_slopes(scan_data['volume'].to_numpy(dtype=np.float64), pivots.window_sizes)[0]
+                         if 'volume' in scan_data.columns else None)
 
-            # Find trend lines
-            upper_trendline = self._find_trendline(window_data['high'], descending=True)
-            lower_trendline = self._find_trendline(window_data['low'], ascending=True)
+        for w, window_size in enumerate(pivots.window_sizes):
+            upper_trendline = upper_trendlines[w]
+            lower_trendline = lower_trendlines[w]
 
             if upper_trendline and lower_trendline:
                 # Check for convergence (triangle formation)
@@ -736,6 +765,7 @@ class PatternRecognitionCalculator(IndicatorCalculatorBase):
                     else:
                         continue
 
+                    window_data = scan_data.tail(window_size)
                     confidence = self._calculate_triangle_confidence(window_data, upper_trendline, lower_trendline)
 
                     if confidence >= 0.7:
@@ -746,7 +776,7 @@ class PatternRecognitionCalculator(IndicatorCalculatorBase):
                             start_time=window_data.index[0],
                             end_time=window_data.index[-1],
                             price_levels=[upper_trendline['intercept'], lower_trendline['intercept']],
-                            volume_confirmation=self._check_volume_convergence(window_data),
+                            volume_confirmation=bool(volume_slopes is not None and volume_slopes[w] < 0),
                             breakout_level=None,  # Will be determined by breakout direction
                             target_price=None,
                             stop_loss=None,
@@ -760,6 +790,44 @@ class PatternRecognitionCalculator(IndicatorCalculatorBase):
 
         return patterns
 
+    # Patterns of one kind are the same formation when their spans overlap by
+    # this share of their union and their price levels agree within tolerance
+    DUPLICATE_OVERLAP_RATIO = 0.8
+    DUPLICATE_PRICE_TOLERANCE = 0.01
+
+    def _is_duplicate_pattern(self, pattern: ChartPattern, other: ChartPattern) -> bool:
+        """Check whether two patterns describe the same formation."""
+        if (pattern.pattern_type != other.pattern_type or
+                pattern.pattern_direction != other.pattern_direction or
+                pattern.metadata.get('triangle_type') != other.metadata.get('triangle_type')):
+            return False
+
+        def position(value: Any) -> float:
+            return value.timestamp() if hasattr(value, 'timestamp') else float(value)
+
+        start, end = position(pattern.start_time), position(pattern.end_time)
+        other_start, other_end = position(other.start_time), position(other.end_time)
+        overlap = min(end, other_end) - max(start, other_start)
+        union = max(end, other_end) - min(start, other_start)
+        if overlap < 0 or (union > 0 and overlap / union < self.DUPLICATE_OVERLAP_RATIO):
+            return False
+
+        if len(pattern.price_levels) != len(other.price_levels):
+            return False
+        return all(abs(a - b) <= self.DUPLICATE_PRICE_TOLERANCE * max(abs(a), abs(b))
+                   for a, b in zip(pattern.price_levels, other.price_levels))
+
+    def _deduplicate_patterns(self, patterns: List[ChartPattern]) -> List[ChartPattern]:
+        """Keep the most confident of near-identical patterns of the same kind."""
+        kept = []
+        for pattern in sorted(patterns, key=lambda p: p.confidence, reverse=True):
+            if not any(self._is_duplicate_pattern(pattern, other) for other in kept):
+                kept.append(pattern)
+
+        # Restore detection order
+        kept_ids = {id(pattern) for pattern in kept}
+        return [pattern for pattern in patterns if id(pattern) in kept_ids]
+
     def _find_peaks(self, prices: pd.Series) -> List[Dict[str, Any]]:
         """Find significant peaks in price series."""
         peaks = []
@@ -792,33 +860,64 @@ class PatternRecognitionCalculator(IndicatorCalculatorBase):
 
         return troughs
 
-    def _find_trendline(self, prices: pd.Series, ascending: bool = False, descending: bool = False) -> Optional[Dict[str, Any]]:
-        """Find trend line for price series."""
-        if len(prices) < 5:
-            return None
-
-        # Use linear regression to find trend
-        x = np.arange(len(prices))
-        y = prices.values
-
-        slope, intercept, r_value, p_value, std_err = linregress(x, y)
-
-        # Check if trend matches requested direction
-        if ascending and slope <= 0:
-            return None
-        if descending and slope >= 0:
-            return None
+    @staticmethod
+    def _window_slopes(values: np.ndarray, window_sizes: List[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Least-squares fit over the trailing ``window_sizes`` bars of ``values``.
+
+        Returns:
+            Slopes, intercepts and correlation coefficients per window
+        """
+        # Center values so the suffix sums do not lose precision
+        offset = values.mean()
+        centered = values - offset
+        positions = np.arange(len(values), dtype=np.float64)
+
+        sizes = np.asarray(window_sizes, dtype=np.float64)
+        starts = len(values) - np.asarray(window_sizes)
+        sum_y = np.cumsum(centered[::-1])[::-1][starts]
+        sum_py = np.cumsum((positions * centered)[::-1])[::-1][starts]
+        sum_yy = np.cumsum((centered * centered)[::-1])[::-1][starts]
+
+        # x runs 0..n-1 within each window
+        sum_x = sizes * (sizes - 1) / 2
+        sum_xx = (sizes - 1) * sizes * (2 * sizes - 1) / 6
+        sum_xy = sum_py - starts * sum_y
+
+        ss_x = sum_xx - sum_x * sum_x / sizes
+        ss_y = np.maximum(sum_yy - sum_y * sum_y / sizes, 0.0)
+        ss_xy = sum_xy - sum_x * sum_y / sizes
+
+        slopes = ss_xy / ss_x
+        intercepts = offset + (sum_y - slopes * sum_x) / sizes
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r_values = np.where(ss_y > 0, ss_xy / np.sqrt(ss_x * ss_y), 0.0)
+
+        return slopes, intercepts, np.clip(r_values, -1.0, 1.0)
+
+    def _find_trendlines(self, prices: pd.Series, window_sizes: List[int], ascending: bool = False,
+                         descending: bool = False) -> List[Optional[Dict[str, Any]]]:
+        """Find the trend line of each trailing window of a price series."""
+        slopes, intercepts, r_values = self._window_slopes(prices.to_numpy(dtype=np.float64), window_sizes)
+
+        trendlines = []
+        for window_size, slope, intercept, r_value in zip(window_sizes, slopes, intercepts, r_values):
+            if (window_size < 5 or
+                    # Check if trend matches requested direction
+                    (ascending and slope <= 0) or (descending and slope >= 0) or
+                    # Check if trend is significant
+                    abs(r_value) < 0.7):
+                trendlines.append(None)
+                continue
 
-        # Check if trend is significant
-        if abs(r_value) < 0.7:  # Weak correlation
-            return None
+            trendlines.append({
+                'slope': float(slope),
+                'intercept': float(intercept),
+                'r_squared': float(r_value ** 2),
+                'strength': float(abs(r_value))
+            })
 
-        return {
-            'slope': slope,
-            'intercept': intercept,
-            'r_squared': r_value ** 2,
-            'strength': abs(r_value)
-        }
+        return trendlines
 
     def _calculate_hs_confidence(self, data: pd.DataFrame, left_shoulder: Dict, head: Dict, right_shoulder: Dict) -> float:
         """Calculate confidence for head and shoulders pattern."""
@@ -886,15 +985,6 @@ class PatternRecognitionCalculator(IndicatorCalculatorBase):
         # Volume should be significant
         return pattern_volume.mean() > avg_volume * 0.8
 
-    def _check_volume_convergence(self, data: pd.DataFrame) -> bool:
-        """Check if volume shows convergence pattern."""
-        if 'volume' not in data.columns:
-            return False
-
-        # Check if volume decreases as pattern develops
-        volume_trend = np.polyfit(range(len(data)), data['volume'], 1)[0]
-        return volume_trend < 0
-
     def _check_volume_decrease(self, data: pd.DataFrame, end_idx: int) -> bool:
         """Check if volume decreases toward pattern end."""
         if 'volume' not in data.columns or end_idx < 10:
@@ -0,0 +1,227 @@
+"""
+Cross-Symbol Indicator Kernels for Long Analyst Agent.
+
+Scanning a whole universe of pairs on one timeframe repeats the same
+rolling and exponential passes once per symbol, and most of that time is
+per-call overhead rather than arithmetic. This module stacks the aligned
+series of all symbols into (symbols x bars) matrices and evaluates the
+indicator math along the bar axis for every symbol at once. Rolling and
+exponential windows run on the same pandas kernels as the per-frame
+calculators, column-wise over the transposed matrix, so every row equals
+the single-symbol result exactly. Results are 2D arrays whose rows are
+handed out as per-symbol Series views.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+# Panel fields besides ``close``, in the order they are aligned
+OPTIONAL_FIELDS = ('high', 'low', 'open', 'volume')
+
+
+@dataclass
+class UniversePanel:
+    """
+    Aligned OHLC matrices for a universe of symbols.
+
+    Each field is a float64 (symbols x bars) matrix; row ``i`` belongs to
+    ``symbols[i]`` and column ``j`` to ``index[j]``. Symbols with a shorter
+    history carry leading NaN values. ``high`` and ``low`` are only needed
+    for range-based indicators such as ATR, ``open`` and ``volume`` for
+    calculators without a panel kernel that read them per frame.
+    """
+
+    symbols: List[str]
+    close: np.ndarray
+    high: Optional[np.ndarray] = None
+    low: Optional[np.ndarray] = None
+    index: Optional[pd.Index] = None
+    open: Optional[np.ndarray] = None
+    volume: Optional[np.ndarray] = None
+
+    def __post_init__(self):
+        """Validate shapes and normalize the matrices."""
+        self.symbols = list(self.symbols)
+        self.close = self._as_matrix(self.close)
+        for name in OPTIONAL_FIELDS:
+            values = getattr(self, name)
+            if values is not None:
+                values = self._as_matrix(values)
+                if values.shape != self.close.shape:
+                    raise ValueError(f"Panel fields must share shape {self.close.shape}, got {values.shape}")
+                setattr(self, name, values)
+        if self.index is None:
+            self.index = pd.RangeIndex(self.close.shape[1])
+        if len(self.index) != self.close.shape[1]:
+            raise ValueError(f"Index has {len(self.index)} bars, panel has {self.close.shape[1]}")
+
+    def _as_matrix(self, values) -> np.ndarray:
+        """Convert to a C-contiguous float64 matrix without copying when possible."""
+        matrix = np.ascontiguousarray(values, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[0] != len(self.symbols):
+            raise ValueError(f"Expected a ({len(self.symbols)} x bars) matrix, got shape {matrix.shape}")
+        return matrix
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> 'UniversePanel':
+        """
+        Build a panel from per-symbol OHLCV frames.
+
+        Frames are aligned on the union of their indexes; bars missing for a
+        symbol become NaN.
+
+        Args:
+            frames: OHLCV DataFrames keyed by symbol
+
+        Returns:
+            Aligned universe panel
+        """
+        symbols = list(frames)
+        index = None
+        for frame in frames.values():
+            index = frame.index if index is None else index.union(frame.index)
+        if index is None:
+            index = pd.RangeIndex(0)
+
+        fields = {}
+        for name in ('close',) + OPTIONAL_FIELDS:
+            if not all(name in frame.columns for frame in frames.values()):
+                continue
+            matrix = np.full((len(symbols), len(index)), np.nan)
+            for i, frame in enumerate(frames.values()):
+                column = frame[name]
+                if not column.index.equals(index):
+                    column = column.reindex(index)
+                matrix[i] = column.to_numpy(dtype=np.float64)
+            fields[name] = matrix
+
+        if 'close' not in fields:
+            raise ValueError("All frames need a 'close' column")
+        return cls(symbols=symbols, index=index, **fields)
+
+    @property
+    def shape(self) -> tuple:
+        """Panel shape as (symbols, bars)."""
+        return self.close.shape
+
+    def leading_mask(self) -> np.ndarray:
+        """Mask of the bars before each symbol's first valid close."""
+        return np.cumsum(~np.isnan(self.close), axis=1) == 0
+
+    def bar_counts(self) -> np.ndarray:
+        """Number of bars per symbol, counted from its first valid close."""
+        return self.shape[1] - self.leading_mask().sum(axis=1)
+
+    def row(self, values: np.ndarray, position: int) -> pd.Series:
+        """Wrap one row of a panel-shaped result as a Series view."""
+        return pd.Series(values[position], index=self.index, copy=False)
+
+    def frame(self, position: int) -> pd.DataFrame:
+        """
+        Rebuild one symbol's OHLCV frame from the panel.
+
+        Leading bars before the symbol's first valid close are dropped, so the
+        frame matches what a per-frame calculator would have been given.
+        """
+        start = int(self.leading_mask()[position].sum())
+        columns = {name: getattr(self, name)[position, start:]
+                   for name in ('open', 'high', 'low', 'close', 'volume')
+                   if getattr(self, name) is not None}
+        return pd.DataFrame(columns, index=self.index[start:])
+
+
+def _bars_frame(values: np.ndarray) -> pd.DataFrame:
+    """View a (symbols x bars) matrix as a (bars x symbols) frame without copying."""
+    return pd.DataFrame(values.T, copy=False)
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean along the bar axis."""
+    return _bars_frame(values).rolling(window=window).mean().to_numpy().T
+
+
+def rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample standard deviation along the bar axis."""
+    return _bars_frame(values).rolling(window=window).std().to_numpy().T
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average along the bar axis (``adjust=False``)."""
+    return _bars_frame(values).ewm(span=span, adjust=False).mean().to_numpy().T
+
+
+def shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Shift along the bar axis, filling with NaN."""
+    result = np.full(values.shape, np.nan)
+    if periods < values.shape[1]:
+        result[:, periods:] = values[:, :values.shape[1] - periods]
+    return result
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Relative Strength Index for every row."""
+    delta = np.diff(close, axis=1, prepend=np.nan)
+    # Missing deltas count as no change, except before a row's history starts
+    leading = np.cumsum(~np.isnan(close), axis=1) == 0
+    gain = rolling_mean(np.where(leading, np.nan, np.where(delta > 0, delta, 0.0)), period)
+    loss = rolling_mean(np.where(leading, np.nan, np.where(delta < 0, -delta, 0.0)), period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 - (100 / (1 + gain / loss))
+
+
+def macd(close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+    """MACD line, signal line and histogram for every row."""
+    macd_line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(macd_line, signal)
+    return {
+        'macd': macd_line,
+        'signal': signal_line,
+        'histogram': macd_line - signal_line
+    }
+
+
+def bollinger_bands(close: np.ndarray, period: int = 20, std_dev: float = 2.0) -> Dict[str, np.ndarray]:
+    """Bollinger Bands for every row."""
+    middle_band = rolling_mean(close, period)
+    std = rolling_std(close, period)
+    upper_band = middle_band + (std * std_dev)
+    lower_band = middle_band - (std * std_dev)
+    return {
+        'upper': upper_band,
+        'middle': middle_band,
+        'lower': lower_band,
+        'width': upper_band - lower_band
+    }
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range for every row; the first bar falls back to high - low."""
+    previous_close = shift(close)
+    return np.fmax(high - low, np.fmax(np.abs(high - previous_close), np.abs(low - previous_close)))
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Average true range for every row."""
+    return rolling_mean(true_range(high, low, close), period)
+
+
+def valid_ratio(mask: np.ndarray, bars: np.ndarray) -> np.ndarray:
+    """Share of True values per row over each row's own bar count."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(bars > 0, mask.sum(axis=1) / bars, 0.0)
+
+
+def select_signals(conditions: Sequence[np.ndarray], scores: Sequence[float], shape: tuple) -> np.ndarray:
+    """
+    Apply signal scores in order, later conditions overriding earlier ones.
+
+    Mirrors the sequential mask assignments of the single-frame calculators.
+    """
+    signals = np.zeros(shape)
+    for condition, score in zip(conditions, scores):
+        signals[condition] = score
+    return signals
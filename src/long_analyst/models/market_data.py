@@ -228,6 +228,70 @@ class OrderBookData:
         }
 
 
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+@dataclass(frozen=True, eq=False)
+class OHLCVColumns:
+    """
+    Read-only columnar view of a list of OHLCV candles.
+
+    ``values`` holds one contiguous float64 row per OHLCV column, so each
+    column is a contiguous array and the whole view wraps into a single
+    DataFrame block without copying.
+    """
+    timestamp: np.ndarray
+    values: np.ndarray  # shape (len(OHLCV_COLUMNS), n)
+
+    @classmethod
+    def from_candles(cls, candles: List[OHLCVData]) -> "OHLCVColumns":
+        """Build the view in one pass over the candles."""
+        rows = np.array(
+            [(c.timestamp, c.open, c.high, c.low, c.close, c.volume) for c in candles],
+            dtype=np.float64
+        ).reshape(-1, len(OHLCV_COLUMNS) + 1)
+        matrix = np.ascontiguousarray(rows.T)
+        matrix.flags.writeable = False
+        return cls(timestamp=matrix[0], values=matrix[1:])
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.values[0]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.values[1]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.values[2]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.values[3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.values[4]
+
+    def to_frame(self, index: Optional[pd.Index] = None) -> pd.DataFrame:
+        """
+        Wrap the view in a DataFrame without copying the column data.
+
+        Args:
+            index: Row index, defaults to the float timestamps
+
+        Returns:
+            DataFrame backed by the read-only arrays
+        """
+        if index is None:
+            index = pd.Index(self.timestamp, name='timestamp')
+        return pd.DataFrame(self.values.T, index=index, columns=list(OHLCV_COLUMNS), copy=False)
+
+
 @dataclass
 class MarketData:
     """
@@ -256,6 +320,12 @@ class MarketData:
     quality_score: float = 1.0  # 0.0 to 1.0
     is_complete: bool = True
 
+    # Columnar view of ohlcv_data, built on first use
+    _columns: Optional[OHLCVColumns] = field(default=None, init=False, repr=False, compare=False)
+    _columns_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _frame: Optional[pd.DataFrame] = field(default=None, init=False, repr=False, compare=False)
+    _indicator_graph: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate market data."""
         if not self.symbol:
@@ -296,26 +366,71 @@ class MarketData:
             return self.ohlcv_data[-1].volume
         return None
 
+    def get_ohlcv_columns(self) -> Optional[OHLCVColumns]:
+        """
+        Get the cached columnar view of the OHLCV data.
+
+        The view is built once and rebuilt only if candles are added to or
+        replaced in ``ohlcv_data``, or the live last candle is updated in place.
+
+        Returns:
+            Read-only OHLCV columns, or None without OHLCV data
+        """
+        if not self.ohlcv_data:
+            return None
+
+        last = self.ohlcv_data[-1]
+        key = (id(self.ohlcv_data), len(self.ohlcv_data), id(self.ohlcv_data[0]), id(last),
+               last.timestamp, last.open, last.high, last.low, last.close, last.volume)
+        if self._columns is None or self._columns_key != key:
+            self._columns = OHLCVColumns.from_candles(self.ohlcv_data)
+            self._columns_key = key
+            self._frame = None
+            self._indicator_graph = None
+        return self._columns
+
+    def get_ohlcv_frame(self) -> Optional[pd.DataFrame]:
+        """
+        Get the OHLCV data as a DataFrame indexed by float timestamp.
+
+        Every call returns a shallow copy backed by the shared read-only
+        columns, so consumers can add columns without affecting each other.
+        """
+        columns = self.get_ohlcv_columns()
+        if columns is None:
+            return None
+
+        if self._frame is None:
+            self._frame = columns.to_frame()
+        return self._frame.copy(deep=False)
+
+    def get_indicator_graph(self):
+        """
+        Get the indicator graph shared by all consumers of this data.
+
+        Intermediate series (moving averages, true range, rolling extremes)
+        are computed once per set of candles and reused by every detector.
+
+        Returns:
+            IndicatorGraph over ``get_ohlcv_frame()``, or None without OHLCV data
+        """
+        from ..indicators.indicator_graph import IndicatorGraph
+
+        if self.get_ohlcv_columns() is None:
+            return None
+
+        if self._indicator_graph is None:
+            self._indicator_graph = IndicatorGraph(self.get_ohlcv_frame())
+        return self._indicator_graph
+
     def to_dataframe(self) -> Optional[pd.DataFrame]:
         """Convert OHLCV data to pandas DataFrame."""
-        if not self.ohlcv_data:
+        columns = self.get_ohlcv_columns()
+        if columns is None:
             return None
 
-        data = []
-        for ohlcv in self.ohlcv_data:
-            data.append({
-                'timestamp': ohlcv.timestamp,
-                'open': ohlcv.open,
-                'high': ohlcv.high,
-                'low': ohlcv.low,
-                'close': ohlcv.close,
-                'volume': ohlcv.volume
-            })
-
-        df = pd.DataFrame(data)
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
-        df.set_index('timestamp', inplace=True)
-        return df
+        index = pd.DatetimeIndex(pd.to_datetime(columns.timestamp, unit='s'), name='timestamp')
+        return columns.to_frame(index)
 
     def calculate_returns(self, periods: int = 1) -> Optional[np.ndarray]:
         """Calculate price returns."""
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from enum import Enum
 import time
 import heapq
+import itertools
 from datetime import datetime, timedelta
 
 from ..models.market_data import Timeframe, MarketData
@@ -103,6 +104,11 @@ class OrchestratorConfig:
                 Timeframe.D1: 86400
             }
 
+        # A zero interval would re-arm a schedule as already due, spinning the scheduler
+        invalid = [timeframe for timeframe, interval in self.analysis_interval_seconds.items() if interval <= 0]
+        if invalid:
+            raise ValueError(f"Analysis intervals must be positive, got {invalid}")
+
 
 class AnalysisOrchestrator:
     """
@@ -120,15 +126,25 @@ class AnalysisOrchestrator:
         self.performance_monitor = PerformanceMonitor()
         self.event_manager = EventManager()
 
-        # Task management
+        # Task management: tasks wait in a heap keyed by scheduled_at until
+        # due, then move to a priority-ordered ready queue served by workers
         self.task_queue = []
+        self.ready_queue: Optional[asyncio.PriorityQueue] = None  # Created in start()
+        self.pending_tasks = {}
         self.running_tasks = {}
         self.completed_tasks = {}
         self.task_counter = 0
+        self._sequence = itertools.count()
 
-        # Symbol management
+        # Symbol management: recurring analyses wait in a heap keyed by next run time
         self.symbol_analysis_schedule = {}
         self.symbol_last_analysis = {}
+        self.schedule_heap = []
+        self._armed_schedules = set()
+
+        # Set when the scheduler must re-evaluate its next deadline. Loop-bound
+        # primitives are created in start(), inside the running loop
+        self._scheduler_wakeup: Optional[asyncio.Event] = None
 
         # Resource monitoring
         self.system_resources = {
@@ -148,7 +164,8 @@ class AnalysisOrchestrator:
             'total_tasks_failed': 0,
             'total_retry_attempts': 0,
             'average_execution_time': 0.0,
-            'tasks_per_second': 0.0
+            'tasks_per_second': 0.0,
+            'scheduler_wakeups': 0
         }
 
         self.logger.info("Analysis orchestrator initialized")
@@ -161,18 +178,29 @@ class AnalysisOrchestrator:
             self.logger.warning("Analysis orchestrator is already running")
             return
 
+        previous_ready = self.ready_queue
+        self.ready_queue = asyncio.PriorityQueue()
+        self._scheduler_wakeup = asyncio.Event()
+        # Carry over tasks left ready by a previous run
+        while previous_ready is not None and not previous_ready.empty():
+            self.ready_queue.put_nowait(previous_ready.get_nowait())
+
         # Initialize symbol schedules
         await self._initialize_symbol_schedules()
+        for symbol in self.symbol_analysis_schedule:
+            self._arm_symbol(symbol)
+
+        self.is_running = True
 
-        # Start background tasks
+        # Start background tasks: one scheduler and a bounded pool of workers
         self.background_tasks = [
             asyncio.create_task(self._task_scheduling_loop()),
-            asyncio.create_task(self._task_execution_loop()),
+            *[asyncio.create_task(self._task_execution_loop(worker_id))
+              for worker_id in range(max(1, self.config.max_concurrent_tasks))],
             asyncio.create_task(self._resource_monitoring_loop()),
             asyncio.create_task(self._metric_collection_loop())
         ]
 
-        self.is_running = True
         self.logger.info("Analysis orchestrator started")
 
     async def stop(self):
@@ -231,8 +259,8 @@ class AnalysisOrchestrator:
             max_retries=self.config.max_retry_attempts
         )
 
-        # Add to priority queue
-        heapq.heappush(self.task_queue, task)
+        # Queue until due, or hand straight to the workers
+        self._enqueue_task(task)
 
         # Update metrics
         self.metrics['total_tasks_created'] += 1
@@ -258,21 +286,43 @@ class AnalysisOrchestrator:
         """
         triggered = []
         current_time = time.time()
+        rescheduled = []
 
-        # Check for overdue tasks
-        while self.task_queue and self.task_queue[0].scheduled_at <= current_time:
-            task = heapq.heappop(self.task_queue)
+        # Check for overdue tasks still waiting in the timer heap
+        while self.task_queue and self.task_queue[0][0] <= current_time:
+            _, _, task = heapq.heappop(self.task_queue)
 
             if task.status == TaskStatus.PENDING:
                 triggered.append((task.symbol, task.timeframe))
 
                 # Schedule next analysis
-                next_time = self._calculate_next_analysis_time(task.symbol, task.timeframe)
-                task.scheduled_at = next_time
-                heapq.heappush(self.task_queue, task)
+                task.scheduled_at = self._calculate_next_analysis_time(task.symbol, task.timeframe)
+                rescheduled.append(task)
+
+        for task in rescheduled:
+            heapq.heappush(self.task_queue, (task.scheduled_at, next(self._sequence), task))
 
         return triggered
 
+    def add_symbol(self, symbol: str):
+        """
+        Add a symbol to the recurring analysis schedule.
+
+        Args:
+            symbol: Trading symbol to analyze on every analysis timeframe
+        """
+        self.symbol_analysis_schedule[symbol] = True
+        self._arm_symbol(symbol)
+
+    def remove_symbol(self, symbol: str):
+        """
+        Remove a symbol from the recurring analysis schedule.
+
+        Args:
+            symbol: Trading symbol to stop analyzing
+        """
+        self.symbol_analysis_schedule.pop(symbol, None)
+
     async def execute_task(self, task: AnalysisTask) -> AnalysisResult:
         """
         Execute an analysis task.
@@ -288,6 +338,7 @@ class AnalysisOrchestrator:
         try:
             # Update task status
             task.status = TaskStatus.RUNNING
+            self.pending_tasks.pop(task.id, None)
             self.running_tasks[task.id] = task
 
             # Emit task start event
@@ -354,10 +405,12 @@ class AnalysisOrchestrator:
             if task.retry_count < task.max_retries:
                 task.retry_count += 1
                 task.status = TaskStatus.PENDING
-                task.scheduled_at = time.time() + (task.retry_delay * (self.config.backoff_factor ** task.retry_count))
+                task.scheduled_at = time.time() + (
+                    self.config.retry_delay_seconds * (self.config.backoff_factor ** task.retry_count)
+                )
 
                 # Add back to queue
-                heapq.heappush(self.task_queue, task)
+                self._enqueue_task(task)
 
                 self.metrics['total_retry_attempts'] += 1
                 self.logger.info(f"Retrying task {task.id} (attempt {task.retry_count})")
@@ -406,18 +459,28 @@ class AnalysisOrchestrator:
         return result
 
     async def _task_scheduling_loop(self):
-        """Background task for scheduling analysis tasks."""
+        """Background task releasing due analyses, sleeping until the next deadline."""
         self.logger.info("Starting task scheduling loop")
 
         while self.is_running:
             try:
-                # Schedule regular analysis for configured timeframes
-                for symbol in self.symbol_analysis_schedule:
-                    for timeframe in self.analysis_timeframes:
-                        await self._schedule_regular_analysis(symbol, timeframe)
+                self.metrics['scheduler_wakeups'] += 1
+                current_time = time.time()
+
+                # Schedule regular analysis for due symbol/timeframe pairs
+                await self._run_due_schedules(current_time)
 
-                # Sleep for scheduling interval
-                await asyncio.sleep(self.config.schedule_interval_seconds)
+                # Hand due tasks to the workers
+                self._release_due_tasks(current_time)
+
+                # Sleep until the earliest deadline or until woken by new work
+                self._scheduler_wakeup.clear()
+                deadline = self._next_deadline()
+                timeout = None if deadline is None else max(0.0, deadline - time.time())
+                try:
+                    await asyncio.wait_for(self._scheduler_wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
 
             except Exception as e:
                 self.logger.error(f"Error in task scheduling loop: {e}")
@@ -425,48 +488,23 @@ class AnalysisOrchestrator:
 
         self.logger.info("Task scheduling loop stopped")
 
-    async def _task_execution_loop(self):
-        """Background task for executing analysis tasks."""
-        self.logger.info("Starting task execution loop")
+    async def _task_execution_loop(self, worker_id: int = 0):
+        """Background worker executing ready tasks in priority order."""
+        self.logger.info(f"Starting task execution worker {worker_id}")
 
         while self.is_running:
+            _, _, _, task = await self.ready_queue.get()
             try:
-                # Check resource availability
-                if self._can_execute_task():
-                    # Get next task to execute
-                    current_time = time.time()
-                    executable_tasks = []
-
-                    # Find tasks that are ready to execute
-                    temp_queue = []
-                    while self.task_queue:
-                        task = heapq.heappop(self.task_queue)
-                        if task.scheduled_at <= current_time and task.status == TaskStatus.PENDING:
-                            executable_tasks.append(task)
-                        else:
-                            temp_queue.append(task)
-
-                    # Put back non-executable tasks
-                    for task in temp_queue:
-                        heapq.heappush(self.task_queue, task)
-
-                    # Execute highest priority task
-                    if executable_tasks:
-                        task = executable_tasks[0]  # Already sorted by priority
-                        try:
-                            await self.execute_task(task)
-                        except Exception as e:
-                            self.logger.error(f"Error executing task {task.id}: {e}")
-
+                if task.status == TaskStatus.PENDING:
+                    await self.execute_task(task)
                 else:
-                    # Wait for resources to become available
-                    await asyncio.sleep(1.0)
-
+                    self.pending_tasks.pop(task.id, None)
             except Exception as e:
-                self.logger.error(f"Error in task execution loop: {e}")
-                await asyncio.sleep(5)
+                self.logger.error(f"Error executing task {task.id}: {e}")
+            finally:
+                self.ready_queue.task_done()
 
-        self.logger.info("Task execution loop stopped")
+        self.logger.info(f"Task execution worker {worker_id} stopped")
 
     async def _resource_monitoring_loop(self):
         """Background task for resource monitoring."""
@@ -512,7 +550,7 @@ class AnalysisOrchestrator:
 
                 # Record metrics
                 self.performance_monitor.record_metric("active_tasks", len(self.running_tasks))
-                self.performance_monitor.record_metric("pending_tasks", len(self.task_queue))
+                self.performance_monitor.record_metric("pending_tasks", len(self.pending_tasks))
                 self.performance_monitor.record_metric("total_tasks_created", self.metrics['total_tasks_created'])
                 self.performance_monitor.record_metric("total_tasks_completed", self.metrics['total_tasks_completed'])
                 self.performance_monitor.record_metric("total_tasks_failed", self.metrics['total_tasks_failed'])
@@ -525,12 +563,77 @@ class AnalysisOrchestrator:
 
         self.logger.info("Metric collection loop stopped")
 
-    def _can_execute_task(self) -> bool:
-        """Check if a task can be executed based on resource availability."""
-        if not self.config.enable_resource_monitoring:
-            return True
+    def _enqueue_task(self, task: AnalysisTask):
+        """Queue a task on the timer heap, or on the ready queue if it is due."""
+        self.pending_tasks[task.id] = task
+        if task.scheduled_at <= time.time():
+            self._make_ready(task)
+            return
 
-        return len(self.running_tasks) < self.config.max_concurrent_tasks
+        heapq.heappush(self.task_queue, (task.scheduled_at, next(self._sequence), task))
+        if self.task_queue[0][2] is task:
+            # New earliest deadline
+            self._wake_scheduler()
+
+    def _wake_scheduler(self):
+        """Make the scheduler re-evaluate its next deadline (no-op before start)."""
+        if self._scheduler_wakeup is not None:
+            self._scheduler_wakeup.set()
+
+    def _make_ready(self, task: AnalysisTask):
+        """Hand a due task to the workers, highest priority first."""
+        if self.ready_queue is None:
+            # Not started: the scheduler releases it on its first pass
+            heapq.heappush(self.task_queue, (task.scheduled_at, next(self._sequence), task))
+            return
+        self.ready_queue.put_nowait((-task.priority.value, task.scheduled_at, next(self._sequence), task))
+
+    def _release_due_tasks(self, current_time: float) -> int:
+        """Move due tasks from the timer heap to the ready queue."""
+        released = 0
+        while self.task_queue and self.task_queue[0][0] <= current_time:
+            _, _, task = heapq.heappop(self.task_queue)
+            if task.status == TaskStatus.PENDING:
+                self._make_ready(task)
+                released += 1
+            else:
+                self.pending_tasks.pop(task.id, None)
+        return released
+
+    def _arm_symbol(self, symbol: str):
+        """Add recurring schedule entries for a symbol on every analysis timeframe."""
+        for timeframe in self.analysis_timeframes:
+            key = (symbol, timeframe)
+            if key in self._armed_schedules:
+                continue
+            self._armed_schedules.add(key)
+            last_analysis = self.symbol_last_analysis.get(f"{symbol}_{timeframe.value}", 0)
+            next_run = last_analysis + self.config.analysis_interval_seconds.get(timeframe, 3600)
+            heapq.heappush(self.schedule_heap, (next_run, next(self._sequence), symbol, timeframe))
+        self._wake_scheduler()
+
+    async def _run_due_schedules(self, current_time: float) -> int:
+        """Schedule analyses whose recurring interval has elapsed and re-arm them."""
+        scheduled = 0
+        while self.schedule_heap and self.schedule_heap[0][0] <= current_time:
+            _, _, symbol, timeframe = heapq.heappop(self.schedule_heap)
+            if symbol not in self.symbol_analysis_schedule or timeframe not in self.analysis_timeframes:
+                # Removed since it was armed
+                self._armed_schedules.discard((symbol, timeframe))
+                continue
+
+            await self._schedule_regular_analysis(symbol, timeframe)
+            scheduled += 1
+
+            last_analysis = self.symbol_last_analysis.get(f"{symbol}_{timeframe.value}", current_time)
+            next_run = last_analysis + self.config.analysis_interval_seconds.get(timeframe, 3600)
+            heapq.heappush(self.schedule_heap, (next_run, next(self._sequence), symbol, timeframe))
+        return scheduled
+
+    def _next_deadline(self) -> Optional[float]:
+        """Earliest time the scheduler has work to do, if any."""
+        deadlines = [heap[0][0] for heap in (self.task_queue, self.schedule_heap) if heap]
+        return min(deadlines) if deadlines else None
 
     def _calculate_next_analysis_time(self, symbol: str, timeframe: Timeframe) -> float:
         """Calculate the next analysis time for a symbol and timeframe."""
@@ -573,7 +676,9 @@ class AnalysisOrchestrator:
         """Get orchestrator metrics."""
         return {
             **self.metrics,
-            "task_queue_size": len(self.task_queue),
+            "task_queue_size": len(self.pending_tasks),
+            "ready_tasks": self.ready_queue.qsize() if self.ready_queue is not None else 0,
+            "recurring_schedules": len(self._armed_schedules),
             "running_tasks": len(self.running_tasks),
             "completed_tasks": len(self.completed_tasks),
             "system_resources": self.system_resources,
@@ -611,18 +716,18 @@ class AnalysisOrchestrator:
             }
 
         # Check pending tasks
-        for task in self.task_queue:
-            if task.id == task_id:
-                return {
-                    "task_id": task_id,
-                    "status": task.status.value,
-                    "symbol": task.symbol,
-                    "timeframe": task.timeframe.value,
-                    "priority": task.priority.value,
-                    "created_at": task.created_at,
-                    "scheduled_at": task.scheduled_at,
-                    "retry_count": task.retry_count
-                }
+        if task_id in self.pending_tasks:
+            task = self.pending_tasks[task_id]
+            return {
+                "task_id": task_id,
+                "status": task.status.value,
+                "symbol": task.symbol,
+                "timeframe": task.timeframe.value,
+                "priority": task.priority.value,
+                "created_at": task.created_at,
+                "scheduled_at": task.scheduled_at,
+                "retry_count": task.retry_count
+            }
 
         return None
 
@@ -635,7 +740,7 @@ class AnalysisOrchestrator:
         }
 
         # Check task queue
-        if len(self.task_queue) > self.config.max_pending_tasks * 0.9:
+        if len(self.pending_tasks) > self.config.max_pending_tasks * 0.9:
             health_status["status"] = "degraded"
             health_status["components"]["task_queue"] = {
                 "status": "degraded",
@@ -17,6 +17,8 @@ from enum import Enum
 from ..signal_detector import SignalDetector, DetectorConfig, DetectionResult
 from ...models.signal import SignalType, SignalStrength
 from ...models.market_data import MarketData
+from ...indicators.indicator_graph import IndicatorGraph
+from ...indicators.extrema import find_extrema
 
 
 class BreakoutType(Enum):
@@ -97,17 +99,18 @@ class BreakoutDetector(SignalDetector):
                 return []
 
             # Analyze different types of breakouts
+            graph = self.get_indicator_graph(market_data, df)
             breakout_signals = []
 
             # Resistance breakout detection
-            resistance_breakout = await self._detect_resistance_breakout(df)
+            resistance_breakout = await self._detect_resistance_breakout(df, graph)
             if resistance_breakout.breakout_detected:
                 signal = self._generate_breakout_signal(resistance_breakout, market_data)
                 if signal:
                     breakout_signals.append(signal)
 
             # Pattern breakout detection
-            pattern_breakout = await self._detect_pattern_breakout(df)
+            pattern_breakout = await self._detect_pattern_breakout(df, graph)
             if pattern_breakout.breakout_detected:
                 signal = self._generate_breakout_signal(pattern_breakout, market_data)
                 if signal:
@@ -126,11 +129,11 @@ class BreakoutDetector(SignalDetector):
             self.logger.error(f"Error in breakout detection: {e}")
             return []
 
-    async def _detect_resistance_breakout(self, df: pd.DataFrame) -> BreakoutAnalysis:
+    async def _detect_resistance_breakout(self, df: pd.DataFrame, graph: IndicatorGraph) -> BreakoutAnalysis:
         """Detect resistance level breakouts."""
         try:
             # Identify resistance levels
-            resistance_levels = self._identify_resistance_levels(df)
+            resistance_levels = self._identify_resistance_levels(df, graph)
 
             if not resistance_levels:
                 return BreakoutAnalysis(
@@ -193,11 +196,11 @@ class BreakoutDetector(SignalDetector):
                 breakout_time=0.0
             )
 
-    async def _detect_pattern_breakout(self, df: pd.DataFrame) -> BreakoutAnalysis:
+    async def _detect_pattern_breakout(self, df: pd.DataFrame, graph: IndicatorGraph) -> BreakoutAnalysis:
         """Detect pattern-based breakouts."""
         try:
             # Detect chart patterns
-            patterns = self._detect_chart_patterns(df)
+            patterns = self._detect_chart_patterns(df, graph)
 
             if not patterns:
                 return BreakoutAnalysis(
@@ -323,35 +326,30 @@ class BreakoutDetector(SignalDetector):
                 breakout_time=0.0
             )
 
-    def _identify_resistance_levels(self, df: pd.DataFrame) -> List[float]:
+    def _identify_resistance_levels(self, df: pd.DataFrame, graph: IndicatorGraph) -> List[float]:
         """Identify resistance levels from price data."""
         resistance_levels = []
 
         # Use recent highs
-        recent_highs = df['high'].rolling(window=5, center=True).max().dropna()
+        recent_highs = graph.rolling_max('high', 5, center=True).dropna().to_numpy()
 
         # Find significant highs (local maxima)
-        for i in range(2, len(recent_highs) - 2):
-            if (recent_highs.iloc[i] > recent_highs.iloc[i-1] and
-                recent_highs.iloc[i] > recent_highs.iloc[i+1] and
-                recent_highs.iloc[i] > recent_highs.iloc[i-2] and
-                recent_highs.iloc[i] > recent_highs.iloc[i+2]):
+        for i in find_extrema(recent_highs, 2, kind="max", strict=True):
+            # Group nearby levels
+            level = recent_highs[i]
+            found_group = False
 
-                # Group nearby levels
-                level = recent_highs.iloc[i]
-                found_group = False
+            for existing_level in resistance_levels:
+                if abs(level - existing_level) / existing_level < 0.02:  # 2% tolerance
+                    found_group = True
+                    break
 
-                for existing_level in resistance_levels:
-                    if abs(level - existing_level) / existing_level < 0.02:  # 2% tolerance
-                        found_group = True
-                        break
-
-                if not found_group:
-                    resistance_levels.append(level)
+            if not found_group:
+                resistance_levels.append(level)
 
         return resistance_levels
 
-    def _detect_chart_patterns(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _detect_chart_patterns(self, df: pd.DataFrame, graph: IndicatorGraph) -> List[Dict[str, Any]]:
         """Detect chart patterns that could lead to breakouts."""
         patterns = []
 
@@ -360,11 +358,11 @@ class BreakoutDetector(SignalDetector):
         patterns.extend(triangle_patterns)
 
         # Detect rectangles
-        rectangle_patterns = self._detect_rectangles(df)
+        rectangle_patterns = self._detect_rectangles(df, graph)
         patterns.extend(rectangle_patterns)
 
         # Detect flags and pennants
-        flag_patterns = self._detect_flags_pennants(df)
+        flag_patterns = self._detect_flags_pennants(df, graph)
         patterns.extend(flag_patterns)
 
         return patterns
@@ -418,7 +416,7 @@ class BreakoutDetector(SignalDetector):
 
         return patterns
 
-    def _detect_rectangles(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _detect_rectangles(self, df: pd.DataFrame, graph: IndicatorGraph) -> List[Dict[str, Any]]:
         """Detect rectangle patterns."""
         patterns = []
 
@@ -428,7 +426,7 @@ class BreakoutDetector(SignalDetector):
         # Look for consolidation zones
         recent_data = df.tail(20)
         price_range = recent_data['high'].max() - recent_data['low'].min()
-        avg_range = (df['high'] - df['low']).rolling(20).mean().iloc[-1]
+        avg_range = graph.sma('range', 20).iloc[-1]
 
         # Check if price is consolidating (range bound)
         if price_range < avg_range * 1.5:  # Range is relatively tight
@@ -451,7 +449,7 @@ class BreakoutDetector(SignalDetector):
 
         return patterns
 
-    def _detect_flags_pennants(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _detect_flags_pennants(self, df: pd.DataFrame, graph: IndicatorGraph) -> List[Dict[str, Any]]:
         """Detect flag and pennant patterns."""
         patterns = []
 
@@ -469,7 +467,7 @@ class BreakoutDetector(SignalDetector):
         if abs(prior_move) > 0.05:  # 5% move
             # Check for tight consolidation
             consolidation_range = consolidation_data['high'].max() - consolidation_data['low'].min()
-            avg_range = (df['high'] - df['low']).rolling(20).mean().iloc[-1]
+            avg_range = graph.sma('range', 20).iloc[-1]
 
             if consolidation_range < avg_range:  # Tight consolidation
                 upper_bound = consolidation_data['high'].max()
@@ -705,20 +703,7 @@ class BreakoutDetector(SignalDetector):
         """Convert market data to pandas DataFrame."""
         try:
             if hasattr(market_data, 'ohlcv_data') and market_data.ohlcv_data:
-                data_list = []
-                for ohlcv in market_data.ohlcv_data:
-                    data_list.append({
-                        'timestamp': ohlcv.timestamp,
-                        'open': ohlcv.open,
-                        'high': ohlcv.high,
-                        'low': ohlcv.low,
-                        'close': ohlcv.close,
-                        'volume': ohlcv.volume
-                    })
-
-                df = pd.DataFrame(data_list)
-                df.set_index('timestamp', inplace=True)
-                return df
+                return market_data.get_ohlcv_frame()
 
             elif hasattr(market_data, 'data') and isinstance(market_data.data, pd.DataFrame):
                 return market_data.data
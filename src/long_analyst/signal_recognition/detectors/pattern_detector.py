@@ -17,6 +17,8 @@ from enum import Enum
 from ..signal_detector import SignalDetector, DetectorConfig, DetectionResult
 from ...models.signal import SignalType, SignalStrength
 from ...models.market_data import MarketData
+from ...indicators.indicator_graph import IndicatorGraph
+from ...indicators.extrema import find_extrema
 
 
 class PatternType(Enum):
@@ -92,17 +94,18 @@ class PatternDetector(SignalDetector):
                 return []
 
             # Analyze different types of patterns
+            graph = self.get_indicator_graph(market_data, df)
             pattern_signals = []
 
             # Head and shoulders bottom detection
-            hns_pattern = await self._detect_head_and_shoulders_bottom(df)
+            hns_pattern = await self._detect_head_and_shoulders_bottom(df, graph)
             if hns_pattern.pattern_detected and hns_pattern.confidence >= self.min_confidence:
                 signal = self._generate_pattern_signal(hns_pattern, market_data)
                 if signal:
                     pattern_signals.append(signal)
 
             # Double bottom detection
-            double_bottom = await self._detect_double_bottom(df)
+            double_bottom = await self._detect_double_bottom(df, graph)
             if double_bottom.pattern_detected and double_bottom.confidence >= self.min_confidence:
                 signal = self._generate_pattern_signal(double_bottom, market_data)
                 if signal:
@@ -129,7 +132,7 @@ class PatternDetector(SignalDetector):
             self.logger.error(f"Error in pattern detection: {e}")
             return []
 
-    async def _detect_head_and_shoulders_bottom(self, df: pd.DataFrame) -> PatternAnalysis:
+    async def _detect_head_and_shoulders_bottom(self, df: pd.DataFrame, graph: IndicatorGraph) -> PatternAnalysis:
         """Detect head and shoulders bottom pattern."""
         try:
             if len(df) < 50:
@@ -145,8 +148,8 @@ class PatternDetector(SignalDetector):
             # Look for: left shoulder -> head -> right shoulder structure with lower lows
 
             # Find potential pattern points
-            lows = df['low'].rolling(window=5, center=True).min().dropna()
-            highs = df['high'].rolling(window=5, center=True).max().dropna()
+            lows = graph.rolling_min('low', 5, center=True).dropna()
+            highs = graph.rolling_max('high', 5, center=True).dropna()
 
             if len(lows) < 30:
                 return PatternAnalysis(
@@ -158,13 +161,11 @@ class PatternDetector(SignalDetector):
                 )
 
             # Find three major lows (shoulders and head)
-            significant_lows = []
-            for i in range(5, len(lows) - 5):
-                if (lows.iloc[i] < lows.iloc[i-1] and lows.iloc[i] < lows.iloc[i+1] and
-                    lows.iloc[i] < lows.iloc[i-2] and lows.iloc[i] < lows.iloc[i+2] and
-                    lows.iloc[i] < lows.iloc[i-3] and lows.iloc[i] < lows.iloc[i+3]):
-
-                    significant_lows.append((i, lows.iloc[i]))
+            low_values = lows.to_numpy()
+            significant_lows = [
+                (i, low_values[i])
+                for i in find_extrema(low_values, 3, kind="min", strict=True, margin=5).tolist()
+            ]
 
             if len(significant_lows) < 3:
                 return PatternAnalysis(
@@ -262,7 +263,7 @@ class PatternDetector(SignalDetector):
                 pattern_end=0.0
             )
 
-    async def _detect_double_bottom(self, df: pd.DataFrame) -> PatternAnalysis:
+    async def _detect_double_bottom(self, df: pd.DataFrame, graph: IndicatorGraph) -> PatternAnalysis:
         """Detect double bottom pattern."""
         try:
             if len(df) < 40:
@@ -275,14 +276,12 @@ class PatternDetector(SignalDetector):
                 )
 
             # Find significant lows
-            lows = df['low'].rolling(window=5, center=True).min().dropna()
-            significant_lows = []
-
-            for i in range(5, len(lows) - 5):
-                if (lows.iloc[i] < lows.iloc[i-1] and lows.iloc[i] < lows.iloc[i+1] and
-                    lows.iloc[i] < lows.iloc[i-2] and lows.iloc[i] < lows.iloc[i+1]):
-
-                    significant_lows.append((i, lows.iloc[i]))
+            lows = graph.rolling_min('low', 5, center=True).dropna()
+            low_values = lows.to_numpy()
+            significant_lows = [
+                (i, low_values[i])
+                for i in find_extrema(low_values, 2, kind="min", strict=True, right_window=1, margin=5).tolist()
+            ]
 
             if len(significant_lows) < 2:
                 return PatternAnalysis(
@@ -788,20 +787,7 @@ class PatternDetector(SignalDetector):
         """Convert market data to pandas DataFrame."""
         try:
             if hasattr(market_data, 'ohlcv_data') and market_data.ohlcv_data:
-                data_list = []
-                for ohlcv in market_data.ohlcv_data:
-                    data_list.append({
-                        'timestamp': ohlcv.timestamp,
-                        'open': ohlcv.open,
-                        'high': ohlcv.high,
-                        'low': ohlcv.low,
-                        'close': ohlcv.close,
-                        'volume': ohlcv.volume
-                    })
-
-                df = pd.DataFrame(data_list)
-                df.set_index('timestamp', inplace=True)
-                return df
+                return market_data.get_ohlcv_frame()
 
             elif hasattr(market_data, 'data') and isinstance(market_data.data, pd.DataFrame):
                 return market_data.data
@@ -17,6 +17,8 @@ from enum import Enum
 from ..signal_detector import SignalDetector, DetectorConfig, DetectionResult
 from ...models.signal import SignalType, SignalStrength
 from ...models.market_data import MarketData
+from ...indicators.indicator_graph import IndicatorGraph
+from ...indicators.extrema import find_extrema
 
 
 class PullbackType(Enum):
@@ -86,24 +88,25 @@ class PullbackDetector(SignalDetector):
                 return []
 
             # Analyze different types of pullbacks
+            graph = self.get_indicator_graph(market_data, df)
             pullback_signals = []
 
             # Fibonacci pullback detection
-            fib_pullback = await self._detect_fibonacci_pullback(df)
+            fib_pullback = await self._detect_fibonacci_pullback(df, graph)
             if fib_pullback.pullback_detected:
                 signal = self._generate_pullback_signal(fib_pullback, market_data)
                 if signal:
                     pullback_signals.append(signal)
 
             # Moving average pullback detection
-            ma_pullback = await self._detect_ma_pullback(df)
+            ma_pullback = await self._detect_ma_pullback(df, graph)
             if ma_pullback.pullback_detected:
                 signal = self._generate_pullback_signal(ma_pullback, market_data)
                 if signal:
                     pullback_signals.append(signal)
 
             # Support level pullback detection
-            support_pullback = await self._detect_support_pullback(df)
+            support_pullback = await self._detect_support_pullback(df, graph)
             if support_pullback.pullback_detected:
                 signal = self._generate_pullback_signal(support_pullback, market_data)
                 if signal:
@@ -115,7 +118,7 @@ class PullbackDetector(SignalDetector):
             self.logger.error(f"Error in pullback detection: {e}")
             return []
 
-    async def _detect_fibonacci_pullback(self, df: pd.DataFrame) -> PullbackAnalysis:
+    async def _detect_fibonacci_pullback(self, df: pd.DataFrame, graph: IndicatorGraph) -> PullbackAnalysis:
         """Detect Fibonacci-based pullbacks."""
         try:
             # Identify recent swing high and low
@@ -170,7 +173,7 @@ class PullbackDetector(SignalDetector):
             bounce_strength = self._analyze_bounce_strength(df, best_level_price)
 
             # Calculate trend strength
-            trend_strength = self._calculate_trend_strength(df)
+            trend_strength = self._calculate_trend_strength(df, graph)
 
             return PullbackAnalysis(
                 pullback_detected=is_at_fib_level,
@@ -200,7 +203,7 @@ class PullbackDetector(SignalDetector):
                 trend_strength=0.0
             )
 
-    async def _detect_ma_pullback(self, df: pd.DataFrame) -> PullbackAnalysis:
+    async def _detect_ma_pullback(self, df: pd.DataFrame, graph: IndicatorGraph) -> PullbackAnalysis:
         """Detect moving average-based pullbacks."""
         try:
             current_price = df['close'].iloc[-1]
@@ -210,7 +213,7 @@ class PullbackDetector(SignalDetector):
             # Check each moving average period
             for period in self.ma_periods:
                 if len(df) >= period:
-                    ma = df['close'].rolling(window=period).mean()
+                    ma = graph.sma('close', period)
                     ma_value = ma.iloc[-1]
 
                     # Check if price pulled back to MA
@@ -254,7 +257,7 @@ class PullbackDetector(SignalDetector):
             bounce_strength = self._analyze_bounce_strength(df, best_ma_pullback['ma_value'])
 
             # Calculate trend strength
-            trend_strength = self._calculate_trend_strength(df)
+            trend_strength = self._calculate_trend_strength(df, graph)
 
             return PullbackAnalysis(
                 pullback_detected=True,
@@ -282,11 +285,11 @@ class PullbackDetector(SignalDetector):
                 trend_strength=0.0
             )
 
-    async def _detect_support_pullback(self, df: pd.DataFrame) -> PullbackAnalysis:
+    async def _detect_support_pullback(self, df: pd.DataFrame, graph: IndicatorGraph) -> PullbackAnalysis:
         """Detect support level-based pullbacks."""
         try:
             # Identify support levels
-            support_levels = self._identify_support_levels(df)
+            support_levels = self._identify_support_levels(df, graph)
 
             if not support_levels:
                 return PullbackAnalysis(
@@ -333,7 +336,7 @@ class PullbackDetector(SignalDetector):
             bounce_strength = self._analyze_bounce_strength(df, nearest_support)
 
             # Calculate trend strength
-            trend_strength = self._calculate_trend_strength(df)
+            trend_strength = self._calculate_trend_strength(df, graph)
 
             return PullbackAnalysis(
                 pullback_detected=True,
@@ -368,31 +371,15 @@ class PullbackDetector(SignalDetector):
             lookback_period = min(50, len(df))
             recent_data = df.tail(lookback_period)
 
-            # Find swing high (local maximum)
-            swing_high = None
-            for i in range(5, len(recent_data) - 5):
-                if (recent_data['high'].iloc[i] > recent_data['high'].iloc[i-1] and
-                    recent_data['high'].iloc[i] > recent_data['high'].iloc[i+1] and
-                    recent_data['high'].iloc[i] > recent_data['high'].iloc[i-2] and
-                    recent_data['high'].iloc[i] > recent_data['high'].iloc[i+2] and
-                    recent_data['high'].iloc[i] > recent_data['high'].iloc[i-3] and
-                    recent_data['high'].iloc[i] > recent_data['high'].iloc[i+3]):
-
-                    swing_high = recent_data['high'].iloc[i]
-                    break
-
-            # Find swing low (local minimum)
-            swing_low = None
-            for i in range(5, len(recent_data) - 5):
-                if (recent_data['low'].iloc[i] < recent_data['low'].iloc[i-1] and
-                    recent_data['low'].iloc[i] < recent_data['low'].iloc[i+1] and
-                    recent_data['low'].iloc[i] < recent_data['low'].iloc[i-2] and
-                    recent_data['low'].iloc[i] < recent_data['low'].iloc[i+2] and
-                    recent_data['low'].iloc[i] < recent_data['low'].iloc[i-3] and
-                    recent_data['low'].iloc[i] < recent_data['low'].iloc[i+3]):
-
-                    swing_low = recent_data['low'].iloc[i]
-                    break
+            # Find swing high (first local maximum)
+            highs = recent_data['high'].to_numpy()
+            swing_highs = find_extrema(highs, 3, kind="max", strict=True, margin=5)
+            swing_high = highs[swing_highs[0]] if len(swing_highs) else None
+
+            # Find swing low (first local minimum)
+            lows = recent_data['low'].to_numpy()
+            swing_lows = find_extrema(lows, 3, kind="min", strict=True, margin=5)
+            swing_low = lows[swing_lows[0]] if len(swing_lows) else None
 
             return swing_high, swing_low
 
@@ -400,32 +387,27 @@ class PullbackDetector(SignalDetector):
             self.logger.error(f"Error identifying swing points: {e}")
             return None, None
 
-    def _identify_support_levels(self, df: pd.DataFrame) -> List[float]:
+    def _identify_support_levels(self, df: pd.DataFrame, graph: IndicatorGraph) -> List[float]:
         """Identify support levels from price data."""
         support_levels = []
 
         try:
             # Use recent lows
-            recent_lows = df['low'].rolling(window=5, center=True).min().dropna()
-
-            # Find significant lows (local minima)
-            for i in range(2, len(recent_lows) - 2):
-                if (recent_lows.iloc[i] < recent_lows.iloc[i-1] and
-                    recent_lows.iloc[i] < recent_lows.iloc[i+1] and
-                    recent_lows.iloc[i] < recent_lows.iloc[i-2] and
-                    recent_lows.iloc[i] < recent_lows.iloc[i+1]):
+            recent_lows = graph.rolling_min('low', 5, center=True).dropna().to_numpy()
 
-                    # Group nearby levels
-                    level = recent_lows.iloc[i]
-                    found_group = False
+            # Find significant lows (local minima against two bars left, one right)
+            for i in find_extrema(recent_lows, 2, kind="min", strict=True, right_window=1, margin=2):
+                # Group nearby levels
+                level = recent_lows[i]
+                found_group = False
 
-                    for existing_level in support_levels:
-                        if abs(level - existing_level) / existing_level < 0.02:  # 2% tolerance
-                            found_group = True
-                            break
+                for existing_level in support_levels:
+                    if abs(level - existing_level) / existing_level < 0.02:  # 2% tolerance
+                        found_group = True
+                        break
 
-                    if not found_group:
-                        support_levels.append(level)
+                if not found_group:
+                    support_levels.append(level)
 
         except Exception as e:
             self.logger.error(f"Error identifying support levels: {e}")
@@ -464,15 +446,15 @@ class PullbackDetector(SignalDetector):
             self.logger.error(f"Error analyzing bounce strength: {e}")
             return 0.5
 
-    def _calculate_trend_strength(self, df: pd.DataFrame) -> float:
+    def _calculate_trend_strength(self, df: pd.DataFrame, graph: IndicatorGraph) -> float:
         """Calculate overall trend strength."""
         try:
             if len(df) < 20:
                 return 0.5
 
             # Simple trend strength using moving averages
-            ma_20 = df['close'].rolling(window=20).mean().iloc[-1]
-            ma_50 = df['close'].rolling(window=50).mean().iloc[-1] if len(df) >= 50 else ma_20
+            ma_20 = graph.sma('close', 20).iloc[-1]
+            ma_50 = graph.sma('close', 50).iloc[-1] if len(df) >= 50 else ma_20
 
             current_price = df['close'].iloc[-1]
 
@@ -599,20 +581,7 @@ class PullbackDetector(SignalDetector):
         """Convert market data to pandas DataFrame."""
         try:
             if hasattr(market_data, 'ohlcv_data') and market_data.ohlcv_data:
-                data_list = []
-                for ohlcv in market_data.ohlcv_data:
-                    data_list.append({
-                        'timestamp': ohlcv.timestamp,
-                        'open': ohlcv.open,
-                        'high': ohlcv.high,
-                        'low': ohlcv.low,
-                        'close': ohlcv.close,
-                        'volume': ohlcv.volume
-                    })
-
-                df = pd.DataFrame(data_list)
-                df.set_index('timestamp', inplace=True)
-                return df
+                return market_data.get_ohlcv_frame()
 
             elif hasattr(market_data, 'data') and isinstance(market_data.data, pd.DataFrame):
                 return market_data.data
@@ -17,6 +17,7 @@ from enum import Enum
 from ..signal_detector import SignalDetector, DetectorConfig, DetectionResult
 from ...models.signal import SignalType, SignalStrength
 from ...models.market_data import MarketData
+from ...indicators.indicator_graph import IndicatorGraph
 
 
 class TrendState(Enum):
@@ -89,7 +90,7 @@ class TrendDetector(SignalDetector):
                 return []
 
             # Perform comprehensive trend analysis
-            trend_analysis = await self._analyze_trend(df)
+            trend_analysis = await self._analyze_trend(df, self.get_indicator_graph(market_data, df))
 
             # Generate signals based on trend analysis
             signals = []
@@ -104,19 +105,21 @@ class TrendDetector(SignalDetector):
             self.logger.error(f"Error in trend detection: {e}")
             return []
 
-    async def _analyze_trend(self, df: pd.DataFrame) -> TrendAnalysis:
+    async def _analyze_trend(self, df: pd.DataFrame, graph: Optional[IndicatorGraph] = None) -> TrendAnalysis:
         """Perform comprehensive trend analysis."""
+        graph = graph or IndicatorGraph(df)
+
         # Higher highs and higher lows analysis
-        higher_highs, higher_lows = self._analyze_price_structure(df)
+        higher_highs, higher_lows = self._analyze_price_structure(df, graph)
 
         # Moving average analysis
-        ma_alignment, price_above_ma = self._analyze_moving_averages(df)
+        ma_alignment, price_above_ma = self._analyze_moving_averages(df, graph)
 
         # Momentum analysis
         momentum = self._analyze_momentum(df)
 
         # Trend strength using ADX
-        adx_value = self._calculate_adx(df)
+        adx_value = self._calculate_adx(df, graph)
 
         # Volume confirmation
         volume_confirmation = self._confirm_volume_trend(df)
@@ -148,14 +151,14 @@ class TrendDetector(SignalDetector):
             }
         )
 
-    def _analyze_price_structure(self, df: pd.DataFrame) -> Tuple[bool, bool]:
+    def _analyze_price_structure(self, df: pd.DataFrame, graph: IndicatorGraph) -> Tuple[bool, bool]:
         """Analyze price structure for higher highs and higher lows."""
         if len(df) < 5:
             return False, False
 
         # Get recent highs and lows
-        recent_highs = df['high'].rolling(window=5, center=True).max()
-        recent_lows = df['low'].rolling(window=5, center=True).min()
+        recent_highs = graph.rolling_max('high', 5, center=True)
+        recent_lows = graph.rolling_min('low', 5, center=True)
 
         # Check for higher highs
         higher_highs = False
@@ -175,14 +178,14 @@ class TrendDetector(SignalDetector):
 
         return higher_highs, higher_lows
 
-    def _analyze_moving_averages(self, df: pd.DataFrame) -> Tuple[float, bool]:
+    def _analyze_moving_averages(self, df: pd.DataFrame, graph: IndicatorGraph) -> Tuple[float, bool]:
         """Analyze moving average alignment and price position."""
         ma_values = {}
         price_above_ma_count = 0
 
         for period in self.ma_periods:
             if len(df) >= period:
-                ma = df['close'].rolling(window=period).mean()
+                ma = graph.sma('close', period)
                 ma_values[period] = ma.iloc[-1]
 
                 # Check if price is above MA
@@ -223,42 +226,26 @@ class TrendDetector(SignalDetector):
 
         return normalized_momentum
 
-    def _calculate_adx(self, df: pd.DataFrame) -> Optional[float]:
+    def _calculate_adx(self, df: pd.DataFrame, graph: IndicatorGraph) -> Optional[float]:
         """Calculate Average Directional Index (ADX)."""
         try:
             if len(df) < 20:
                 return None
 
-            # Calculate True Range
-            df['tr'] = np.maximum(
-                df['high'] - df['low'],
-                np.maximum(
-                    abs(df['high'] - df['close'].shift(1)),
-                    abs(df['low'] - df['close'].shift(1))
-                )
-            )
-
             # Calculate Directional Movement
-            df['plus_dm'] = np.where(
-                (df['high'] - df['high'].shift(1)) > (df['low'].shift(1) - df['low']),
-                np.maximum(df['high'] - df['high'].shift(1), 0),
-                0
-            )
-
-            df['minus_dm'] = np.where(
-                (df['low'].shift(1) - df['low']) > (df['high'] - df['high'].shift(1)),
-                np.maximum(df['low'].shift(1) - df['low'], 0),
-                0
-            )
+            up_move = df['high'] - graph.shift('high')
+            down_move = graph.shift('low') - df['low']
+            plus_dm = pd.Series(np.where(up_move > down_move, np.maximum(up_move, 0), 0), index=df.index)
+            minus_dm = pd.Series(np.where(down_move > up_move, np.maximum(down_move, 0), 0), index=df.index)
 
-            # Calculate Smoothed True Range and Directional Movement
-            df['atr'] = df['tr'].rolling(window=14).mean()
-            df['plus_di'] = 100 * (df['plus_dm'].rolling(window=14).mean() / df['atr'])
-            df['minus_di'] = 100 * (df['minus_dm'].rolling(window=14).mean() / df['atr'])
+            # Smoothed Directional Movement over the shared Average True Range
+            atr = graph.atr(14)
+            plus_di = 100 * (plus_dm.rolling(window=14).mean() / atr)
+            minus_di = 100 * (minus_dm.rolling(window=14).mean() / atr)
 
             # Calculate DX and ADX
-            df['dx'] = 100 * abs(df['plus_di'] - df['minus_di']) / (df['plus_di'] + df['minus_di'])
-            adx = df['dx'].rolling(window=14).mean()
+            dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+            adx = dx.rolling(window=14).mean()
 
             return adx.iloc[-1] if not pd.isna(adx.iloc[-1]) else None
 
@@ -439,20 +426,7 @@ class TrendDetector(SignalDetector):
         """Convert market data to pandas DataFrame."""
         try:
             if hasattr(market_data, 'ohlcv_data') and market_data.ohlcv_data:
-                data_list = []
-                for ohlcv in market_data.ohlcv_data:
-                    data_list.append({
-                        'timestamp': ohlcv.timestamp,
-                        'open': ohlcv.open,
-                        'high': ohlcv.high,
-                        'low': ohlcv.low,
-                        'close': ohlcv.close,
-                        'volume': ohlcv.volume
-                    })
-
-                df = pd.DataFrame(data_list)
-                df.set_index('timestamp', inplace=True)
-                return df
+                return market_data.get_ohlcv_frame()
 
             elif hasattr(market_data, 'data') and isinstance(market_data.data, pd.DataFrame):
                 return market_data.data
@@ -478,7 +452,7 @@ class TrendDetector(SignalDetector):
             if df is None or len(df) < self.min_period:
                 return 0.0
 
-            trend_analysis = await self._analyze_trend(df)
+            trend_analysis = await self._analyze_trend(df, self.get_indicator_graph(market_data, df))
             return trend_analysis.strength
 
         except Exception as e:
@@ -16,6 +16,7 @@ import numpy as np
 
 from ..models.signal import Signal, SignalType, SignalStrength, SignalSource, SignalCategory
 from ..models.market_data import MarketData
+from ..indicators.indicator_graph import IndicatorGraph
 from .signal_config import DetectorConfig
 
 
@@ -75,6 +76,23 @@ class SignalDetector(ABC):
         """
         pass
 
+    def get_indicator_graph(self, market_data: MarketData, df: pd.DataFrame) -> IndicatorGraph:
+        """
+        Get the indicator graph for a detection pass.
+
+        Detectors share the graph owned by the market data, so moving averages,
+        true range and rolling extremes are computed once per pass.
+
+        Args:
+            market_data: Market data being analyzed
+            df: DataFrame the detector built from ``market_data``
+
+        Returns:
+            Shared graph, or a private one over ``df`` for non-OHLCV inputs
+        """
+        graph = market_data.get_indicator_graph() if getattr(market_data, 'ohlcv_data', None) else None
+        return graph if graph is not None else IndicatorGraph(df)
+
     @abstractmethod
     def get_required_indicators(self) -> List[str]:
         """
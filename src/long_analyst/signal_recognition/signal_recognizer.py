@@ -12,7 +12,6 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor
 
 from ..models.signal import Signal, SignalType, SignalStrength
 from ..models.market_data import MarketData
@@ -74,8 +73,8 @@ class SignalRecognizer:
         else:
             self.multi_timeframe_analyzer = None
 
-        # Thread pool for concurrent processing
-        self.executor = ThreadPoolExecutor(max_workers=config.max_concurrent_detections)
+        # Detectors share the indicator engine's executor layer
+        self.executor = self.indicator_engine.executor
 
         # Recognition cache
         self.recognition_cache: Dict[str, RecognitionResult] = {}
@@ -211,7 +210,15 @@ class SignalRecognizer:
 
             # Get required indicators for all detectors
             required_indicators = self._get_required_indicators()
-            indicator_results = await self.indicator_engine.batch_calculate(required_indicators, df)
+
+            # Compute shared intermediate series once for every detector
+            indicator_graph = market_data.get_indicator_graph() if getattr(market_data, 'ohlcv_data', None) else None
+            if indicator_graph is not None:
+                indicator_graph.prepare(required_indicators)
+
+            indicator_results = await self.indicator_engine.batch_calculate(
+                [name for name in required_indicators if name in self.indicator_engine.calculators], df
+            )
 
             # Detect signals using all detectors
             all_signals = await self._detect_signals(market_data, indicator_results)
@@ -319,7 +326,9 @@ class SignalRecognizer:
 
         for detector_name, detector in self.detectors.items():
             if detector.config.enabled:
-                task = detector.detect_and_validate(market_data, indicator_results)
+                task = self.executor.run(
+                    f"detector:{detector_name}", detector.detect_and_validate, market_data, indicator_results
+                )
                 detection_tasks.append((detector_name, task))
 
         # Run detections concurrently
@@ -421,21 +430,7 @@ class SignalRecognizer:
         """Convert market data to pandas DataFrame."""
         try:
             if hasattr(market_data, 'ohlcv_data') and market_data.ohlcv_data:
-                # Convert OHLCV data to DataFrame
-                data_list = []
-                for ohlcv in market_data.ohlcv_data:
-                    data_list.append({
-                        'timestamp': ohlcv.timestamp,
-                        'open': ohlcv.open,
-                        'high': ohlcv.high,
-                        'low': ohlcv.low,
-                        'close': ohlcv.close,
-                        'volume': ohlcv.volume
-                    })
-
-                df = pd.DataFrame(data_list)
-                df.set_index('timestamp', inplace=True)
-                return df
+                return market_data.get_ohlcv_frame()
 
             elif hasattr(market_data, 'data') and isinstance(market_data.data, pd.DataFrame):
                 return market_data.data
@@ -617,10 +612,7 @@ class SignalRecognizer:
         """Shutdown the signal recognizer."""
         self.logger.info("Shutting down signal recognizer")
 
-        # Shutdown thread pool
-        self.executor.shutdown(wait=True)
-
-        # Shutdown indicator engine
+        # Shutdown indicator engine (and the shared executor)
         await self.indicator_engine.shutdown()
 
         # Clear cache
@@ -11,6 +11,9 @@ from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import logging
 
+from ..indicators.extrema import find_extrema, cluster_levels
+from ..indicators.indicator_graph import IndicatorGraph
+
 
 class IndicatorCalculator:
     """
@@ -41,10 +44,28 @@ class IndicatorCalculator:
         rsi = 100 - (100 / (1 + rs))
         return rsi
 
-    def macd(self, prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, pd.Series]:
+    def _shared(self, graph: Optional[IndicatorGraph], prices: pd.Series) -> Optional[IndicatorGraph]:
+        """Get the graph holding ``prices`` as a column of its own frame, if any."""
+        if graph is not None and graph.holds(prices):
+            return graph
+        return None
+
+    def _graph_for(self, graph: Optional[IndicatorGraph], df: pd.DataFrame) -> IndicatorGraph:
+        """Get ``graph`` if it was built over ``df``, otherwise a new graph over ``df``."""
+        if graph is not None and graph.holds(df):
+            return graph
+        return IndicatorGraph(df)
+
+    def macd(self, prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9,
+             graph: Optional[IndicatorGraph] = None) -> Dict[str, pd.Series]:
         """Calculate MACD (Moving Average Convergence Divergence)."""
-        ema_fast = self.ema(prices, fast)
-        ema_slow = self.ema(prices, slow)
+        graph = self._shared(graph, prices)
+        if graph is not None:
+            ema_fast = graph.ema(prices.name, fast)
+            ema_slow = graph.ema(prices.name, slow)
+        else:
+            ema_fast = self.ema(prices, fast)
+            ema_slow = self.ema(prices, slow)
         macd_line = ema_fast - ema_slow
         signal_line = self.ema(macd_line, signal)
         histogram = macd_line - signal_line
@@ -55,10 +76,16 @@ class IndicatorCalculator:
             'histogram': histogram
         }
 
-    def bollinger_bands(self, prices: pd.Series, period: int = 20, std_dev: float = 2.0) -> Dict[str, pd.Series]:
+    def bollinger_bands(self, prices: pd.Series, period: int = 20, std_dev: float = 2.0,
+                        graph: Optional[IndicatorGraph] = None) -> Dict[str, pd.Series]:
         """Calculate Bollinger Bands."""
-        middle_band = self.sma(prices, period)
-        std = prices.rolling(window=period).std()
+        graph = self._shared(graph, prices)
+        if graph is not None:
+            middle_band = graph.sma(prices.name, period)
+            std = graph.std(prices.name, period)
+        else:
+            middle_band = self.sma(prices, period)
+            std = prices.rolling(window=period).std()
         upper_band = middle_band + (std * std_dev)
         lower_band = middle_band - (std * std_dev)
 
@@ -69,10 +96,12 @@ class IndicatorCalculator:
             'width': upper_band - lower_band
         }
 
-    def stochastic(self, df: pd.DataFrame, k_period: int = 14, d_period: int = 3) -> Dict[str, pd.Series]:
+    def stochastic(self, df: pd.DataFrame, k_period: int = 14, d_period: int = 3,
+                   graph: Optional[IndicatorGraph] = None) -> Dict[str, pd.Series]:
         """Calculate Stochastic Oscillator."""
-        low_min = df['low'].rolling(window=k_period).min()
-        high_max = df['high'].rolling(window=k_period).max()
+        graph = self._graph_for(graph, df)
+        low_min = graph.rolling_min('low', k_period)
+        high_max = graph.rolling_max('high', k_period)
         k_percent = 100 * ((df['close'] - low_min) / (high_max - low_min))
         d_percent = k_percent.rolling(window=d_period).mean()
 
@@ -81,17 +110,13 @@ class IndicatorCalculator:
             'd': d_percent
         }
 
-    def atr(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
+    def atr(self, df: pd.DataFrame, period: int = 14, graph: Optional[IndicatorGraph] = None) -> pd.Series:
         """Calculate Average True Range."""
-        high_low = df['high'] - df['low']
-        high_close = np.abs(df['high'] - df['close'].shift())
-        low_close = np.abs(df['low'] - df['close'].shift())
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = true_range.rolling(window=period).mean()
-        return atr
-
-    def adx(self, df: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
+        return self._graph_for(graph, df).atr(period)
+
+    def adx(self, df: pd.DataFrame, period: int = 14, graph: Optional[IndicatorGraph] = None) -> Dict[str, pd.Series]:
         """Calculate Average Directional Index."""
+        graph = self._graph_for(graph, df)
         high_diff = df['high'].diff()
         low_diff = df['low'].diff()
 
@@ -101,7 +126,7 @@ class IndicatorCalculator:
         plus_dm = pd.Series(plus_dm, index=df.index).rolling(window=period).mean()
         minus_dm = pd.Series(minus_dm, index=df.index).rolling(window=period).mean()
 
-        atr_values = self.atr(df, period)
+        atr_values = graph.atr(period)
 
         plus_di = 100 * (plus_dm / atr_values)
         minus_di = 100 * (minus_dm / atr_values)
@@ -123,10 +148,11 @@ class IndicatorCalculator:
         cci = (tp - sma_tp) / (0.015 * mad)
         return cci
 
-    def williams_r(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
+    def williams_r(self, df: pd.DataFrame, period: int = 14, graph: Optional[IndicatorGraph] = None) -> pd.Series:
         """Calculate Williams %R."""
-        highest_high = df['high'].rolling(window=period).max()
-        lowest_low = df['low'].rolling(window=period).min()
+        graph = self._graph_for(graph, df)
+        highest_high = graph.rolling_max('high', period)
+        lowest_low = graph.rolling_min('low', period)
         williams_r = -100 * (highest_high - df['close']) / (highest_high - lowest_low)
         return williams_r
 
@@ -211,16 +237,12 @@ class IndicatorCalculator:
         lows = df['low'].rolling(window=window).min()
 
         # Find resistance levels (local highs)
-        resistance_candidates = []
-        for i in range(1, len(highs) - 1):
-            if highs.iloc[i] >= highs.iloc[i-1] and highs.iloc[i] >= highs.iloc[i+1]:
-                resistance_candidates.append(highs.iloc[i])
+        high_values = highs.to_numpy()
+        resistance_candidates = list(high_values[find_extrema(high_values, 1, kind="max")])
 
         # Find support levels (local lows)
-        support_candidates = []
-        for i in range(1, len(lows) - 1):
-            if lows.iloc[i] <= lows.iloc[i-1] and lows.iloc[i] <= lows.iloc[i+1]:
-                support_candidates.append(lows.iloc[i])
+        low_values = lows.to_numpy()
+        support_candidates = list(low_values[find_extrema(low_values, 1, kind="min")])
 
         # Cluster similar levels
         resistance = self._cluster_levels(resistance_candidates, threshold)
@@ -301,56 +323,54 @@ class IndicatorCalculator:
 
     def _cluster_levels(self, levels: List[float], threshold: float) -> List[float]:
         """Cluster similar price levels."""
-        if not levels:
-            return []
+        return [np.mean(cluster) for cluster in cluster_levels(levels, threshold, chained=True)]
 
-        levels.sort()
-        clusters = []
-        current_cluster = [levels[0]]
+    def calculate_all_indicators(self, df: pd.DataFrame, graph: Optional[IndicatorGraph] = None) -> Dict[str, pd.Series]:
+        """
+        Calculate all available indicators for comprehensive analysis.
 
-        for level in levels[1:]:
-            if abs(level - current_cluster[-1]) / current_cluster[-1] <= threshold:
-                current_cluster.append(level)
-            else:
-                clusters.append(np.mean(current_cluster))
-                current_cluster = [level]
+        Moving averages, true range and rolling extremes shared between
+        indicators are computed once through an indicator graph.
 
-        clusters.append(np.mean(current_cluster))
-        return clusters
+        Args:
+            df: OHLCV data
+            graph: Indicator graph over ``df`` to share with other consumers
 
-    def calculate_all_indicators(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
-        """Calculate all available indicators for comprehensive analysis."""
+        Returns:
+            Indicator series by name
+        """
+        graph = self._graph_for(graph, df)
         indicators = {}
 
         # Trend indicators
-        indicators['sma_20'] = self.sma(df['close'], 20)
-        indicators['sma_50'] = self.sma(df['close'], 50)
-        indicators['sma_200'] = self.sma(df['close'], 200)
-        indicators['ema_12'] = self.ema(df['close'], 12)
-        indicators['ema_26'] = self.ema(df['close'], 26)
+        indicators['sma_20'] = graph.sma('close', 20)
+        indicators['sma_50'] = graph.sma('close', 50)
+        indicators['sma_200'] = graph.sma('close', 200)
+        indicators['ema_12'] = graph.ema('close', 12)
+        indicators['ema_26'] = graph.ema('close', 26)
 
         # Momentum indicators
         indicators['rsi'] = self.rsi(df['close'])
-        macd_data = self.macd(df['close'])
+        macd_data = self.macd(df['close'], graph=graph)
         indicators.update(macd_data)
 
-        stochastic_data = self.stochastic(df)
+        stochastic_data = self.stochastic(df, graph=graph)
         indicators.update(stochastic_data)
 
         indicators['cci'] = self.cci(df)
-        indicators['williams_r'] = self.williams_r(df)
+        indicators['williams_r'] = self.williams_r(df, graph=graph)
 
         # Volatility indicators
-        bollinger_data = self.bollinger_bands(df['close'])
+        bollinger_data = self.bollinger_bands(df['close'], graph=graph)
         indicators.update(bollinger_data)
 
-        indicators['atr'] = self.atr(df)
+        indicators['atr'] = self.atr(df, graph=graph)
 
-        adx_data = self.adx(df)
+        adx_data = self.adx(df, graph=graph)
         indicators.update(adx_data)
 
         # Volume indicators
-        indicators['volume_sma'] = self.sma(df['volume'], 20)
+        indicators['volume_sma'] = graph.sma('volume', 20)
         indicators['obv'] = self.obv(df)
         indicators['mfi'] = self.mfi(df)
         indicators['vwap'] = self.vwap(df)
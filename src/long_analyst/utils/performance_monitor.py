@@ -127,6 +127,18 @@ class PerformanceMonitor:
             self.counters[counter_key] += value
             self.record_metric(counter_key, float(self.counters[counter_key]), tags)
 
+    def record_error(self, name: str, tags: Optional[Dict[str, str]] = None):
+        """
+        Record an error event.
+
+        Args:
+            name: Error name
+            tags: Optional tags
+        """
+        with self._lock:
+            self.counters["error_events"] += 1
+            self.increment_counter(name, tags=tags)
+
     def set_gauge(self, name: str, value: float, tags: Optional[Dict[str, str]] = None):
         """
         Set a gauge metric.
@@ -19,6 +19,7 @@ from ..models.base import (
     NewsSourceStatus
 )
 from ..core.adapter import NewsSourceAdapter
+from ..core.body_fetcher import ArticleBodyFetcher
 from ..core.error_handler import ErrorContext, ErrorType
 
 
@@ -30,6 +31,7 @@ class CoinDeskAdapter(NewsSourceAdapter):
         self.logger = logging.getLogger(__name__)
         self._api_base = "https://api.coindesk.com/v1"
         self._web_base = "https://www.coindesk.com"
+        self.body_fetcher = ArticleBodyFetcher(container_hints=["at-body", "article-body", "document-body"])
 
     @property
     def source_name(self) -> str:
@@ -115,6 +117,9 @@ class CoinDeskAdapter(NewsSourceAdapter):
             # 过滤文章
             filtered_articles = self._filter_articles(articles, query)
 
+            # 列表页不含正文，并发抓取详情页补全
+            await self._enrich_article_bodies(filtered_articles)
+
             execution_time = (datetime.now() - start_time).total_seconds() * 1000
 
             return NewsQueryResult(
@@ -21,6 +21,7 @@ from ..models.base import (
     NewsSourceStatus
 )
 from ..core.adapter import NewsSourceAdapter
+from ..core.body_fetcher import ArticleBodyFetcher
 from ..core.error_handler import ErrorContext, ErrorType
 
 
@@ -32,6 +33,7 @@ class CoinTelegraphAdapter(NewsSourceAdapter):
         self.logger = logging.getLogger(__name__)
         self._api_base = "https://cointelegraph.com/api/v1"
         self._web_base = "https://cointelegraph.com"
+        self.body_fetcher = ArticleBodyFetcher(container_hints=["post-content", "post__content"])
         self._editor_api = "https://editorial.cointelegraph.com/api"
 
     @property
@@ -113,6 +115,9 @@ class CoinTelegraphAdapter(NewsSourceAdapter):
             # 过滤文章
             filtered_articles = self._filter_articles(articles, query)
 
+            # 列表页不含正文，并发抓取详情页补全
+            await self._enrich_article_bodies(filtered_articles)
+
             execution_time = (datetime.now() - start_time).total_seconds() * 1000
 
             return NewsQueryResult(
@@ -14,6 +14,8 @@ import pickle
 from pathlib import Path
 
 from ..models.base import NewsArticle, NewsSourceConfig
+from .tracker_store import TrackerStore, FingerprintRow
+from ..utils.bloom_filter import RotatingBloomFilter
 
 
 @dataclass
@@ -62,9 +64,23 @@ class IncrementalTracker:
         self.url_index: Dict[str, str] = {}  # url -> fingerprint_id
         self.title_source_index: Dict[str, Set[str]] = {}  # (title_hash, source) -> set of fingerprint_ids
 
-        # 持久化
+        # 持久化：只写入自上次持久化以来的变更
         self.last_persistence_time = datetime.now()
         self.persistence_task: Optional[asyncio.Task] = None
+        self.store: Optional[TrackerStore] = None
+        self._dirty_fingerprints: Set[str] = set()
+        self._deleted_fingerprints: Set[str] = set()
+        self._dirty_sources: Set[str] = set()
+
+        # 布隆过滤器：在精确索引前判断"一定未见过"，按天分区随窗口滚动
+        # 每篇文章写入URL和标题源两个键；超过内存上限的已持久化文章只保留在存储中
+        bloom_capacity = config.get('bloom_capacity', 100000)  # 窗口内预计文章数
+        self.seen_filter = RotatingBloomFilter(
+            partition_seconds=86400,
+            capacity_per_partition=max(1, 2 * bloom_capacity // max(1, self.window_days)),
+            error_rate=config.get('bloom_error_rate', 0.01)
+        )
+        self.evicted_articles = 0
 
         # 初始化存储路径
         Path(self.storage_path).mkdir(parents=True, exist_ok=True)
@@ -96,19 +112,59 @@ class IncrementalTracker:
         # 最后保存数据
         await self._save_data()
 
-    def is_duplicate(self, article: NewsArticle) -> bool:
-        """检查文章是否重复"""
+        if self.store:
+            self.store.close()
+            self.store = None
+
+    def is_duplicate(self, article: NewsArticle) -> Optional[bool]:
+        """
+        检查文章是否重复，不访问存储，可在事件循环中直接调用
+
+        返回True或False时结果是精确的；布隆过滤器命中但文章只可能保存在存储中时返回
+        None，表示可能重复，调用方须用 confirm_duplicate 确认，避免布隆过滤器误判丢弃新文章。
+        """
+        return self._check_in_memory(article)
+
+    async def confirm_duplicate(self, article: NewsArticle) -> bool:
+        """检查文章是否重复，只保存在存储中的文章在线程池中精确查询，不阻塞事件循环"""
+        result = self._check_in_memory(article)
+        if result is not None:
+            return result
+
+        loop = asyncio.get_running_loop()
+        if article.url:
+            return await loop.run_in_executor(None, self.store.has_url, article.url)
+        return await loop.run_in_executor(
+            None, self.store.has_title_source, self._generate_hash(article.title), str(article.source)
+        )
+
+    def _check_in_memory(self, article: NewsArticle) -> Optional[bool]:
+        """用布隆过滤器和内存索引判断是否重复，需要查询存储才能确定时返回None"""
         if not article.url:
             # 如果没有URL，使用标题和来源检查
-            title_hash = self._generate_hash(article.title)
-            key = f"{title_hash}_{article.source}"
-            return key in self.title_source_index
+            key = f"{self._generate_hash(article.title)}_{article.source}"
+            if f"title:{key}" not in self.seen_filter:
+                return False
+            if key in self.title_source_index:
+                return True
+        else:
+            # 检查URL是否已存在
+            if f"url:{article.url}" not in self.seen_filter:
+                return False
+            if article.url in self.url_index:
+                return True
 
-        # 检查URL是否已存在
-        if article.url in self.url_index:
-            return True
+        return None if self._has_evicted_articles() else False
 
-        return False
+    def _has_evicted_articles(self) -> bool:
+        """是否有文章只保存在存储中"""
+        return self.store is not None and self.evicted_articles > 0
+
+    def _add_seen_keys(self, url: str, title_source_key: str, created_at: datetime):
+        """将去重键写入布隆过滤器"""
+        if url:
+            self.seen_filter.add(f"url:{url}", created_at)
+        self.seen_filter.add(f"title:{title_source_key}", created_at)
 
     def get_fingerprint(self, article: NewsArticle) -> str:
         """生成文章指纹"""
@@ -137,19 +193,40 @@ class IncrementalTracker:
             created_at=datetime.now()
         )
 
-        # 存储指纹
+        # 存储指纹并更新索引
+        self._index_fingerprint(fingerprint_id, fingerprint)
+        self._add_seen_keys(fingerprint.url, f"{title_hash}_{fingerprint.source}", fingerprint.created_at)
+        self._dirty_fingerprints.add(fingerprint_id)
+        self._deleted_fingerprints.discard(fingerprint_id)
+
+        return fingerprint_id
+
+    def _index_fingerprint(self, fingerprint_id: str, fingerprint: ArticleFingerprint):
+        """存储指纹并更新URL和标题源索引"""
         self.article_fingerprints[fingerprint_id] = fingerprint
 
-        # 更新索引
-        if article.url:
-            self.url_index[article.url] = fingerprint_id
+        if fingerprint.url:
+            self.url_index[fingerprint.url] = fingerprint_id
 
-        title_source_key = f"{title_hash}_{fingerprint.source}"
+        title_source_key = f"{fingerprint.title_hash}_{fingerprint.source}"
         if title_source_key not in self.title_source_index:
             self.title_source_index[title_source_key] = set()
         self.title_source_index[title_source_key].add(fingerprint_id)
 
-        return fingerprint_id
+    def _unindex_fingerprint(self, fingerprint_id: str):
+        """从内存中移除指纹及其URL和标题源索引"""
+        fingerprint = self.article_fingerprints.pop(fingerprint_id)
+
+        # 从URL索引中移除
+        if fingerprint.url and fingerprint.url in self.url_index:
+            del self.url_index[fingerprint.url]
+
+        # 从标题源索引中移除
+        title_source_key = f"{fingerprint.title_hash}_{fingerprint.source}"
+        if title_source_key in self.title_source_index:
+            self.title_source_index[title_source_key].discard(fingerprint_id)
+            if not self.title_source_index[title_source_key]:
+                del self.title_source_index[title_source_key]
 
     def update_source_tracking(self,
                               source_name: str,
@@ -162,6 +239,7 @@ class IncrementalTracker:
             self.source_tracking[source_name] = SourceTrackingInfo(source_name=source_name)
 
         tracking_info = self.source_tracking[source_name]
+        self._dirty_sources.add(source_name)
         tracking_info.last_collection_time = collection_time
         tracking_info.total_articles_collected += articles_count
 
@@ -209,14 +287,19 @@ class IncrementalTracker:
                               end_time: datetime,
                               source: Optional[str] = None) -> List[ArticleFingerprint]:
         """获取时间窗口内的文章"""
-        articles = []
+        articles = {}
+
+        # 部分文章只保存在存储中时从存储补充
+        if self._has_evicted_articles():
+            for row in self.store.load_published_between(start_time, end_time, source):
+                articles[row[0]] = self._row_to_fingerprint(row)
 
-        for fingerprint in self.article_fingerprints.values():
+        for fingerprint_id, fingerprint in self.article_fingerprints.items():
             if start_time <= fingerprint.published_at <= end_time:
                 if source is None or fingerprint.source == source:
-                    articles.append(fingerprint)
+                    articles[fingerprint_id] = fingerprint
 
-        return sorted(articles, key=lambda x: x.published_at, reverse=True)
+        return sorted(articles.values(), key=lambda x: x.published_at, reverse=True)
 
     def remove_expired_articles(self, cutoff_time: datetime) -> int:
         """移除过期文章"""
@@ -230,36 +313,47 @@ class IncrementalTracker:
 
         # 移除文章和相关索引
         for fingerprint_id in fingerprints_to_remove:
-            fingerprint = self.article_fingerprints[fingerprint_id]
-
-            # 从URL索引中移除
-            if fingerprint.url and fingerprint.url in self.url_index:
-                del self.url_index[fingerprint.url]
-
-            # 从标题源索引中移除
-            title_source_key = f"{fingerprint.title_hash}_{fingerprint.source}"
-            if title_source_key in self.title_source_index:
-                self.title_source_index[title_source_key].discard(fingerprint_id)
-                if not self.title_source_index[title_source_key]:
-                    del self.title_source_index[title_source_key]
-
-            # 从主存储中移除
-            del self.article_fingerprints[fingerprint_id]
+            self._unindex_fingerprint(fingerprint_id)
+            self._dirty_fingerprints.discard(fingerprint_id)
+            self._deleted_fingerprints.add(fingerprint_id)
             removed_count += 1
 
+        # 丢弃完全早于截止时间的布隆过滤器分区
+        self.seen_filter.expire(cutoff_time)
+
         self.logger.info(f"移除了 {removed_count} 篇过期文章")
         return removed_count
 
+    def _evict_persisted_articles(self) -> int:
+        """内存中文章超过上限时，移出最早的已持久化文章，精确查询改由存储完成"""
+        excess = len(self.article_fingerprints) - self.max_articles_in_memory
+        if excess <= 0 or self.store is None:
+            return 0
+
+        candidates = sorted(
+            (fingerprint.created_at, fingerprint_id)
+            for fingerprint_id, fingerprint in self.article_fingerprints.items()
+            if fingerprint_id not in self._dirty_fingerprints
+        )[:excess]
+
+        for _, fingerprint_id in candidates:
+            self._unindex_fingerprint(fingerprint_id)
+
+        self.evicted_articles += len(candidates)
+        self.logger.debug(f"从内存移出 {len(candidates)} 篇已持久化的文章")
+        return len(candidates)
+
     def get_statistics(self) -> Dict[str, Any]:
         """获取统计信息"""
-        total_articles = len(self.article_fingerprints)
+        total_articles = len(self.article_fingerprints) + self.evicted_articles
         total_sources = len(self.source_tracking)
 
         # 计算内存使用情况
         estimated_memory = (
-            total_articles * 500 +  # 每个文章指纹约500字节
+            len(self.article_fingerprints) * 500 +  # 每个文章指纹约500字节
             len(self.url_index) * 100 +  # URL索引每项约100字节
-            len(self.title_source_index) * 200  # 标题源索引每项约200字节
+            len(self.title_source_index) * 200 +  # 标题源索引每项约200字节
+            self.seen_filter.memory_bytes
         )
 
         # 源统计
@@ -277,6 +371,9 @@ class IncrementalTracker:
             'total_articles_tracked': total_articles,
             'total_sources_tracked': total_sources,
             'estimated_memory_usage_bytes': estimated_memory,
+            'articles_in_memory': len(self.article_fingerprints),
+            'evicted_articles': self.evicted_articles,
+            'bloom_filter_memory_bytes': self.seen_filter.memory_bytes,
             'window_days': self.window_days,
             'sources': source_stats
         }
@@ -299,94 +396,159 @@ class IncrementalTracker:
                     # 内存清理
                     if len(self.article_fingerprints) > self.max_articles_in_memory:
                         await self._cleanup_expired_data()
+                        self._evict_persisted_articles()
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error("持久化循环异常", exc_info=e)
 
+    def _get_store(self) -> TrackerStore:
+        """获取持久化存储，首次使用时打开"""
+        if self.store is None:
+            self.store = TrackerStore(os.path.join(self.storage_path, 'tracker.db'))
+        return self.store
+
     async def _save_data(self):
-        """保存数据到磁盘"""
-        try:
-            # 保存文章指纹
-            fingerprints_file = os.path.join(self.storage_path, 'fingerprints.pkl')
-            with open(fingerprints_file, 'wb') as f:
-                pickle.dump(self.article_fingerprints, f)
-
-            # 保存源跟踪信息
-            tracking_file = os.path.join(self.storage_path, 'tracking.json')
-            tracking_data = {}
-            for source_name, tracking_info in self.source_tracking.items():
-                tracking_data[source_name] = {
-                    'source_name': tracking_info.source_name,
-                    'last_collection_time': tracking_info.last_collection_time.isoformat() if tracking_info.last_collection_time else None,
-                    'last_article_id': tracking_info.last_article_id,
-                    'total_articles_collected': tracking_info.total_articles_collected,
-                    'last_successful_collection': tracking_info.last_successful_collection.isoformat() if tracking_info.last_successful_collection else None,
-                    'consecutive_failures': tracking_info.consecutive_failures,
-                    'collection_stats': tracking_info.collection_stats
-                }
-
-            with open(tracking_file, 'w', encoding='utf-8') as f:
-                json.dump(tracking_data, f, indent=2, ensure_ascii=False)
-
-            # 保存索引
-            indexes_file = os.path.join(self.storage_path, 'indexes.json')
-            indexes_data = {
-                'url_index': self.url_index,
-                'title_source_index': {k: list(v) for k, v in self.title_source_index.items()}
-            }
+        """将自上次持久化以来的变更写入磁盘"""
+        upserts = [
+            self._fingerprint_to_row(fingerprint_id, self.article_fingerprints[fingerprint_id])
+            for fingerprint_id in self._dirty_fingerprints
+            if fingerprint_id in self.article_fingerprints
+        ]
+        deletes = list(self._deleted_fingerprints)
+        sources = [
+            (source_name, json.dumps(self._tracking_to_dict(self.source_tracking[source_name]), ensure_ascii=False))
+            for source_name in self._dirty_sources
+            if source_name in self.source_tracking
+        ]
+
+        if not upserts and not deletes and not sources:
+            return
+
+        self._dirty_fingerprints.clear()
+        self._deleted_fingerprints.clear()
+        self._dirty_sources.clear()
 
-            with open(indexes_file, 'w', encoding='utf-8') as f:
-                json.dump(indexes_data, f, indent=2, ensure_ascii=False)
+        try:
+            store = self._get_store()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, store.write_changes, upserts, deletes, sources)
 
-            self.logger.debug("数据持久化完成")
+            self.logger.debug(f"数据持久化完成: 写入 {len(upserts)} 篇, 删除 {len(deletes)} 篇, 更新 {len(sources)} 个源")
 
         except Exception as e:
+            # 写入失败时保留变更，下次持久化重试
+            self._dirty_fingerprints.update(row[0] for row in upserts)
+            self._deleted_fingerprints.update(deletes)
+            self._dirty_sources.update(source_name for source_name, _ in sources)
             self.logger.error("保存数据失败", exc_info=e)
 
     async def _load_data(self):
-        """从磁盘加载数据"""
+        """从磁盘加载数据，窗口内的文章全部写入布隆过滤器，内存中只保留最新的文章"""
         try:
-            # 加载文章指纹
-            fingerprints_file = os.path.join(self.storage_path, 'fingerprints.pkl')
-            if os.path.exists(fingerprints_file):
-                with open(fingerprints_file, 'rb') as f:
-                    self.article_fingerprints = pickle.load(f)
+            store = self._get_store()
+            loop = asyncio.get_running_loop()
+
+            await loop.run_in_executor(None, self._migrate_legacy_data, store)
+
+            # 窗口外的文章直接在存储中删除，不再加载
+            cutoff_time = datetime.now() - timedelta(days=self.window_days)
+            await loop.run_in_executor(None, store.delete_created_before, cutoff_time)
+
+            keys = await loop.run_in_executor(None, store.load_keys, cutoff_time)
+            for url, title_hash, source, created_at in keys:
+                self._add_seen_keys(url, f"{title_hash}_{source}", datetime.fromisoformat(created_at))
+
+            rows = await loop.run_in_executor(None, store.load_fingerprints, cutoff_time, self.max_articles_in_memory)
+            for row in rows:
+                if row[0] not in self.article_fingerprints:
+                    self._index_fingerprint(row[0], self._row_to_fingerprint(row))
+            self.evicted_articles = max(0, len(keys) - len(rows))
 
             # 加载源跟踪信息
-            tracking_file = os.path.join(self.storage_path, 'tracking.json')
-            if os.path.exists(tracking_file):
-                with open(tracking_file, 'r', encoding='utf-8') as f:
-                    tracking_data = json.load(f)
-
-                for source_name, data in tracking_data.items():
-                    self.source_tracking[source_name] = SourceTrackingInfo(
-                        source_name=data['source_name'],
-                        last_collection_time=datetime.fromisoformat(data['last_collection_time']) if data['last_collection_time'] else None,
-                        last_article_id=data['last_article_id'],
-                        total_articles_collected=data['total_articles_collected'],
-                        last_successful_collection=datetime.fromisoformat(data['last_successful_collection']) if data['last_successful_collection'] else None,
-                        consecutive_failures=data['consecutive_failures'],
-                        collection_stats=data['collection_stats']
-                    )
-
-            # 加载索引
-            indexes_file = os.path.join(self.storage_path, 'indexes.json')
-            if os.path.exists(indexes_file):
-                with open(indexes_file, 'r', encoding='utf-8') as f:
-                    indexes_data = json.load(f)
-
-                self.url_index = indexes_data.get('url_index', {})
-                self.title_source_index = {
-                    k: set(v) for k, v in indexes_data.get('title_source_index', {}).items()
-                }
+            for source_name, data in await loop.run_in_executor(None, store.load_sources):
+                self.source_tracking[source_name] = self._tracking_from_dict(json.loads(data))
 
             self.logger.info(f"加载了 {len(self.article_fingerprints)} 篇文章和 {len(self.source_tracking)} 个源的跟踪数据")
 
         except Exception as e:
             self.logger.error("加载数据失败", exc_info=e)
 
+    def _migrate_legacy_data(self, store: TrackerStore):
+        """将旧版全量文件（fingerprints.pkl、tracking.json）导入存储，导入后重命名"""
+        fingerprints_file = os.path.join(self.storage_path, 'fingerprints.pkl')
+        tracking_file = os.path.join(self.storage_path, 'tracking.json')
+        if not os.path.exists(fingerprints_file) and not os.path.exists(tracking_file):
+            return
+
+        upserts = []
+        if os.path.exists(fingerprints_file):
+            with open(fingerprints_file, 'rb') as f:
+                fingerprints = pickle.load(f)
+            upserts = [self._fingerprint_to_row(k, v) for k, v in fingerprints.items()]
+
+        sources = []
+        if os.path.exists(tracking_file):
+            with open(tracking_file, 'r', encoding='utf-8') as f:
+                sources = [(k, json.dumps(v, ensure_ascii=False)) for k, v in json.load(f).items()]
+
+        store.write_changes(upserts, [], sources)
+
+        for legacy_file in (fingerprints_file, tracking_file, os.path.join(self.storage_path, 'indexes.json')):
+            if os.path.exists(legacy_file):
+                os.replace(legacy_file, legacy_file + '.migrated')
+
+        self.logger.info(f"从旧版文件迁移了 {len(upserts)} 篇文章和 {len(sources)} 个源的跟踪数据")
+
+    def _fingerprint_to_row(self, fingerprint_id: str, fingerprint: ArticleFingerprint) -> FingerprintRow:
+        """指纹转换为存储行"""
+        return (
+            fingerprint_id,
+            fingerprint.title_hash,
+            fingerprint.content_hash,
+            fingerprint.source,
+            fingerprint.url,
+            fingerprint.published_at.isoformat(),
+            fingerprint.created_at.isoformat()
+        )
+
+    def _row_to_fingerprint(self, row: FingerprintRow) -> ArticleFingerprint:
+        """存储行转换为指纹"""
+        _, title_hash, content_hash, source, url, published_at, created_at = row
+        return ArticleFingerprint(
+            title_hash=title_hash,
+            content_hash=content_hash,
+            source=source,
+            url=url,
+            published_at=datetime.fromisoformat(published_at),
+            created_at=datetime.fromisoformat(created_at)
+        )
+
+    def _tracking_to_dict(self, tracking_info: SourceTrackingInfo) -> Dict[str, Any]:
+        """源跟踪信息序列化"""
+        return {
+            'source_name': tracking_info.source_name,
+            'last_collection_time': tracking_info.last_collection_time.isoformat() if tracking_info.last_collection_time else None,
+            'last_article_id': tracking_info.last_article_id,
+            'total_articles_collected': tracking_info.total_articles_collected,
+            'last_successful_collection': tracking_info.last_successful_collection.isoformat() if tracking_info.last_successful_collection else None,
+            'consecutive_failures': tracking_info.consecutive_failures,
+            'collection_stats': tracking_info.collection_stats
+        }
+
+    def _tracking_from_dict(self, data: Dict[str, Any]) -> SourceTrackingInfo:
+        """源跟踪信息反序列化"""
+        return SourceTrackingInfo(
+            source_name=data['source_name'],
+            last_collection_time=datetime.fromisoformat(data['last_collection_time']) if data['last_collection_time'] else None,
+            last_article_id=data['last_article_id'],
+            total_articles_collected=data['total_articles_collected'],
+            last_successful_collection=datetime.fromisoformat(data['last_successful_collection']) if data['last_successful_collection'] else None,
+            consecutive_failures=data['consecutive_failures'],
+            collection_stats=data['collection_stats']
+        )
+
     async def _cleanup_expired_data(self):
         """清理过期数据"""
         # 计算15天前的截止时间
@@ -395,12 +557,20 @@ class IncrementalTracker:
         # 移除过期文章
         removed_count = self.remove_expired_articles(cutoff_time)
 
+        # 只保存在存储中的过期文章直接在存储中删除
+        if self._has_evicted_articles():
+            loop = asyncio.get_running_loop()
+            removed_count += await loop.run_in_executor(None, self.store.delete_created_before, cutoff_time)
+            persisted = await loop.run_in_executor(None, self.store.count_fingerprints)
+            in_memory_persisted = len(self.article_fingerprints) - len(self._dirty_fingerprints)
+            self.evicted_articles = max(0, persisted - in_memory_persisted)
+
         if removed_count > 0:
             self.logger.info(f"清理完成，移除了 {removed_count} 篇过期文章")
 
         # 清理过期的收集统计（保留最近30天）
         stats_cutoff = datetime.now() - timedelta(days=30)
-        for tracking_info in self.source_tracking.values():
+        for source_name, tracking_info in self.source_tracking.items():
             expired_stats = []
             for date_key in tracking_info.collection_stats:
                 try:
@@ -412,6 +582,8 @@ class IncrementalTracker:
 
             for date_key in expired_stats:
                 del tracking_info.collection_stats[date_key]
+            if expired_stats:
+                self._dirty_sources.add(source_name)
 
     def export_data(self, export_path: str) -> bool:
         """导出数据"""
@@ -2,7 +2,6 @@
 Cryptocurrency relevance filtering and scoring system
 """
 
-import re
 import logging
 from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass
@@ -11,6 +10,7 @@ import json
 from pathlib import Path
 
 from ..models.base import NewsArticle, NewsCategory
+from ..utils.keyword_automaton import KeywordAutomaton
 
 
 class RelevanceLevel(Enum):
@@ -62,7 +62,7 @@ class RelevanceFilter:
         # 加载关键词
         self.keywords = self._load_keywords()
 
-        # 编译正则表达式
+        # 编译关键词自动机
         self._compile_patterns()
 
     def _load_crypto_database(self) -> Dict[str, CryptocurrencyInfo]:
@@ -177,7 +177,7 @@ class RelevanceFilter:
         }
 
         # 从配置文件加载更多加密货币
-        config_crypto = config.get('additional_cryptocurrencies', {})
+        config_crypto = self.config.get('additional_cryptocurrencies', {})
         for symbol, data in config_crypto.items():
             crypto_data[symbol] = CryptocurrencyInfo(
                 symbol=symbol,
@@ -224,7 +224,7 @@ class RelevanceFilter:
         }
 
         # 从配置文件加载额外关键词
-        config_keywords = config.get('additional_keywords', {})
+        config_keywords = self.config.get('additional_keywords', {})
         for category, words in config_keywords.items():
             if category in keywords:
                 keywords[category].extend(words)
@@ -234,39 +234,45 @@ class RelevanceFilter:
         return keywords
 
     def _compile_patterns(self):
-        """编译正则表达式模式"""
-        # 编译加密货币名称模式
-        self.crypto_patterns = {}
+        """编译关键词自动机"""
+        # 加密货币别名和各类关键词共用一个自动机，单次扫描得到全部匹配
+        self.keyword_automaton = KeywordAutomaton()
         for symbol, crypto_info in self.crypto_db.items():
-            pattern = r'\b(?:' + '|'.join(re.escape(alias) for alias in crypto_info.aliases) + r')\b'
-            self.crypto_patterns[symbol] = re.compile(pattern, re.IGNORECASE)
-
-        # 编译关键词模式
-        self.keyword_patterns = {}
+            self.keyword_automaton.add_keywords(crypto_info.aliases, ('crypto', symbol))
         for category, words in self.keywords.items():
-            pattern = r'\b(?:' + '|'.join(re.escape(word) for word in words) + r')\b'
-            self.keyword_patterns[category] = re.compile(pattern, re.IGNORECASE)
+            self.keyword_automaton.add_keywords(words, ('keyword', category))
+
+    def _match_keywords(self, text: str) -> Tuple[Dict[Tuple[str, str], int], List[str]]:
+        """单次扫描文本，返回 (各标签匹配次数, 匹配到的关键词)"""
+        counts: Dict[Tuple[str, str], int] = {}
+        keywords = []
+        for match in self.keyword_automaton.find_all(text):
+            for payload in match.payloads:
+                counts[payload] = counts.get(payload, 0) + 1
+                if payload[0] == 'keyword':
+                    keywords.append(match.keyword)
+        return counts, keywords
 
     def calculate_relevance(self, article: NewsArticle) -> RelevanceScore:
         """计算文章相关性分数"""
         text = f"{article.title} {article.content or ''}".lower()
 
         # 匹配结果
-        matched_keywords = []
+        match_counts, matched_keywords = self._match_keywords(text)
         matched_cryptos = []
         category_matches = []
         reasoning = []
         total_score = 0.0
 
         # 1. 加密货币匹配 (最高权重)
-        crypto_score, matched_crypto_symbols = self._score_crypto_matches(text)
+        crypto_score, matched_crypto_symbols = self._score_crypto_matches(match_counts)
         if matched_crypto_symbols:
             matched_cryptos.extend(matched_crypto_symbols)
             reasoning.append(f"匹配到加密货币: {', '.join(matched_crypto_symbols)}")
         total_score += crypto_score * 0.4  # 40%权重
 
         # 2. 关键词匹配
-        keyword_score, matched_keyword_cats = self._score_keyword_matches(text)
+        keyword_score, matched_keyword_cats = self._score_keyword_matches(match_counts)
         if matched_keyword_cats:
             category_matches.extend(matched_keyword_cats)
             reasoning.append(f"匹配到关键词类别: {', '.join(matched_keyword_cats)}")
@@ -316,20 +322,19 @@ class RelevanceFilter:
             reasoning=reasoning
         )
 
-    def _score_crypto_matches(self, text: str) -> Tuple[float, List[str]]:
+    def _score_crypto_matches(self, match_counts: Dict[Tuple[str, str], int]) -> Tuple[float, List[str]]:
         """评分加密货币匹配"""
         score = 0.0
         matched_symbols = []
 
-        for symbol, pattern in self.crypto_patterns.items():
-            matches = pattern.findall(text)
-            if matches:
+        for symbol, crypto_info in self.crypto_db.items():
+            match_count = match_counts.get(('crypto', symbol), 0)
+            if match_count:
                 matched_symbols.append(symbol)
-                crypto_info = self.crypto_db[symbol]
 
                 # 基于优先级和出现次数计算分数
                 base_score = crypto_info.priority * 2
-                frequency_bonus = min(len(matches), 5) * 2  # 最多额外10分
+                frequency_bonus = min(match_count, 5) * 2  # 最多额外10分
 
                 # 主要加密货币额外加分
                 if "major" in crypto_info.categories:
@@ -340,29 +345,29 @@ class RelevanceFilter:
         # 限制分数
         return min(score, 40.0), matched_symbols  # 最多40分
 
-    def _score_keyword_matches(self, text: str) -> Tuple[float, List[str]]:
+    def _score_keyword_matches(self, match_counts: Dict[Tuple[str, str], int]) -> Tuple[float, List[str]]:
         """评分关键词匹配"""
         score = 0.0
         matched_categories = []
 
-        for category, pattern in self.keyword_patterns.items():
-            matches = pattern.findall(text)
-            if matches:
+        for category in self.keywords:
+            match_count = match_counts.get(('keyword', category), 0)
+            if match_count:
                 matched_categories.append(category)
 
                 # 不同类别有不同权重
                 if category == "high_relevance":
-                    category_score = min(len(matches) * 3, 15)  # 最多15分
+                    category_score = min(match_count * 3, 15)  # 最多15分
                 elif category == "market_terms":
-                    category_score = min(len(matches) * 2, 10)  # 最多10分
+                    category_score = min(match_count * 2, 10)  # 最多10分
                 elif category == "technology_terms":
-                    category_score = min(len(matches) * 1.5, 8)  # 最多8分
+                    category_score = min(match_count * 1.5, 8)  # 最多8分
                 elif category == "regulation_terms":
-                    category_score = min(len(matches) * 2, 10)  # 最多10分
+                    category_score = min(match_count * 2, 10)  # 最多10分
                 elif category == "security_terms":
-                    category_score = min(len(matches) * 2.5, 12)  # 最多12分
+                    category_score = min(match_count * 2.5, 12)  # 最多12分
                 else:
-                    category_score = min(len(matches) * 1, 5)  # 最多5分
+                    category_score = min(match_count * 1, 5)  # 最多5分
 
                 score += category_score
 
@@ -376,16 +381,15 @@ class RelevanceFilter:
 
         title_lower = title.lower()
         score = 0.0
+        title_counts, _ = self._match_keywords(title_lower)
 
         # 检查标题中是否有加密货币
-        for symbol, pattern in self.crypto_patterns.items():
-            if pattern.search(title_lower):
-                crypto_info = self.crypto_db[symbol]
+        for symbol, crypto_info in self.crypto_db.items():
+            if ('crypto', symbol) in title_counts:
                 score += crypto_info.priority * 1.5  # 标题中的加密货币更重要
 
         # 检查标题中是否有高相关性关键词
-        high_relevance_pattern = self.keyword_patterns.get("high_relevance", re.compile(r''))
-        if high_relevance_pattern.search(title_lower):
+        if ('keyword', 'high_relevance') in title_counts:
             score += 5
 
         # 检查标题是否直接讨论市场或价格
@@ -518,9 +522,8 @@ class RelevanceFilter:
                 priority=data.get('priority', 1)
             )
 
-            # 重新编译模式
-            pattern = r'\b(?:' + '|'.join(re.escape(alias) for alias in self.crypto_db[symbol].aliases) + r')\b'
-            self.crypto_patterns[symbol] = re.compile(pattern, re.IGNORECASE)
+        # 重新编译关键词自动机
+        self._compile_patterns()
 
         self.logger.info(f"更新了 {len(new_cryptos)} 个加密货币到数据库")
 
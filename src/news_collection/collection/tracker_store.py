@@ -0,0 +1,149 @@
+"""
+SQLite-backed incremental persistence for the incremental tracker
+"""
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+
+# (fingerprint_id, title_hash, content_hash, source, url, published_at, created_at)，时间为ISO格式
+FingerprintRow = Tuple[str, str, str, str, str, str, str]
+# (source_name, 跟踪信息JSON)
+SourceRow = Tuple[str, str]
+
+
+class TrackerStore:
+    """
+    增量跟踪器持久化存储
+
+    文章指纹按行存储在SQLite中（WAL模式），在url、标题哈希+来源和创建时间上建立
+    索引。每次持久化只在一个事务内写入新增/删除的指纹和变更的源跟踪信息，写入量与
+    新文章数成正比而与历史总量无关；事务提交是原子的，崩溃不会留下半写的文件。
+    所有方法均为同步调用，由调用方放入线程池执行。
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS fingerprints (
+        fingerprint_id TEXT PRIMARY KEY,
+        title_hash TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        source TEXT NOT NULL,
+        url TEXT NOT NULL,
+        published_at TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_fingerprints_url ON fingerprints (url);
+    CREATE INDEX IF NOT EXISTS idx_fingerprints_title_source ON fingerprints (title_hash, source);
+    CREATE INDEX IF NOT EXISTS idx_fingerprints_created_at ON fingerprints (created_at);
+    CREATE TABLE IF NOT EXISTS source_tracking (
+        source_name TEXT PRIMARY KEY,
+        data TEXT NOT NULL
+    );
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def write_changes(self,
+                      upserts: List[FingerprintRow],
+                      deletes: List[str],
+                      sources: List[SourceRow]):
+        """在一个事务内写入增量变更"""
+        with self._lock, self._conn:
+            if upserts:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?, ?, ?)", upserts
+                )
+            if deletes:
+                self._conn.executemany(
+                    "DELETE FROM fingerprints WHERE fingerprint_id = ?", [(fid,) for fid in deletes]
+                )
+            if sources:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO source_tracking VALUES (?, ?)", sources
+                )
+
+    def delete_created_before(self, cutoff_time: datetime) -> int:
+        """删除创建时间早于截止时间的指纹"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM fingerprints WHERE created_at < ?", (cutoff_time.isoformat(),)
+            )
+            return cursor.rowcount
+
+    def load_fingerprints(self, created_after: Optional[datetime] = None,
+                          limit: Optional[int] = None) -> List[FingerprintRow]:
+        """加载指纹，可只加载某时间之后创建的；指定 limit 时按创建时间从新到旧取前 limit 条"""
+        query = "SELECT * FROM fingerprints"
+        params: list = []
+        if created_after is not None:
+            query += " WHERE created_at >= ?"
+            params.append(created_after.isoformat())
+        if limit is not None:
+            query += " ORDER BY created_at DESC LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def load_keys(self, created_after: Optional[datetime] = None) -> List[Tuple[str, str, str, str]]:
+        """加载去重键 (url, title_hash, source, created_at)"""
+        query = "SELECT url, title_hash, source, created_at FROM fingerprints"
+        params: list = []
+        if created_after is not None:
+            query += " WHERE created_at >= ?"
+            params.append(created_after.isoformat())
+
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def load_published_between(self, start_time: datetime, end_time: datetime,
+                               source: Optional[str] = None) -> List[FingerprintRow]:
+        """加载发布时间在区间内的指纹"""
+        query = "SELECT * FROM fingerprints WHERE published_at >= ? AND published_at <= ?"
+        params: list = [start_time.isoformat(), end_time.isoformat()]
+        if source is not None:
+            query += " AND source = ?"
+            params.append(source)
+
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def has_url(self, url: str) -> bool:
+        """按URL索引精确查询"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM fingerprints WHERE url = ? LIMIT 1", (url,)
+            ).fetchone() is not None
+
+    def has_title_source(self, title_hash: str, source: str) -> bool:
+        """按标题哈希+来源索引精确查询"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM fingerprints WHERE title_hash = ? AND source = ? LIMIT 1", (title_hash, source)
+            ).fetchone() is not None
+
+    def load_sources(self) -> List[SourceRow]:
+        """加载全部源跟踪信息"""
+        with self._lock:
+            return self._conn.execute("SELECT source_name, data FROM source_tracking").fetchall()
+
+    def count_fingerprints(self) -> int:
+        """已持久化的指纹数量"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
@@ -17,6 +17,7 @@ from ..models.base import (
     NewsSourceStatus,
     ConnectionInfo
 )
+from .body_fetcher import ArticleBodyFetcher
 
 
 class NewsSourceAdapter(ABC):
@@ -29,6 +30,8 @@ class NewsSourceAdapter(ABC):
         self._health_status: Optional[HealthStatus] = None
         self._request_count = 0
         self._error_count = 0
+        # 列表页只有标题时用于并发抓取正文，由子类按站点结构创建
+        self.body_fetcher: Optional[ArticleBodyFetcher] = None
 
     @property
     @abstractmethod
@@ -161,6 +164,16 @@ class NewsSourceAdapter(ABC):
             print(f"请求异常: {e}")
             return None
 
+    async def _enrich_article_bodies(self, articles: List[NewsArticle],
+                                     headers: Optional[Dict[str, str]] = None) -> int:
+        """为缺少正文的文章并发抓取详情页正文，配置关闭 fetch_article_bodies 时跳过"""
+        if not self.config.fetch_article_bodies:
+            return 0
+        if not self.body_fetcher or not self.session or not articles:
+            return 0
+
+        return await self.body_fetcher.fetch_bodies(self.session, articles, headers)
+
     def get_connection_info(self) -> Optional[ConnectionInfo]:
         """获取连接信息"""
         return self._connection_info
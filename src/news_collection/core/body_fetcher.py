@@ -0,0 +1,267 @@
+"""
+Concurrent article body fetching with per-host limits, conditional requests and streaming extraction
+"""
+
+import asyncio
+import codecs
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+
+from ..models.base import NewsArticle
+
+
+@dataclass
+class CachedBody:
+    """已抓取正文及其校验信息"""
+    content: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ArticleBodyExtractor(HTMLParser):
+    """
+    流式正文提取器
+
+    边接收HTML片段边解析，进入正文节点（<article>、itemprop="articleBody" 或类名
+    匹配提示的元素）后收集段落文本，正文节点闭合即结束，调用方据此停止读取响应。
+    页面中没有正文节点时，退回到全文段落。
+    """
+
+    VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+    SKIP_TAGS = {'script', 'style', 'noscript', 'figure', 'figcaption', 'aside', 'nav', 'button', 'form', 'svg'}
+    BLOCK_TAGS = {'p', 'h2', 'h3', 'h4', 'li', 'blockquote'}
+
+    def __init__(self, container_hints: Optional[List[str]] = None):
+        super().__init__(convert_charrefs=True)
+        self.container_hints = [hint.lower() for hint in (container_hints or [])]
+        self.finished = False
+
+        self._container_depth = 0
+        self._skip_depth = 0
+        self._block_depth = 0
+        self._buffer: List[str] = []
+        self._paragraphs: List[str] = []
+        self._fallback_paragraphs: List[str] = []
+
+    def get_text(self) -> str:
+        """返回提取的正文"""
+        paragraphs = self._paragraphs if self._paragraphs else self._fallback_paragraphs
+        return "\n\n".join(paragraphs)
+
+    def handle_starttag(self, tag, attrs):
+        if self.finished:
+            return
+
+        if self._container_depth == 0:
+            if self._is_container(tag, dict(attrs)):
+                self._container_depth = 1
+                self._flush()
+                self._block_depth = 0
+                return
+        elif tag not in self.VOID_TAGS:
+            self._container_depth += 1
+
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            if self._block_depth == 0:
+                self._flush()
+            self._block_depth += 1
+
+    def handle_endtag(self, tag):
+        if self.finished:
+            return
+
+        if tag in self.SKIP_TAGS and self._skip_depth > 0:
+            self._skip_depth -= 1
+        elif tag in self.BLOCK_TAGS and self._block_depth > 0:
+            self._block_depth -= 1
+            if self._block_depth == 0:
+                self._flush()
+
+        if self._container_depth > 0 and tag not in self.VOID_TAGS:
+            self._container_depth -= 1
+            if self._container_depth == 0:
+                # 正文节点闭合，后续内容不再解析
+                self._flush()
+                self.finished = bool(self._paragraphs)
+
+    def handle_data(self, data):
+        if self.finished or self._skip_depth > 0 or self._block_depth == 0:
+            return
+        self._buffer.append(data)
+
+    def _flush(self):
+        """结束当前段落"""
+        text = " ".join("".join(self._buffer).split())
+        self._buffer = []
+        if not text:
+            return
+
+        if self._container_depth > 0:
+            self._paragraphs.append(text)
+        elif not self._paragraphs:
+            self._fallback_paragraphs.append(text)
+
+    def _is_container(self, tag: str, attrs: Dict[str, Optional[str]]) -> bool:
+        """判断是否为正文节点"""
+        if tag == 'article' or (attrs.get('itemprop') or '').lower() == 'articlebody':
+            return True
+
+        class_names = (attrs.get('class') or '').lower()
+        return bool(class_names) and any(hint in class_names for hint in self.container_hints)
+
+
+class ArticleBodyFetcher:
+    """
+    文章正文抓取器
+
+    对列表页得到的文章并发抓取详情页：全局并发和每个主机的并发分别限制；带上
+    ETag/Last-Modified 做条件请求，304 时复用缓存的正文；响应按块流式交给
+    提取器，正文节点结束即停止读取。
+    """
+
+    def __init__(self,
+                 max_concurrency: int = 20,
+                 per_host_limit: int = 4,
+                 timeout: float = 10.0,
+                 max_bytes: int = 2 * 1024 * 1024,
+                 cache_size: int = 1000,
+                 container_hints: Optional[List[str]] = None,
+                 chunk_size: int = 16 * 1024):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.cache_size = cache_size
+        self.container_hints = container_hints or []
+        self.chunk_size = chunk_size
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._global_semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._cache: "OrderedDict[str, CachedBody]" = OrderedDict()
+
+        self.stats = {
+            'requests': 0,
+            'not_modified': 0,
+            'failures': 0,
+            'early_stops': 0
+        }
+
+    async def fetch_bodies(self, session: aiohttp.ClientSession, articles: List[NewsArticle],
+                           headers: Optional[Dict[str, str]] = None) -> int:
+        """并发抓取缺少正文的文章，原地填充 content，返回成功填充的数量"""
+        pending = [article for article in articles if article.url and not article.content]
+        if not pending:
+            return 0
+
+        bodies = await asyncio.gather(
+            *(self.fetch_body(session, article.url, headers) for article in pending),
+            return_exceptions=True
+        )
+
+        enriched = 0
+        for article, body in zip(pending, bodies):
+            if isinstance(body, str) and body:
+                article.content = body
+                article.metadata["body_fetched"] = True
+                enriched += 1
+
+        self.logger.debug(f"正文抓取完成: {enriched}/{len(pending)}")
+        return enriched
+
+    async def fetch_body(self, session: aiohttp.ClientSession, url: str,
+                         headers: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """抓取单篇文章正文，失败时返回None"""
+        # 先取主机级许可再取全局许可，等待同一主机的请求不占用全局并发
+        async with self._host_semaphore(url), self._global_semaphore:
+            request_headers = dict(headers or {})
+            cached = self._cache.get(url)
+            if cached:
+                if cached.etag:
+                    request_headers['If-None-Match'] = cached.etag
+                if cached.last_modified:
+                    request_headers['If-Modified-Since'] = cached.last_modified
+
+            try:
+                self.stats['requests'] += 1
+                async with session.get(url, headers=request_headers,
+                                       timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                    if response.status == 304 and cached:
+                        self.stats['not_modified'] += 1
+                        self._cache.move_to_end(url)
+                        return cached.content
+
+                    if response.status != 200:
+                        self.stats['failures'] += 1
+                        self.logger.debug(f"正文抓取HTTP错误 {response.status}: {url}")
+                        return None
+
+                    content, stopped_early = await self._extract_streaming(response)
+                    if stopped_early:
+                        self.stats['early_stops'] += 1
+
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    if content and (etag or last_modified):
+                        self._remember(url, CachedBody(content, etag, last_modified))
+
+                    return content
+
+            except Exception as e:
+                self.stats['failures'] += 1
+                self.logger.debug(f"正文抓取失败 {url}: {e}")
+                return None
+
+    async def _extract_streaming(self, response: aiohttp.ClientResponse) -> Tuple[str, bool]:
+        """边读取边解析，正文节点结束或超过大小上限时停止读取"""
+        extractor = ArticleBodyExtractor(self.container_hints)
+        decoder = self._make_decoder(response.charset)
+        received = 0
+
+        # 增量解码，跨块的多字节字符留在解码器中与下一块拼接
+        async for chunk in response.content.iter_chunked(self.chunk_size):
+            extractor.feed(decoder.decode(chunk))
+            received += len(chunk)
+            if extractor.finished or received >= self.max_bytes:
+                break
+
+        stopped_early = extractor.finished and not response.content.at_eof()
+        extractor.feed(decoder.decode(b'', final=True))
+        extractor.close()
+        return extractor.get_text(), stopped_early
+
+    @staticmethod
+    def _make_decoder(charset: Optional[str]) -> codecs.IncrementalDecoder:
+        """按响应字符集创建增量解码器，未知字符集按UTF-8处理"""
+        try:
+            return codecs.getincrementaldecoder(charset or 'utf-8')(errors='replace')
+        except LookupError:
+            return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """获取主机级别的并发限制"""
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_limit)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _remember(self, url: str, body: CachedBody):
+        """缓存正文及校验信息，超出容量时淘汰最久未使用的"""
+        self._cache[url] = body
+        self._cache.move_to_end(url)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取统计信息"""
+        return dict(self.stats, cached_bodies=len(self._cache))
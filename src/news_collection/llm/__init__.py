@@ -9,7 +9,8 @@ from .llm_connector import (
     LLMMessage,
     LLMResponse,
     LLMError,
-    CacheManager
+    CacheManager,
+    HTTPSessionPool
 )
 
 from .summarizer import (
@@ -61,6 +62,13 @@ from .market_impact import (
     ImpactMagnitude
 )
 
+from .article_packer import ArticlePacker
+
+from .comprehensive_analyzer import (
+    ComprehensiveAnalyzer,
+    ComprehensiveAnalysisResult
+)
+
 from .batch_processor import (
     BatchProcessor,
     BatchConfig,
@@ -89,6 +97,7 @@ __all__ = [
     'LLMResponse',
     'LLMError',
     'CacheManager',
+    'HTTPSessionPool',
 
     # Summarization
     'NewsSummarizer',
@@ -134,6 +143,13 @@ __all__ = [
     'ImpactTimeframe',
     'ImpactMagnitude',
 
+    # Article Packing
+    'ArticlePacker',
+
+    # Comprehensive Analysis
+    'ComprehensiveAnalyzer',
+    'ComprehensiveAnalysisResult',
+
     # Batch Processing
     'BatchProcessor',
     'BatchConfig',
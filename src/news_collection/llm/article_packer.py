@@ -0,0 +1,218 @@
+"""
+Multi-article request packing for batch LLM analysis
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable
+
+from ..models.base import NewsArticle
+from .llm_connector import LLMResponse
+
+
+def parse_json_response(response: str) -> Optional[Any]:
+    """解析LLM返回的JSON，容忍Markdown代码块和前后说明文字，无法解析时返回None"""
+    content = response.strip()
+    if content.startswith("```"):
+        content = content.split("\n", 1)[1] if "\n" in content else ""
+        if content.rstrip().endswith("```"):
+            content = content.rstrip()[:-3]
+
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        pass
+
+    for open_char, close_char in (("{", "}"), ("[", "]")):
+        start, end = content.find(open_char), content.rfind(close_char)
+        if start != -1 and end > start:
+            try:
+                return json.loads(content[start:end + 1])
+            except json.JSONDecodeError:
+                continue
+    return None
+
+
+class ArticlePacker:
+    """
+    多文章请求打包器
+
+    将多篇短文章按token预算贪心分组，每组在一次请求中发送，共享系统提示的固定
+    开销；每篇文章在提示中带有ID，响应按ID拆分回各篇文章。超过单篇上限的长文章
+    不参与打包。
+    """
+
+    def __init__(self, token_budget: int = 3000, max_articles: int = 8, max_article_tokens: int = 600,
+                 chars_per_token: float = 4.0):
+        self.token_budget = token_budget
+        self.max_articles = max_articles
+        self.max_article_tokens = max_article_tokens
+        self.chars_per_token = chars_per_token
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def estimate_tokens(self, article: NewsArticle) -> int:
+        """粗略估算文章在提示中占用的token数"""
+        length = len(article.title or "") + len(article.content or "") + len(article.source or "") + 64
+        return int(length / self.chars_per_token) + 1
+
+    def pack(self, articles: List[NewsArticle]) -> Tuple[List[List[int]], List[int]]:
+        """将文章分组，返回 (多篇打包的分组, 需单独处理的文章)，均为文章下标"""
+        packs: List[List[int]] = []
+        singles: List[int] = []
+
+        current: List[int] = []
+        current_tokens = 0
+        seen_ids = set()
+        for index, article in enumerate(articles):
+            tokens = self.estimate_tokens(article)
+            # 长文章或重复ID无法可靠拆分，单独处理
+            if tokens > self.max_article_tokens or article.id in seen_ids:
+                singles.append(index)
+                continue
+            seen_ids.add(article.id)
+
+            if current and (current_tokens + tokens > self.token_budget or len(current) >= self.max_articles):
+                packs.append(current)
+                current, current_tokens = [], 0
+
+            current.append(index)
+            current_tokens += tokens
+
+        if current:
+            packs.append(current)
+
+        # 只有一篇的分组直接走单篇请求
+        singles.extend(pack[0] for pack in packs if len(pack) == 1)
+        return [pack for pack in packs if len(pack) > 1], sorted(singles)
+
+    def format_articles(self, articles: List[NewsArticle]) -> str:
+        """格式化打包的文章，每篇带有ID"""
+        blocks = []
+        for article in articles:
+            block = f"""### Article ID: {article.id}
+Title: {article.title}
+Source: {article.source or 'Unknown'}
+Published: {article.published_at or 'Unknown date'}
+Category: {article.category.value if article.category else 'General'}
+
+Content:
+{article.content}
+"""
+            if article.tags:
+                block += f"Tags: {', '.join(article.tags)}\n"
+            blocks.append(block)
+
+        return "\n".join(blocks)
+
+    def response_instructions(self, articles: List[NewsArticle]) -> str:
+        """多文章响应格式说明"""
+        article_ids = ", ".join(f'"{article.id}"' for article in articles)
+        return f"""Analyze each article independently.
+
+Respond with ONE valid JSON object of the form:
+{{"articles": [{{"article_id": "<Article ID>", ...per-article result fields...}}]}}
+
+Include exactly one entry for each of these article IDs: {article_ids}"""
+
+    def demultiplex(self, response: str, articles: List[NewsArticle]) -> Dict[str, Dict[str, Any]]:
+        """将打包响应拆分为 {文章ID: 单篇结果}，无法识别的文章不出现在结果中"""
+        parsed = parse_json_response(response)
+        if parsed is None:
+            return {}
+
+        # 支持 {"articles": [...]}、顶层数组以及以文章ID为键的对象
+        if isinstance(parsed, dict) and isinstance(parsed.get("articles"), list):
+            entries = parsed["articles"]
+        elif isinstance(parsed, list):
+            entries = parsed
+        elif isinstance(parsed, dict):
+            return {article.id: parsed[article.id] for article in articles
+                    if isinstance(parsed.get(article.id), dict)}
+        else:
+            return {}
+
+        entries = [entry for entry in entries if isinstance(entry, dict)]
+        article_ids = {article.id for article in articles}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for entry in entries:
+            article_id = entry.get("article_id", entry.get("id"))
+            if article_id is not None and str(article_id) in article_ids and str(article_id) not in results:
+                data = dict(entry)
+                data.pop("article_id", None)
+                results[str(article_id)] = data
+
+        # 所有条目都没有ID但数量一致时按顺序对应
+        if not results and len(entries) == len(articles) and \
+                not any("article_id" in entry or "id" in entry for entry in entries):
+            results = {article.id: entry for article, entry in zip(articles, entries)}
+
+        missing = article_ids - set(results)
+        if missing:
+            self.logger.warning(f"Packed response missing {len(missing)} of {len(articles)} articles")
+        return results
+
+    async def run(self, articles: List[NewsArticle],
+                  request_pack: Callable[[List[NewsArticle]], Awaitable[LLMResponse]],
+                  build_one: Callable[[NewsArticle, Dict[str, Any], LLMResponse, float], Any],
+                  run_single: Callable[[NewsArticle], Awaitable[Any]]) -> List[Any]:
+        """
+        打包执行批量分析，返回与输入顺序一致的结果或异常
+
+        request_pack 对一组文章发出一次请求，build_one 由单篇输出构建结果，
+        run_single 对单篇文章独立分析；打包结果缺失或无法构建的文章回退到 run_single。
+        """
+        packs, singles = self.pack(articles)
+        results: List[Any] = [None] * len(articles)
+
+        outcomes = await asyncio.gather(
+            *(self._run_pack([articles[i] for i in pack], request_pack, build_one, run_single) for pack in packs),
+            *(run_single(articles[i]) for i in singles),
+            return_exceptions=True
+        )
+
+        for pack, outcome in zip(packs, outcomes[:len(packs)]):
+            for index, result in zip(pack, outcome if isinstance(outcome, list) else [outcome] * len(pack)):
+                results[index] = result
+        for index, outcome in zip(singles, outcomes[len(packs):]):
+            results[index] = outcome
+
+        self.logger.info(f"Packed {sum(len(pack) for pack in packs)} articles into {len(packs)} requests, {len(singles)} processed individually")
+        return results
+
+    async def _run_pack(self, articles: List[NewsArticle],
+                        request_pack: Callable[[List[NewsArticle]], Awaitable[LLMResponse]],
+                        build_one: Callable[[NewsArticle, Dict[str, Any], LLMResponse, float], Any],
+                        run_single: Callable[[NewsArticle], Awaitable[Any]]) -> List[Any]:
+        """一次请求处理一组文章，未能拆分出结果的文章回退到单篇处理"""
+        start_time = time.time()
+        packed_data: Dict[str, Dict[str, Any]] = {}
+        response = None
+
+        try:
+            response = await request_pack(articles)
+            packed_data = self.demultiplex(response.content, articles)
+        except Exception as e:
+            self.logger.warning(f"Packed request failed for {len(articles)} articles: {str(e)}")
+
+        results: List[Any] = []
+        for article in articles:
+            result = None
+            if article.id in packed_data:
+                try:
+                    result = build_one(article, packed_data[article.id], response, start_time)
+                    result.metadata["packed_articles"] = len(articles)
+                except Exception as e:
+                    self.logger.warning(f"Invalid packed result for article {article.id}: {str(e)}")
+            results.append(result)
+
+        # 单篇回退
+        fallback = [i for i, result in enumerate(results) if result is None]
+        if fallback:
+            fallback_results = await asyncio.gather(*(run_single(articles[i]) for i in fallback))
+            for i, result in zip(fallback, fallback_results):
+                results[i] = result
+
+        return results
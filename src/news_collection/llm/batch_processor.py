@@ -3,6 +3,7 @@ Batch processing optimization module for efficient LLM operations
 """
 
 import asyncio
+import itertools
 import logging
 import time
 import json
@@ -21,6 +22,7 @@ from .sentiment_analyzer import SentimentAnalyzer, SentimentConfig, SentimentAna
 from .content_segmenter import ContentSegmenter, SectionConfig, SegmentationResult
 from .entity_extractor import EntityExtractor, EntityConfig, EntityExtractionResult
 from .market_impact import MarketImpactAssessor, MarketImpactConfig, MarketImpactResult
+from .comprehensive_analyzer import ComprehensiveAnalyzer
 
 
 class BatchPriority(Enum):
@@ -57,6 +59,10 @@ class BatchConfig:
     enable_error_handling: bool = True
     enable_result_caching: bool = True
     priority_weighting: bool = True
+    enable_combined_analysis: bool = True  # 综合分析使用单次组合调用
+    combined_max_tokens: int = 6000
+    num_workers: Optional[int] = None  # 工作协程数量，默认与 max_concurrent_requests 相同
+    queue_capacity: int = 1000  # 排队及处理中的任务上限，超过时 submit_task 等待空位
 
 
 @dataclass
@@ -71,6 +77,7 @@ class BatchTask:
     retry_count: int = 0
     callback: Optional[Callable] = None
     metadata: Dict[str, Any] = None
+    deadline: Optional[float] = None  # 截止时间（time.monotonic），首次处理时按 timeout 计算
 
     def __post_init__(self):
         if self.metadata is None:
@@ -157,20 +164,38 @@ class BatchProcessor:
         self.content_segmenter = ContentSegmenter(llm_connector, SectionConfig())
         self.entity_extractor = EntityExtractor(llm_connector, EntityConfig())
         self.market_impact_assessor = MarketImpactAssessor(llm_connector, MarketImpactConfig())
+        self.comprehensive_analyzer = ComprehensiveAnalyzer(
+            llm_connector,
+            self.summarizer,
+            self.sentiment_analyzer,
+            self.content_segmenter,
+            self.entity_extractor,
+            self.market_impact_assessor,
+            max_tokens=self.config.combined_max_tokens
+        )
 
-        # 任务队列
-        self.task_queue = queue.PriorityQueue()
+        # 任务队列：元素为 (队列优先级, 截止时间, 序号, 任务)，工作协程在队列上等待，入队即唤醒
+        # 异步原语在事件循环运行后由 _ensure_async_primitives 创建，处理器可在事件循环外构造
+        self.task_queue: Optional[asyncio.PriorityQueue] = None
         self.result_queue = queue.Queue()
+        self._sequence = itertools.count()
+
+        # 反压：排队及处理中的任务总数不超过 queue_capacity
+        self.queue_slots: Optional[asyncio.Semaphore] = None
+        self.pending_task_ids = set()
+        self.idle_event: Optional[asyncio.Event] = None
+        self.results_changed: Optional[asyncio.Condition] = None
 
         # 速率限制
         self.rate_limiter = RateLimiter(self.config.requests_per_minute) if self.config.enable_rate_limiting else None
 
         # 并发控制
-        self.semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+        self.semaphore: Optional[asyncio.Semaphore] = None
         self.executor = ThreadPoolExecutor(max_workers=self.config.max_concurrent_requests)
 
         # 状态控制
         self.is_running = False
+        self.workers: List[asyncio.Task] = []
         self.processing_tasks = {}
         self.completed_tasks = {}
 
@@ -186,11 +211,25 @@ class BatchProcessor:
         if self.is_running:
             return
 
+        self._ensure_async_primitives()
         self.is_running = True
-        self.logger.info("Batch processor started")
-
-        # 启动处理循环
-        asyncio.create_task(self._processing_loop())
+        self._start_time = time.time()
+
+        # 启动固定数量的工作协程
+        worker_count = self.config.num_workers or self.config.max_concurrent_requests
+        self.workers = [asyncio.create_task(self._worker_loop(i)) for i in range(worker_count)]
+        self.logger.info(f"Batch processor started with {worker_count} workers")
+
+    def _ensure_async_primitives(self):
+        """在运行中的事件循环内创建队列、信号量等异步原语"""
+        if self.task_queue is None:
+            self.task_queue = asyncio.PriorityQueue()
+            self.queue_slots = asyncio.Semaphore(self.config.queue_capacity)
+            self.idle_event = asyncio.Event()
+            self.idle_event.set()
+            self.results_changed = asyncio.Condition()
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
 
     async def stop(self):
         """停止批处理器"""
@@ -200,6 +239,12 @@ class BatchProcessor:
         # 等待当前任务完成
         await self._wait_for_completion()
 
+        # 停止工作协程
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
         # 关闭执行器
         self.executor.shutdown(wait=True)
         self.logger.info("Batch processor stopped")
@@ -207,8 +252,11 @@ class BatchProcessor:
     async def submit_task(self, task_type: str, data: Any, priority: BatchPriority = BatchPriority.NORMAL,
                          callback: Optional[Callable] = None, timeout: Optional[float] = None,
                          metadata: Optional[Dict[str, Any]] = None) -> str:
-        """提交任务"""
-        task_id = f"{task_type}_{int(time.time() * 1000)}_{len(self.processing_tasks)}"
+        """提交任务，排队及处理中的任务达到 queue_capacity 时等待空位"""
+        self._ensure_async_primitives()
+        await self.queue_slots.acquire()
+
+        task_id = f"{task_type}_{int(time.time() * 1000)}_{next(self._sequence)}"
 
         task = BatchTask(
             id=task_id,
@@ -220,19 +268,45 @@ class BatchProcessor:
             callback=callback,
             metadata=metadata or {}
         )
+        task.deadline = time.monotonic() + task.timeout
 
-        # 根据优先级计算队列优先级
-        queue_priority = self._calculate_queue_priority(task)
+        self.pending_task_ids.add(task_id)
+        self.idle_event.clear()
+        self._enqueue(task)
 
         with self.lock:
-            self.task_queue.put((queue_priority, task))
-            self.stats.current_queue_size = self.task_queue.qsize()
-            self.stats.max_queue_size = max(self.stats.max_queue_size, self.stats.current_queue_size)
             self.stats.priority_distribution[priority.value] += 1
 
         self.logger.debug(f"Task {task_id} submitted with priority {priority.value}")
         return task_id
 
+    def _enqueue(self, task: BatchTask):
+        """任务入队，同一优先级内截止时间早的先处理"""
+        queue_priority = self._calculate_queue_priority(task)
+        self.task_queue.put_nowait((queue_priority, task.deadline, next(self._sequence), task))
+
+        with self.lock:
+            self.stats.current_queue_size = self.task_queue.qsize()
+            self.stats.max_queue_size = max(self.stats.max_queue_size, self.stats.current_queue_size)
+
+    def _finish_task(self, task_id: str):
+        """释放已提交任务占用的队列空位"""
+        if task_id in self.pending_task_ids:
+            self.pending_task_ids.discard(task_id)
+            self.queue_slots.release()
+            if not self.pending_task_ids:
+                self.idle_event.set()
+
+    async def _store_result(self, batch_result: BatchResult):
+        """存储结果并唤醒等待结果的协程"""
+        with self.lock:
+            self.completed_tasks[batch_result.task_id] = batch_result
+
+        self._finish_task(batch_result.task_id)
+
+        async with self.results_changed:
+            self.results_changed.notify_all()
+
     def _calculate_queue_priority(self, task: BatchTask) -> int:
         """计算队列优先级"""
         if self.config.priority_weighting:
@@ -252,129 +326,133 @@ class BatchProcessor:
         else:
             return 0
 
-    async def _processing_loop(self):
-        """处理循环"""
-        while self.is_running:
-            try:
-                if not self.task_queue.empty():
-                    # 获取下一个任务
-                    queue_priority, task = self.task_queue.get_nowait()
-
-                    # 更新队列大小统计
-                    with self.lock:
-                        self.stats.current_queue_size = self.task_queue.qsize()
-
-                    # 处理任务
-                    asyncio.create_task(self._process_task(task))
+    async def _worker_loop(self, worker_id: int):
+        """工作协程：在队列上等待下一个任务，入队即被唤醒"""
+        while True:
+            _, _, _, task = await self.task_queue.get()
 
-                else:
-                    # 队列为空，短暂休眠
-                    await asyncio.sleep(0.1)
+            with self.lock:
+                self.stats.current_queue_size = self.task_queue.qsize()
 
-            except queue.Empty:
-                await asyncio.sleep(0.1)
+            try:
+                await self._process_task(task)
             except Exception as e:
-                self.logger.error(f"Error in processing loop: {str(e)}")
-                await asyncio.sleep(1)
+                self.logger.error(f"Error in worker {worker_id}: {str(e)}")
+            finally:
+                self.task_queue.task_done()
+
+    async def _dispatch_task(self, task: BatchTask) -> Any:
+        """根据任务类型处理"""
+        if task.task_type == "summarize":
+            return await self._process_summarization(task)
+        elif task.task_type == "sentiment":
+            return await self._process_sentiment_analysis(task)
+        elif task.task_type == "segment":
+            return await self._process_content_segmentation(task)
+        elif task.task_type == "extract_entities":
+            return await self._process_entity_extraction(task)
+        elif task.task_type == "market_impact":
+            return await self._process_market_impact(task)
+        elif task.task_type == "comprehensive":
+            return await self._process_comprehensive_analysis(task)
+        else:
+            raise ValueError(f"Unknown task type: {task.task_type}")
 
-    async def _process_task(self, task: BatchTask):
-        """处理单个任务"""
-        start_time = time.time()
+    async def _process_task(self, task: BatchTask) -> BatchResult:
+        """处理单个任务，失败时在截止时间内按指数退避重试"""
         task_id = task.id
+        self._ensure_async_primitives()
 
-        try:
-            self.logger.debug(f"Processing task {task_id}")
-
-            # 检查速率限制
-            if self.rate_limiter and not self.rate_limiter.can_proceed():
-                wait_time = self.rate_limiter.wait_time()
-                await asyncio.sleep(wait_time)
-
-            # 获取信号量
-            async with self.semaphore:
-                # 根据任务类型处理
-                if task.task_type == "summarize":
-                    result = await self._process_summarization(task)
-                elif task.task_type == "sentiment":
-                    result = await self._process_sentiment_analysis(task)
-                elif task.task_type == "segment":
-                    result = await self._process_content_segmentation(task)
-                elif task.task_type == "extract_entities":
-                    result = await self._process_entity_extraction(task)
-                elif task.task_type == "market_impact":
-                    result = await self._process_market_impact(task)
-                elif task.task_type == "comprehensive":
-                    result = await self._process_comprehensive_analysis(task)
-                else:
-                    raise ValueError(f"Unknown task type: {task.task_type}")
-
-                # 创建批处理结果
-                batch_result = BatchResult(
-                    task_id=task_id,
-                    task_type=task.task_type,
-                    result=result,
-                    success=True,
-                    processing_time=time.time() - start_time,
-                    metadata=task.metadata
-                )
-
-                # 更新统计
-                self._update_task_stats(batch_result, True)
-
-                # 调用回调函数
-                if task.callback:
-                    await self._call_callback(task.callback, batch_result)
-
-                # 存储结果
-                with self.lock:
-                    self.completed_tasks[task_id] = batch_result
+        if task.deadline is None:
+            task.deadline = time.monotonic() + task.timeout
+        self.processing_tasks[task_id] = task
 
-                self.logger.debug(f"Task {task_id} completed successfully in {batch_result.processing_time:.2f}s")
+        try:
+            while True:
+                start_time = time.time()
 
-        except Exception as e:
-            processing_time = time.time() - start_time
-            error_message = str(e)
+                try:
+                    self.logger.debug(f"Processing task {task_id}")
+
+                    # 已过截止时间的任务不再发送请求
+                    if task.deadline <= time.monotonic():
+                        raise asyncio.TimeoutError()
+
+                    # 检查速率限制
+                    if self.rate_limiter and not self.rate_limiter.can_proceed():
+                        wait_time = self.rate_limiter.wait_time()
+                        await asyncio.sleep(wait_time)
+
+                    # 获取信号量
+                    async with self.semaphore:
+                        result = await asyncio.wait_for(self._dispatch_task(task), task.deadline - time.monotonic())
+
+                    # 创建批处理结果
+                    batch_result = BatchResult(
+                        task_id=task_id,
+                        task_type=task.task_type,
+                        result=result,
+                        success=True,
+                        processing_time=time.time() - start_time,
+                        metadata=task.metadata
+                    )
+
+                    # 更新统计
+                    self._update_task_stats(batch_result, True)
+
+                    # 调用回调函数
+                    if task.callback:
+                        await self._call_callback(task.callback, batch_result)
+
+                    # 存储结果
+                    await self._store_result(batch_result)
+
+                    self.logger.debug(f"Task {task_id} completed successfully in {batch_result.processing_time:.2f}s")
+                    return batch_result
+
+                except Exception as e:
+                    processing_time = time.time() - start_time
+                    if isinstance(e, asyncio.TimeoutError):
+                        error_message = f"Task deadline exceeded ({task.timeout}s)"
+                    else:
+                        error_message = str(e)
 
-            self.logger.error(f"Task {task_id} failed: {error_message}")
+                    self.logger.error(f"Task {task_id} failed: {error_message}")
 
-            # 重试逻辑
-            if task.retry_count < self.config.retry_attempts:
-                task.retry_count += 1
-                # 指数退避
-                retry_delay = self.config.retry_delay * (2 ** task.retry_count)
-                await asyncio.sleep(retry_delay)
+                    # 重试逻辑（指数退避），退避后已超过截止时间的任务直接失败
+                    retry_delay = self.config.retry_delay * (2 ** (task.retry_count + 1))
+                    if task.retry_count < self.config.retry_attempts and time.monotonic() + retry_delay < task.deadline:
+                        task.retry_count += 1
+                        self.logger.info(f"Retrying task {task_id} in {retry_delay:.1f}s (attempt {task.retry_count})")
+                        await asyncio.sleep(retry_delay)
+                        continue
 
-                # 重新提交任务
-                queue_priority = self._calculate_queue_priority(task)
-                with self.lock:
-                    self.task_queue.put((queue_priority, task))
-                    self.stats.current_queue_size = self.task_queue.qsize()
+                    # 创建失败结果
+                    batch_result = BatchResult(
+                        task_id=task_id,
+                        task_type=task.task_type,
+                        result=None,
+                        success=False,
+                        processing_time=processing_time,
+                        error_message=error_message,
+                        metadata=task.metadata
+                    )
 
-                self.logger.info(f"Retrying task {task_id} (attempt {task.retry_count})")
-            else:
-                # 创建失败结果
-                batch_result = BatchResult(
-                    task_id=task_id,
-                    task_type=task.task_type,
-                    result=None,
-                    success=False,
-                    processing_time=processing_time,
-                    error_message=error_message,
-                    metadata=task.metadata
-                )
+                    # 更新统计
+                    self._update_task_stats(batch_result, False)
 
-                # 更新统计
-                self._update_task_stats(batch_result, False)
+                    # 调用回调函数
+                    if task.callback:
+                        await self._call_callback(task.callback, batch_result)
 
-                # 调用回调函数
-                if task.callback:
-                    await self._call_callback(task.callback, batch_result)
+                    # 存储结果
+                    await self._store_result(batch_result)
 
-                # 存储结果
-                with self.lock:
-                    self.completed_tasks[task_id] = batch_result
+                    self.logger.error(f"Task {task_id} failed after {task.retry_count} retries")
+                    return batch_result
 
-                self.logger.error(f"Task {task_id} failed after {task.retry_count} retries")
+        finally:
+            self.processing_tasks.pop(task_id, None)
 
     async def _process_summarization(self, task: BatchTask) -> SummaryResult:
         """处理摘要任务"""
@@ -436,6 +514,10 @@ class BatchProcessor:
         results = []
         for article in articles:
             try:
+                if self.config.enable_combined_analysis:
+                    results.append(await self._process_combined_analysis(article))
+                    continue
+
                 # 并行执行所有分析
                 summary_task = asyncio.create_task(self.summarizer.summarize_article(article))
                 sentiment_task = asyncio.create_task(self.sentiment_analyzer.analyze_sentiment(article))
@@ -484,6 +566,22 @@ class BatchProcessor:
 
         return {"results": results, "total_articles": len(articles)} if len(articles) > 1 else results[0]
 
+    async def _process_combined_analysis(self, article: NewsArticle) -> Dict[str, Any]:
+        """单次组合调用完成综合分析，解析失败的任务回退到独立调用"""
+        analysis = await self.comprehensive_analyzer.analyze(article)
+
+        return {
+            "article_id": article.id,
+            "summary": analysis.summary.__dict__ if analysis.summary else None,
+            "sentiment": analysis.sentiment.__dict__ if analysis.sentiment else None,
+            "segmentation": analysis.segmentation.__dict__ if analysis.segmentation else None,
+            "entities": analysis.entities.__dict__ if analysis.entities else None,
+            "market_impact": analysis.market_impact.__dict__ if analysis.market_impact else None,
+            "combined_analysis": analysis.combined,
+            "fallback_tasks": analysis.fallback_tasks,
+            "processing_time": analysis.processing_time
+        }
+
     async def _call_callback(self, callback: Callable, result: BatchResult):
         """调用回调函数"""
         try:
@@ -517,51 +615,51 @@ class BatchProcessor:
                 self.stats.throughput = self.stats.total_tasks_processed / max(1, total_runtime)
 
     async def _wait_for_completion(self):
-        """等待所有任务完成"""
-        while not self.task_queue.empty() or self.processing_tasks:
-            await asyncio.sleep(0.1)
+        """等待所有已提交任务完成"""
+        self._ensure_async_primitives()
+        await self.idle_event.wait()
 
     async def get_result(self, task_id: str, timeout: Optional[float] = None) -> Optional[BatchResult]:
-        """获取任务结果"""
-        start_time = time.time()
-
-        while True:
-            with self.lock:
-                if task_id in self.completed_tasks:
-                    return self.completed_tasks[task_id]
-
-            # 检查超时
-            if timeout and (time.time() - start_time) > timeout:
+        """获取任务结果，任务完成时立即唤醒"""
+        self._ensure_async_primitives()
+        async with self.results_changed:
+            try:
+                await asyncio.wait_for(
+                    self.results_changed.wait_for(lambda: task_id in self.completed_tasks), timeout
+                )
+            except asyncio.TimeoutError:
                 return None
 
-            await asyncio.sleep(0.1)
+        with self.lock:
+            return self.completed_tasks.get(task_id)
 
     async def wait_for_completion(self, task_ids: List[str], timeout: Optional[float] = None) -> Dict[str, BatchResult]:
-        """等待多个任务完成"""
-        results = {}
-        start_time = time.time()
-
-        while len(results) < len(task_ids):
-            # 检查超时
-            if timeout and (time.time() - start_time) > timeout:
-                break
-
-            with self.lock:
-                for task_id in task_ids:
-                    if task_id not in results and task_id in self.completed_tasks:
-                        results[task_id] = self.completed_tasks[task_id]
-
-            await asyncio.sleep(0.1)
+        """等待多个任务完成，超时时返回已完成的部分"""
+        self._ensure_async_primitives()
+        async with self.results_changed:
+            try:
+                await asyncio.wait_for(
+                    self.results_changed.wait_for(
+                        lambda: all(task_id in self.completed_tasks for task_id in task_ids)
+                    ),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                pass
 
-        return results
+        with self.lock:
+            return {task_id: self.completed_tasks[task_id] for task_id in task_ids if task_id in self.completed_tasks}
 
     def get_stats(self) -> Dict[str, Any]:
         """获取统计信息"""
         with self.lock:
             stats = self.stats.__dict__.copy()
             stats["is_running"] = self.is_running
-            stats["queue_size"] = self.task_queue.qsize()
+            stats["queue_size"] = self.task_queue.qsize() if self.task_queue is not None else 0
+            stats["pending_tasks"] = len(self.pending_task_ids)
+            stats["active_workers"] = len(self.processing_tasks)
             stats["memory_usage"] = self._get_memory_usage()
+            stats["comprehensive_analysis"] = self.comprehensive_analyzer.get_stats()
             return stats
 
     def _get_memory_usage(self) -> float:
@@ -583,22 +681,23 @@ class BatchProcessor:
         """取消任务"""
         # 由于任务已经开始处理，取消操作比较复杂
         # 这里简化实现，仅从队列中移除未处理的任务
-        with self.lock:
-            # 创建新队列，排除要取消的任务
-            new_queue = queue.PriorityQueue()
-            removed = False
+        self._ensure_async_primitives()
+        entries = []
+        while not self.task_queue.empty():
+            entries.append(self.task_queue.get_nowait())
+            self.task_queue.task_done()
+
+        removed = False
+        for entry in entries:
+            if entry[3].id == task_id:
+                removed = True
+            else:
+                self.task_queue.put_nowait(entry)
 
-            while not self.task_queue.empty():
-                try:
-                    priority, task = self.task_queue.get_nowait()
-                    if task.id != task_id:
-                        new_queue.put((priority, task))
-                    else:
-                        removed = True
-                except queue.Empty:
-                    break
+        if removed:
+            self._finish_task(task_id)
 
-            self.task_queue = new_queue
+        with self.lock:
             self.stats.current_queue_size = self.task_queue.qsize()
 
         return removed
@@ -614,15 +713,14 @@ class BatchProcessor:
         else:
             self.rate_limiter = None
 
-        # 更新信号量
-        if hasattr(self, 'semaphore'):
-            self.semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+        # 更新信号量，下次处理任务时按新配置创建
+        self.semaphore = None
 
     async def health_check(self) -> Dict[str, Any]:
         """健康检查"""
         return {
             "status": "healthy" if self.is_running else "stopped",
-            "queue_size": self.task_queue.qsize(),
+            "queue_size": self.task_queue.qsize() if self.task_queue is not None else 0,
             "active_tasks": len(self.processing_tasks),
             "completed_tasks": len(self.completed_tasks),
             "stats": self.get_stats(),
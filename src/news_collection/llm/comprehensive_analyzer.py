@@ -0,0 +1,238 @@
+"""
+Single-call multi-task LLM analysis combining summary, sentiment, segmentation, entities and market impact
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, Any, Optional, List
+
+from ..models.base import NewsArticle
+from .llm_connector import LLMConnector, LLMMessage, LLMResponse
+from .article_packer import parse_json_response
+from .summarizer import NewsSummarizer, SummaryResult
+from .sentiment_analyzer import SentimentAnalyzer, SentimentAnalysisResult
+from .content_segmenter import ContentSegmenter, SegmentationResult
+from .entity_extractor import EntityExtractor, EntityExtractionResult
+from .market_impact import MarketImpactAssessor, MarketImpactResult
+
+
+# 组合输出中各任务的键，顺序即提示中的排列顺序
+COMBINED_TASKS = ("summary", "sentiment", "segmentation", "entities", "market_impact")
+
+
+@dataclass
+class ComprehensiveAnalysisResult:
+    """综合分析结果"""
+    article_id: str
+    summary: Optional[SummaryResult] = None
+    sentiment: Optional[SentimentAnalysisResult] = None
+    segmentation: Optional[SegmentationResult] = None
+    entities: Optional[EntityExtractionResult] = None
+    market_impact: Optional[MarketImpactResult] = None
+    combined: bool = False  # 是否由单次组合调用得到
+    fallback_tasks: List[str] = field(default_factory=list)
+    processing_time: float = 0.0
+
+
+class ComprehensiveAnalyzer:
+    """
+    单次调用的综合分析器
+
+    将五个分析任务的说明合并为一个提示，文章正文只发送一次，要求LLM返回以任务名
+    为键的单个JSON对象，再交由各组件按原有逻辑构建结果。某个任务的输出缺失或
+    无法构建时，仅该任务回退到独立调用；整个响应无法解析时全部回退。
+    """
+
+    def __init__(self, llm_connector: LLMConnector,
+                 summarizer: NewsSummarizer,
+                 sentiment_analyzer: SentimentAnalyzer,
+                 content_segmenter: ContentSegmenter,
+                 entity_extractor: EntityExtractor,
+                 market_impact_assessor: MarketImpactAssessor,
+                 max_tokens: Optional[int] = None):
+        self.llm_connector = llm_connector
+        self.summarizer = summarizer
+        self.sentiment_analyzer = sentiment_analyzer
+        self.content_segmenter = content_segmenter
+        self.entity_extractor = entity_extractor
+        self.market_impact_assessor = market_impact_assessor
+        self.max_tokens = max_tokens
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.stats = {
+            "total_articles": 0,
+            "combined_calls": 0,
+            "combined_parse_failures": 0,
+            "fallback_tasks": 0
+        }
+
+    def _create_system_prompt(self) -> str:
+        """创建组合系统提示"""
+        sections = {
+            "summary": self.summarizer._create_system_prompt(),
+            "sentiment": self.sentiment_analyzer._create_system_prompt(),
+            "segmentation": self.content_segmenter._create_system_prompt(),
+            "entities": self.entity_extractor._create_system_prompt(),
+            "market_impact": self.market_impact_assessor._create_system_prompt()
+        }
+
+        system_prompt = f"""You are an expert analyst for cryptocurrency and financial news.
+
+You will perform {len(COMBINED_TASKS)} analysis tasks on the same article in a single response.
+
+Respond with ONE valid JSON object and nothing else, with exactly these top-level keys:
+{', '.join(COMBINED_TASKS)}
+
+The value of each key must be the JSON object that the corresponding task below asks for.
+The market_impact analysis must be consistent with your sentiment and entities results.
+"""
+
+        for task_name in COMBINED_TASKS:
+            system_prompt += f"\n=== Task \"{task_name}\" ===\n{sections[task_name]}\n"
+
+        return system_prompt
+
+    def _create_user_prompt(self, article: NewsArticle) -> str:
+        """创建组合用户提示，文章正文只出现一次"""
+        prompt = f"""Please analyze the following news article:
+
+Title: {article.title}
+Source: {article.source or 'Unknown'}
+Published: {article.published_at or 'Unknown date'}
+Category: {article.category.value if article.category else 'General'}
+Author: {article.author or 'Unknown'}
+
+Content:
+{article.content}
+
+"""
+
+        if article.tags:
+            prompt += f"Tags: {', '.join(article.tags)}\n"
+
+        instructions = {
+            "sentiment": self.sentiment_analyzer._create_task_instructions(),
+            "segmentation": self.content_segmenter._create_task_instructions(),
+            "entities": self.entity_extractor._create_task_instructions(),
+            "market_impact": self.market_impact_assessor._create_task_instructions()
+        }
+        for task_name, task_instructions in instructions.items():
+            prompt += f"\n[{task_name}]\n{task_instructions.strip()}\n"
+
+        prompt += f"\nReturn a single JSON object with the keys: {', '.join(COMBINED_TASKS)}."
+
+        return prompt
+
+    def _parse_combined_response(self, response: str) -> Optional[Dict[str, Any]]:
+        """解析组合响应，无法解析为JSON对象时返回None"""
+        parsed = parse_json_response(response)
+        return parsed if isinstance(parsed, dict) else None
+
+    def _build_section(self, task_name: str, article: NewsArticle, section: Any,
+                       response: LLMResponse, start_time: float):
+        """由组合响应中的单个任务输出构建结果，无效时返回None"""
+        if not isinstance(section, dict) or not section:
+            return None
+
+        builders = {
+            "summary": self.summarizer.build_result,
+            "sentiment": self.sentiment_analyzer.build_result,
+            "segmentation": self.content_segmenter.build_result,
+            "entities": self.entity_extractor.build_result,
+            "market_impact": self.market_impact_assessor.build_result
+        }
+
+        try:
+            result = builders[task_name](article, section, response, start_time)
+        except Exception as e:
+            self.logger.warning(f"Invalid combined output for task {task_name} of article {article.id}: {str(e)}")
+            return None
+
+        result.metadata["combined_analysis"] = True
+        return result
+
+    async def analyze(self, article: NewsArticle) -> ComprehensiveAnalysisResult:
+        """对单篇文章执行综合分析"""
+        start_time = time.time()
+        self.stats["total_articles"] += 1
+
+        results: Dict[str, Any] = {task_name: None for task_name in COMBINED_TASKS}
+        combined = False
+
+        try:
+            messages = [
+                LLMMessage(role="system", content=self._create_system_prompt()),
+                LLMMessage(role="user", content=self._create_user_prompt(article))
+            ]
+
+            if self.max_tokens:
+                config = replace(self.llm_connector.config, max_tokens=self.max_tokens)
+                response = await self.llm_connector.generate_response(messages, config)
+            else:
+                response = await self.llm_connector.generate_response(messages)
+            self.stats["combined_calls"] += 1
+
+            parsed = self._parse_combined_response(response.content)
+            if parsed is None:
+                self.stats["combined_parse_failures"] += 1
+                self.logger.warning(f"Failed to parse combined analysis response for article {article.id}, falling back to per-task analysis")
+            else:
+                combined = True
+                for task_name in COMBINED_TASKS:
+                    results[task_name] = self._build_section(task_name, article, parsed.get(task_name),
+                                                             response, start_time)
+
+        except Exception as e:
+            self.logger.error(f"Combined analysis request failed for article {article.id}: {str(e)}")
+
+        fallback_tasks = [task_name for task_name in COMBINED_TASKS if results[task_name] is None]
+        if fallback_tasks:
+            self.stats["fallback_tasks"] += len(fallback_tasks)
+            await self._run_fallback(article, results, fallback_tasks)
+
+        return ComprehensiveAnalysisResult(
+            article_id=article.id,
+            summary=results["summary"],
+            sentiment=results["sentiment"],
+            segmentation=results["segmentation"],
+            entities=results["entities"],
+            market_impact=results["market_impact"],
+            combined=combined,
+            fallback_tasks=fallback_tasks,
+            processing_time=time.time() - start_time
+        )
+
+    async def _run_fallback(self, article: NewsArticle, results: Dict[str, Any], fallback_tasks: List[str]):
+        """对缺失的任务逐个独立调用，市场影响最后执行以利用前面的结果"""
+        calls = {
+            "summary": self.summarizer.summarize_article,
+            "sentiment": self.sentiment_analyzer.analyze_sentiment,
+            "segmentation": self.content_segmenter.segment_content,
+            "entities": self.entity_extractor.extract_entities
+        }
+
+        independent_tasks = [task_name for task_name in fallback_tasks if task_name in calls]
+        outcomes = await asyncio.gather(
+            *(calls[task_name](article) for task_name in independent_tasks),
+            return_exceptions=True
+        )
+        for task_name, outcome in zip(independent_tasks, outcomes):
+            results[task_name] = None if isinstance(outcome, Exception) else outcome
+
+        if "market_impact" in fallback_tasks:
+            results["market_impact"] = await self.market_impact_assessor.assess_market_impact(
+                article, results["sentiment"], results["entities"]
+            )
+
+    async def analyze_batch(self, articles: List[NewsArticle]) -> List[ComprehensiveAnalysisResult]:
+        """批量综合分析"""
+        return await asyncio.gather(*(self.analyze(article) for article in articles))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取统计信息"""
+        stats = dict(self.stats)
+        total = stats["total_articles"] * len(COMBINED_TASKS)
+        stats["fallback_rate"] = stats["fallback_tasks"] / total if total else 0.0
+        return stats
@@ -13,6 +13,7 @@ from enum import Enum
 
 from ..models.base import NewsArticle
 from .llm_connector import LLMConnector, LLMMessage, LLMConfig, LLMResponse
+from .result_builder import ResultBuilderMixin
 
 
 class SectionType(Enum):
@@ -101,7 +102,7 @@ class SegmentationStats:
     average_section_length: float = 0.0
 
 
-class ContentSegmenter:
+class ContentSegmenter(ResultBuilderMixin):
     """内容分段器"""
 
     def __init__(self, llm_connector: LLMConnector, config: SectionConfig):
@@ -199,6 +200,16 @@ Content:
         if article.tags:
             prompt += f"Tags: {', '.join(article.tags)}\n"
 
+        prompt += self._create_task_instructions()
+
+        prompt += "\nProvide a comprehensive segmentation following the requirements specified."
+
+        return prompt
+
+    def _create_task_instructions(self) -> str:
+        """创建与文章无关的任务配置说明"""
+        instructions = ""
+
         # 添加配置说明
         config_details = []
         if self.config.enable_hierarchical_segmentation:
@@ -211,17 +222,15 @@ Content:
             config_details.append("section summarization")
 
         if config_details:
-            prompt += f"\nPlease include: {', '.join(config_details)}\n"
+            instructions += f"\nPlease include: {', '.join(config_details)}\n"
 
         # 添加优先段落类型
         priority_types = [section_type.value for section_type in self.config.prioritize_section_types]
-        prompt += f"\nPrioritize these section types: {', '.join(priority_types)}\n"
+        instructions += f"\nPrioritize these section types: {', '.join(priority_types)}\n"
 
-        prompt += f"\nTarget section length: {self.config.min_section_length}-{self.config.max_section_length} characters\n"
+        instructions += f"\nTarget section length: {self.config.min_section_length}-{self.config.max_section_length} characters\n"
 
-        prompt += "\nProvide a comprehensive segmentation following the requirements specified."
-
-        return prompt
+        return instructions
 
     def _parse_segmentation_response(self, response: str) -> Dict[str, Any]:
         """解析分段响应"""
@@ -322,34 +331,7 @@ Content:
             # 解析响应
             segmentation_data = self._parse_segmentation_response(response.content)
 
-            # 创建段落对象
-            sections = []
-            for i, section_data in enumerate(segmentation_data.get("sections", [])):
-                section_id = section_data.get("id", f"section_{i+1}")
-                section = self._create_content_section(section_data, section_id)
-                sections.append(section)
-
-            # 创建结果
-            result = SegmentationResult(
-                sections=sections,
-                overall_structure=segmentation_data.get("overall_structure", {}),
-                section_hierarchy=segmentation_data.get("section_hierarchy", {}),
-                processing_time=time.time() - start_time,
-                metadata={
-                    "llm_provider": response.provider.value,
-                    "llm_model": response.model,
-                    "response_time": response.response_time,
-                    "tokens_used": response.usage.get("total_tokens", 0),
-                    "cached": response.cached
-                }
-            )
-
-            # 更新统计
-            self.stats.successful_segmentations += 1
-            self._update_stats(result)
-
-            self.logger.info(f"Successfully segmented article {article.id} into {len(sections)} sections")
-            return result
+            return self._build_result(article, segmentation_data, response, start_time)
 
         except Exception as e:
             self.stats.failed_segmentations += 1
@@ -376,6 +358,38 @@ Content:
                 metadata={"error": str(e)}
             )
 
+    def _build_result(self, article: NewsArticle, segmentation_data: Dict[str, Any],
+                      response: LLMResponse, start_time: float) -> SegmentationResult:
+        """构建分段结果并更新统计"""
+        # 创建段落对象
+        sections = []
+        for i, section_data in enumerate(segmentation_data.get("sections", [])):
+            section_id = section_data.get("id", f"section_{i+1}")
+            section = self._create_content_section(section_data, section_id)
+            sections.append(section)
+
+        # 创建结果
+        result = SegmentationResult(
+            sections=sections,
+            overall_structure=segmentation_data.get("overall_structure", {}),
+            section_hierarchy=segmentation_data.get("section_hierarchy", {}),
+            processing_time=time.time() - start_time,
+            metadata={
+                "llm_provider": response.provider.value,
+                "llm_model": response.model,
+                "response_time": response.response_time,
+                "tokens_used": response.usage.get("total_tokens", 0),
+                "cached": response.cached
+            }
+        )
+
+        # 更新统计
+        self.stats.successful_segmentations += 1
+        self._update_stats(result)
+
+        self.logger.info(f"Successfully segmented article {article.id} into {len(sections)} sections")
+        return result
+
     async def segment_batch_content(self, articles: List[NewsArticle]) -> List[SegmentationResult]:
         """批量内容分段"""
         self.logger.info(f"Starting batch content segmentation of {len(articles)} articles")
@@ -7,12 +7,15 @@ import time
 import json
 import re
 from typing import Dict, Any, Optional, List, Tuple, Set
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import asyncio
 
 from ..models.base import NewsArticle
 from .llm_connector import LLMConnector, LLMMessage, LLMConfig, LLMResponse
+from .result_builder import ResultBuilderMixin
+from .article_packer import ArticlePacker
+from ..utils.keyword_automaton import KeywordAutomaton
 
 
 class EntityType(Enum):
@@ -65,6 +68,14 @@ class EntityConfig:
     language: str = "en"
     output_format: str = "structured"
 
+    # 批量提取时将多篇短文章打包到一次请求
+    enable_article_packing: bool = True
+    packing_token_budget: int = 3000
+    max_articles_per_request: int = 8
+    max_packed_article_tokens: int = 600
+    # 打包请求按文章数放大输出上限，避免多篇结果被截断
+    packed_output_tokens_per_article: int = 400
+
 
 @dataclass
 class Entity:
@@ -132,7 +143,7 @@ class EntityExtractionStats:
     average_confidence_score: float = 0.0
 
 
-class EntityExtractor:
+class EntityExtractor(ResultBuilderMixin):
     """实体提取器"""
 
     def __init__(self, llm_connector: LLMConnector, config: EntityConfig):
@@ -140,6 +151,11 @@ class EntityExtractor:
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
         self.stats = EntityExtractionStats()
+        self.packer = ArticlePacker(
+            token_budget=config.packing_token_budget,
+            max_articles=config.max_articles_per_request,
+            max_article_tokens=config.max_packed_article_tokens
+        )
 
         # 初始化实体类型分布
         for entity_type in EntityType:
@@ -169,6 +185,20 @@ class EntityExtractor:
             'liquidity pool', 'decentralized', 'centralized', 'cryptography'
         }
 
+        # 关键词自动机，基础提取时单次扫描文本
+        self.keyword_automaton = KeywordAutomaton.from_groups({
+            "cryptocurrency": self.crypto_keywords,
+            "company": self.company_keywords,
+            "technology": self.technology_keywords
+        })
+
+        # 各实体类型的置信度和规范化形式
+        self.keyword_entity_rules = {
+            "cryptocurrency": (0.8, str.upper),
+            "company": (0.7, str.title),
+            "technology": (0.6, str.lower)
+        }
+
     def _create_system_prompt(self) -> str:
         """创建系统提示"""
         system_prompt = """You are an expert entity extraction specialist for cryptocurrency and financial news.
@@ -296,13 +326,31 @@ Content:
         if article.tags:
             prompt += f"Tags: {', '.join(article.tags)}\n"
 
+        prompt += self._create_task_instructions()
+
+        prompt += "\nPlease provide comprehensive entity extraction following the requirements specified."
+
+        return prompt
+
+    def _create_packed_user_prompt(self, articles: List[NewsArticle]) -> str:
+        """创建多文章打包的用户提示"""
+        return f"""Please extract entities from each of the following {len(articles)} news articles:
+
+{self.packer.format_articles(articles)}
+{self._create_task_instructions()}
+{self.packer.response_instructions(articles)}"""
+
+    def _create_task_instructions(self) -> str:
+        """创建与文章无关的任务配置说明"""
+        instructions = ""
+
         # 添加配置说明
         if self.config.prioritize_entity_types:
             priority_types = [entity_type.value for entity_type in self.config.prioritize_entity_types]
-            prompt += f"\nPrioritize these entity types: {', '.join(priority_types)}\n"
+            instructions += f"\nPrioritize these entity types: {', '.join(priority_types)}\n"
 
-        prompt += f"\nMaximum entities to extract: {self.config.max_entities_per_article}\n"
-        prompt += f"Minimum confidence threshold: {self.config.min_entity_confidence}\n"
+        instructions += f"\nMaximum entities to extract: {self.config.max_entities_per_article}\n"
+        instructions += f"Minimum confidence threshold: {self.config.min_entity_confidence}\n"
 
         config_features = []
         if self.config.enable_entity_linking:
@@ -315,11 +363,9 @@ Content:
             config_features.append("sentiment association")
 
         if config_features:
-            prompt += f"\nInclude: {', '.join(config_features)}\n"
+            instructions += f"\nInclude: {', '.join(config_features)}\n"
 
-        prompt += "\nPlease provide comprehensive entity extraction following the requirements specified."
-
-        return prompt
+        return instructions
 
     def _parse_entity_response(self, response: str) -> Dict[str, Any]:
         """解析实体提取响应"""
@@ -333,61 +379,31 @@ Content:
             return self._basic_entity_extraction(response)
 
     def _basic_entity_extraction(self, content: str) -> Dict[str, Any]:
-        """基础实体提取逻辑"""
+        """
+        基础实体提取逻辑
+
+        关键词按单词边界匹配：词内出现的关键词（如 "together" 中的 "eth"、"bitcoins" 中的
+        "bitcoin"）不再识别为实体；同一类型的较长关键词优先，"bitcoin cash" 只产生一个
+        加密货币实体，不再同时报告其中的 "bitcoin"。实体按在文中出现的位置排序。
+        """
         entities = []
         entity_id = 0
 
-        # 基于关键词匹配提取实体
-        # 加密货币
-        for crypto in self.crypto_keywords:
-            if crypto.lower() in content.lower():
-                positions = self._find_all_positions(content, crypto)
-                for pos in positions:
-                    entity_id += 1
-                    entities.append({
-                        "id": f"entity_{entity_id}",
-                        "text": crypto,
-                        "type": "cryptocurrency",
-                        "start_position": pos,
-                        "end_position": pos + len(crypto),
-                        "confidence": 0.8,
-                        "normalized_form": crypto.upper(),
-                        "context": self._get_context(content, pos, pos + len(crypto))
-                    })
-
-        # 公司
-        for company in self.company_keywords:
-            if company.lower() in content.lower():
-                positions = self._find_all_positions(content, company)
-                for pos in positions:
-                    entity_id += 1
-                    entities.append({
-                        "id": f"entity_{entity_id}",
-                        "text": company,
-                        "type": "company",
-                        "start_position": pos,
-                        "end_position": pos + len(company),
-                        "confidence": 0.7,
-                        "normalized_form": company.title(),
-                        "context": self._get_context(content, pos, pos + len(company))
-                    })
-
-        # 技术
-        for tech in self.technology_keywords:
-            if tech.lower() in content.lower():
-                positions = self._find_all_positions(content, tech)
-                for pos in positions:
-                    entity_id += 1
-                    entities.append({
-                        "id": f"entity_{entity_id}",
-                        "text": tech,
-                        "type": "technology",
-                        "start_position": pos,
-                        "end_position": pos + len(tech),
-                        "confidence": 0.6,
-                        "normalized_form": tech.lower(),
-                        "context": self._get_context(content, pos, pos + len(tech))
-                    })
+        # 基于关键词自动机单次扫描提取实体
+        for match in self.keyword_automaton.find_all(content):
+            for entity_type in match.payloads:
+                confidence, normalize = self.keyword_entity_rules[entity_type]
+                entity_id += 1
+                entities.append({
+                    "id": f"entity_{entity_id}",
+                    "text": match.keyword,
+                    "type": entity_type,
+                    "start_position": match.start,
+                    "end_position": match.end,
+                    "confidence": confidence,
+                    "normalized_form": normalize(match.keyword),
+                    "context": self._get_context(content, match.start, match.end)
+                })
 
         return {
             "entities": entities[:self.config.max_entities_per_article],
@@ -398,22 +414,6 @@ Content:
             }
         }
 
-    def _find_all_positions(self, text: str, search_term: str) -> List[int]:
-        """查找所有匹配位置"""
-        positions = []
-        text_lower = text.lower()
-        search_lower = search_term.lower()
-        start = 0
-
-        while True:
-            pos = text_lower.find(search_lower, start)
-            if pos == -1:
-                break
-            positions.append(pos)
-            start = pos + 1
-
-        return positions
-
     def _get_context(self, text: str, start: int, end: int, context_size: int = 100) -> str:
         """获取实体上下文"""
         context_start = max(0, start - context_size)
@@ -481,58 +481,7 @@ Content:
             # 解析响应
             extraction_data = self._parse_entity_response(response.content)
 
-            # 创建实体对象
-            entities = []
-            for entity_data in extraction_data.get("entities", []):
-                # 过滤低置信度实体
-                if entity_data.get("confidence", 0.0) >= self.config.min_entity_confidence:
-                    entity = self._create_entity(entity_data)
-                    entities.append(entity)
-
-            # 限制实体数量
-            entities = entities[:self.config.max_entities_per_article]
-
-            # 创建关系对象
-            relationships = []
-            for rel_data in extraction_data.get("relationships", []):
-                relationship = EntityRelationship(
-                    subject=rel_data.get("subject", ""),
-                    object=rel_data.get("object", ""),
-                    relation=rel_data.get("relation", ""),
-                    confidence=rel_data.get("confidence", 0.0),
-                    context=rel_data.get("context", ""),
-                    metadata=rel_data.get("metadata", {})
-                )
-                relationships.append(relationship)
-
-            # 统计实体类型
-            entity_types_count = {}
-            for entity in entities:
-                entity_type = entity.type.value
-                entity_types_count[entity_type] = entity_types_count.get(entity_type, 0) + 1
-
-            # 创建结果
-            result = EntityExtractionResult(
-                entities=entities,
-                relationships=relationships,
-                entity_types_count=entity_types_count,
-                processing_time=time.time() - start_time,
-                metadata={
-                    "llm_provider": response.provider.value,
-                    "llm_model": response.model,
-                    "response_time": response.response_time,
-                    "tokens_used": response.usage.get("total_tokens", 0),
-                    "cached": response.cached,
-                    "extraction_stats": extraction_data.get("entity_stats", {})
-                }
-            )
-
-            # 更新统计
-            self.stats.successful_extractions += 1
-            self._update_stats(result)
-
-            self.logger.info(f"Successfully extracted {len(entities)} entities from article {article.id}")
-            return result
+            return self._build_result(article, extraction_data, response, start_time)
 
         except Exception as e:
             self.stats.failed_extractions += 1
@@ -547,16 +496,75 @@ Content:
                 metadata={"error": str(e)}
             )
 
+    def _build_result(self, article: NewsArticle, extraction_data: Dict[str, Any],
+                      response: LLMResponse, start_time: float) -> EntityExtractionResult:
+        """构建实体提取结果并更新统计"""
+        # 创建实体对象
+        entities = []
+        for entity_data in extraction_data.get("entities", []):
+            # 过滤低置信度实体
+            if entity_data.get("confidence", 0.0) >= self.config.min_entity_confidence:
+                entity = self._create_entity(entity_data)
+                entities.append(entity)
+
+        # 限制实体数量
+        entities = entities[:self.config.max_entities_per_article]
+
+        # 创建关系对象
+        relationships = []
+        for rel_data in extraction_data.get("relationships", []):
+            relationship = EntityRelationship(
+                subject=rel_data.get("subject", ""),
+                object=rel_data.get("object", ""),
+                relation=rel_data.get("relation", ""),
+                confidence=rel_data.get("confidence", 0.0),
+                context=rel_data.get("context", ""),
+                metadata=rel_data.get("metadata", {})
+            )
+            relationships.append(relationship)
+
+        # 统计实体类型
+        entity_types_count = {}
+        for entity in entities:
+            entity_type = entity.type.value
+            entity_types_count[entity_type] = entity_types_count.get(entity_type, 0) + 1
+
+        # 创建结果
+        result = EntityExtractionResult(
+            entities=entities,
+            relationships=relationships,
+            entity_types_count=entity_types_count,
+            processing_time=time.time() - start_time,
+            metadata={
+                "llm_provider": response.provider.value,
+                "llm_model": response.model,
+                "response_time": response.response_time,
+                "tokens_used": response.usage.get("total_tokens", 0),
+                "cached": response.cached,
+                "extraction_stats": extraction_data.get("entity_stats", {})
+            }
+        )
+
+        # 更新统计
+        self.stats.successful_extractions += 1
+        self._update_stats(result)
+
+        self.logger.info(f"Successfully extracted {len(entities)} entities from article {article.id}")
+        return result
+
     async def extract_batch_entities(self, articles: List[NewsArticle]) -> List[EntityExtractionResult]:
         """批量实体提取"""
         self.logger.info(f"Starting batch entity extraction from {len(articles)} articles")
 
-        tasks = []
-        for article in articles:
-            task = self.extract_entities(article)
-            tasks.append(task)
+        if self.config.enable_article_packing:
+            results = await self.packer.run(articles, self._request_packed, self.build_result, self.extract_entities)
+        else:
+            tasks = []
+            for article in articles:
+                task = self.extract_entities(article)
+                tasks.append(task)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # 处理结果
         extraction_results = []
@@ -576,6 +584,17 @@ Content:
         self.logger.info(f"Batch entity extraction completed: {len(extraction_results)} articles processed")
         return extraction_results
 
+    async def _request_packed(self, articles: List[NewsArticle]) -> LLMResponse:
+        """对一组文章发出一次打包请求，输出上限随文章数放大"""
+        messages = [
+            LLMMessage(role="system", content=self._create_system_prompt()),
+            LLMMessage(role="user", content=self._create_packed_user_prompt(articles))
+        ]
+        max_tokens = max(self.llm_connector.config.max_tokens,
+                         self.config.packed_output_tokens_per_article * len(articles))
+        config = replace(self.llm_connector.config, max_tokens=max_tokens)
+        return await self.llm_connector.generate_response(messages, config)
+
     def _update_stats(self, result: EntityExtractionResult):
         """更新统计信息"""
         # 更新平均处理时间
@@ -48,6 +48,12 @@ class LLMConfig:
     # Local model specific
     local_endpoint: Optional[str] = None
 
+    # HTTP connection pool
+    connection_limit: int = 100
+    connection_limit_per_host: int = 20
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+
 
 @dataclass
 class LLMMessage:
@@ -79,6 +85,67 @@ class LLMError:
     timestamp: float
 
 
+class HTTPSessionPool:
+    """
+    共享HTTP会话池
+
+    为所有提供商请求复用一个 aiohttp.ClientSession，连接器按主机限制并发连接数、
+    保持长连接并缓存DNS解析结果，避免每次调用都重新建立TCP和TLS连接。
+    会话与事件循环绑定，在首次使用时按当前事件循环惰性创建。
+    """
+
+    def __init__(self, config: LLMConfig):
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {"sessions_created": 0, "requests": 0}
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """获取共享会话，不存在或已关闭时创建"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self._session is not None and not self._session.closed:
+                self.logger.warning("HTTP session belongs to another event loop, creating a new one")
+            # 检查与创建之间没有await，同一事件循环内不会重复创建
+            self._session = self._create_session()
+            self._loop = loop
+            self.stats["sessions_created"] += 1
+
+        self.stats["requests"] += 1
+        return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """创建带连接池的会话"""
+        connector = aiohttp.TCPConnector(
+            limit=self.config.connection_limit,
+            limit_per_host=self.config.connection_limit_per_host,
+            keepalive_timeout=self.config.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.config.dns_cache_ttl
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        )
+
+    @property
+    def closed(self) -> bool:
+        """会话是否已关闭"""
+        return self._session is None or self._session.closed
+
+    async def close(self):
+        """关闭会话并释放所有连接"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取会话池统计"""
+        return {**self.stats, "open": not self.closed}
+
+
 class LLMProviderInterface(ABC):
     """LLM提供商接口"""
 
@@ -96,10 +163,11 @@ class LLMProviderInterface(ABC):
 class OpenAIProvider(LLMProviderInterface):
     """OpenAI提供商实现"""
 
-    def __init__(self, config: LLMConfig):
+    def __init__(self, config: LLMConfig, session_pool: Optional[HTTPSessionPool] = None):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
         self.base_url = config.base_url or "https://api.openai.com/v1"
+        self.session_pool = session_pool or HTTPSessionPool(config)
 
     async def generate_response(self, messages: List[LLMMessage], config: LLMConfig) -> LLMResponse:
         """生成响应"""
@@ -127,34 +195,35 @@ class OpenAIProvider(LLMProviderInterface):
         }
 
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=config.timeout)) as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                ) as response:
-
-                    if response.status == 200:
-                        data = await response.json()
-                        choice = data["choices"][0]
-
-                        usage = {
-                            "prompt_tokens": data["usage"]["prompt_tokens"],
-                            "completion_tokens": data["usage"]["completion_tokens"],
-                            "total_tokens": data["usage"]["total_tokens"]
-                        }
-
-                        return LLMResponse(
-                            content=choice["message"]["content"],
-                            usage=usage,
-                            model=config.model,
-                            provider=LLMProvider.OPENAI,
-                            response_time=time.time() - start_time,
-                            metadata={"finish_reason": choice.get("finish_reason")}
-                        )
-                    else:
-                        error_data = await response.json()
-                        raise Exception(f"OpenAI API error: {error_data.get('error', {}).get('message', 'Unknown error')}")
+            session = await self.session_pool.get_session()
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=config.timeout)
+            ) as response:
+
+                if response.status == 200:
+                    data = await response.json()
+                    choice = data["choices"][0]
+
+                    usage = {
+                        "prompt_tokens": data["usage"]["prompt_tokens"],
+                        "completion_tokens": data["usage"]["completion_tokens"],
+                        "total_tokens": data["usage"]["total_tokens"]
+                    }
+
+                    return LLMResponse(
+                        content=choice["message"]["content"],
+                        usage=usage,
+                        model=config.model,
+                        provider=LLMProvider.OPENAI,
+                        response_time=time.time() - start_time,
+                        metadata={"finish_reason": choice.get("finish_reason")}
+                    )
+                else:
+                    error_data = await response.json()
+                    raise Exception(f"OpenAI API error: {error_data.get('error', {}).get('message', 'Unknown error')}")
 
         except Exception as e:
             self.logger.error(f"OpenAI API call failed: {str(e)}")
@@ -164,9 +233,10 @@ class OpenAIProvider(LLMProviderInterface):
         """健康检查"""
         try:
             headers = {"Authorization": f"Bearer {self.config.api_key}"}
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.get(f"{self.base_url}/models", headers=headers) as response:
-                    return response.status == 200
+            session = await self.session_pool.get_session()
+            async with session.get(f"{self.base_url}/models", headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=10)) as response:
+                return response.status == 200
         except Exception:
             return False
 
@@ -174,10 +244,11 @@ class OpenAIProvider(LLMProviderInterface):
 class AnthropicProvider(LLMProviderInterface):
     """Anthropic提供商实现"""
 
-    def __init__(self, config: LLMConfig):
+    def __init__(self, config: LLMConfig, session_pool: Optional[HTTPSessionPool] = None):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
         self.base_url = config.base_url or "https://api.anthropic.com"
+        self.session_pool = session_pool or HTTPSessionPool(config)
 
     async def generate_response(self, messages: List[LLMMessage], config: LLMConfig) -> LLMResponse:
         """生成响应"""
@@ -215,33 +286,34 @@ class AnthropicProvider(LLMProviderInterface):
             payload["system"] = system_messages[0]
 
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=config.timeout)) as session:
-                async with session.post(
-                    f"{self.base_url}/messages",
-                    headers=headers,
-                    json=payload
-                ) as response:
-
-                    if response.status == 200:
-                        data = await response.json()
-                        content = data["content"][0]["text"]
-
-                        usage = {
-                            "input_tokens": data.get("usage", {}).get("input_tokens", 0),
-                            "output_tokens": data.get("usage", {}).get("output_tokens", 0)
-                        }
-
-                        return LLMResponse(
-                            content=content,
-                            usage=usage,
-                            model=config.model,
-                            provider=LLMProvider.ANTHROPIC,
-                            response_time=time.time() - start_time,
-                            metadata={"stop_reason": data.get("stop_reason")}
-                        )
-                    else:
-                        error_data = await response.json()
-                        raise Exception(f"Anthropic API error: {error_data.get('error', {}).get('message', 'Unknown error')}")
+            session = await self.session_pool.get_session()
+            async with session.post(
+                f"{self.base_url}/messages",
+                headers=headers,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=config.timeout)
+            ) as response:
+
+                if response.status == 200:
+                    data = await response.json()
+                    content = data["content"][0]["text"]
+
+                    usage = {
+                        "input_tokens": data.get("usage", {}).get("input_tokens", 0),
+                        "output_tokens": data.get("usage", {}).get("output_tokens", 0)
+                    }
+
+                    return LLMResponse(
+                        content=content,
+                        usage=usage,
+                        model=config.model,
+                        provider=LLMProvider.ANTHROPIC,
+                        response_time=time.time() - start_time,
+                        metadata={"stop_reason": data.get("stop_reason")}
+                    )
+                else:
+                    error_data = await response.json()
+                    raise Exception(f"Anthropic API error: {error_data.get('error', {}).get('message', 'Unknown error')}")
 
         except Exception as e:
             self.logger.error(f"Anthropic API call failed: {str(e)}")
@@ -251,9 +323,10 @@ class AnthropicProvider(LLMProviderInterface):
         """健康检查"""
         try:
             headers = {"x-api-key": self.config.api_key}
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.get(f"{self.base_url}/messages", headers=headers) as response:
-                    return response.status == 200
+            session = await self.session_pool.get_session()
+            async with session.get(f"{self.base_url}/messages", headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=10)) as response:
+                return response.status == 200
         except Exception:
             return False
 
@@ -406,6 +479,9 @@ class LLMConnector:
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # 所有提供商共享的HTTP会话池
+        self.session_pool = HTTPSessionPool(config)
+
         # 初始化提供商
         self.provider = self._init_provider()
 
@@ -424,9 +500,9 @@ class LLMConnector:
     def _init_provider(self) -> LLMProviderInterface:
         """初始化提供商"""
         if self.config.provider == LLMProvider.OPENAI:
-            return OpenAIProvider(self.config)
+            return OpenAIProvider(self.config, self.session_pool)
         elif self.config.provider == LLMProvider.ANTHROPIC:
-            return AnthropicProvider(self.config)
+            return AnthropicProvider(self.config, self.session_pool)
         elif self.config.provider == LLMProvider.LOCAL:
             # TODO: 实现本地模型提供商
             raise NotImplementedError("Local provider not implemented yet")
@@ -499,7 +575,8 @@ class LLMConnector:
             "provider": self.config.provider.value,
             "model": self.config.model,
             "stats": self.stats,
-            "cache_stats": self.cache.get_stats()
+            "cache_stats": self.cache.get_stats(),
+            "session_stats": self.session_pool.get_stats()
         }
 
     def clear_cache(self):
@@ -508,12 +585,14 @@ class LLMConnector:
         self.logger.info("LLM cache cleared")
 
     def update_config(self, config: LLMConfig):
-        """更新配置"""
+        """更新配置，已建立的会话继续复用，新的连接池参数在会话重建后生效"""
         self.config = config
+        self.session_pool.config = config
         self.provider = self._init_provider()
         self.cache = CacheManager(config)
         self.logger.info("LLM connector configuration updated")
 
     async def close(self):
         """关闭连接器"""
+        await self.session_pool.close()
         self.logger.info("LLM connector closed")
\ No newline at end of file
@@ -13,6 +13,7 @@ import asyncio
 
 from ..models.base import NewsArticle
 from .llm_connector import LLMConnector, LLMMessage, LLMConfig, LLMResponse
+from .result_builder import ResultBuilderMixin
 from .sentiment_analyzer import SentimentAnalysisResult, SentimentCategory
 from .entity_extractor import EntityExtractionResult, Entity, EntityType
 
@@ -120,9 +121,11 @@ class MarketImpactStats:
     high_impact_articles: int = 0
 
 
-class MarketImpactAssessor:
+class MarketImpactAssessor(ResultBuilderMixin):
     """市场影响评估器"""
 
+    total_stat = "total_analyses"
+
     def __init__(self, llm_connector: LLMConnector, config: MarketImpactConfig):
         self.llm_connector = llm_connector
         self.config = config
@@ -331,12 +334,20 @@ Content:
                 if entities:
                     prompt += f"- {entity_type}: {', '.join(entities[:5])}\n"  # 限制显示数量
 
+        prompt += self._create_task_instructions()
+
+        prompt += "\nPlease provide comprehensive market impact analysis following the requirements specified."
+
+        return prompt
+
+    def _create_task_instructions(self) -> str:
+        """创建与文章无关的任务配置说明"""
         # 添加配置说明
         impact_types = [impact_type.value for impact_type in self.config.impact_types_to_analyze]
-        prompt += f"\nFocus on these impact types: {', '.join(impact_types)}\n"
+        instructions = f"\nFocus on these impact types: {', '.join(impact_types)}\n"
 
         timeframes = [timeframe.value for timeframe in self.config.timeframes_to_analyze]
-        prompt += f"Analyze these timeframes: {', '.join(timeframes)}\n"
+        instructions += f"Analyze these timeframes: {', '.join(timeframes)}\n"
 
         config_features = []
         if self.config.enable_multi_factor_analysis:
@@ -349,13 +360,11 @@ Content:
             config_features.append("opportunity identification")
 
         if config_features:
-            prompt += f"\nInclude: {', '.join(config_features)}\n"
+            instructions += f"\nInclude: {', '.join(config_features)}\n"
 
-        prompt += f"\nMinimum confidence threshold: {self.config.min_confidence_threshold}\n"
+        instructions += f"\nMinimum confidence threshold: {self.config.min_confidence_threshold}\n"
 
-        prompt += "\nPlease provide comprehensive market impact analysis following the requirements specified."
-
-        return prompt
+        return instructions
 
     def _parse_impact_response(self, response: str) -> Dict[str, Any]:
         """解析市场影响响应"""
@@ -480,57 +489,7 @@ Content:
             # 解析响应
             impact_data = self._parse_impact_response(response.content)
 
-            # 创建整体影响分数
-            overall_impact_data = impact_data.get("overall_impact", {})
-            overall_impact = self._create_impact_score(
-                overall_impact_data,
-                ImpactType.MARKET_SENTIMENT,
-                ImpactTimeframe.IMMEDIATE
-            )
-
-            # 创建影响细分
-            impact_breakdown = {}
-            for impact_type in self.config.impact_types_to_analyze:
-                impact_breakdown[impact_type] = []
-                for timeframe in self.config.timeframes_to_analyze:
-                    # 尝试从响应中获取特定类型和时间框架的影响
-                    impact_key = f"{impact_type.value}_{timeframe.value}"
-                    if impact_key in impact_data.get("impact_breakdown", {}):
-                        impact_score_data = impact_data["impact_breakdown"][impact_key]
-                        impact_score = self._create_impact_score(impact_score_data, impact_type, timeframe)
-                        impact_breakdown[impact_type].append(impact_score)
-
-            # 检查是否为高影响文章
-            is_high_impact = (overall_impact.magnitude in [ImpactMagnitude.HIGH, ImpactMagnitude.VERY_HIGH, ImpactMagnitude.EXTREME] and
-                             overall_impact.confidence > 0.7)
-
-            # 创建结果
-            result = MarketImpactResult(
-                overall_impact=overall_impact,
-                impact_breakdown=impact_breakdown,
-                market_sentiment=impact_data.get("market_sentiment", {}),
-                risk_assessment=impact_data.get("risk_assessment", {}),
-                opportunity_analysis=impact_data.get("opportunity_analysis", {}),
-                correlation_analysis=impact_data.get("correlation_analysis", {}),
-                processing_time=time.time() - start_time,
-                metadata={
-                    "llm_provider": response.provider.value,
-                    "llm_model": response.model,
-                    "response_time": response.response_time,
-                    "tokens_used": response.usage.get("total_tokens", 0),
-                    "cached": response.cached,
-                    "analysis_confidence": impact_data.get("confidence_assessment", {}).get("overall_confidence", 0.5)
-                }
-            )
-
-            # 更新统计
-            self.stats.successful_analyses += 1
-            if is_high_impact:
-                self.stats.high_impact_articles += 1
-            self._update_stats(result)
-
-            self.logger.info(f"Successfully assessed market impact for article {article.id}: {overall_impact.magnitude.value} impact")
-            return result
+            return self._build_result(article, impact_data, response, start_time)
 
         except Exception as e:
             self.stats.failed_analyses += 1
@@ -558,6 +517,61 @@ Content:
                 metadata={"error": str(e)}
             )
 
+    def _build_result(self, article: NewsArticle, impact_data: Dict[str, Any],
+                      response: LLMResponse, start_time: float) -> MarketImpactResult:
+        """构建市场影响结果并更新统计"""
+        # 创建整体影响分数
+        overall_impact_data = impact_data.get("overall_impact", {})
+        overall_impact = self._create_impact_score(
+            overall_impact_data,
+            ImpactType.MARKET_SENTIMENT,
+            ImpactTimeframe.IMMEDIATE
+        )
+
+        # 创建影响细分
+        impact_breakdown = {}
+        for impact_type in self.config.impact_types_to_analyze:
+            impact_breakdown[impact_type] = []
+            for timeframe in self.config.timeframes_to_analyze:
+                # 尝试从响应中获取特定类型和时间框架的影响
+                impact_key = f"{impact_type.value}_{timeframe.value}"
+                if impact_key in impact_data.get("impact_breakdown", {}):
+                    impact_score_data = impact_data["impact_breakdown"][impact_key]
+                    impact_score = self._create_impact_score(impact_score_data, impact_type, timeframe)
+                    impact_breakdown[impact_type].append(impact_score)
+
+        # 检查是否为高影响文章
+        is_high_impact = (overall_impact.magnitude in [ImpactMagnitude.HIGH, ImpactMagnitude.VERY_HIGH, ImpactMagnitude.EXTREME] and
+                         overall_impact.confidence > 0.7)
+
+        # 创建结果
+        result = MarketImpactResult(
+            overall_impact=overall_impact,
+            impact_breakdown=impact_breakdown,
+            market_sentiment=impact_data.get("market_sentiment", {}),
+            risk_assessment=impact_data.get("risk_assessment", {}),
+            opportunity_analysis=impact_data.get("opportunity_analysis", {}),
+            correlation_analysis=impact_data.get("correlation_analysis", {}),
+            processing_time=time.time() - start_time,
+            metadata={
+                "llm_provider": response.provider.value,
+                "llm_model": response.model,
+                "response_time": response.response_time,
+                "tokens_used": response.usage.get("total_tokens", 0),
+                "cached": response.cached,
+                "analysis_confidence": impact_data.get("confidence_assessment", {}).get("overall_confidence", 0.5)
+            }
+        )
+
+        # 更新统计
+        self.stats.successful_analyses += 1
+        if is_high_impact:
+            self.stats.high_impact_articles += 1
+        self._update_stats(result)
+
+        self.logger.info(f"Successfully assessed market impact for article {article.id}: {overall_impact.magnitude.value} impact")
+        return result
+
     async def assess_batch_market_impact(self, articles: List[NewsArticle],
                                        sentiment_results: Optional[List[SentimentAnalysisResult]] = None,
                                        entity_results: Optional[List[EntityExtractionResult]] = None) -> List[MarketImpactResult]:
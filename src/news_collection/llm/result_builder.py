@@ -0,0 +1,33 @@
+"""
+Shared result building for analyzers whose LLM output is reused by combined and packed requests
+"""
+
+from typing import Dict, Any
+
+from ..models.base import NewsArticle
+from .llm_connector import LLMResponse
+
+
+class ResultBuilderMixin:
+    """
+    由已解析的LLM输出构建结果的公共入口
+
+    组合分析和多文章打包请求绕过各组件的单篇请求方法，通过 build_result 复用
+    组件的 _build_result。文章计数在构建成功后进行：构建失败时由调用方回退到
+    单篇请求，由单篇请求计数，避免同一篇文章重复计数。
+    """
+
+    # 统计对象中记录处理文章数的字段
+    total_stat = "total_articles"
+
+    def build_result(self, article: NewsArticle, data: Dict[str, Any],
+                     response: LLMResponse, start_time: float) -> Any:
+        """构建结果并计入统计"""
+        result = self._build_result(article, data, response, start_time)
+        setattr(self.stats, self.total_stat, getattr(self.stats, self.total_stat) + 1)
+        return result
+
+    def _build_result(self, article: NewsArticle, data: Dict[str, Any],
+                      response: LLMResponse, start_time: float) -> Any:
+        """构建结果，由各组件实现"""
+        raise NotImplementedError
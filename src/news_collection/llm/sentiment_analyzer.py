@@ -7,12 +7,14 @@ import time
 import json
 import re
 from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import asyncio
 
 from ..models.base import NewsArticle
 from .llm_connector import LLMConnector, LLMMessage, LLMConfig, LLMResponse
+from .result_builder import ResultBuilderMixin
+from .article_packer import ArticlePacker
 
 
 class SentimentCategory(Enum):
@@ -52,6 +54,14 @@ class SentimentConfig:
     include_key_phrases: bool = True
     max_key_phrases: int = 10
 
+    # 批量分析时将多篇短文章打包到一次请求
+    enable_article_packing: bool = True
+    packing_token_budget: int = 3000
+    max_articles_per_request: int = 8
+    max_packed_article_tokens: int = 600
+    # 打包请求按文章数放大输出上限，避免多篇结果被截断
+    packed_output_tokens_per_article: int = 400
+
 
 @dataclass
 class SentimentScore:
@@ -98,14 +108,21 @@ class SentimentStats:
     aspect_analysis_count: Dict[str, int] = field(default_factory=dict)
 
 
-class SentimentAnalyzer:
+class SentimentAnalyzer(ResultBuilderMixin):
     """情感分析器"""
 
+    total_stat = "total_analyses"
+
     def __init__(self, llm_connector: LLMConnector, config: SentimentConfig):
         self.llm_connector = llm_connector
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
         self.stats = SentimentStats()
+        self.packer = ArticlePacker(
+            token_budget=config.packing_token_budget,
+            max_articles=config.max_articles_per_request,
+            max_article_tokens=config.max_packed_article_tokens
+        )
 
         # 初始化情感分布
         for category in SentimentCategory:
@@ -216,15 +233,28 @@ Content:
             if relevant_metadata:
                 prompt += f"Market Context: {json.dumps(relevant_metadata, indent=2)}\n"
 
-        aspects_to_analyze = [aspect.value for aspect in self.config.aspects_to_analyze]
         prompt += f"""
 
-Please focus your analysis on these aspects: {', '.join(aspects_to_analyze)}
+{self._create_task_instructions()}
 
 Provide a comprehensive sentiment analysis following the requirements specified."""
 
         return prompt
 
+    def _create_packed_user_prompt(self, articles: List[NewsArticle]) -> str:
+        """创建多文章打包的用户提示"""
+        return f"""Please analyze the sentiment of each of the following {len(articles)} news articles:
+
+{self.packer.format_articles(articles)}
+{self._create_task_instructions()}
+
+{self.packer.response_instructions(articles)}"""
+
+    def _create_task_instructions(self) -> str:
+        """创建与文章无关的任务配置说明"""
+        aspects_to_analyze = [aspect.value for aspect in self.config.aspects_to_analyze]
+        return f"Please focus your analysis on these aspects: {', '.join(aspects_to_analyze)}"
+
     def _parse_sentiment_response(self, response: str) -> Dict[str, Any]:
         """解析情感分析响应"""
         try:
@@ -355,44 +385,7 @@ Provide a comprehensive sentiment analysis following the requirements specified.
             # 解析响应
             sentiment_data = self._parse_sentiment_response(response.content)
 
-            # 创建整体情感分数
-            overall_sentiment = self._create_sentiment_score(sentiment_data.get("overall_sentiment", {}))
-
-            # 创建维度情感分数
-            aspect_sentiments = {}
-            aspect_data = sentiment_data.get("aspect_sentiments", {})
-
-            for aspect in self.config.aspects_to_analyze:
-                if aspect.value in aspect_data:
-                    aspect_sentiments[aspect] = self._create_sentiment_score(aspect_data[aspect.value])
-                else:
-                    # 如果没有特定维度分析，使用整体情感
-                    aspect_sentiments[aspect] = overall_sentiment
-
-            # 创建结果
-            result = SentimentAnalysisResult(
-                overall_sentiment=overall_sentiment,
-                aspect_sentiments=aspect_sentiments,
-                market_impact_indicators=sentiment_data.get("market_impact_indicators", {}),
-                temporal_indicators=self._analyze_temporal_indicators(article, sentiment_data),
-                reliability_score=sentiment_data.get("reliability_score", 0.5),
-                processing_time=time.time() - start_time,
-                metadata={
-                    "llm_provider": response.provider.value,
-                    "llm_model": response.model,
-                    "response_time": response.response_time,
-                    "tokens_used": response.usage.get("total_tokens", 0),
-                    "cached": response.cached,
-                    "analysis_confidence": sentiment_data.get("analysis_confidence", 0.5)
-                }
-            )
-
-            # 更新统计
-            self.stats.successful_analyses += 1
-            self._update_stats(result)
-
-            self.logger.info(f"Successfully analyzed sentiment for article {article.id}: {overall_sentiment.category.value} ({overall_sentiment.score:.2f})")
-            return result
+            return self._build_result(article, sentiment_data, response, start_time)
 
         except Exception as e:
             self.stats.failed_analyses += 1
@@ -420,6 +413,48 @@ Provide a comprehensive sentiment analysis following the requirements specified.
                 metadata={"error": str(e)}
             )
 
+    def _build_result(self, article: NewsArticle, sentiment_data: Dict[str, Any],
+                      response: LLMResponse, start_time: float) -> SentimentAnalysisResult:
+        """构建情感分析结果并更新统计"""
+        # 创建整体情感分数
+        overall_sentiment = self._create_sentiment_score(sentiment_data.get("overall_sentiment", {}))
+
+        # 创建维度情感分数
+        aspect_sentiments = {}
+        aspect_data = sentiment_data.get("aspect_sentiments", {})
+
+        for aspect in self.config.aspects_to_analyze:
+            if aspect.value in aspect_data:
+                aspect_sentiments[aspect] = self._create_sentiment_score(aspect_data[aspect.value])
+            else:
+                # 如果没有特定维度分析，使用整体情感
+                aspect_sentiments[aspect] = overall_sentiment
+
+        # 创建结果
+        result = SentimentAnalysisResult(
+            overall_sentiment=overall_sentiment,
+            aspect_sentiments=aspect_sentiments,
+            market_impact_indicators=sentiment_data.get("market_impact_indicators", {}),
+            temporal_indicators=self._analyze_temporal_indicators(article, sentiment_data),
+            reliability_score=sentiment_data.get("reliability_score", 0.5),
+            processing_time=time.time() - start_time,
+            metadata={
+                "llm_provider": response.provider.value,
+                "llm_model": response.model,
+                "response_time": response.response_time,
+                "tokens_used": response.usage.get("total_tokens", 0),
+                "cached": response.cached,
+                "analysis_confidence": sentiment_data.get("analysis_confidence", 0.5)
+            }
+        )
+
+        # 更新统计
+        self.stats.successful_analyses += 1
+        self._update_stats(result)
+
+        self.logger.info(f"Successfully analyzed sentiment for article {article.id}: {overall_sentiment.category.value} ({overall_sentiment.score:.2f})")
+        return result
+
     def _analyze_temporal_indicators(self, article: NewsArticle, sentiment_data: Dict[str, Any]) -> Dict[str, Any]:
         """分析时间指标"""
         temporal_indicators = {
@@ -451,12 +486,15 @@ Provide a comprehensive sentiment analysis following the requirements specified.
         """批量情感分析"""
         self.logger.info(f"Starting batch sentiment analysis of {len(articles)} articles")
 
-        tasks = []
-        for article in articles:
-            task = self.analyze_sentiment(article)
-            tasks.append(task)
+        if self.config.enable_article_packing:
+            results = await self.packer.run(articles, self._request_packed, self.build_result, self.analyze_sentiment)
+        else:
+            tasks = []
+            for article in articles:
+                task = self.analyze_sentiment(article)
+                tasks.append(task)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # 处理结果
         sentiment_results = []
@@ -490,6 +528,17 @@ Provide a comprehensive sentiment analysis following the requirements specified.
         self.logger.info(f"Batch sentiment analysis completed: {len(sentiment_results)} articles processed")
         return sentiment_results
 
+    async def _request_packed(self, articles: List[NewsArticle]) -> LLMResponse:
+        """对一组文章发出一次打包请求，输出上限随文章数放大"""
+        messages = [
+            LLMMessage(role="system", content=self._create_system_prompt()),
+            LLMMessage(role="user", content=self._create_packed_user_prompt(articles))
+        ]
+        max_tokens = max(self.llm_connector.config.max_tokens,
+                         self.config.packed_output_tokens_per_article * len(articles))
+        config = replace(self.llm_connector.config, max_tokens=max_tokens)
+        return await self.llm_connector.generate_response(messages, config)
+
     def _update_stats(self, result: SentimentAnalysisResult):
         """更新统计信息"""
         # 更新情感分布
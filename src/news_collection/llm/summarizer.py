@@ -12,6 +12,7 @@ import re
 
 from ..models.base import NewsArticle
 from .llm_connector import LLMConnector, LLMMessage, LLMConfig, LLMResponse
+from .result_builder import ResultBuilderMixin
 
 
 class SummaryLength(Enum):
@@ -71,7 +72,7 @@ class SummaryStats:
     word_count_ratio: float = 0.0  # summary_word_count / original_word_count
 
 
-class NewsSummarizer:
+class NewsSummarizer(ResultBuilderMixin):
     """新闻摘要生成器"""
 
     def __init__(self, llm_connector: LLMConnector, config: SummaryConfig):
@@ -255,9 +256,6 @@ Content:
         self.stats.total_articles += 1
 
         try:
-            # 计算原始单词数量
-            original_word_count = self._extract_word_count(article.content)
-
             # 创建消息
             system_prompt = self._create_system_prompt()
             user_prompt = self._create_user_prompt(article)
@@ -282,36 +280,7 @@ Content:
                     "confidence": 0.7
                 }
 
-            # 计算摘要单词数量
-            summary_word_count = self._extract_word_count(structured_data["summary"])
-
-            # 创建结果
-            result = SummaryResult(
-                summary=structured_data["summary"],
-                key_points=structured_data.get("key_points", []),
-                entities=structured_data.get("entities", []),
-                sentiment=structured_data.get("sentiment", {"overall_sentiment": "neutral", "confidence": 0.5, "explanation": "Not analyzed"}),
-                confidence=structured_data.get("confidence", 0.7),
-                processing_time=time.time() - start_time,
-                word_count={
-                    "original": original_word_count,
-                    "summary": summary_word_count
-                },
-                metadata={
-                    "llm_provider": response.provider.value,
-                    "llm_model": response.model,
-                    "response_time": response.response_time,
-                    "tokens_used": response.usage.get("total_tokens", 0),
-                    "cached": response.cached
-                }
-            )
-
-            # 更新统计
-            self.stats.successful_summaries += 1
-            self._update_stats(result)
-
-            self.logger.info(f"Successfully summarized article {article.id}: {original_word_count} -> {summary_word_count} words")
-            return result
+            return self._build_result(article, structured_data, response, start_time)
 
         except Exception as e:
             self.stats.failed_summaries += 1
@@ -329,6 +298,42 @@ Content:
                 metadata={"error": str(e)}
             )
 
+    def _build_result(self, article: NewsArticle, structured_data: Dict[str, Any],
+                      response: LLMResponse, start_time: float) -> SummaryResult:
+        """构建摘要结果并更新统计"""
+        original_word_count = self._extract_word_count(article.content)
+
+        # 计算摘要单词数量
+        summary_word_count = self._extract_word_count(structured_data["summary"])
+
+        # 创建结果
+        result = SummaryResult(
+            summary=structured_data["summary"],
+            key_points=structured_data.get("key_points", []),
+            entities=structured_data.get("entities", []),
+            sentiment=structured_data.get("sentiment", {"overall_sentiment": "neutral", "confidence": 0.5, "explanation": "Not analyzed"}),
+            confidence=structured_data.get("confidence", 0.7),
+            processing_time=time.time() - start_time,
+            word_count={
+                "original": original_word_count,
+                "summary": summary_word_count
+            },
+            metadata={
+                "llm_provider": response.provider.value,
+                "llm_model": response.model,
+                "response_time": response.response_time,
+                "tokens_used": response.usage.get("total_tokens", 0),
+                "cached": response.cached
+            }
+        )
+
+        # 更新统计
+        self.stats.successful_summaries += 1
+        self._update_stats(result)
+
+        self.logger.info(f"Successfully summarized article {article.id}: {original_word_count} -> {summary_word_count} words")
+        return result
+
     async def summarize_batch(self, articles: List[NewsArticle]) -> List[SummaryResult]:
         """批量摘要文章"""
         self.logger.info(f"Starting batch summarization of {len(articles)} articles")
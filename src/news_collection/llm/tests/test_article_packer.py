@@ -0,0 +1,220 @@
+"""
+Tests for article packer module
+"""
+
+import pytest
+import json
+from unittest.mock import Mock, AsyncMock
+
+from ..article_packer import ArticlePacker
+from ..llm_connector import LLMConnector, LLMConfig, LLMResponse, LLMProvider
+from ..sentiment_analyzer import SentimentAnalyzer, SentimentConfig, SentimentCategory
+from ..entity_extractor import EntityExtractor, EntityConfig
+from ...models.base import NewsArticle
+
+
+def make_articles(count: int, content_length: int = 100):
+    """创建测试文章"""
+    return [
+        NewsArticle(
+            id=f"article-{i}",
+            title=f"Headline {i}",
+            content="x" * content_length,
+            source="Test"
+        )
+        for i in range(count)
+    ]
+
+
+def make_response(content: str) -> LLMResponse:
+    """创建测试响应"""
+    return LLMResponse(
+        content=content,
+        usage={"total_tokens": 300},
+        model="test-model",
+        provider=LLMProvider.MOCK,
+        response_time=0.2
+    )
+
+
+def make_connector(content_for_messages):
+    """创建按提示内容返回响应的模拟连接器"""
+    connector = Mock(spec=LLMConnector)
+    connector.config = LLMConfig()
+
+    async def mock_generate_response(messages, config=None):
+        return make_response(content_for_messages(messages))
+
+    connector.generate_response = AsyncMock(side_effect=mock_generate_response)
+    return connector
+
+
+def sentiment_entry(article_id: str, category: str = "positive"):
+    """单篇情感结果"""
+    return {
+        "article_id": article_id,
+        "overall_sentiment": {"category": category, "score": 0.6, "confidence": 0.8,
+                              "explanation": "Test", "intensity": 0.5}
+    }
+
+
+class TestArticlePacker:
+    """测试多文章打包器"""
+
+    def test_pack_respects_limits(self):
+        """测试按文章数和token预算分组"""
+        packer = ArticlePacker(token_budget=200, max_articles=3, max_article_tokens=100)
+        articles = make_articles(7, content_length=100)
+
+        packs, singles = packer.pack(articles)
+
+        assert all(len(pack) <= 3 for pack in packs)
+        assert all(sum(packer.estimate_tokens(articles[i]) for i in pack) <= 200 for pack in packs)
+        assert sorted([i for pack in packs for i in pack] + singles) == list(range(7))
+
+    def test_long_and_duplicate_articles_not_packed(self):
+        """测试长文章和重复ID的文章单独处理"""
+        packer = ArticlePacker(max_article_tokens=100)
+        articles = make_articles(3)
+        articles.append(NewsArticle(id="long", title="Long", content="y" * 2000))
+        articles.append(NewsArticle(id="article-0", title="Duplicate", content="z"))
+
+        packs, singles = packer.pack(articles)
+
+        assert packs == [[0, 1, 2]]
+        assert singles == [3, 4]
+
+    def test_demultiplex_by_id(self):
+        """测试按文章ID拆分响应，忽略未知ID"""
+        packer = ArticlePacker()
+        articles = make_articles(3)
+        response = "```json\n" + json.dumps({"articles": [
+            {"article_id": "article-2", "value": 2},
+            {"article_id": "unknown", "value": 9},
+            {"article_id": "article-0", "value": 0}
+        ]}) + "\n```"
+
+        results = packer.demultiplex(response, articles)
+
+        assert results == {"article-0": {"value": 0}, "article-2": {"value": 2}}
+
+    def test_demultiplex_other_shapes(self):
+        """测试以ID为键的对象、无ID的顺序数组和无效响应"""
+        packer = ArticlePacker()
+        articles = make_articles(2)
+
+        keyed = json.dumps({"article-1": {"value": 1}, "article-0": {"value": 0}})
+        assert packer.demultiplex(keyed, articles) == {"article-0": {"value": 0}, "article-1": {"value": 1}}
+
+        ordered = "Here you go: " + json.dumps([{"value": 0}, {"value": 1}])
+        assert packer.demultiplex(ordered, articles) == {"article-0": {"value": 0}, "article-1": {"value": 1}}
+
+        assert packer.demultiplex("not json", articles) == {}
+
+    @pytest.mark.asyncio
+    async def test_run_scatters_results_and_falls_back(self):
+        """测试打包执行按输入顺序返回结果，缺失和长文章走单篇处理"""
+        packer = ArticlePacker(max_article_tokens=100)
+        articles = make_articles(3) + make_articles(1, content_length=1000)
+        articles[3].id = "long"
+
+        async def request_pack(pack):
+            return make_response(json.dumps({"articles": [
+                {"article_id": article.id, "value": article.id} for article in pack if article.id != "article-1"
+            ]}))
+
+        def build_one(article, data, response, start_time):
+            return Mock(value=data["value"], metadata={})
+
+        async def run_single(article):
+            return Mock(value=f"single:{article.id}", metadata={})
+
+        results = await packer.run(articles, request_pack, build_one, run_single)
+
+        assert [result.value for result in results] == ["article-0", "single:article-1", "article-2", "single:long"]
+        assert results[0].metadata["packed_articles"] == 3
+
+
+class TestPackedBatchAnalysis:
+    """测试情感分析和实体提取的打包批处理"""
+
+    @pytest.mark.asyncio
+    async def test_sentiment_batch_single_request(self):
+        """测试多篇短文章共用一次情感分析请求"""
+        articles = make_articles(5)
+        connector = make_connector(lambda messages: json.dumps(
+            {"articles": [sentiment_entry(article.id) for article in articles]}
+        ))
+        analyzer = SentimentAnalyzer(connector, SentimentConfig())
+
+        results = await analyzer.analyze_batch_sentiment(articles)
+
+        assert connector.generate_response.call_count == 1
+        assert len(results) == 5
+        assert all(result.overall_sentiment.category == SentimentCategory.POSITIVE for result in results)
+        assert all(result.metadata["packed_articles"] == 5 for result in results)
+        assert analyzer.stats.successful_analyses == 5
+
+    @pytest.mark.asyncio
+    async def test_packed_request_scales_max_tokens(self):
+        """测试打包请求的输出上限随文章数放大"""
+        articles = make_articles(8)
+        connector = make_connector(lambda messages: json.dumps(
+            {"articles": [sentiment_entry(article.id) for article in articles]}
+        ))
+        analyzer = SentimentAnalyzer(connector, SentimentConfig(packed_output_tokens_per_article=400))
+
+        await analyzer.analyze_batch_sentiment(articles)
+
+        assert connector.generate_response.call_args[0][1].max_tokens == 3200
+        assert connector.config.max_tokens == 2000
+
+    @pytest.mark.asyncio
+    async def test_sentiment_missing_article_falls_back(self):
+        """测试响应中缺失的文章单独回退请求，且结果顺序不变"""
+        articles = make_articles(3)
+
+        def respond(messages):
+            if "Article ID:" in messages[1].content:
+                return json.dumps({"articles": [sentiment_entry("article-0"), sentiment_entry("article-2")]})
+            return json.dumps(sentiment_entry("single", "negative"))
+
+        connector = make_connector(respond)
+        analyzer = SentimentAnalyzer(connector, SentimentConfig())
+
+        results = await analyzer.analyze_batch_sentiment(articles)
+
+        assert connector.generate_response.call_count == 2
+        assert [result.overall_sentiment.category for result in results] == [
+            SentimentCategory.POSITIVE, SentimentCategory.NEGATIVE, SentimentCategory.POSITIVE
+        ]
+        assert "packed_articles" not in results[1].metadata
+
+    @pytest.mark.asyncio
+    async def test_packing_disabled(self):
+        """测试关闭打包时每篇文章一次请求"""
+        articles = make_articles(3)
+        connector = make_connector(lambda messages: json.dumps(sentiment_entry("single")))
+        analyzer = SentimentAnalyzer(connector, SentimentConfig(enable_article_packing=False))
+
+        await analyzer.analyze_batch_sentiment(articles)
+
+        assert connector.generate_response.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_entity_batch_single_request(self):
+        """测试多篇短文章共用一次实体提取请求"""
+        articles = [
+            NewsArticle(id="a", title="Bitcoin rallies", content="Bitcoin rallies again", source="Test"),
+            NewsArticle(id="b", title="Coinbase listing", content="Coinbase lists a token", source="Test")
+        ]
+        connector = make_connector(lambda messages: json.dumps({"articles": [
+            {"article_id": "a", "entities": [{"text": "Bitcoin", "type": "cryptocurrency", "confidence": 0.9}]},
+            {"article_id": "b", "entities": [{"text": "Coinbase", "type": "company", "confidence": 0.9}]}
+        ]}))
+        extractor = EntityExtractor(connector, EntityConfig())
+
+        results = await extractor.extract_batch_entities(articles)
+
+        assert connector.generate_response.call_count == 1
+        assert [result.entities[0].text for result in results] == ["Bitcoin", "Coinbase"]
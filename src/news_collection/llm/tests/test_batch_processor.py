@@ -740,5 +740,125 @@ class TestBatchProcessor:
         # 注意：在真实环境中，这会在事件循环中执行
 
 
+
+class TestBatchProcessorWorkerPool:
+    """测试事件驱动的工作协程池"""
+
+    def make_processor(self, handler, **config_overrides):
+        """创建任务处理逻辑替换为 handler 的批处理器"""
+        config_overrides.setdefault("retry_attempts", 0)
+        config = BatchConfig(enable_rate_limiting=False, **config_overrides)
+        processor = BatchProcessor(Mock(spec=LLMConnector), config)
+        processor._dispatch_task = handler
+        return processor
+
+    @pytest.mark.asyncio
+    async def test_task_dispatched_without_polling_delay(self):
+        """测试任务入队后立即被工作协程处理"""
+        async def handler(task):
+            return task.data
+
+        processor = self.make_processor(handler, num_workers=2)
+        await processor.start()
+
+        start = time.monotonic()
+        task_id = await processor.submit_task("summarize", "payload")
+        result = await processor.get_result(task_id, timeout=1.0)
+        elapsed = time.monotonic() - start
+
+        assert result.success is True
+        assert result.result == "payload"
+        assert elapsed < 0.05
+        assert len(processor.workers) == 2
+
+        await processor.stop()
+        assert processor.workers == []
+
+    def test_constructed_outside_event_loop(self):
+        """测试在事件循环外构造的处理器可在之后启动的事件循环中使用"""
+        async def handler(task):
+            return task.data
+
+        processor = self.make_processor(handler, num_workers=1)
+        assert processor.task_queue is None
+        assert processor.get_stats()["queue_size"] == 0
+
+        async def run():
+            await processor.start()
+            task_id = await processor.submit_task("summarize", "payload")
+            result = await processor.get_result(task_id, timeout=1.0)
+            await processor.stop()
+            return result
+
+        result = asyncio.run(run())
+        assert result.success is True
+        assert result.result == "payload"
+
+    @pytest.mark.asyncio
+    async def test_priority_and_deadline_order(self):
+        """测试按优先级出队，同一优先级内截止时间早的先处理"""
+        order = []
+
+        async def handler(task):
+            order.append(task.data)
+
+        processor = self.make_processor(handler, num_workers=1)
+        await processor.submit_task("summarize", "normal-late", BatchPriority.NORMAL, timeout=30.0)
+        await processor.submit_task("summarize", "low", BatchPriority.LOW)
+        await processor.submit_task("summarize", "normal-early", BatchPriority.NORMAL, timeout=5.0)
+        await processor.submit_task("summarize", "critical", BatchPriority.CRITICAL)
+
+        await processor.start()
+        await processor.stop()
+
+        assert order == ["critical", "normal-early", "normal-late", "low"]
+
+    @pytest.mark.asyncio
+    async def test_submit_blocks_when_queue_full(self):
+        """测试排队及处理中的任务达到上限时提交等待"""
+        release = asyncio.Event()
+
+        async def handler(task):
+            await release.wait()
+
+        processor = self.make_processor(handler, num_workers=1, queue_capacity=2)
+        await processor.start()
+
+        await processor.submit_task("summarize", 1)
+        await processor.submit_task("summarize", 2)
+
+        blocked = asyncio.create_task(processor.submit_task("summarize", 3))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+        assert processor.get_stats()["pending_tasks"] == 2
+
+        release.set()
+        await asyncio.wait_for(blocked, timeout=1.0)
+
+        await processor.stop()
+        assert processor.stats.successful_tasks == 3
+
+    @pytest.mark.asyncio
+    async def test_expired_task_not_dispatched(self):
+        """测试超过截止时间的任务直接失败且不再重试"""
+        handler = AsyncMock()
+        processor = self.make_processor(handler, retry_attempts=3)
+        task = BatchTask(
+            id="expired",
+            task_type="summarize",
+            data="payload",
+            priority=BatchPriority.NORMAL,
+            created_at=datetime.now(),
+            timeout=1.0,
+            deadline=time.monotonic() - 1
+        )
+
+        result = await processor._process_task(task)
+
+        assert result.success is False
+        assert "deadline" in result.error_message
+        assert task.retry_count == 0
+        handler.assert_not_called()
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
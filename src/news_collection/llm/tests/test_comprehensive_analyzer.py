@@ -0,0 +1,205 @@
+"""
+Tests for comprehensive analyzer module
+"""
+
+import pytest
+import json
+from unittest.mock import Mock, AsyncMock
+
+from ..comprehensive_analyzer import ComprehensiveAnalyzer, ComprehensiveAnalysisResult, COMBINED_TASKS
+from ..llm_connector import LLMConnector, LLMConfig, LLMResponse, LLMProvider
+from ..summarizer import NewsSummarizer, SummaryConfig
+from ..sentiment_analyzer import SentimentAnalyzer, SentimentConfig, SentimentCategory
+from ..content_segmenter import ContentSegmenter, SectionConfig
+from ..entity_extractor import EntityExtractor, EntityConfig
+from ..market_impact import MarketImpactAssessor, MarketImpactConfig
+from ..batch_processor import BatchProcessor, BatchConfig, BatchTask, BatchPriority
+from ...models.base import NewsArticle
+
+
+COMBINED_OUTPUT = {
+    "summary": {
+        "summary": "Bitcoin rallied on institutional demand.",
+        "key_points": ["Institutional demand", "New highs"],
+        "confidence": 0.8
+    },
+    "sentiment": {
+        "overall_sentiment": {"category": "positive", "score": 0.7, "confidence": 0.8, "explanation": "Bullish tone"},
+        "reliability_score": 0.8
+    },
+    "segmentation": {
+        "sections": [
+            {"type": "headline", "title": "Headline", "content": "Bitcoin Surges to New Heights", "importance": 0.9},
+            {"type": "main_content", "title": "Body", "content": "Bitcoin has experienced a significant surge.", "importance": 0.8}
+        ],
+        "overall_structure": {"type": "news_article"}
+    },
+    "entities": {
+        "entities": [
+            {"text": "Bitcoin", "type": "cryptocurrency", "confidence": 0.9}
+        ]
+    },
+    "market_impact": {
+        "overall_impact": {"impact_type": "price_movement", "timeframe": "short_term", "magnitude": "moderate",
+                           "direction": "positive", "confidence": 0.7, "reasoning": "Institutional inflows"}
+    }
+}
+
+
+def make_response(content: str) -> LLMResponse:
+    """创建测试响应"""
+    return LLMResponse(
+        content=content,
+        usage={"total_tokens": 800},
+        model="test-model",
+        provider=LLMProvider.MOCK,
+        response_time=0.5
+    )
+
+
+class TestComprehensiveAnalyzer:
+    """测试单次调用的综合分析器"""
+
+    @pytest.fixture
+    def sample_article(self):
+        """示例文章"""
+        return NewsArticle(
+            id="test-article-1",
+            title="Bitcoin Surges to New Heights",
+            content="Bitcoin has experienced a significant surge, reaching new price levels as institutional investors continue to show strong interest in the cryptocurrency market.",
+            source="CoinDesk",
+            tags=["bitcoin", "institutional"]
+        )
+
+    def make_analyzer(self, combined_content: str, per_task_content: str = "{}") -> ComprehensiveAnalyzer:
+        """创建分析器，组合提示返回 combined_content，其余调用返回 per_task_content"""
+        connector = Mock(spec=LLMConnector)
+        connector.config = LLMConfig()
+
+        async def mock_generate_response(messages, config=None):
+            if "top-level keys" in messages[0].content:
+                return make_response(combined_content)
+            return make_response(per_task_content)
+
+        connector.generate_response = AsyncMock(side_effect=mock_generate_response)
+
+        return ComprehensiveAnalyzer(
+            connector,
+            NewsSummarizer(connector, SummaryConfig()),
+            SentimentAnalyzer(connector, SentimentConfig()),
+            ContentSegmenter(connector, SectionConfig()),
+            EntityExtractor(connector, EntityConfig()),
+            MarketImpactAssessor(connector, MarketImpactConfig()),
+            max_tokens=6000
+        )
+
+    def test_prompt_contains_article_once(self, sample_article):
+        """测试组合提示中文章正文只出现一次并包含全部任务"""
+        analyzer = self.make_analyzer("{}")
+        user_prompt = analyzer._create_user_prompt(sample_article)
+        system_prompt = analyzer._create_system_prompt()
+
+        assert user_prompt.count(sample_article.content) == 1
+        for task_name in COMBINED_TASKS:
+            assert f'=== Task "{task_name}" ===' in system_prompt
+
+    @pytest.mark.asyncio
+    async def test_single_call_for_all_tasks(self, sample_article):
+        """测试一次LLM调用得到全部五项结果"""
+        analyzer = self.make_analyzer(json.dumps(COMBINED_OUTPUT))
+
+        result = await analyzer.analyze(sample_article)
+
+        assert isinstance(result, ComprehensiveAnalysisResult)
+        assert analyzer.llm_connector.generate_response.call_count == 1
+        assert analyzer.llm_connector.generate_response.call_args[0][1].max_tokens == 6000
+        assert result.combined is True
+        assert result.fallback_tasks == []
+        assert result.summary.summary == "Bitcoin rallied on institutional demand."
+        assert result.sentiment.overall_sentiment.category == SentimentCategory.POSITIVE
+        assert result.entities.entities[0].text == "Bitcoin"
+        assert result.market_impact is not None
+        assert result.summary.metadata["combined_analysis"] is True
+        assert analyzer.sentiment_analyzer.stats.successful_analyses == 1
+
+    @pytest.mark.asyncio
+    async def test_code_fenced_response(self, sample_article):
+        """测试解析Markdown代码块包裹的JSON"""
+        analyzer = self.make_analyzer("```json\n" + json.dumps(COMBINED_OUTPUT) + "\n```")
+
+        result = await analyzer.analyze(sample_article)
+
+        assert result.combined is True
+        assert result.fallback_tasks == []
+
+    @pytest.mark.asyncio
+    async def test_missing_section_falls_back(self, sample_article):
+        """测试缺失的任务单独回退调用"""
+        output = dict(COMBINED_OUTPUT)
+        del output["segmentation"]
+        analyzer = self.make_analyzer(json.dumps(output))
+
+        result = await analyzer.analyze(sample_article)
+
+        assert result.combined is True
+        assert result.fallback_tasks == ["segmentation"]
+        assert result.segmentation is not None
+        assert analyzer.llm_connector.generate_response.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_section_counted_once(self, sample_article):
+        """测试无法构建的任务回退后组件统计只计一次"""
+        output = dict(COMBINED_OUTPUT)
+        output["sentiment"] = {"overall_sentiment": "positive"}
+        analyzer = self.make_analyzer(json.dumps(output), json.dumps(COMBINED_OUTPUT["sentiment"]))
+
+        result = await analyzer.analyze(sample_article)
+
+        assert result.fallback_tasks == ["sentiment"]
+        stats = analyzer.sentiment_analyzer.get_stats()
+        assert stats["total_analyses"] == 1
+        assert stats["successful_analyses"] == 1
+        assert stats["failed_analyses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_falls_back_to_all_tasks(self, sample_article):
+        """测试整个响应无法解析时全部回退"""
+        analyzer = self.make_analyzer("not a json response")
+
+        result = await analyzer.analyze(sample_article)
+
+        assert result.combined is False
+        assert result.fallback_tasks == list(COMBINED_TASKS)
+        assert analyzer.llm_connector.generate_response.call_count == 1 + len(COMBINED_TASKS)
+        assert analyzer.get_stats()["combined_parse_failures"] == 1
+
+
+class TestBatchProcessorCombinedAnalysis:
+    """测试批处理器使用组合分析"""
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_task_uses_single_call(self):
+        """测试综合分析任务只发出一次LLM请求"""
+        connector = Mock(spec=LLMConnector)
+        connector.config = LLMConfig()
+        connector.generate_response = AsyncMock(return_value=make_response(json.dumps(COMBINED_OUTPUT)))
+
+        processor = BatchProcessor(connector, BatchConfig(enable_rate_limiting=False))
+        article = NewsArticle(id="a1", title="Bitcoin", content="Bitcoin price rises on institutional demand.")
+        task = BatchTask(
+            id="test-comprehensive",
+            task_type="comprehensive",
+            data=article,
+            priority=BatchPriority.NORMAL,
+            created_at=None,
+            timeout=60.0
+        )
+
+        result = await processor._process_comprehensive_analysis(task)
+
+        assert connector.generate_response.call_count == 1
+        assert result["article_id"] == "a1"
+        assert result["combined_analysis"] is True
+        assert result["summary"]["summary"] == "Bitcoin rallied on institutional demand."
+        assert result["market_impact"] is not None
+        assert 0 <= result["processing_time"] < 60
@@ -328,20 +328,6 @@ class TestEntityExtractor:
         assert any("bitcoin" in text.lower() for text in entity_texts)
         assert any("coinbase" in text.lower() for text in entity_texts)
 
-    def test_find_all_positions(self):
-        """测试查找所有位置"""
-        config = EntityConfig()
-        llm_connector = Mock(spec=LLMConnector)
-        extractor = EntityExtractor(llm_connector, config)
-
-        text = "Bitcoin is popular. Bitcoin is valuable. Bitcoin is digital."
-        positions = extractor._find_all_positions(text, "Bitcoin")
-
-        assert len(positions) == 3
-        assert positions[0] == 0
-        assert positions[1] == 17
-        assert positions[2] == 36
-
     def test_get_context(self):
         """测试获取上下文"""
         config = EntityConfig()
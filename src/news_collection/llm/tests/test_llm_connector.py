@@ -6,9 +6,11 @@ import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 
+from aiohttp import web
+
 from ..llm_connector import (
     LLMConnector, LLMConfig, LLMProvider, LLMMessage, LLMResponse,
-    OpenAIProvider, AnthropicProvider, MockProvider, CacheManager
+    OpenAIProvider, AnthropicProvider, MockProvider, CacheManager, HTTPSessionPool
 )
 from ...models.base import NewsArticle
 
@@ -243,6 +245,79 @@ class TestLLMConnector:
         assert "request_stats" in health
 
 
+class TestHTTPSessionPool:
+    """测试共享HTTP会话池"""
+
+    @pytest.fixture
+    async def openai_server(self):
+        """启动记录客户端连接的本地OpenAI兼容服务"""
+        peers = []
+
+        async def chat_completions(request):
+            peers.append(request.transport.get_extra_info('peername'))
+            return web.json_response({
+                "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+            })
+
+        app = web.Application()
+        app.router.add_post('/v1/chat/completions', chat_completions)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        yield f"http://127.0.0.1:{port}/v1", peers
+
+        await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_session_reused(self):
+        """测试会话在请求之间复用"""
+        pool = HTTPSessionPool(LLMConfig(connection_limit_per_host=5))
+
+        session = await pool.get_session()
+        assert await pool.get_session() is session
+        assert session.connector.limit_per_host == 5
+
+        await pool.close()
+        assert pool.closed
+        assert session.closed
+        assert await pool.get_session() is not session
+        assert pool.get_stats()["sessions_created"] == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_providers_share_connector_pool(self):
+        """测试提供商共享连接器的会话池并随连接器关闭"""
+        connector = LLMConnector(LLMConfig(provider=LLMProvider.OPENAI, api_key="test"))
+        assert connector.provider.session_pool is connector.session_pool
+
+        session = await connector.session_pool.get_session()
+        await connector.close()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_connection(self, openai_server):
+        """测试连续请求复用同一个TCP连接"""
+        base_url, peers = openai_server
+        config = LLMConfig(provider=LLMProvider.OPENAI, api_key="test", base_url=base_url,
+                           enable_cache=False)
+        connector = LLMConnector(config)
+
+        try:
+            for i in range(5):
+                response = await connector.generate_response([LLMMessage(role="user", content=f"message {i}")])
+                assert response.content == "ok"
+        finally:
+            await connector.close()
+
+        assert len(peers) == 5
+        assert len(set(peers)) == 1
+        assert connector.session_pool.get_stats()["sessions_created"] == 1
+
+
 class TestLLMConnectorIntegration:
     """LLM连接器集成测试"""
 
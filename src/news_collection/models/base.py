@@ -61,6 +61,7 @@ class NewsSourceConfig:
     headers: Dict[str, str] = None
     enabled: bool = True
     priority: int = 1  # 1-10, higher is more important
+    fetch_article_bodies: bool = True  # 列表页缺少正文时是否自动抓取详情页
 
     def __post_init__(self):
         if self.headers is None:
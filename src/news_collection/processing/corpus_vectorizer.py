@@ -0,0 +1,80 @@
+"""
+Incrementally maintained corpus TF-IDF vectorizer for semantic deduplication
+"""
+
+import hashlib
+from typing import List
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+
+class CorpusVectorizer:
+    """
+    语料级TF-IDF向量化器
+
+    使用无状态的哈希向量化得到词频向量，词表不随文档变化，因此每篇文章的
+    词频向量只需计算一次并可缓存；文档频率随新文章增量累加，IDF权重在计算
+    相似度时按当前语料统计施加，无需重新拟合。
+    """
+
+    def __init__(self, n_features: int = 2 ** 18, ngram_range: tuple = (1, 2), stop_words: str = 'english'):
+        self.n_features = n_features
+        self.hasher = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=ngram_range,
+            stop_words=stop_words,
+            lowercase=True,
+            alternate_sign=False,
+            norm=None
+        )
+        self.document_frequency = np.zeros(n_features, dtype=np.float64)
+        self.document_count = 0
+
+    def term_vectors(self, texts: List[str]) -> sparse.csr_matrix:
+        """计算文本的词频向量，每行一篇"""
+        return self.hasher.transform(texts).tocsr()
+
+    def partial_fit(self, term_vectors: sparse.csr_matrix):
+        """将新文档计入文档频率"""
+        if term_vectors.shape[0] == 0:
+            return
+        self.document_frequency += np.bincount(term_vectors.indices, minlength=self.n_features)
+        self.document_count += term_vectors.shape[0]
+
+    def idf(self) -> np.ndarray:
+        """当前语料的平滑IDF权重"""
+        return np.log((1.0 + self.document_count) / (1.0 + self.document_frequency)) + 1.0
+
+    def weight(self, term_vectors: sparse.csr_matrix) -> sparse.csr_matrix:
+        """按当前IDF加权并做L2归一化"""
+        return normalize(term_vectors @ sparse.diags(self.idf()), norm='l2', copy=False).tocsr()
+
+    def similarity(self, query_vectors: sparse.csr_matrix, candidate_vectors: sparse.csr_matrix) -> np.ndarray:
+        """计算查询向量与候选向量两两之间的余弦相似度矩阵"""
+        block = self.weight(query_vectors) @ self.weight(candidate_vectors).T
+        return np.asarray(block.todense())
+
+    def pairwise_similarity(self, term_vectors: sparse.csr_matrix, rows: np.ndarray, cols: np.ndarray,
+                            chunk_size: int = 65536) -> np.ndarray:
+        """计算给定行对 (rows[k], cols[k]) 的余弦相似度，按块处理以限制中间矩阵的内存"""
+        if len(rows) == 0:
+            return np.zeros(0)
+        weighted = self.weight(term_vectors)
+        scores = np.empty(len(rows), dtype=np.float64)
+        for start in range(0, len(rows), chunk_size):
+            stop = start + chunk_size
+            block = weighted[rows[start:stop]].multiply(weighted[cols[start:stop]])
+            scores[start:stop] = np.asarray(block.sum(axis=1)).ravel()
+        return scores
+
+    @staticmethod
+    def vector_hash(term_vector: sparse.csr_matrix) -> str:
+        """词频向量的稳定哈希"""
+        vector = term_vector.tocsr()
+        vector.sort_indices()
+        digest = hashlib.sha256(vector.indices.astype(np.int64).tobytes())
+        digest.update(vector.data.astype(np.float64).tobytes())
+        return digest.hexdigest()
@@ -17,11 +17,11 @@ from .models import (
     DeduplicationResult,
     ProcessingConfig
 )
+from .minhash_index import MinHashLSHIndex
 
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
-    from sklearn.decomposition import TruncatedSVD
+    from scipy import sparse
+    from .corpus_vectorizer import CorpusVectorizer
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
@@ -32,6 +32,7 @@ except ImportError:
 class FingerprintCache:
     """指纹缓存"""
     fingerprints: Dict[str, ContentFingerprint] = field(default_factory=dict)
+    article_fingerprints: Dict[str, ContentFingerprint] = field(default_factory=dict)
     article_groups: Dict[str, Set[str]] = field(default_factory=dict)
     last_cleanup: datetime = field(default_factory=datetime.now)
     cache_ttl_hours: int = 24
@@ -47,18 +48,20 @@ class DeduplicationEngine:
         # 初始化缓存
         self.cache = FingerprintCache()
 
-        # 初始化文本向量化器
+        # 初始化语料级向量化器，文章词频向量缓存在指纹上
         if SKLEARN_AVAILABLE:
-            self.vectorizer = TfidfVectorizer(
-                max_features=1000,
-                stop_words='english' if self._is_english_content() else None,
-                ngram_range=(1, 3),
-                lowercase=True
+            self.vectorizer = CorpusVectorizer(
+                stop_words='english' if self._is_english_content() else None
             )
-            self.svd = TruncatedSVD(n_components=100, random_state=42)
         else:
             self.vectorizer = None
-            self.svd = None
+
+        # 综合相似度权重
+        self.similarity_weights = {'content': 0.5, 'title': 0.3, 'semantic': 0.2}
+
+        # MinHash + LSH 候选索引，只对候选文章计算精确相似度
+        self.lsh_index = self._create_lsh_index()
+        self.use_lsh = self._lsh_recall_sufficient()
 
         # 去重统计
         self.stats = {
@@ -66,16 +69,33 @@ class DeduplicationEngine:
             'duplicates_found': 0,
             'false_positives': 0,
             'false_negatives': 0,
-            'avg_processing_time': 0.0
+            'avg_processing_time': 0.0,
+            'similarity_comparisons': 0
         }
 
     async def deduplicate(self, article: NewsArticle, existing_articles: List[NewsArticle] = None) -> DeduplicationResult:
         """去重单篇文章"""
+        existing = {}
+        if existing_articles:
+            existing = {existing_article.id: existing_article for existing_article in existing_articles}
+            if self.use_lsh:
+                self.lsh_index.add_many(existing_articles)
+
+        return await self._deduplicate(article, existing)
+
+    async def _deduplicate(self, article: NewsArticle, existing_articles: Dict[str, NewsArticle],
+                           semantic_scores: Optional[Dict[str, Optional[float]]] = None) -> DeduplicationResult:
+        """
+        去重单篇文章
+
+        existing_articles 为按ID索引的比较范围；semantic_scores 为预先计算的
+        {候选文章ID: 语义相似度}，给出时只与其中的候选比较。
+        """
         start_time = time.time()
 
         try:
-            # 生成内容指纹
-            fingerprint = await self._generate_fingerprint(article)
+            # 获取内容指纹
+            fingerprint = await self._get_fingerprint(article)
 
             # 检查缓存中的重复
             cached_duplicate = await self._check_cache_duplicate(fingerprint)
@@ -84,7 +104,9 @@ class DeduplicationEngine:
 
             # 检查与现有文章的重复
             if existing_articles:
-                duplicate_result = await self._check_duplicate_with_existing(article, fingerprint, existing_articles)
+                duplicate_result = await self._check_duplicate_with_existing(
+                    article, fingerprint, existing_articles, semantic_scores
+                )
                 if duplicate_result.is_duplicate:
                     # 更新缓存
                     await self._update_cache(fingerprint, duplicate_result.duplicate_group_id)
@@ -123,17 +145,20 @@ class DeduplicationEngine:
         self.logger.info(f"开始批量去重 {len(articles)} 篇文章")
 
         results = []
-        processed_articles = []
+        processed_articles = {}
 
-        for article in articles:
+        # 一次性计算批内所有候选对的语义相似度
+        batch_scores = await self._batch_semantic_scores(articles)
+
+        for article, semantic_scores in zip(articles, batch_scores):
             try:
                 # 检查与已处理文章的重复
-                result = await self.deduplicate(article, processed_articles)
+                result = await self._deduplicate(article, processed_articles, semantic_scores)
                 results.append(result)
 
-                # 如果不是重复，添加到已处理列表
+                # 如果不是重复，添加到已处理集合
                 if not result.is_duplicate:
-                    processed_articles.append(article)
+                    processed_articles[article.id] = article
 
             except Exception as e:
                 self.logger.error(f"批量去重失败: {str(e)}", exc_info=True)
@@ -153,13 +178,77 @@ class DeduplicationEngine:
         self.logger.info(f"批量去重完成，发现 {sum(1 for r in results if r.is_duplicate)} 个重复")
         return results
 
-    async def _generate_fingerprint(self, article: NewsArticle) -> ContentFingerprint:
-        """生成内容指纹"""
+    async def _batch_semantic_scores(self, articles: List[NewsArticle]) -> List[Optional[Dict[str, Optional[float]]]]:
+        """
+        计算批内候选对的语义相似度
+
+        启用LSH时，批内每篇文章只与批内临时索引给出的、排在它之前的候选比较，
+        所有候选对的余弦相似度由分块的稀疏矩阵运算得到；无向量化器时相似度为None，
+        逐对回退计算。未启用LSH时候选对数为O(n²)，不预先展开，返回None由逐篇比较
+        处理（每篇文章与候选一次矩阵乘法），此时只批量预计算词频向量。
+        """
+        if not self.use_lsh:
+            if self.vectorizer:
+                await self._batch_fingerprints(articles)
+            return [None] * len(articles)
+
+        rows, cols = self._batch_candidate_pairs(articles)
+
+        scores = [None] * len(rows)
+        if self.vectorizer and len(rows) > 0:
+            fingerprints = await self._batch_fingerprints(articles)
+            term_vectors = sparse.vstack([fingerprint.term_vector for fingerprint in fingerprints], format='csr')
+            scores = self.vectorizer.pairwise_similarity(term_vectors, rows, cols).tolist()
+
+        batch_scores = [{} for _ in articles]
+        for row, col, score in zip(rows.tolist(), cols.tolist(), scores):
+            batch_scores[row][articles[col].id] = score
+        return batch_scores
+
+    def _batch_candidate_pairs(self, articles: List[NewsArticle]) -> Tuple[np.ndarray, np.ndarray]:
+        """批内LSH候选对 (rows[k], cols[k])，满足 cols[k] < rows[k]"""
+        index = self._create_lsh_index()
+        positions = {}
+        rows, cols = [], []
+        for position, article in enumerate(articles):
+            for candidate_id in index.query(article):
+                rows.append(position)
+                cols.append(positions[candidate_id])
+            if index.add(article):
+                positions[article.id] = position
+        return np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)
+
+    async def _batch_fingerprints(self, articles: List[NewsArticle]) -> List[ContentFingerprint]:
+        """获取批内文章的指纹，未缓存文章的词频向量一次性计算"""
+        missing = [article for article in articles if article.id not in self.cache.article_fingerprints]
+        if missing:
+            term_vectors = self.vectorizer.term_vectors([article.content or '' for article in missing])
+            self.vectorizer.partial_fit(term_vectors)
+            for position, article in enumerate(missing):
+                fingerprint = await self._generate_fingerprint(article, term_vectors[position])
+                self.cache.article_fingerprints[article.id] = fingerprint
+        return [self.cache.article_fingerprints[article.id] for article in articles]
+
+    async def _get_fingerprint(self, article: NewsArticle) -> ContentFingerprint:
+        """获取文章指纹，每篇文章只生成一次"""
+        fingerprint = self.cache.article_fingerprints.get(article.id)
+        if fingerprint is None:
+            fingerprint = await self._generate_fingerprint(article)
+            self.cache.article_fingerprints[article.id] = fingerprint
+        return fingerprint
+
+    async def _generate_fingerprint(self, article: NewsArticle, term_vector=None) -> ContentFingerprint:
+        """生成内容指纹，term_vector 为已计算并计入语料的词频向量"""
         # 内容哈希
         content_hash = self._generate_content_hash(article.content)
 
+        # 语料词频向量
+        if term_vector is None and self.vectorizer:
+            term_vector = self.vectorizer.term_vectors([article.content or ''])
+            self.vectorizer.partial_fit(term_vector)
+
         # 语义哈希
-        semantic_hash = await self._generate_semantic_hash(article.content)
+        semantic_hash = await self._generate_semantic_hash(article.content, term_vector)
 
         # 源指纹
         source_fingerprint = self._generate_source_fingerprint(article)
@@ -170,7 +259,8 @@ class DeduplicationEngine:
             semantic_hash=semantic_hash,
             source_fingerprint=source_fingerprint,
             created_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(hours=self.config.time_window_hours)
+            expires_at=datetime.now() + timedelta(hours=self.config.time_window_hours),
+            term_vector=term_vector
         )
 
     def _generate_content_hash(self, content: str) -> str:
@@ -182,27 +272,17 @@ class DeduplicationEngine:
         # 使用SHA256生成哈希
         return hashlib.sha256(normalized_content.encode('utf-8')).hexdigest()
 
-    async def _generate_semantic_hash(self, content: str) -> str:
+    async def _generate_semantic_hash(self, content: str, term_vector=None) -> str:
         """生成语义哈希"""
         if not SKLEARN_AVAILABLE or not self.vectorizer:
             # 回退到简单的内容哈希
             return self._generate_content_hash(content)
 
         try:
-            # 使用TF-IDF向量化
-            tfidf_matrix = self.vectorizer.fit_transform([content])
-
-            # 使用SVD降维
-            if tfidf_matrix.shape[1] > 100:
-                reduced_matrix = self.svd.fit_transform(tfidf_matrix)
-            else:
-                reduced_matrix = tfidf_matrix.toarray()
-
-            # 生成语义哈希
-            semantic_vector = reduced_matrix.flatten()
-            semantic_hash = hashlib.sha256(semantic_vector.tobytes()).hexdigest()
-
-            return semantic_hash
+            # 哈希词频向量不依赖语料状态，相同内容得到相同的语义哈希
+            if term_vector is None:
+                term_vector = self.vectorizer.term_vectors([content or ''])
+            return CorpusVectorizer.vector_hash(term_vector)
 
         except Exception as e:
             self.logger.warning(f"语义哈希生成失败，使用内容哈希: {str(e)}")
@@ -237,20 +317,36 @@ class DeduplicationEngine:
         return None
 
     async def _check_duplicate_with_existing(self, article: NewsArticle, fingerprint: ContentFingerprint,
-                                           existing_articles: List[NewsArticle]) -> DeduplicationResult:
+                                           existing_articles: Dict[str, NewsArticle],
+                                           semantic_scores: Optional[Dict[str, Optional[float]]] = None
+                                           ) -> DeduplicationResult:
         """检查与现有文章的重复"""
         best_match = None
         best_score = 0.0
 
-        for existing_article in existing_articles:
-            # 跳过时间窗口外的文章
-            if (existing_article.published_at and article.published_at and
-                abs((existing_article.published_at - article.published_at).total_seconds()) >
-                self.config.time_window_hours * 3600):
-                continue
+        if semantic_scores is None:
+            candidates = self._find_candidates(article, existing_articles)
+        else:
+            candidates = [existing_articles[article_id] for article_id in semantic_scores
+                          if article_id in existing_articles]
+
+        # 跳过时间窗口外的文章
+        candidates = [
+            existing_article for existing_article in candidates
+            if not (existing_article.published_at and article.published_at and
+                    abs((existing_article.published_at - article.published_at).total_seconds()) >
+                    self.config.time_window_hours * 3600)
+        ]
 
+        if semantic_scores is None:
+            semantic_scores = await self._semantic_scores(fingerprint, candidates)
+
+        for existing_article in candidates:
             # 计算相似度
-            similarity = await self._calculate_similarity(article, existing_article)
+            similarity = await self._calculate_similarity(
+                article, existing_article, semantic_scores.get(existing_article.id)
+            )
+            self.stats['similarity_comparisons'] += 1
 
             if similarity > best_score:
                 best_score = similarity
@@ -276,8 +372,51 @@ class DeduplicationEngine:
             confidence=1.0 - best_score
         )
 
-    async def _calculate_similarity(self, article1: NewsArticle, article2: NewsArticle) -> float:
-        """计算两篇文章的相似度"""
+    def _find_candidates(self, article: NewsArticle, existing_articles: Dict[str, NewsArticle]) -> List[NewsArticle]:
+        """通过LSH索引查找候选重复文章，索引不可用时返回全部现有文章"""
+        if not self.use_lsh:
+            return list(existing_articles.values())
+
+        return [existing_articles[article_id] for article_id in sorted(self.lsh_index.query(article))
+                if article_id in existing_articles]
+
+    async def _semantic_scores(self, fingerprint: ContentFingerprint,
+                               candidates: List[NewsArticle]) -> Dict[str, Optional[float]]:
+        """用一次稀疏矩阵乘法计算文章与全部候选的语义相似度"""
+        if not self.vectorizer or not candidates or fingerprint.term_vector is None:
+            return {}
+
+        candidate_vectors = sparse.vstack(
+            [(await self._get_fingerprint(candidate)).term_vector for candidate in candidates], format='csr'
+        )
+        similarities = self.vectorizer.similarity(fingerprint.term_vector, candidate_vectors)[0]
+        return {candidate.id: float(score) for candidate, score in zip(candidates, similarities)}
+
+    def _create_lsh_index(self) -> MinHashLSHIndex:
+        """按配置创建LSH索引"""
+        return MinHashLSHIndex(
+            num_perm=self.config.minhash_permutations,
+            bands=self.config.lsh_bands,
+            window_seconds=self.config.time_window_hours * 3600
+        )
+
+    def _lsh_recall_sufficient(self) -> bool:
+        """
+        判断LSH候选召回是否足够
+
+        综合相似度达到阈值时，内容Jaccard相似度至少为
+        (阈值 - 其余权重之和) / 内容权重；只有该下限处的候选概率足够高时才启用LSH，
+        否则回退到逐一比较。
+        """
+        content_weight = self.similarity_weights['content']
+        min_jaccard = (self.config.similarity_threshold - (1.0 - content_weight)) / content_weight
+        if min_jaccard <= 0:
+            return False
+        return self.lsh_index.candidate_probability(min(min_jaccard, 1.0)) >= 0.99
+
+    async def _calculate_similarity(self, article1: NewsArticle, article2: NewsArticle,
+                                    semantic_similarity: Optional[float] = None) -> float:
+        """计算两篇文章的相似度，semantic_similarity 为预先计算的语义相似度"""
         try:
             # 内容相似度
             content_similarity = self._calculate_content_similarity(article1.content, article2.content)
@@ -286,10 +425,11 @@ class DeduplicationEngine:
             title_similarity = self._calculate_title_similarity(article1.title, article2.title)
 
             # 语义相似度
-            semantic_similarity = await self._calculate_semantic_similarity(article1.content, article2.content)
+            if semantic_similarity is None:
+                semantic_similarity = await self._calculate_semantic_similarity(article1.content, article2.content)
 
             # 综合相似度
-            weights = {'content': 0.5, 'title': 0.3, 'semantic': 0.2}
+            weights = self.similarity_weights
             combined_similarity = (
                 weights['content'] * content_similarity +
                 weights['title'] * title_similarity +
@@ -345,12 +485,9 @@ class DeduplicationEngine:
             return self._calculate_content_similarity(content1, content2)
 
         try:
-            # 向量化内容
-            tfidf_matrix = self.vectorizer.fit_transform([content1, content2])
-
-            # 计算余弦相似度
-            similarity_matrix = cosine_similarity(tfidf_matrix)
-            return float(similarity_matrix[0, 1])
+            # 使用语料IDF计算余弦相似度，不重新拟合
+            term_vectors = self.vectorizer.term_vectors([content1, content2])
+            return float(self.vectorizer.similarity(term_vectors[0], term_vectors[1])[0, 0])
 
         except Exception as e:
             self.logger.warning(f"语义相似度计算失败: {str(e)}")
@@ -408,8 +545,16 @@ class DeduplicationEngine:
         for fp_id in expired_fingerprints:
             del self.cache.fingerprints[fp_id]
 
+        expired_articles = [article_id for article_id, fingerprint in self.cache.article_fingerprints.items()
+                            if fingerprint.expires_at and fingerprint.expires_at < now]
+        for article_id in expired_articles:
+            del self.cache.article_fingerprints[article_id]
+
+        # 淘汰时间窗口外的LSH时间桶
+        evicted = self.lsh_index.evict_before(now - timedelta(hours=self.config.time_window_hours))
+
         self.cache.last_cleanup = now
-        self.logger.info(f"清理了 {len(expired_fingerprints)} 个过期指纹")
+        self.logger.info(f"清理了 {len(expired_fingerprints)} 个过期指纹，{evicted} 个过期索引条目")
 
     def _update_stats(self, processing_time: float):
         """更新统计信息"""
@@ -426,11 +571,15 @@ class DeduplicationEngine:
 
     def get_stats(self) -> Dict[str, Any]:
         """获取统计信息"""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats['lsh_index'] = self.lsh_index.get_stats()
+        return stats
 
     def clear_cache(self):
         """清空缓存"""
         self.cache.fingerprints.clear()
+        self.cache.article_fingerprints.clear()
         self.cache.article_groups.clear()
         self.cache.last_cleanup = datetime.now()
+        self.lsh_index.clear()
         self.logger.info("缓存已清空")
\ No newline at end of file
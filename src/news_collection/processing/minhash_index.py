@@ -0,0 +1,196 @@
+"""
+MinHash + LSH near-duplicate index with time-window buckets
+"""
+
+import zlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ..models.base import NewsArticle
+
+
+# 梅森素数 2^61 - 1，作为通用哈希族的模数
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class MinHashLSHIndex:
+    """
+    MinHash + 局部敏感哈希(LSH)近似重复索引
+
+    文章正文被切分为词级shingle，生成 num_perm 维MinHash签名，再按 bands 个分段
+    写入哈希桶；两篇文章只要有一个分段完全相同即成为候选对。桶再按发布时间
+    划分为宽度为 window_seconds 的时间桶，查询只访问相邻的三个时间桶，
+    过期时间桶可整体淘汰。
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, window_seconds: float = 24 * 3600,
+                 shingle_size: int = 1, seed: int = 42):
+        if num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) 必须能被 bands ({bands}) 整除")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.window_seconds = window_seconds
+        self.shingle_size = shingle_size
+
+        # 哈希函数 (a * x + b) mod p；a、b < 2^31 且 x < 2^32，保证uint64不溢出
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._b = generator.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+        # 时间桶 -> 每个分段的 {分段键: 文章ID集合}
+        self._buckets: Dict[Optional[int], List[Dict[bytes, Set[str]]]] = {}
+        # 文章ID -> (时间桶, 各分段键)
+        self._entries: Dict[str, Tuple[Optional[int], List[bytes]]] = {}
+        # 最近一次计算的签名，查询后紧接着加入同一篇文章时复用
+        self._last_signature: Optional[Tuple[str, str, Optional[np.ndarray]]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, article_id: str) -> bool:
+        return article_id in self._entries
+
+    def shingles(self, text: str) -> Set[str]:
+        """将文本切分为词级shingle集合"""
+        tokens = text.lower().split() if text else []
+        if self.shingle_size <= 1 or not tokens:
+            return set(tokens)
+
+        size = min(self.shingle_size, len(tokens))
+        return {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """计算文本的MinHash签名，无shingle时返回None"""
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=0)
+
+    def candidate_probability(self, jaccard: float) -> float:
+        """Jaccard相似度为 jaccard 的文章对成为候选的概率"""
+        return 1.0 - (1.0 - jaccard ** self.rows) ** self.bands
+
+    def add(self, article: NewsArticle) -> bool:
+        """将文章加入索引，已存在或无内容时返回False"""
+        if article.id in self._entries:
+            return False
+
+        signature = self._article_signature(article)
+        if signature is None:
+            return False
+
+        time_bucket = self._time_bucket(article.published_at)
+        band_keys = self._band_keys(signature)
+        tables = self._buckets.setdefault(time_bucket, [{} for _ in range(self.bands)])
+        for table, key in zip(tables, band_keys):
+            table.setdefault(key, set()).add(article.id)
+
+        self._entries[article.id] = (time_bucket, band_keys)
+        return True
+
+    def add_many(self, articles: Iterable[NewsArticle]) -> int:
+        """批量加入文章，返回新加入的数量"""
+        return sum(1 for article in articles if self.add(article))
+
+    def query(self, article: NewsArticle) -> Set[str]:
+        """查询与文章可能近似重复的文章ID（不含文章自身）"""
+        signature = self._article_signature(article)
+        if signature is None:
+            return set()
+
+        band_keys = self._band_keys(signature)
+        candidates: Set[str] = set()
+        for tables in self._candidate_tables(self._time_bucket(article.published_at)):
+            for table, key in zip(tables, band_keys):
+                matched = table.get(key)
+                if matched:
+                    candidates |= matched
+
+        candidates.discard(article.id)
+        return candidates
+
+    def remove(self, article_id: str) -> bool:
+        """从索引中移除文章"""
+        entry = self._entries.pop(article_id, None)
+        if entry is None:
+            return False
+
+        time_bucket, band_keys = entry
+        tables = self._buckets.get(time_bucket)
+        if tables:
+            for table, key in zip(tables, band_keys):
+                matched = table.get(key)
+                if matched:
+                    matched.discard(article_id)
+                    if not matched:
+                        del table[key]
+        return True
+
+    def evict_before(self, cutoff: datetime) -> int:
+        """整体淘汰早于 cutoff 所在时间桶前一个桶的所有时间桶，返回移除的文章数"""
+        cutoff_bucket = self._time_bucket(cutoff)
+        if cutoff_bucket is None:
+            return 0
+
+        cutoff_bucket -= 1
+        expired = [bucket for bucket in self._buckets if bucket is not None and bucket < cutoff_bucket]
+        for bucket in expired:
+            del self._buckets[bucket]
+
+        expired_set = set(expired)
+        expired_ids = [article_id for article_id, (bucket, _) in self._entries.items() if bucket in expired_set]
+        for article_id in expired_ids:
+            del self._entries[article_id]
+        return len(expired_ids)
+
+    def clear(self):
+        """清空索引"""
+        self._buckets.clear()
+        self._entries.clear()
+        self._last_signature = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取索引统计"""
+        return {
+            'indexed_articles': len(self._entries),
+            'time_buckets': len(self._buckets),
+            'bands': self.bands,
+            'rows_per_band': self.rows
+        }
+
+    def _article_signature(self, article: NewsArticle) -> Optional[np.ndarray]:
+        """计算文章签名，同一文章连续计算时复用结果"""
+        cached = self._last_signature
+        if cached is not None and cached[0] == article.id and cached[1] is article.content:
+            return cached[2]
+
+        signature = self.signature(article.content)
+        self._last_signature = (article.id, article.content, signature)
+        return signature
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """将签名切分为各分段的哈希键"""
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _time_bucket(self, published_at: Optional[datetime]) -> Optional[int]:
+        """计算发布时间所在的时间桶，无发布时间返回None"""
+        if published_at is None or self.window_seconds <= 0:
+            return None
+        return int(published_at.timestamp() // self.window_seconds)
+
+    def _candidate_tables(self, time_bucket: Optional[int]) -> List[List[Dict[bytes, Set[str]]]]:
+        """查询需要访问的时间桶：相邻三个时间桶加无时间桶；无发布时间时访问全部"""
+        if time_bucket is None:
+            return list(self._buckets.values())
+
+        tables = [self._buckets.get(bucket) for bucket in (time_bucket - 1, time_bucket, time_bucket + 1, None)]
+        return [table for table in tables if table is not None]
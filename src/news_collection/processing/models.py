@@ -38,6 +38,7 @@ class ContentFingerprint:
     source_fingerprint: str
     created_at: datetime
     expires_at: Optional[datetime] = None
+    term_vector: Optional[Any] = None  # 语料向量化器的稀疏词频向量
 
 
 @dataclass
@@ -107,6 +108,8 @@ class ProcessingConfig:
     semantic_threshold: float = 0.75
     cross_source_detection: bool = True
     time_window_hours: int = 24
+    minhash_permutations: int = 128
+    lsh_bands: int = 32
 
     # 噪声过滤配置
     remove_ads: bool = True
@@ -11,6 +11,7 @@ from collections import Counter
 
 from ..models.base import NewsArticle
 from .models import ProcessingConfig
+from ..utils.keyword_automaton import KeywordAutomaton
 
 
 @dataclass
@@ -92,6 +93,12 @@ class NoiseFilter:
             '紧急通知', '重要提醒', '速看', '马上删除', '内部消息',
         }
 
+        # 关键词自动机，单次扫描统计两类关键词（中文按子串匹配）
+        self.keyword_automaton = KeywordAutomaton.from_groups({
+            'irrelevant': self.irrelevant_keywords,
+            'low_quality': self.low_quality_indicators,
+        }, word_boundary=False)
+
     async def filter_noise(self, article: NewsArticle) -> Tuple[NewsArticle, NoiseFilterStats]:
         """过滤噪声内容"""
         start_time = datetime.now()
@@ -234,7 +241,7 @@ class NoiseFilter:
             return {'is_quality': False, 'reason': '重复率过高'}
 
         # 检查低质量指示词
-        low_quality_count = sum(1 for indicator in self.low_quality_indicators if indicator in content)
+        low_quality_count = len(self.keyword_automaton.distinct_by_payload(content).get('low_quality', ()))
         if low_quality_count > 2:  # 超过2个低质量指示词
             return {'is_quality': False, 'reason': '包含过多低质量指示词'}
 
@@ -243,7 +250,7 @@ class NoiseFilter:
     async def _check_content_relevance(self, content: str, category) -> Dict[str, Any]:
         """检查内容相关性"""
         # 检查不相关关键词
-        irrelevant_count = sum(1 for keyword in self.irrelevant_keywords if keyword in content)
+        irrelevant_count = len(self.keyword_automaton.distinct_by_payload(content).get('irrelevant', ()))
         if irrelevant_count > 3:  # 超过3个不相关关键词
             return {'is_relevant': False, 'reason': '包含过多不相关关键词'}
 
@@ -112,6 +112,21 @@ class TestNewsSourceAdapter:
         assert adapter.source_name == "mock_source"
         assert adapter.adapter_type == "mock_adapter"
 
+    @pytest.mark.asyncio
+    async def test_body_fetching_opt_out(self, config):
+        """测试关闭 fetch_article_bodies 时不抓取详情页"""
+        config.fetch_article_bodies = False
+        adapter = MockNewsSourceAdapter(config)
+        adapter.session = Mock()
+        adapter.body_fetcher = Mock()
+        adapter.body_fetcher.fetch_bodies = AsyncMock(return_value=1)
+
+        articles = [NewsArticle(id="1", title="Title", content="", url="https://example.com/a")]
+        enriched = await adapter._enrich_article_bodies(articles)
+
+        assert enriched == 0
+        adapter.body_fetcher.fetch_bodies.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_adapter_connect_disconnect(self, adapter):
         """测试连接和断开"""
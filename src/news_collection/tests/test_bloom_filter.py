@@ -0,0 +1,72 @@
+"""
+Tests for bloom filters
+"""
+
+import unittest
+from datetime import datetime, timedelta
+
+from ..utils.bloom_filter import BloomFilter, RotatingBloomFilter
+
+
+class TestBloomFilter(unittest.TestCase):
+    """测试布隆过滤器"""
+
+    def test_no_false_negatives(self):
+        """测试已添加的键全部命中"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f"https://example.com/{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        self.assertTrue(all(key in bloom for key in keys))
+        self.assertEqual(len(bloom), 1000)
+
+    def test_false_positive_rate(self):
+        """测试误判率接近目标值"""
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        for i in range(2000):
+            bloom.add(f"seen-{i}")
+
+        false_positives = sum(1 for i in range(10000) if f"unseen-{i}" in bloom)
+
+        self.assertLess(false_positives / 10000, 0.03)
+        # 每个键约10位，远小于字典中保存URL的开销
+        self.assertLess(bloom.memory_bytes, 2000 * 2)
+
+
+class TestRotatingBloomFilter(unittest.TestCase):
+    """测试按时间分区的布隆过滤器"""
+
+    def test_partitions_and_expire(self):
+        """测试键写入时间所在分区，过期时整块丢弃"""
+        bloom = RotatingBloomFilter(partition_seconds=86400, capacity_per_partition=100)
+        now = datetime.now()
+        bloom.add("old", now - timedelta(days=20))
+        bloom.add("recent", now - timedelta(days=1))
+        bloom.add("current")
+
+        self.assertEqual(len(bloom.partitions), 3)
+        self.assertIn("old", bloom)
+
+        dropped = bloom.expire(now - timedelta(days=15))
+
+        self.assertEqual(dropped, 1)
+        self.assertNotIn("old", bloom)
+        self.assertIn("recent", bloom)
+        self.assertIn("current", bloom)
+
+    def test_expire_keeps_partition_containing_cutoff(self):
+        """测试包含截止时间的分区保留，不产生漏判"""
+        bloom = RotatingBloomFilter(partition_seconds=3600, capacity_per_partition=100)
+        cutoff = datetime(2024, 1, 1, 12, 30)
+        bloom.add("after-cutoff", datetime(2024, 1, 1, 12, 45))
+        bloom.add("same-partition-before-cutoff", datetime(2024, 1, 1, 12, 5))
+
+        bloom.expire(cutoff)
+
+        self.assertIn("after-cutoff", bloom)
+        self.assertIn("same-partition-before-cutoff", bloom)
+
+
+if __name__ == '__main__':
+    unittest.main()
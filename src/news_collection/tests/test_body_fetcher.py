@@ -0,0 +1,170 @@
+"""
+Tests for article body fetcher
+"""
+
+import unittest
+import asyncio
+from datetime import datetime
+
+from ..core.body_fetcher import ArticleBodyExtractor, ArticleBodyFetcher
+from ..models.base import NewsArticle
+
+
+class FakeStream:
+    """按块返回HTML的响应体"""
+
+    def __init__(self, body: bytes, chunk_size: int):
+        self.chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+        self.read_chunks = 0
+
+    async def iter_chunked(self, size):
+        for chunk in self.chunks:
+            self.read_chunks += 1
+            await asyncio.sleep(0)
+            yield chunk
+
+    def at_eof(self):
+        return self.read_chunks >= len(self.chunks)
+
+
+class FakeResponse:
+    def __init__(self, status, body=b"", headers=None, chunk_size=64):
+        self.status = status
+        self.headers = headers or {}
+        self.charset = 'utf-8'
+        self.content = FakeStream(body, chunk_size)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeSession:
+    """记录请求头和并发数的会话"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, dict(headers or {})))
+        return _TrackedRequest(self, url, headers or {})
+
+
+class _TrackedRequest:
+    def __init__(self, session, url, headers):
+        self.session = session
+        self.url = url
+        self.headers = headers
+
+    async def __aenter__(self):
+        self.session.active += 1
+        self.session.max_active = max(self.session.max_active, self.session.active)
+        await asyncio.sleep(0.01)
+        return self.session.handler(self.url, self.headers)
+
+    async def __aexit__(self, *args):
+        self.session.active -= 1
+        return False
+
+
+ARTICLE_HTML = (
+    "<html><head><script>var x = 1;</script></head><body>"
+    "<nav><p>菜单</p></nav>"
+    "<div class=\"post-content\"><p>First paragraph.</p><figure><p>caption</p></figure>"
+    "<p>Second <b>bold</b> paragraph.</p></div>"
+    "<footer><p>Footer text</p></footer>"
+    + "<p>filler</p>" * 200 +
+    "</body></html>"
+).encode('utf-8')
+
+
+def make_article(url: str) -> NewsArticle:
+    return NewsArticle(id=url, title="title", content="", url=url,
+                       source="test", published_at=datetime.now())
+
+
+class TestArticleBodyExtractor(unittest.TestCase):
+    """测试流式正文提取"""
+
+    def test_stops_after_container(self):
+        """测试正文节点闭合后停止解析"""
+        extractor = ArticleBodyExtractor(container_hints=["post-content"])
+        extractor.feed(ARTICLE_HTML.decode('utf-8'))
+
+        self.assertTrue(extractor.finished)
+        self.assertEqual(extractor.get_text(), "First paragraph.\n\nSecond bold paragraph.")
+
+    def test_fallback_paragraphs(self):
+        """测试没有正文节点时退回全文段落"""
+        extractor = ArticleBodyExtractor()
+        extractor.feed("<div><p>One</p><script>ignored()</script><p>Two</p></div>")
+        extractor.close()
+
+        self.assertFalse(extractor.finished)
+        self.assertEqual(extractor.get_text(), "One\n\nTwo")
+
+
+class TestArticleBodyFetcher(unittest.TestCase):
+    """测试正文抓取器"""
+
+    def test_streaming_stops_early_and_fills_content(self):
+        """测试流式读取提前结束并填充文章正文"""
+        session = FakeSession(lambda url, headers: FakeResponse(200, ARTICLE_HTML))
+        fetcher = ArticleBodyFetcher(container_hints=["post-content"], chunk_size=64)
+        articles = [make_article("https://example.com/a")]
+
+        enriched = asyncio.run(fetcher.fetch_bodies(session, articles))
+
+        self.assertEqual(enriched, 1)
+        self.assertIn("First paragraph.", articles[0].content)
+        self.assertTrue(articles[0].metadata["body_fetched"])
+        self.assertEqual(fetcher.stats['early_stops'], 1)
+
+    def test_per_host_limit(self):
+        """测试每个主机的并发限制"""
+        session = FakeSession(lambda url, headers: FakeResponse(200, b"<article><p>x</p></article>"))
+        fetcher = ArticleBodyFetcher(max_concurrency=10, per_host_limit=2)
+        articles = [make_article(f"https://example.com/{i}") for i in range(6)]
+
+        enriched = asyncio.run(fetcher.fetch_bodies(session, articles))
+
+        self.assertEqual(enriched, 6)
+        self.assertEqual(session.max_active, 2)
+
+    def test_conditional_request_reuses_cache(self):
+        """测试304响应复用缓存正文"""
+        def handler(url, headers):
+            if headers.get('If-None-Match') == '"v1"':
+                return FakeResponse(304)
+            return FakeResponse(200, b"<article><p>Cached body</p></article>", headers={'ETag': '"v1"'})
+
+        session = FakeSession(handler)
+        fetcher = ArticleBodyFetcher()
+        url = "https://example.com/a"
+
+        first = asyncio.run(fetcher.fetch_body(session, url))
+        second = asyncio.run(fetcher.fetch_body(session, url))
+
+        self.assertEqual(first, "Cached body")
+        self.assertEqual(second, "Cached body")
+        self.assertEqual(session.requests[1][1]['If-None-Match'], '"v1"')
+        self.assertEqual(fetcher.stats['not_modified'], 1)
+
+    def test_multibyte_characters_split_across_chunks(self):
+        """测试跨块的多字节字符完整解码"""
+        body = "<article><p>比特币价格上涨</p></article>".encode('utf-8')
+        session = FakeSession(lambda url, headers: FakeResponse(200, body, chunk_size=5))
+        fetcher = ArticleBodyFetcher(chunk_size=5)
+
+        content = asyncio.run(fetcher.fetch_body(session, "https://example.com/a"))
+
+        self.assertEqual(content, "比特币价格上涨")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Tests for corpus vectorizer
+"""
+
+import unittest
+import asyncio
+from datetime import datetime
+
+import numpy as np
+
+from ..processing.corpus_vectorizer import CorpusVectorizer
+from ..processing.deduplication_engine import DeduplicationEngine
+from ..processing.models import ProcessingConfig
+from ..models.base import NewsArticle
+
+
+class TestCorpusVectorizer(unittest.TestCase):
+    """测试语料级向量化器"""
+
+    def setUp(self):
+        """测试设置"""
+        self.vectorizer = CorpusVectorizer()
+        self.texts = [
+            "Bitcoin price surged as institutional adoption increases",
+            "Bitcoin price reached new levels with institutional interest",
+            "Ethereum developers released protocol improvements"
+        ]
+
+    def test_partial_fit_document_frequency(self):
+        """测试文档频率增量累加"""
+        term_vectors = self.vectorizer.term_vectors(self.texts)
+        self.vectorizer.partial_fit(term_vectors)
+        self.vectorizer.partial_fit(term_vectors[:1])
+
+        bitcoin = self.vectorizer.term_vectors(["bitcoin"]).indices[0]
+        self.assertEqual(self.vectorizer.document_count, 4)
+        self.assertEqual(self.vectorizer.document_frequency[bitcoin], 3)
+
+    def test_idf_downweights_common_terms(self):
+        """测试常见词的IDF权重更低"""
+        self.vectorizer.partial_fit(self.vectorizer.term_vectors(self.texts))
+        idf = self.vectorizer.idf()
+
+        bitcoin = self.vectorizer.term_vectors(["bitcoin"]).indices[0]
+        ethereum = self.vectorizer.term_vectors(["ethereum"]).indices[0]
+        self.assertLess(idf[bitcoin], idf[ethereum])
+
+    def test_similarity_block_matches_pairs(self):
+        """测试相似度矩阵与逐对计算一致"""
+        term_vectors = self.vectorizer.term_vectors(self.texts)
+        self.vectorizer.partial_fit(term_vectors)
+
+        block = self.vectorizer.similarity(term_vectors, term_vectors)
+        pairs = self.vectorizer.pairwise_similarity(term_vectors, np.array([1, 2, 2]), np.array([0, 0, 1]))
+
+        np.testing.assert_allclose(np.diag(block), 1.0)
+        np.testing.assert_allclose(pairs, [block[1, 0], block[2, 0], block[2, 1]])
+        self.assertGreater(block[1, 0], block[2, 0])
+
+    def test_pairwise_similarity_chunked(self):
+        """测试分块计算与整体计算一致"""
+        term_vectors = self.vectorizer.term_vectors(self.texts)
+        self.vectorizer.partial_fit(term_vectors)
+        rows, cols = np.array([1, 2, 2]), np.array([0, 0, 1])
+
+        np.testing.assert_allclose(self.vectorizer.pairwise_similarity(term_vectors, rows, cols, chunk_size=2),
+                                   self.vectorizer.pairwise_similarity(term_vectors, rows, cols))
+
+    def test_vector_hash(self):
+        """测试相同内容的向量哈希一致"""
+        hash1 = CorpusVectorizer.vector_hash(self.vectorizer.term_vectors(self.texts[:1]))
+        hash2 = CorpusVectorizer.vector_hash(self.vectorizer.term_vectors(self.texts[:1]))
+        hash3 = CorpusVectorizer.vector_hash(self.vectorizer.term_vectors(self.texts[1:2]))
+
+        self.assertEqual(hash1, hash2)
+        self.assertNotEqual(hash1, hash3)
+
+
+class TestDeduplicationEngineCorpusVectors(unittest.TestCase):
+    """测试去重引擎复用语料向量"""
+
+    def setUp(self):
+        """测试设置"""
+        self.engine = DeduplicationEngine(ProcessingConfig())
+        self.articles = [
+            NewsArticle(
+                id=f"article_{i}",
+                title=f"Market update {i}",
+                content=" ".join(f"topic{i}_{j}" for j in range(40)) + " bitcoin market",
+                published_at=datetime(2024, 1, 1, 12)
+            )
+            for i in range(20)
+        ]
+
+    def test_term_vector_cached_on_fingerprint(self):
+        """测试每篇文章的词频向量只计算并计入语料一次"""
+        fingerprint = asyncio.run(self.engine._get_fingerprint(self.articles[0]))
+        self.assertIsNotNone(fingerprint.term_vector)
+
+        asyncio.run(self.engine.deduplicate(self.articles[1], self.articles[:1]))
+        asyncio.run(self.engine.deduplicate(self.articles[2], self.articles[:2]))
+
+        self.assertIs(asyncio.run(self.engine._get_fingerprint(self.articles[0])), fingerprint)
+        self.assertEqual(self.engine.vectorizer.document_count, 3)
+
+    def test_batch_scores_match_single_path(self):
+        """测试批量语义相似度与单篇路径一致"""
+        near = NewsArticle(
+            id="near",
+            title=self.articles[3].title,
+            content=self.articles[3].content.replace("topic3_0 ", "update "),
+            published_at=datetime(2024, 1, 1, 13)
+        )
+        articles = self.articles + [near]
+
+        batch_scores = asyncio.run(self.engine._batch_semantic_scores(articles))
+        self.assertEqual(self.engine.vectorizer.document_count, len(articles))
+        self.assertEqual(set(batch_scores[-1]), {"article_3"})
+
+        fingerprint = asyncio.run(self.engine._get_fingerprint(near))
+        single_scores = asyncio.run(self.engine._semantic_scores(fingerprint, [self.articles[3]]))
+        self.assertAlmostEqual(batch_scores[-1]["article_3"], single_scores["article_3"])
+
+    def test_batch_without_lsh_defers_to_per_article_comparison(self):
+        """测试关闭LSH时不展开O(n²)候选对，只批量预计算词频向量"""
+        engine = DeduplicationEngine(ProcessingConfig(similarity_threshold=0.4))
+        batch_scores = asyncio.run(engine._batch_semantic_scores(self.articles[:5]))
+
+        self.assertEqual(batch_scores, [None] * 5)
+        self.assertEqual(engine.vectorizer.document_count, 5)
+
+        results = asyncio.run(engine.batch_deduplicate(self.articles[:5]))
+        self.assertEqual(len(results), 5)
+        self.assertEqual(engine.vectorizer.document_count, 5)
+
+if __name__ == '__main__':
+    unittest.main()
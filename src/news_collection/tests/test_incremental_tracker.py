@@ -307,10 +307,8 @@ class TestIncrementalTracker(unittest.TestCase):
         # 保存数据
         self.loop.run_until_complete(self.tracker._save_data())
 
-        # 验证文件已创建
-        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'fingerprints.pkl')))
-        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'tracking.json')))
-        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'indexes.json')))
+        # 验证数据库已创建
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'tracker.db')))
 
         # 创建新的跟踪器实例
         new_tracker = IncrementalTracker(self.config)
@@ -322,6 +320,77 @@ class TestIncrementalTracker(unittest.TestCase):
         self.assertEqual(len(new_tracker.article_fingerprints), 1)
         self.assertEqual(len(new_tracker.source_tracking), 1)
         self.assertIn("coindesk", new_tracker.source_tracking)
+        self.assertTrue(new_tracker.is_duplicate(self.test_articles[0]))
+        self.assertEqual(new_tracker.source_tracking["coindesk"].last_article_id, "article123")
+
+    def test_persistence_writes_only_changes(self):
+        """测试持久化只写入增量变更"""
+        self.tracker.track_article(self.test_articles[0])
+        self.loop.run_until_complete(self.tracker._save_data())
+
+        # 没有变更时不写入
+        with patch.object(self.tracker.store, 'write_changes') as write_changes:
+            self.loop.run_until_complete(self.tracker._save_data())
+            write_changes.assert_not_called()
+
+            self.tracker.track_article(self.test_articles[1])
+            self.loop.run_until_complete(self.tracker._save_data())
+
+            upserts, deletes, sources = write_changes.call_args[0]
+            self.assertEqual(len(upserts), 1)
+            self.assertEqual(upserts[0][4], self.test_articles[1].url)
+            self.assertEqual(deletes, [])
+            self.assertEqual(sources, [])
+
+    def test_persistence_removes_expired_articles(self):
+        """测试移除的文章同步从存储中删除，窗口外的文章不再加载"""
+        self.tracker.track_article(self.test_articles[0])
+        fingerprint_id = self.tracker.track_article(self.test_articles[1])
+        self.tracker.article_fingerprints[fingerprint_id].created_at = datetime.now() - timedelta(days=20)
+        self.loop.run_until_complete(self.tracker._save_data())
+
+        new_tracker = IncrementalTracker(self.config)
+        self.loop.run_until_complete(new_tracker._load_data())
+        self.assertEqual(len(new_tracker.article_fingerprints), 1)
+        self.assertEqual(new_tracker.store.count_fingerprints(), 1)
+
+        new_tracker.remove_expired_articles(datetime.now() + timedelta(days=1))
+        self.loop.run_until_complete(new_tracker._save_data())
+        self.assertEqual(new_tracker.store.count_fingerprints(), 0)
+
+    def test_legacy_files_migrated(self):
+        """测试旧版全量文件导入存储"""
+        import json
+        import pickle
+
+        fingerprint_id = self.tracker.get_fingerprint(self.test_articles[0])
+        fingerprint = ArticleFingerprint(
+            title_hash="title",
+            content_hash="content",
+            source="coindesk",
+            url=self.test_articles[0].url,
+            published_at=datetime.now(),
+            created_at=datetime.now()
+        )
+        with open(os.path.join(self.temp_dir, 'fingerprints.pkl'), 'wb') as f:
+            pickle.dump({fingerprint_id: fingerprint}, f)
+        with open(os.path.join(self.temp_dir, 'tracking.json'), 'w', encoding='utf-8') as f:
+            json.dump({"coindesk": {
+                'source_name': "coindesk",
+                'last_collection_time': None,
+                'last_article_id': None,
+                'total_articles_collected': 3,
+                'last_successful_collection': None,
+                'consecutive_failures': 0,
+                'collection_stats': {}
+            }}, f)
+
+        self.loop.run_until_complete(self.tracker._load_data())
+
+        self.assertTrue(self.tracker.is_duplicate(self.test_articles[0]))
+        self.assertEqual(self.tracker.source_tracking["coindesk"].total_articles_collected, 3)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, 'fingerprints.pkl')))
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, 'fingerprints.pkl.migrated')))
 
     def test_export_data(self):
         """测试数据导出"""
@@ -381,5 +450,81 @@ class TestIncrementalTracker(unittest.TestCase):
         self.assertEqual(tracking_info.collection_stats[collection_time.strftime('%Y-%m-%d')], 15)
 
 
+    def test_bloom_filter_front(self):
+        """测试布隆过滤器未命中时不查询精确索引"""
+        self.tracker.track_article(self.test_articles[0])
+        self.assertIn(f"url:{self.test_articles[0].url}", self.tracker.seen_filter)
+
+        # 精确索引中存在但布隆过滤器中没有的键视为未见过
+        self.tracker.url_index["https://example.com/untracked"] = "fingerprint"
+        article = NewsArticle(id="9", title="Untracked", content="", url="https://example.com/untracked")
+        self.assertFalse(self.tracker.is_duplicate(article))
+
+    def test_evicted_articles_checked_in_store(self):
+        """测试移出内存的文章仍能通过存储检测为重复"""
+        self.tracker.max_articles_in_memory = 1
+        self.tracker.track_article(self.test_articles[0])
+        self.tracker.track_article(self.test_articles[1])
+        self.loop.run_until_complete(self.tracker._save_data())
+
+        evicted = self.tracker._evict_persisted_articles()
+
+        self.assertEqual(evicted, 1)
+        self.assertEqual(len(self.tracker.article_fingerprints), 1)
+        self.assertEqual(len(self.tracker.url_index), 1)
+        self.assertIsNone(self.tracker.is_duplicate(self.test_articles[0]))
+        self.assertTrue(self.loop.run_until_complete(self.tracker.confirm_duplicate(self.test_articles[0])))
+        self.assertTrue(self.tracker.is_duplicate(self.test_articles[1]))
+        self.assertEqual(self.tracker.get_statistics()['total_articles_tracked'], 2)
+
+        start_time = datetime.now() - timedelta(days=1)
+        self.assertEqual(len(self.tracker.get_articles_in_window(start_time, datetime.now())), 2)
+
+    def test_confirm_duplicate_queries_store(self):
+        """测试精确检查在存储中确认只保存在存储中的文章，并排除布隆过滤器误判"""
+        self.tracker.max_articles_in_memory = 1
+        self.tracker.track_article(self.test_articles[0])
+        self.tracker.track_article(self.test_articles[1])
+        self.loop.run_until_complete(self.tracker._save_data())
+        self.tracker._evict_persisted_articles()
+
+        # 模拟布隆过滤器误判：键在过滤器中但从未跟踪过
+        article = NewsArticle(id="9", title="Untracked", content="", url="https://example.com/untracked")
+        self.tracker.seen_filter.add(f"url:{article.url}", datetime.now())
+
+        self.assertIsNone(self.tracker.is_duplicate(article))
+        self.assertFalse(self.loop.run_until_complete(self.tracker.confirm_duplicate(article)))
+        self.assertTrue(self.loop.run_until_complete(self.tracker.confirm_duplicate(self.test_articles[0])))
+        self.assertTrue(self.loop.run_until_complete(self.tracker.confirm_duplicate(self.test_articles[1])))
+
+    def test_bloom_false_positive_not_dropped(self):
+        """测试布隆过滤器误判的新文章不会被判定为重复"""
+        self.tracker.max_articles_in_memory = 1
+        self.tracker.track_article(self.test_articles[0])
+        self.tracker.track_article(self.test_articles[1])
+        self.loop.run_until_complete(self.tracker._save_data())
+        self.tracker._evict_persisted_articles()
+
+        article = NewsArticle(id="10", title="Colliding", content="", source="Other")
+        self.tracker.seen_filter.add(f"title:{self.tracker._generate_hash(article.title)}_{article.source}",
+                                     datetime.now())
+
+        self.assertIsNot(self.tracker.is_duplicate(article), True)
+        self.assertFalse(self.loop.run_until_complete(self.tracker.confirm_duplicate(article)))
+
+    def test_load_keeps_newest_in_memory(self):
+        """测试加载时全部文章进入布隆过滤器，内存中只保留最新的文章"""
+        self.tracker.track_article(self.test_articles[0])
+        self.tracker.track_article(self.test_articles[1])
+        self.loop.run_until_complete(self.tracker._save_data())
+
+        new_tracker = IncrementalTracker(dict(self.config, max_articles_in_memory=1))
+        self.loop.run_until_complete(new_tracker._load_data())
+
+        self.assertEqual(len(new_tracker.article_fingerprints), 1)
+        self.assertEqual(new_tracker.evicted_articles, 1)
+        self.assertTrue(self.loop.run_until_complete(new_tracker.confirm_duplicate(self.test_articles[0])))
+        self.assertTrue(self.loop.run_until_complete(new_tracker.confirm_duplicate(self.test_articles[1])))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
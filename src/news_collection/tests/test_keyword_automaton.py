@@ -0,0 +1,128 @@
+"""
+Tests for keyword automaton
+"""
+
+import unittest
+import asyncio
+from unittest.mock import Mock
+
+from ..utils.keyword_automaton import KeywordAutomaton, KeywordMatch
+from ..collection.relevance_filter import RelevanceFilter
+from ..processing.noise_filter import NoiseFilter
+from ..processing.models import ProcessingConfig
+from ..llm.entity_extractor import EntityExtractor, EntityConfig
+from ..llm.llm_connector import LLMConnector
+
+
+class TestKeywordAutomaton(unittest.TestCase):
+    """测试关键词自动机"""
+
+    def test_word_boundary_and_case(self):
+        """测试单词边界和大小写不敏感"""
+        automaton = KeywordAutomaton.from_groups({'crypto': ['bitcoin', 'ETH']})
+
+        matches = automaton.find_all("Bitcoin and eth rally; ethereum and bitcoins do not count")
+
+        self.assertEqual([(m.keyword, m.start, m.end) for m in matches], [('bitcoin', 0, 7), ('eth', 12, 15)])
+        self.assertEqual(matches[0].payloads, ('crypto',))
+        self.assertIn('Bitcoin', automaton)
+        self.assertEqual(len(automaton), 2)
+
+    def test_longest_match_and_contained_keywords(self):
+        """测试最长匹配以及被包含关键词的标签展开"""
+        automaton = KeywordAutomaton()
+        automaton.add_keywords(['bitcoin cash'], 'BCH')
+        automaton.add_keywords(['bitcoin'], 'BTC')
+        automaton.add_keywords(['bitcoin', 'cash'], 'terms')
+        automaton.add_keywords(['bitcoin cash'], 'terms')
+
+        matches = automaton.find_all("Bitcoin Cash")
+
+        self.assertEqual(matches[0], KeywordMatch('bitcoin cash', 0, 12, ('BCH', 'terms')))
+        # 内层关键词只保留外层匹配未覆盖的标签
+        self.assertEqual(matches[1], KeywordMatch('bitcoin', 0, 7, ('BTC',)))
+        self.assertEqual(automaton.count_by_payload("Bitcoin Cash"), {'BCH': 1, 'terms': 1, 'BTC': 1})
+
+    def test_substring_mode(self):
+        """测试无单词边界的子串匹配（中文关键词）"""
+        automaton = KeywordAutomaton.from_groups({
+            'low_quality': ['震惊', '内幕'],
+            'irrelevant': ['股票']
+        }, word_boundary=False)
+
+        distinct = automaton.distinct_by_payload("震惊！股票内幕，震惊")
+
+        self.assertEqual(distinct, {'low_quality': {'震惊', '内幕'}, 'irrelevant': {'股票'}})
+        self.assertEqual(automaton.count_by_payload("震惊！股票内幕，震惊")['low_quality'], 3)
+
+    def test_keywords_added_after_compile(self):
+        """测试编译后新增关键词会重新编译"""
+        automaton = KeywordAutomaton.from_groups({'a': ['alpha']})
+        self.assertEqual(automaton.find_all("alpha beta"), [KeywordMatch('alpha', 0, 5, ('a',))])
+
+        automaton.add_keyword('beta', 'b')
+
+        self.assertEqual([m.keyword for m in automaton.find_all("alpha beta")], ['alpha', 'beta'])
+        self.assertEqual(automaton.find_all(""), [])
+
+
+class TestKeywordAutomatonConsumers(unittest.TestCase):
+    """测试使用关键词自动机的组件"""
+
+    def test_relevance_filter_counts(self):
+        """测试相关性过滤器单次扫描得到加密货币和关键词匹配"""
+        relevance_filter = RelevanceFilter({})
+        counts, keywords = relevance_filter._match_keywords("Bitcoin BTC price rally, bitcoin ETF approved")
+
+        self.assertEqual(counts[('crypto', 'BTC')], 3)
+        self.assertIn('price', keywords)
+        self.assertIn('rally', keywords)
+
+        score, symbols = relevance_filter._score_crypto_matches(counts)
+        self.assertEqual(symbols, ['BTC'])
+        self.assertGreater(score, 0)
+
+    def test_relevance_filter_database_update(self):
+        """测试更新加密货币数据库后自动机同步更新"""
+        relevance_filter = RelevanceFilter({})
+        relevance_filter.update_crypto_database({
+            'NEWC': {'name': 'Newcoin', 'aliases': ['newcoin', 'newc'], 'priority': 5}
+        })
+
+        counts, _ = relevance_filter._match_keywords("Newcoin launches")
+
+        self.assertEqual(counts[('crypto', 'NEWC')], 1)
+
+    def test_noise_filter_keyword_checks(self):
+        """测试噪声过滤器按不同关键词数判断"""
+        noise_filter = NoiseFilter(ProcessingConfig())
+
+        relevance = asyncio.run(noise_filter._check_content_relevance("彩票 赌博 股票 基金 股票", None))
+        self.assertFalse(relevance['is_relevant'])
+
+        relevance = asyncio.run(noise_filter._check_content_relevance("股票 股票 股票 股票 基金", None))
+        self.assertTrue(relevance['is_relevant'])
+
+    def test_entity_extractor_basic_extraction(self):
+        """测试基础实体提取"""
+        extractor = EntityExtractor(Mock(spec=LLMConnector), EntityConfig())
+
+        result = extractor._basic_entity_extraction("Coinbase lists Bitcoin and uses blockchain")
+        entities = {(entity['normalized_form'], entity['type']) for entity in result['entities']}
+
+        self.assertIn(('BITCOIN', 'cryptocurrency'), entities)
+        self.assertIn(('Coinbase', 'company'), entities)
+        self.assertIn(('blockchain', 'technology'), entities)
+
+    def test_entity_extractor_word_bounded_matching(self):
+        """测试基础实体提取按单词边界匹配，较长的同类关键词优先"""
+        extractor = EntityExtractor(Mock(spec=LLMConnector), EntityConfig())
+
+        result = extractor._basic_entity_extraction("Bitcoins move together; Bitcoin Cash and ETH rally")
+        entities = [(entity['text'], entity['start_position']) for entity in result['entities']]
+
+        self.assertEqual(entities, [('bitcoin cash', 24), ('eth', 41)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Tests for MinHash LSH index
+"""
+
+import unittest
+import asyncio
+from datetime import datetime, timedelta
+
+from ..processing.minhash_index import MinHashLSHIndex
+from ..processing.deduplication_engine import DeduplicationEngine
+from ..processing.models import ProcessingConfig
+from ..models.base import NewsArticle
+
+
+def make_article(article_id: str, content: str, published_at: datetime = None) -> NewsArticle:
+    """创建测试文章"""
+    return NewsArticle(
+        id=article_id,
+        title=f"Title {article_id}",
+        content=content,
+        published_at=published_at or datetime(2024, 1, 1, 12)
+    )
+
+
+class TestMinHashLSHIndex(unittest.TestCase):
+    """测试MinHash LSH索引"""
+
+    def setUp(self):
+        """测试设置"""
+        self.index = MinHashLSHIndex(num_perm=128, bands=32, window_seconds=3600)
+        self.base_words = [f"word{i}" for i in range(100)]
+        self.article = make_article("base", " ".join(self.base_words))
+
+    def test_signature_estimates_jaccard(self):
+        """测试签名相同位置比例近似Jaccard相似度"""
+        other = " ".join(self.base_words[:80] + [f"other{i}" for i in range(20)])
+        signature1 = self.index.signature(self.article.content)
+        signature2 = self.index.signature(other)
+
+        # 真实Jaccard = 80 / 120
+        estimate = float((signature1 == signature2).mean())
+        self.assertAlmostEqual(estimate, 80 / 120, delta=0.15)
+        self.assertIsNone(self.index.signature(""))
+
+    def test_query_near_duplicate(self):
+        """测试近似重复成为候选而无关文章不会"""
+        self.index.add(self.article)
+        near = make_article("near", " ".join(self.base_words[:95] + ["changed"] * 5))
+        unrelated = make_article("unrelated", " ".join(f"token{i}" for i in range(100)))
+
+        self.assertEqual(self.index.query(near), {"base"})
+        self.assertEqual(self.index.query(unrelated), set())
+        self.assertEqual(self.index.query(self.article), set())
+
+    def test_time_buckets(self):
+        """测试只查询相邻时间桶"""
+        self.index.add(self.article)
+        later = make_article("later", self.article.content, self.article.published_at + timedelta(hours=1))
+        far = make_article("far", self.article.content, self.article.published_at + timedelta(hours=3))
+        undated = make_article("undated", self.article.content)
+        undated.published_at = None
+
+        self.assertEqual(self.index.query(later), {"base"})
+        self.assertEqual(self.index.query(far), set())
+        self.assertEqual(self.index.query(undated), {"base"})
+
+    def test_remove_and_evict(self):
+        """测试移除和按时间桶淘汰"""
+        old = make_article("old", self.article.content, self.article.published_at - timedelta(hours=5))
+        self.assertEqual(self.index.add_many([self.article, old, self.article]), 2)
+
+        self.assertEqual(self.index.evict_before(self.article.published_at), 1)
+        self.assertNotIn("old", self.index)
+        self.assertTrue(self.index.remove("base"))
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.query(self.article), set())
+
+    def test_candidate_probability(self):
+        """测试候选概率的S曲线"""
+        self.assertGreater(self.index.candidate_probability(0.7), 0.999)
+        self.assertLess(self.index.candidate_probability(0.1), 0.01)
+
+
+class TestDeduplicationEngineLSH(unittest.TestCase):
+    """测试去重引擎使用LSH候选"""
+
+    def setUp(self):
+        """测试设置"""
+        self.engine = DeduplicationEngine(ProcessingConfig())
+        self.articles = []
+        for i in range(200):
+            words = [f"topic{i}_{j}" for j in range(60)]
+            self.articles.append(make_article(f"article_{i}", " ".join(words)))
+
+    def test_lsh_enabled_for_default_threshold(self):
+        """测试默认阈值启用LSH，低阈值回退到逐一比较"""
+        self.assertTrue(self.engine.use_lsh)
+        self.assertFalse(DeduplicationEngine(ProcessingConfig(similarity_threshold=0.4)).use_lsh)
+
+    def test_only_candidates_compared(self):
+        """测试只与候选文章计算精确相似度"""
+        duplicate = make_article("duplicate", self.articles[42].content)
+        duplicate.title = self.articles[42].title
+
+        result = asyncio.run(self.engine.deduplicate(duplicate, self.articles))
+
+        self.assertTrue(result.is_duplicate)
+        self.assertEqual(result.matched_articles, ["article_42"])
+        self.assertEqual(self.engine.stats['similarity_comparisons'], 1)
+
+    def test_batch_deduplicate(self):
+        """测试批量去重检测近似重复"""
+        near = make_article("near", self.articles[7].content.replace("topic7_0 ", "update "))
+        near.title = self.articles[7].title
+
+        results = asyncio.run(self.engine.batch_deduplicate(self.articles + [near]))
+
+        self.assertEqual(sum(result.is_duplicate for result in results), 1)
+        self.assertTrue(results[-1].is_duplicate)
+        self.assertEqual(results[-1].duplicate_group_id, "article_7")
+        self.assertLess(self.engine.stats['similarity_comparisons'], 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
 from .rate_limiter import RateLimiter
+from .keyword_automaton import KeywordAutomaton, KeywordMatch
+from .bloom_filter import BloomFilter, RotatingBloomFilter
 
-__all__ = ["RateLimiter"]
\ No newline at end of file
+__all__ = ["RateLimiter", "KeywordAutomaton", "KeywordMatch", "BloomFilter", "RotatingBloomFilter"]
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Bloom filters for approximate membership checks in deduplication
+"""
+
+import hashlib
+import math
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+
+class BloomFilter:
+    """
+    布隆过滤器
+
+    按容量和目标误判率确定位数组大小和哈希次数，使用双重哈希生成探测位置。
+    只会误判"可能存在"，不会漏判已添加的键。
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+
+        self.num_bits = max(8, int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / self.capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def add(self, key: str):
+        """添加键"""
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        """双重哈希：h1 + i * h2"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+
+class RotatingBloomFilter:
+    """
+    按时间分区的滚动布隆过滤器
+
+    每个分区覆盖固定时长，键按其时间戳写入对应分区，查询时检查全部分区。
+    过期时整块丢弃完全早于截止时间的分区，内存随滚动窗口而非历史总量增长。
+    """
+
+    def __init__(self, partition_seconds: float, capacity_per_partition: int, error_rate: float = 0.01):
+        self.partition_seconds = partition_seconds
+        self.capacity_per_partition = capacity_per_partition
+        self.error_rate = error_rate
+        self.partitions: Dict[int, BloomFilter] = {}
+
+    def add(self, key: str, timestamp: Optional[datetime] = None):
+        """添加键到时间戳所在的分区"""
+        bucket = self._bucket(timestamp or datetime.now())
+        partition = self.partitions.get(bucket)
+        if partition is None:
+            partition = BloomFilter(self.capacity_per_partition, self.error_rate)
+            self.partitions[bucket] = partition
+        partition.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in partition for partition in self.partitions.values())
+
+    def __len__(self) -> int:
+        return sum(len(partition) for partition in self.partitions.values())
+
+    def expire(self, cutoff_time: datetime) -> int:
+        """丢弃结束时间不晚于截止时间的分区，返回丢弃的分区数"""
+        cutoff_bucket = self._bucket(cutoff_time)
+        expired = [bucket for bucket in self.partitions if bucket < cutoff_bucket]
+        for bucket in expired:
+            del self.partitions[bucket]
+        return len(expired)
+
+    def clear(self):
+        """清空全部分区"""
+        self.partitions.clear()
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(partition.memory_bytes for partition in self.partitions.values())
+
+    def _bucket(self, timestamp: datetime) -> int:
+        return int(timestamp.timestamp() // self.partition_seconds)
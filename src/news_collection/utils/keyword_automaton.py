@@ -0,0 +1,195 @@
+"""
+Compiled multi-keyword matcher shared by entity extraction, relevance and noise filtering
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """关键词匹配结果"""
+    keyword: str  # 规范化（小写）后的关键词
+    start: int
+    end: int
+    payloads: Tuple[Any, ...]  # 该关键词注册时附带的标签，如实体类型或关键词类别
+
+
+class KeywordAutomaton:
+    """
+    多关键词匹配自动机
+
+    关键词统一小写并插入前缀树，前缀树编译为一个嵌套分支的正则表达式，由正则引擎
+    在C层沿前缀树单次扫描文本，返回最左最长的匹配；被某个匹配完整包含的其他关键词
+    （如 "bitcoin cash" 中的 "bitcoin"）在编译时预先计算，扫描时直接展开，
+    相当于Aho-Corasick的输出链接。每个关键词可单独指定是否要求单词边界，
+    中文等无空格分词的关键词按子串匹配。
+
+    同一标签内的匹配互不重叠：被包含的关键词若与外层匹配共享某个标签，则不再为该
+    标签重复计数，与为每个标签单独编译一个正则的结果一致。
+    """
+
+    def __init__(self, word_boundary: bool = True):
+        self.word_boundary = word_boundary
+        # 关键词 -> (标签元组, 是否要求单词边界)
+        self._keywords: Dict[str, Tuple[Tuple[Any, ...], bool]] = {}
+        self._pattern: Optional[Pattern] = None
+        # 关键词 -> [(相对偏移, 被包含关键词)]
+        self._contained: Dict[str, List[Tuple[int, str]]] = {}
+
+    @classmethod
+    def from_groups(cls, groups: Dict[Any, Iterable[str]], word_boundary: bool = True) -> 'KeywordAutomaton':
+        """由 {标签: 关键词列表} 构建自动机"""
+        automaton = cls(word_boundary=word_boundary)
+        for payload, keywords in groups.items():
+            automaton.add_keywords(keywords, payload)
+        return automaton
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def __contains__(self, keyword: str) -> bool:
+        return self._normalize(keyword) in self._keywords
+
+    def add_keyword(self, keyword: str, payload: Any = None, word_boundary: Optional[bool] = None):
+        """添加关键词，同一关键词可多次添加以附加不同标签"""
+        normalized = self._normalize(keyword)
+        if not normalized:
+            return
+
+        payloads, bounded = self._keywords.get(normalized, ((), self.word_boundary))
+        if word_boundary is not None:
+            bounded = word_boundary
+        if payload is not None and payload not in payloads:
+            payloads = payloads + (payload,)
+
+        self._keywords[normalized] = (payloads, bounded)
+        self._pattern = None
+
+    def add_keywords(self, keywords: Iterable[str], payload: Any = None, word_boundary: Optional[bool] = None):
+        """批量添加关键词"""
+        for keyword in keywords:
+            self.add_keyword(keyword, payload, word_boundary)
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """单次扫描文本，返回按位置排序的所有匹配"""
+        if not text or not self._keywords:
+            return []
+
+        pattern = self._compile()
+        keywords = self._keywords
+        matches: List[KeywordMatch] = []
+
+        for match in pattern.finditer(text):
+            keyword = match.group().lower()
+            entry = keywords.get(keyword)
+            if entry is None:
+                continue
+
+            start = match.start()
+            payloads = entry[0]
+            matches.append(KeywordMatch(keyword, start, match.end(), payloads))
+
+            # 展开被包含的关键词，只保留外层匹配未覆盖的标签
+            for offset, inner in self._contained.get(keyword, ()):
+                inner_payloads, inner_bounded = keywords[inner]
+                inner_start, inner_end = start + offset, start + offset + len(inner)
+                if inner_bounded and not self._is_bounded(text, inner_start, inner_end):
+                    continue
+                remaining = tuple(p for p in inner_payloads if p not in payloads)
+                if remaining or not inner_payloads:
+                    matches.append(KeywordMatch(inner, inner_start, inner_end, remaining))
+
+        matches.sort(key=lambda m: (m.start, -(m.end - m.start)))
+        return matches
+
+    def count_by_payload(self, text: str) -> Dict[Any, int]:
+        """统计每个标签的匹配次数"""
+        counts: Dict[Any, int] = {}
+        for match in self.find_all(text):
+            for payload in match.payloads:
+                counts[payload] = counts.get(payload, 0) + 1
+        return counts
+
+    def distinct_by_payload(self, text: str) -> Dict[Any, set]:
+        """统计每个标签下出现过的不同关键词"""
+        distinct: Dict[Any, set] = {}
+        for match in self.find_all(text):
+            for payload in match.payloads:
+                distinct.setdefault(payload, set()).add(match.keyword)
+        return distinct
+
+    def _normalize(self, keyword: str) -> str:
+        """关键词规范化：去除首尾空白并小写"""
+        return keyword.strip().lower() if keyword else ""
+
+    def _compile(self) -> Pattern:
+        """编译前缀树正则并预计算包含关系"""
+        if self._pattern is not None:
+            return self._pattern
+
+        bounded = [k for k, (_, b) in self._keywords.items() if b]
+        unbounded = [k for k, (_, b) in self._keywords.items() if not b]
+
+        branches = []
+        if bounded:
+            branches.append(r'(?<!\w)' + self._trie_regex(bounded) + r'(?!\w)')
+        if unbounded:
+            branches.append(self._trie_regex(unbounded))
+
+        self._pattern = re.compile('|'.join(branches), re.IGNORECASE)
+        self._contained = self._build_contained()
+        return self._pattern
+
+    def _trie_regex(self, keywords: List[str]) -> str:
+        """将关键词前缀树转换为正则，分支按字符排列且优先尝试更长的延续"""
+        trie: Dict[str, Any] = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        def convert(node: Dict[str, Any]) -> str:
+            alternatives = [re.escape(char) + convert(child) for char, child in sorted(node.items()) if char != '']
+            if not alternatives:
+                return ''
+
+            body = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+            if '' in node:
+                # 可选的贪婪延续：先尝试更长的关键词，失败时回退到当前节点结束
+                return '(?:' + body + ')?'
+            return body
+
+        return '(?:' + convert(trie) + ')'
+
+    def _build_contained(self) -> Dict[str, List[Tuple[int, str]]]:
+        """预计算每个关键词内部完整出现的其他关键词及其偏移，边界在扫描时按原文检查"""
+        contained: Dict[str, List[Tuple[int, str]]] = {}
+        keywords = list(self._keywords)
+
+        for outer in keywords:
+            found = []
+            for inner in keywords:
+                if len(inner) >= len(outer):
+                    continue
+                start = outer.find(inner)
+                while start != -1:
+                    found.append((start, inner))
+                    start = outer.find(inner, start + 1)
+            if found:
+                contained[outer] = sorted(found)
+
+        return contained
+
+    @classmethod
+    def _is_bounded(cls, text: str, start: int, end: int) -> bool:
+        """检查匹配两端是否为单词边界"""
+        before_ok = start == 0 or not cls._is_word_char(text[start - 1]) or not cls._is_word_char(text[start])
+        after_ok = end == len(text) or not cls._is_word_char(text[end]) or not cls._is_word_char(text[end - 1])
+        return before_ok and after_ok
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        return char.isalnum() or char == '_'
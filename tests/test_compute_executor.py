@@ -0,0 +1,144 @@
+"""
+Test suite for the compute executor layer.
+
+Validates routing of indicator calculations to inline, thread and process
+backends, shared-memory data hand-off and timeout handling.
+"""
+
+import asyncio
+
+import pytest
+import pandas as pd
+import numpy as np
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from long_analyst.indicators.executor import ComputeExecutor, ExecutorType
+from long_analyst.indicators.indicator_engine import IndicatorEngine, IndicatorConfig
+
+
+class SlowCalculator:
+    """Calculator stand-in that blocks longer than the timeout."""
+
+    async def calculate(self, data, parameters=None):
+        import time
+        time.sleep(0.2)
+        return len(data)
+
+
+class ScaledCalculator:
+    """Calculator stand-in whose result depends on instance configuration."""
+
+    def __init__(self, factor=1):
+        self.factor = factor
+
+    async def calculate(self, data, parameters=None):
+        return self.factor * len(data)
+
+
+class TestComputeExecutor:
+    """Test cases for ComputeExecutor."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample OHLCV data for testing."""
+        np.random.seed(42)
+        dates = pd.date_range(start='2024-01-01', periods=300, freq='1h')
+        close = 50000 + np.cumsum(np.random.normal(0, 100, 300))
+        return pd.DataFrame({
+            'open': close,
+            'high': close + np.random.uniform(0, 100, 300),
+            'low': close - np.random.uniform(0, 100, 300),
+            'close': close,
+            'volume': np.random.uniform(100, 1000, 300)
+        }, index=dates)
+
+    def test_shared_frame_round_trip(self, sample_data):
+        """Test data placed in shared memory is rebuilt unchanged."""
+        from long_analyst.indicators.executor import _attach_frame
+
+        executor = ComputeExecutor()
+        shared_frame = executor.share_frame(sample_data)
+        try:
+            pd.testing.assert_frame_equal(_attach_frame(shared_frame), sample_data, check_exact=True)
+        finally:
+            executor.release_frame(shared_frame)
+
+    @pytest.mark.asyncio
+    async def test_routing_matches_inline_results(self, sample_data):
+        """Test thread and process routed indicators match inline results."""
+        indicators = ['rsi', 'bollinger_bands', 'support_resistance']
+        routed = IndicatorEngine(IndicatorConfig(
+            enable_redis_cache=False,
+            calculation_timeout_ms=10000,
+            executor_routing={'support_resistance': 'process'}
+        ))
+        inline = IndicatorEngine(IndicatorConfig(
+            enable_redis_cache=False,
+            default_executor='inline',
+            executor_routing={}
+        ))
+
+        try:
+            routed_results = await routed.batch_calculate(indicators, sample_data)
+            inline_results = await inline.batch_calculate(indicators, sample_data)
+
+            assert list(routed_results) == indicators
+            pd.testing.assert_series_equal(routed_results['rsi'].values['rsi'], inline_results['rsi'].values['rsi'])
+            assert ([level.price for level in routed_results['support_resistance'].values['levels']] ==
+                    [level.price for level in inline_results['support_resistance'].values['levels']])
+
+            stats = routed.executor.get_stats()
+            assert stats['tasks_by_executor']['thread'] == 2
+            assert stats['tasks_by_executor']['process'] + stats['tasks_by_executor']['thread'] == 3
+        finally:
+            await routed.shutdown()
+            await inline.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, sample_data):
+        """Test calculations exceeding their timeout are abandoned."""
+        executor = ComputeExecutor(default_executor=ExecutorType.THREAD, timeout_ms=20)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await executor.run_calculator('slow', SlowCalculator(), sample_data)
+            assert executor.get_stats()['timeouts'] == 1
+        finally:
+            executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_thread_task(self, sample_data):
+        """Test a timed out coroutine is cancelled at its next await point."""
+        progress = []
+
+        async def cooperative(data):
+            for step in range(20):
+                progress.append(step)
+                await asyncio.sleep(0.01)
+            return len(data)
+
+        executor = ComputeExecutor(default_executor=ExecutorType.THREAD, timeout_ms=30)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await executor.run('cooperative', cooperative, sample_data)
+            await asyncio.sleep(0.1)
+            stopped_at = len(progress)
+            await asyncio.sleep(0.1)
+            assert len(progress) == stopped_at < 20
+        finally:
+            executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_process_routing_keeps_calculator_configuration(self, sample_data):
+        """Test process workers receive the configured calculator instance."""
+        executor = ComputeExecutor(routing={'scaled': ExecutorType.PROCESS}, max_process_workers=1,
+                                   timeout_ms=30000)
+        try:
+            result = await executor.run_calculator('scaled', ScaledCalculator(factor=3), sample_data)
+            assert result == 3 * len(sample_data)
+            assert executor.get_stats()['tasks_by_executor']['process'] == 1
+            assert executor.process_start_method in ('forkserver', 'spawn')
+        finally:
+            executor.shutdown(wait=True)
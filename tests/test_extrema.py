@@ -0,0 +1,90 @@
+"""
+Test suite for vectorized extrema detection and level clustering.
+
+Validates find_extrema and cluster_levels against the per-bar loops they
+replaced, including ties and NaN handling.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from long_analyst.indicators.extrema import find_extrema, cluster_levels
+
+
+def _loop_extrema(values, left, right, margin, kind, strict):
+    """Reference per-bar implementation."""
+    positions = []
+    for i in range(margin, len(values) - margin):
+        neighbours = list(values[i-left:i]) + list(values[i+1:i+right+1])
+        if kind == "max":
+            ok = all(values[i] > v if strict else values[i] >= v for v in neighbours)
+        else:
+            ok = all(values[i] < v if strict else values[i] <= v for v in neighbours)
+        if ok:
+            positions.append(i)
+    return positions
+
+
+class TestFindExtrema:
+    """Test cases for find_extrema."""
+
+    @pytest.fixture
+    def prices(self):
+        """Create rounded random-walk prices with ties and NaN gaps."""
+        np.random.seed(42)
+        values = np.round(50000 + np.cumsum(np.random.normal(0, 100, 500)), -1)
+        values[[0, 1, 50, 51, 300]] = np.nan
+        return values
+
+    @pytest.mark.parametrize("kind", ["max", "min"])
+    @pytest.mark.parametrize("strict", [False, True])
+    @pytest.mark.parametrize("left,right,margin", [(1, 1, 1), (2, 2, 2), (3, 3, 5), (2, 1, 5)])
+    def test_matches_loop(self, prices, kind, strict, left, right, margin):
+        """Test positions match the element-wise loop."""
+        expected = _loop_extrema(prices, left, right, margin, kind, strict)
+        actual = find_extrema(prices, left, kind=kind, strict=strict, right_window=right, margin=margin)
+        assert actual.tolist() == expected
+
+    @pytest.mark.parametrize("kind", ["max", "min"])
+    def test_skipna_matches_pandas_window(self, prices, kind):
+        """Test skipna positions match comparisons with pandas window max/min."""
+        series = pd.Series(prices)
+        expected = [
+            i for i in range(5, len(series) - 5)
+            if series.iloc[i] == getattr(series.iloc[i-5:i+6], kind)()
+        ]
+        assert find_extrema(prices, 5, kind=kind, skipna=True).tolist() == expected
+
+    def test_short_input(self):
+        """Test inputs shorter than the window yield no extrema."""
+        assert len(find_extrema([1.0, 2.0, 1.0], 2)) == 0
+
+    def test_invalid_arguments(self):
+        """Test invalid kind and margin are rejected."""
+        with pytest.raises(ValueError):
+            find_extrema([1.0, 2.0, 1.0], 1, kind="median")
+        with pytest.raises(ValueError):
+            find_extrema([1.0, 2.0, 1.0], 2, margin=1)
+
+
+class TestClusterLevels:
+    """Test cases for cluster_levels."""
+
+    def test_anchored(self):
+        """Test levels are grouped relative to the first level of a cluster."""
+        clusters = cluster_levels([102.0, 100.0, 101.0, 101.9, 110.0], 0.015)
+        assert [c.tolist() for c in clusters] == [[100.0, 101.0], [101.9, 102.0], [110.0]]
+
+    def test_chained(self):
+        """Test levels are grouped relative to the previous level."""
+        clusters = cluster_levels([102.0, 100.0, 101.0, 101.9, 110.0], 0.015, chained=True)
+        assert [c.tolist() for c in clusters] == [[100.0, 101.0, 101.9, 102.0], [110.0]]
+
+    def test_empty(self):
+        """Test no levels produce no clusters."""
+        assert cluster_levels([], 0.01) == []
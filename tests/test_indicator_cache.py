@@ -0,0 +1,272 @@
+"""
+Test suite for the indicator result cache.
+
+Validates data fingerprinting, the bounded LRU/TTL memory tier and the
+binary Redis codec of IndicatorCache used by the IndicatorEngine.
+"""
+
+import time
+
+import pytest
+import pandas as pd
+import numpy as np
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from long_analyst.indicators import codec
+from long_analyst.indicators.indicator_engine import (
+    IndicatorCache, IndicatorConfig, IndicatorResult, IndicatorType, IndicatorCategory
+)
+
+
+def _make_result(name: str, size: int = 10) -> IndicatorResult:
+    """Create an indicator result holding a series of the given length."""
+    return IndicatorResult(
+        indicator_name=name,
+        indicator_type=IndicatorType.MOMENTUM,
+        category=IndicatorCategory.PRIMARY,
+        values={'rsi': pd.Series(np.random.rand(size))},
+        parameters={'period': 14},
+        timestamp=time.time(),
+        calculation_time_ms=1.0,
+        data_points_used=size,
+        quality_score=1.0
+    )
+
+
+class TestIndicatorCache:
+    """Test cases for IndicatorCache."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample OHLCV data for testing."""
+        np.random.seed(42)
+        dates = pd.date_range(start='2024-01-01', periods=200, freq='1h')
+        close = 50000 + np.cumsum(np.random.normal(0, 100, 200))
+        return pd.DataFrame({
+            'open': close,
+            'high': close + 50,
+            'low': close - 50,
+            'close': close,
+            'volume': np.random.uniform(100, 1000, 200)
+        }, index=dates)
+
+    def _cache(self, **overrides) -> IndicatorCache:
+        return IndicatorCache(IndicatorConfig(enable_redis_cache=False, **overrides))
+
+    def test_fingerprint_detects_changes(self, sample_data):
+        """Test fingerprint changes on revised, appended or shifted candles."""
+        cache = self._cache()
+        fingerprint = cache._get_data_hash(sample_data)
+
+        assert cache._get_data_hash(sample_data.copy()) == fingerprint
+
+        revised = sample_data.copy()
+        revised.iloc[-1, revised.columns.get_loc('close')] += 0.01
+        assert cache._get_data_hash(revised) != fingerprint
+
+        shifted = sample_data.copy()
+        shifted.index = shifted.index + pd.Timedelta(hours=1)
+        assert cache._get_data_hash(shifted) != fingerprint
+
+        assert cache._get_data_hash(sample_data.iloc[:-1]) != fingerprint
+
+    def test_fingerprint_mixed_dtypes(self, sample_data):
+        """Test fingerprinting frames with non-numeric columns."""
+        cache = self._cache()
+        data = sample_data.copy()
+        data['symbol'] = 'BTC/USDT'
+
+        changed = data.copy()
+        changed.iloc[-1, changed.columns.get_loc('symbol')] = 'ETH/USDT'
+
+        assert cache._get_data_hash(data) != cache._get_data_hash(changed)
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, sample_data):
+        """Test a stored result is returned for the same data and parameters."""
+        cache = self._cache()
+        result = _make_result("RSI")
+
+        await cache.set(result, sample_data, {'period': 14}, 'rsi')
+
+        assert await cache.get('rsi', sample_data, {'period': 14}) is result
+        assert await cache.get('rsi', sample_data, {'period': 21}) is None
+
+        stats = await cache.get_cache_stats()
+        assert stats['memory_hits'] == 1
+        assert stats['cache_misses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_count(self, sample_data):
+        """Test least recently used entries are evicted when full."""
+        cache = self._cache(memory_cache_size=2)
+
+        await cache.set(_make_result("a"), sample_data, {})
+        await cache.set(_make_result("b"), sample_data, {})
+        assert await cache.get("a", sample_data, {}) is not None
+
+        await cache.set(_make_result("c"), sample_data, {})
+
+        assert await cache.get("b", sample_data, {}) is None
+        assert await cache.get("a", sample_data, {}) is not None
+        assert await cache.get("c", sample_data, {}) is not None
+        assert (await cache.get_cache_stats())['evictions'] == 1
+
+    @pytest.mark.asyncio
+    async def test_eviction_by_bytes(self, sample_data):
+        """Test the memory tier stays within its byte budget."""
+        entry_size = IndicatorCache._estimate_size(_make_result("x", size=1000))
+        cache = self._cache(memory_cache_max_bytes=int(entry_size * 2.5))
+
+        for name in ["a", "b", "c", "d"]:
+            await cache.set(_make_result(name, size=1000), sample_data, {})
+
+        stats = await cache.get_cache_stats()
+        assert stats['memory_cache_size'] == 2
+        assert stats['memory_cache_bytes'] <= stats['memory_cache_max_bytes']
+        assert stats['evictions'] == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiration(self, sample_data):
+        """Test expired entries are dropped on access."""
+        cache = self._cache(cache_ttl_seconds=0)
+
+        await cache.set(_make_result("rsi"), sample_data, {})
+
+        assert await cache.get("rsi", sample_data, {}) is None
+        stats = await cache.get_cache_stats()
+        assert stats['expirations'] == 1
+        assert stats['memory_cache_size'] == 0
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio client."""
+
+    def __init__(self):
+        self.store = {}
+        self.round_trips = 0
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Minimal pipeline collecting SETEX commands."""
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, value))
+
+    async def execute(self):
+        self.redis_client.round_trips += 1
+        self.redis_client.store.update(self.commands)
+
+
+class TestResultCodec:
+    """Test cases for the binary indicator result codec."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_result_round_trip(self, compress):
+        """Test indicator results round-trip exactly."""
+        dates = pd.date_range(start='2024-01-01', periods=50, freq='1h', tz='UTC')
+        result = _make_result("RSI", size=50)
+        result.values = {
+            'rsi': pd.Series(np.r_[np.nan, np.random.rand(49)], index=dates, name='rsi'),
+            'long_signals': pd.Series(np.random.rand(50) > 0.5, index=dates),
+            'current_rsi': np.float64(42.5),
+            'levels': [1.5, 2.5],
+        }
+        result.metadata = {'optimal_range': (30, 60), 'description': 'RSI'}
+
+        payload = codec.encode(result, compress=compress, compression_threshold=0)
+        decoded = codec.decode(payload)
+
+        assert isinstance(decoded, IndicatorResult)
+        assert decoded.indicator_type is IndicatorType.MOMENTUM
+        assert decoded.category is IndicatorCategory.PRIMARY
+        assert decoded.metadata == result.metadata
+        assert decoded.values['current_rsi'] == result.values['current_rsi']
+        assert decoded.values['levels'] == result.values['levels']
+        pd.testing.assert_series_equal(decoded.values['rsi'], result.values['rsi'], check_exact=True)
+        pd.testing.assert_series_equal(decoded.values['long_signals'], result.values['long_signals'])
+
+    def test_rejects_unregistered_types(self):
+        """Test arbitrary objects are neither encoded nor instantiated."""
+        with pytest.raises(codec.CodecError):
+            codec.encode({'value': object()})
+
+        with pytest.raises(codec.CodecError):
+            codec.decode(b"not a payload")
+
+    def test_truncated_payloads_raise_codec_error(self):
+        """Test cut-off payloads surface as CodecError, never struct.error."""
+        payload = codec.encode(_make_result("RSI", size=20), compress=False)
+        for size in (6, 10, len(payload) // 2, len(payload) - 1):
+            with pytest.raises(codec.CodecError):
+                codec.decode(payload[:size])
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_batch_round_trip(self):
+        """Test batched lookups share one Redis round trip across processes."""
+        np.random.seed(42)
+        data = pd.DataFrame({'close': np.random.rand(100)})
+        redis_client = FakeRedis()
+
+        writer = IndicatorCache(IndicatorConfig(enable_redis_cache=False))
+        writer.redis_client = redis_client
+        await writer.set_many({
+            'rsi': (_make_result("RSI"), {'period': 14}),
+            'macd': (_make_result("MACD"), {}),
+        }, data)
+
+        reader = IndicatorCache(IndicatorConfig(enable_redis_cache=False))
+        reader.redis_client = redis_client
+        redis_client.round_trips = 0
+
+        results = await reader.get_many({'rsi': {'period': 14}, 'macd': {}, 'atr': {}}, data)
+
+        assert set(results) == {'rsi', 'macd'}
+        assert redis_client.round_trips == 1
+        stats = await reader.get_cache_stats()
+        assert stats['redis_hits'] == 2
+        assert stats['cache_misses'] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_skips_malformed_entries(self):
+        """Test one corrupt key is a miss and does not abort the batch."""
+        np.random.seed(42)
+        data = pd.DataFrame({'close': np.random.rand(100)})
+        redis_client = FakeRedis()
+
+        writer = IndicatorCache(IndicatorConfig(enable_redis_cache=False))
+        writer.redis_client = redis_client
+        await writer.set_many({
+            'rsi': (_make_result("RSI"), {}),
+            'macd': (_make_result("MACD"), {}),
+        }, data)
+
+        rsi_key = writer._generate_cache_key('rsi', writer._get_data_hash(data), {})
+        redis_client.store[rsi_key] = redis_client.store[rsi_key][:12]
+
+        reader = IndicatorCache(IndicatorConfig(enable_redis_cache=False))
+        reader.redis_client = redis_client
+        results = await reader.get_many({'rsi': {}, 'macd': {}}, data)
+
+        assert set(results) == {'macd'}
+        assert reader.cache_errors == 1
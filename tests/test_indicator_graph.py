@@ -0,0 +1,163 @@
+"""
+Test suite for the indicator dependency graph.
+
+Validates that intermediate series are computed once per OHLCV frame and
+shared by the indicator calculator and the signal detectors.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from long_analyst.indicators.indicator_graph import IndicatorGraph
+from long_analyst.models.market_data import MarketData, OHLCVData, Timeframe, DataSource
+from long_analyst.signal_recognition.signal_config import DetectorConfig
+from long_analyst.signal_recognition.detectors.trend_detector import TrendDetector
+from long_analyst.signal_recognition.detectors.breakout_detector import BreakoutDetector
+from long_analyst.utils.indicators import IndicatorCalculator
+
+
+class TestIndicatorGraph:
+    """Test cases for IndicatorGraph."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample OHLCV data."""
+        np.random.seed(42)
+        periods = 300
+        close = 50000 + np.cumsum(np.random.normal(0, 100, periods))
+        return pd.DataFrame({
+            'open': close - 10,
+            'high': close + np.random.uniform(0, 100, periods),
+            'low': close - np.random.uniform(0, 100, periods),
+            'close': close,
+            'volume': np.random.uniform(100, 1000, periods)
+        }, index=pd.date_range(start='2024-01-01', periods=periods, freq='1h'))
+
+    @pytest.fixture
+    def market_data(self, sample_data):
+        """Create MarketData from the sample frame."""
+        candles = [
+            OHLCVData(
+                timestamp=1704067200 + i * 3600,
+                open=row.open,
+                high=row.high,
+                low=row.low,
+                close=row.close,
+                volume=row.volume,
+                timeframe=Timeframe.H1,
+                symbol="BTC/USDT",
+                source=DataSource.BINANCE
+            )
+            for i, row in enumerate(sample_data.itertuples())
+        ]
+        return MarketData.from_ohlcv_list("BTC/USDT", candles)
+
+    def test_nodes_memoized(self, sample_data):
+        """Test each node is computed once and then reused."""
+        graph = IndicatorGraph(sample_data)
+
+        first = graph.sma('close', 20)
+        assert graph.sma('close', 20) is first
+        assert graph.atr(14) is graph.sma('true_range', 14)
+
+        stats = graph.get_stats()
+        # sma(close), shift(close), range, true_range, sma(true_range)
+        assert stats['computed'] == 5
+        assert stats['reused'] >= 2
+
+    def test_node_values(self, sample_data):
+        """Test nodes match direct pandas computations."""
+        graph = IndicatorGraph(sample_data)
+
+        pd.testing.assert_series_equal(graph.ema('close', 12),
+                                       sample_data['close'].ewm(span=12, adjust=False).mean())
+        pd.testing.assert_series_equal(graph.rolling_min('low', 5, True),
+                                       sample_data['low'].rolling(window=5, center=True).min())
+
+        previous_close = sample_data['close'].shift()
+        expected_tr = pd.concat([
+            sample_data['high'] - sample_data['low'],
+            (sample_data['high'] - previous_close).abs(),
+            (sample_data['low'] - previous_close).abs()
+        ], axis=1).max(axis=1)
+        np.testing.assert_allclose(graph.true_range().to_numpy(), expected_tr.to_numpy())
+
+    def test_prepare(self, sample_data):
+        """Test prepare evaluates the dependencies of named indicators and swing points."""
+        graph = IndicatorGraph(sample_data)
+
+        graph.prepare(['macd', 'bollinger_bands', 'unknown'])
+
+        # ema 12/26, sma/std 20, centered rolling low min / high max
+        assert graph.get_stats()['nodes'] == 6
+        graph.ema('close', 26)
+        graph.rolling_min('low', 5, True)
+        assert graph.get_stats()['computed'] == 6
+
+    def test_calculator_ignores_same_named_foreign_series(self, sample_data):
+        """Test a same-named series from another frame is not served from the graph."""
+        graph = IndicatorGraph(sample_data)
+        calculator = IndicatorCalculator()
+
+        shared = calculator.macd(sample_data['close'], graph=graph)
+        assert graph.get_stats()['nodes'] == 2
+
+        other = sample_data['close'].iloc[:-1] * 2
+        expected = calculator.macd(other)
+        actual = calculator.macd(other, graph=graph)
+
+        pd.testing.assert_series_equal(actual['macd'], expected['macd'])
+        assert graph.get_stats()['nodes'] == 2
+        assert not shared['macd'].equals(actual['macd'])
+
+    def test_calculator_ignores_graph_of_other_frame(self, sample_data):
+        """Test frame-based indicators compute directly when the graph was built over another frame."""
+        graph = IndicatorGraph(sample_data)
+        calculator = IndicatorCalculator()
+        other = sample_data.iloc[-100:] * 2
+        other_graph = IndicatorGraph(other)
+
+        assert graph.holds(sample_data)
+        assert not graph.holds(other)
+
+        pd.testing.assert_series_equal(calculator.atr(other, graph=graph), other_graph.atr(14))
+        pd.testing.assert_series_equal(calculator.williams_r(other, graph=graph), calculator.williams_r(other))
+        pd.testing.assert_series_equal(calculator.stochastic(other, graph=graph)['k'],
+                                       calculator.stochastic(other)['k'])
+        pd.testing.assert_series_equal(calculator.adx(other, graph=graph)['adx'], calculator.adx(other)['adx'])
+        assert graph.get_stats()['nodes'] == 0
+
+    def test_calculator_uses_graph(self, sample_data):
+        """Test calculate_all_indicators reads shared nodes from the graph."""
+        graph = IndicatorGraph(sample_data)
+        indicators = IndicatorCalculator().calculate_all_indicators(sample_data, graph=graph)
+
+        assert indicators['sma_20'] is graph.sma('close', 20)
+        assert indicators['middle'] is graph.sma('close', 20)
+        assert indicators['atr'] is graph.atr(14)
+
+    def test_market_data_graph_cached(self, market_data):
+        """Test MarketData keeps one graph until new candles arrive."""
+        graph = market_data.get_indicator_graph()
+        assert market_data.get_indicator_graph() is graph
+
+        market_data.ohlcv_data.append(market_data.ohlcv_data[-1])
+        assert market_data.get_indicator_graph() is not graph
+
+    @pytest.mark.asyncio
+    async def test_detectors_share_graph(self, market_data):
+        """Test detectors reuse the series computed by each other."""
+        graph = market_data.get_indicator_graph()
+
+        await TrendDetector(DetectorConfig(name="trend")).detect(market_data)
+        computed = graph.get_stats()['computed']
+        await BreakoutDetector(DetectorConfig(name="breakout")).detect(market_data)
+
+        assert market_data.get_indicator_graph() is graph
+        assert graph.get_stats()['reused'] > 0
+        assert graph.get_stats()['computed'] >= computed
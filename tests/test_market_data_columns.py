@@ -0,0 +1,92 @@
+"""
+Test suite for the columnar OHLCV view of MarketData.
+
+Validates that candles are converted once into read-only contiguous
+columns and that DataFrames handed to consumers share that memory.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from long_analyst.models.market_data import MarketData, OHLCVData, Timeframe, DataSource
+
+
+class TestOHLCVColumns:
+    """Test cases for MarketData columnar access."""
+
+    @pytest.fixture
+    def market_data(self):
+        """Create sample OHLCV market data."""
+        np.random.seed(42)
+        close = 50000 + np.cumsum(np.random.normal(0, 100, 100))
+        candles = [
+            OHLCVData(
+                timestamp=1704067200 + i * 3600,
+                open=close[i] - 10,
+                high=close[i] + 50,
+                low=close[i] - 50,
+                close=close[i],
+                volume=float(np.random.uniform(100, 1000)),
+                timeframe=Timeframe.H1,
+                symbol="BTC/USDT",
+                source=DataSource.BINANCE
+            )
+            for i in range(100)
+        ]
+        return MarketData.from_ohlcv_list("BTC/USDT", candles)
+
+    def test_columns_match_candles(self, market_data):
+        """Test columns hold the candle values in order."""
+        columns = market_data.get_ohlcv_columns()
+
+        assert len(columns) == 100
+        assert columns.close.tolist() == [c.close for c in market_data.ohlcv_data]
+        assert columns.timestamp.tolist() == [c.timestamp for c in market_data.ohlcv_data]
+        assert columns.high.flags.c_contiguous
+        assert not columns.values.flags.writeable
+
+    def test_columns_cached(self, market_data):
+        """Test the view is built once and rebuilt after new candles."""
+        columns = market_data.get_ohlcv_columns()
+        assert market_data.get_ohlcv_columns() is columns
+
+        market_data.ohlcv_data.append(market_data.ohlcv_data[-1])
+        assert len(market_data.get_ohlcv_columns()) == 101
+
+    def test_columns_follow_live_candle_updates(self, market_data):
+        """Test in-place updates of the last candle rebuild the view."""
+        columns = market_data.get_ohlcv_columns()
+        live = market_data.ohlcv_data[-1]
+
+        live.close = live.close + 10
+        live.high = max(live.high, live.close)
+
+        updated = market_data.get_ohlcv_columns()
+        assert updated is not columns
+        assert updated.close[-1] == live.close
+        assert market_data.get_ohlcv_frame()['high'].iloc[-1] == live.high
+
+    def test_frame_is_zero_copy_and_isolated(self, market_data):
+        """Test frames share the column memory but not added columns."""
+        columns = market_data.get_ohlcv_columns()
+        first = market_data.get_ohlcv_frame()
+        second = market_data.get_ohlcv_frame()
+
+        assert np.shares_memory(first['close'].to_numpy(), columns.close)
+        assert first.index.name == 'timestamp'
+
+        first['tr'] = first['high'] - first['low']
+        assert 'tr' not in second.columns
+
+    def test_to_dataframe_datetime_index(self, market_data):
+        """Test to_dataframe keeps its datetime index."""
+        df = market_data.to_dataframe()
+
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert df.index[0] == pd.Timestamp('2024-01-01 00:00:00')
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
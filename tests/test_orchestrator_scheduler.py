@@ -0,0 +1,203 @@
+"""
+Test suite for the analysis orchestrator scheduler.
+
+Validates that due tasks are served by a bounded worker pool in priority
+order, that future tasks wait on a timer heap, and that the scheduler
+sleeps until its next deadline instead of polling.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from long_analyst.models.market_data import Timeframe
+from long_analyst.orchestration.orchestrator import (
+    AnalysisOrchestrator, OrchestratorConfig, Priority, TaskStatus
+)
+
+
+def make_orchestrator(symbols=(), **config) -> AnalysisOrchestrator:
+    """Create an orchestrator with recorded, instant analyses."""
+    orchestrator = AnalysisOrchestrator(
+        analysis_timeframes=[Timeframe.H1],
+        config=OrchestratorConfig(**config)
+    )
+    orchestrator.event_manager.emit = AsyncMock()
+    orchestrator.executed = []
+
+    async def execute_analysis(task):
+        orchestrator.executed.append(task)
+        await asyncio.sleep(0)
+        return None
+
+    async def initialize_symbol_schedules():
+        orchestrator.symbol_analysis_schedule = {symbol: True for symbol in symbols}
+
+    orchestrator._execute_analysis = execute_analysis
+    orchestrator._initialize_symbol_schedules = initialize_symbol_schedules
+    return orchestrator
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    """Wait until a condition holds."""
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+class TestOrchestratorScheduler:
+    """Test cases for the orchestrator scheduler and worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """Test ready tasks are executed highest priority first."""
+        orchestrator = make_orchestrator(max_concurrent_tasks=1)
+        for symbol, priority in [('A', Priority.LOW), ('B', Priority.CRITICAL), ('C', Priority.NORMAL)]:
+            await orchestrator.schedule_analysis(symbol, Timeframe.H1, priority)
+
+        await orchestrator.start()
+        try:
+            await wait_for(lambda: len(orchestrator.executed) == 3)
+        finally:
+            await orchestrator.stop()
+
+        assert [task.symbol for task in orchestrator.executed] == ['B', 'C', 'A']
+        assert all(task.status == TaskStatus.COMPLETED for task in orchestrator.executed)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self):
+        """Test no more than max_concurrent_tasks analyses run at once."""
+        orchestrator = make_orchestrator(max_concurrent_tasks=3)
+        active = []
+        peak = []
+
+        async def execute_analysis(task):
+            active.append(task)
+            peak.append(len(active))
+            await asyncio.sleep(0.02)
+            active.remove(task)
+            orchestrator.executed.append(task)
+
+        orchestrator._execute_analysis = execute_analysis
+        await orchestrator.start()
+        try:
+            for i in range(12):
+                await orchestrator.schedule_analysis(f"SYM{i}", Timeframe.H1)
+            await wait_for(lambda: len(orchestrator.executed) == 12)
+        finally:
+            await orchestrator.stop()
+
+        assert max(peak) == 3
+
+    @pytest.mark.asyncio
+    async def test_future_task_waits_for_deadline(self):
+        """Test a task scheduled ahead is released once its time arrives."""
+        orchestrator = make_orchestrator()
+        orchestrator.symbol_last_analysis["BTC/USDT_1h"] = time.time() - 3600 + 0.1
+
+        await orchestrator.start()
+        try:
+            task_id = await orchestrator.schedule_analysis("BTC/USDT", Timeframe.H1)
+            status = await orchestrator.get_task_status(task_id)
+            assert status['status'] == 'pending'
+            assert orchestrator.executed == []
+
+            await wait_for(lambda: len(orchestrator.executed) == 1)
+        finally:
+            await orchestrator.stop()
+
+        assert orchestrator.executed[0].id == task_id
+
+    @pytest.mark.asyncio
+    async def test_scheduler_sleeps_between_deadlines(self):
+        """Test the scheduler wakes per deadline rather than per polling interval."""
+        orchestrator = make_orchestrator(symbols=[f"SYM{i}/USDT" for i in range(2000)])
+
+        await orchestrator.start()
+        try:
+            await wait_for(lambda: len(orchestrator.executed) == 2000, timeout=10.0)
+            wakeups = orchestrator.metrics['scheduler_wakeups']
+            await asyncio.sleep(0.2)
+        finally:
+            await orchestrator.stop()
+
+        # Every pair is re-armed an hour out, so nothing wakes the scheduler
+        assert orchestrator.metrics['scheduler_wakeups'] == wakeups
+        assert len(orchestrator.schedule_heap) == 2000
+        assert orchestrator.schedule_heap[0][0] > time.time() + 3500
+
+    @pytest.mark.asyncio
+    async def test_recurring_schedule_add_remove(self):
+        """Test pairs recur on their interval and removed symbols drop out."""
+        orchestrator = make_orchestrator(
+            symbols=['BTC/USDT', 'ETH/USDT'],
+            analysis_interval_seconds={Timeframe.H1: 0.05}
+        )
+
+        def runs(symbol):
+            return sum(task.symbol == symbol for task in orchestrator.executed)
+
+        await orchestrator.start()
+        try:
+            await wait_for(lambda: runs('BTC/USDT') >= 2 and runs('ETH/USDT') >= 2)
+            orchestrator.remove_symbol('ETH/USDT')
+            orchestrator.add_symbol('SOL/USDT')
+            await asyncio.sleep(0.1)
+            eth_runs = runs('ETH/USDT')
+            await wait_for(lambda: runs('SOL/USDT') >= 2)
+            await asyncio.sleep(0.1)
+        finally:
+            await orchestrator.stop()
+
+        assert runs('ETH/USDT') == eth_runs
+        assert ('ETH/USDT', Timeframe.H1) not in orchestrator._armed_schedules
+        assert sorted(entry[2] for entry in orchestrator.schedule_heap) == ['BTC/USDT', 'SOL/USDT']
+
+    @pytest.mark.asyncio
+    async def test_failed_task_retried_with_backoff(self):
+        """Test a failing task is re-queued on the timer heap."""
+        orchestrator = make_orchestrator(retry_delay_seconds=0.01, backoff_factor=1.0, max_retry_attempts=2)
+        attempts = []
+
+        async def execute_analysis(task):
+            attempts.append(task.retry_count)
+            raise RuntimeError("analysis failed")
+
+        orchestrator._execute_analysis = execute_analysis
+        await orchestrator.start()
+        try:
+            await orchestrator.schedule_analysis("BTC/USDT", Timeframe.H1)
+            await wait_for(lambda: len(attempts) == 3)
+        finally:
+            await orchestrator.stop()
+
+        assert attempts == [0, 1, 2]
+        assert orchestrator.metrics['total_retry_attempts'] == 2
+
+    def test_non_positive_interval_rejected(self):
+        """Test a zero analysis interval is rejected instead of spinning the scheduler."""
+        with pytest.raises(ValueError):
+            OrchestratorConfig(analysis_interval_seconds={Timeframe.H1: 0})
+
+    def test_constructed_outside_running_loop(self):
+        """Test loop-bound primitives are created by start(), not the constructor."""
+        orchestrator = make_orchestrator(max_concurrent_tasks=1)
+        assert orchestrator.ready_queue is None
+
+        async def run():
+            await orchestrator.schedule_analysis("BTC/USDT", Timeframe.H1)
+            await orchestrator.start()
+            try:
+                await wait_for(lambda: len(orchestrator.executed) == 1)
+            finally:
+                await orchestrator.stop()
+
+        asyncio.run(run())
+        assert orchestrator.executed[0].status == TaskStatus.COMPLETED
@@ -0,0 +1,110 @@
+"""
+Test suite for the multi-window chart pattern scanner.
+
+Validates that PatternRecognitionCalculator locates pivots once, fits trend
+lines for all window sizes in one pass and deduplicates near-identical patterns.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from scipy.stats import linregress
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from long_analyst.indicators.support_resistance import PatternRecognitionCalculator
+
+
+class TestPatternScanner:
+    """Test cases for the single-pass pattern scanner."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create oscillating OHLCV data that forms repeated tops and bottoms."""
+        np.random.seed(42)
+        periods = 400
+        close = 100 + np.sin(np.arange(periods) / 4) * 5 + np.random.normal(0, 0.3, periods)
+        return pd.DataFrame({
+            'open': close,
+            'high': close + np.random.uniform(0, 1, periods),
+            'low': close - np.random.uniform(0, 1, periods),
+            'close': close,
+            'volume': np.random.uniform(1, 10, periods)
+        }, index=pd.date_range(start='2024-01-01', periods=periods, freq='1h'))
+
+    def test_trendlines_match_linregress(self, sample_data):
+        """Test vectorized window fits match per-window regressions."""
+        calculator = PatternRecognitionCalculator()
+        window_sizes = list(range(20, 100, 10))
+        slopes, intercepts, r_values = calculator._window_slopes(sample_data['high'].to_numpy(), window_sizes)
+
+        for w, window_size in enumerate(window_sizes):
+            window = sample_data['high'].tail(window_size).to_numpy()
+            expected = linregress(np.arange(window_size), window)
+            assert slopes[w] == pytest.approx(expected.slope, rel=1e-9, abs=1e-12)
+            assert intercepts[w] == pytest.approx(expected.intercept, rel=1e-9)
+            assert r_values[w] == pytest.approx(expected.rvalue, rel=1e-9, abs=1e-12)
+
+    def test_pivots_computed_once(self, sample_data, monkeypatch):
+        """Test peaks and troughs are located once per scan, not per window."""
+        calculator = PatternRecognitionCalculator()
+        calls = []
+        find_peaks = calculator._find_peaks
+        monkeypatch.setattr(calculator, '_find_peaks', lambda prices: calls.append(len(prices)) or find_peaks(prices))
+
+        calculator._scan_patterns(sample_data, 20, 100)
+
+        assert calls == [90]
+
+    def test_patterns_use_smallest_window(self, sample_data):
+        """Test pivot indices are relative to the smallest window containing the pattern."""
+        calculator = PatternRecognitionCalculator()
+        patterns = calculator._scan_patterns(sample_data, 20, 100)
+
+        assert patterns
+        for pattern in patterns:
+            if 'peak1' in pattern.metadata:
+                first = pattern.metadata['peak1']
+            elif 'trough1' in pattern.metadata:
+                first = pattern.metadata['trough1']
+            else:
+                continue
+            window_size = len(sample_data) - sample_data.index.get_loc(first['time']) + first['index']
+            assert window_size in range(20, 100, 10)
+            assert 0 < first['index'] <= 10 or window_size == 20
+
+    def test_near_identical_patterns_deduplicated(self, sample_data):
+        """Test no two reported patterns of the same kind are near-identical."""
+        calculator = PatternRecognitionCalculator()
+        patterns = calculator._scan_patterns(sample_data, 20, 100)
+
+        for i, pattern in enumerate(patterns):
+            for other in patterns[i + 1:]:
+                assert not calculator._is_duplicate_pattern(pattern, other)
+
+    def test_distinct_overlapping_patterns_kept(self, sample_data):
+        """Test overlapping but distinct formations of one type both survive."""
+        from long_analyst.indicators.support_resistance import ChartPattern, PatternType
+
+        calculator = PatternRecognitionCalculator()
+        index = sample_data.index
+
+        def triangle(start, levels, confidence):
+            return ChartPattern(
+                pattern_type=PatternType.TRIANGLE, pattern_direction="neutral", confidence=confidence,
+                start_time=index[start], end_time=index[-1], price_levels=levels,
+                volume_confirmation=False, metadata={'triangle_type': 'symmetrical'}
+            )
+
+        short = triangle(-20, [105.0, 95.0], 0.9)
+        long = triangle(-90, [110.0, 90.0], 0.8)
+        repeat = triangle(-21, [105.2, 95.1], 0.75)
+
+        assert calculator._deduplicate_patterns([short, long, repeat]) == [short, long]
+
+    def test_short_data(self, sample_data):
+        """Test data shorter than the smallest window yields no patterns."""
+        calculator = PatternRecognitionCalculator()
+        assert calculator._scan_patterns(sample_data.head(15), 20, 100) == []
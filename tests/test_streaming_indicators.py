@@ -0,0 +1,189 @@
+"""
+Test suite for streaming technical indicators.
+
+Validates that incremental indicator updates reproduce the batch
+IndicatorCalculator results exactly, both when fed candle by candle and
+when warmed up from history before switching to live updates.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from long_analyst.indicators.streaming import (
+    STREAMING_INDICATORS, StreamingIndicatorEngine, StreamingRSI, StreamingBollingerBands
+)
+from long_analyst.utils.indicators import IndicatorCalculator
+
+
+def _batch_outputs(df: pd.DataFrame) -> dict:
+    """Compute the batch reference values for every streaming indicator."""
+    calculator = IndicatorCalculator()
+    return {
+        'rsi': {'rsi': calculator.rsi(df['close'])},
+        'macd': calculator.macd(df['close']),
+        'bollinger_bands': calculator.bollinger_bands(df['close']),
+        'stochastic': calculator.stochastic(df),
+        'atr': {'atr': calculator.atr(df)},
+        'adx': calculator.adx(df),
+        'obv': {'obv': calculator.obv(df)},
+        'mfi': {'mfi': calculator.mfi(df)},
+        'vwap': {'vwap': calculator.vwap(df)},
+    }
+
+
+def _assert_identical(expected, actual):
+    """Assert two float arrays are bit-for-bit identical (NaN positions included)."""
+    expected = np.asarray(expected, dtype=np.float64)
+    actual = np.asarray(actual, dtype=np.float64)
+    assert np.array_equal(np.isnan(expected), np.isnan(actual))
+    mask = ~np.isnan(expected)
+    assert np.array_equal(expected[mask].view(np.int64), actual[mask].view(np.int64))
+
+
+class TestStreamingIndicators:
+    """Test cases for incremental indicator calculators."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample OHLCV data with a flat stretch for testing."""
+        np.random.seed(42)
+        periods = 300
+        close = 50000 + np.cumsum(np.random.normal(0, 100, periods))
+        close[120:150] = close[120]
+        return pd.DataFrame({
+            'timestamp': np.arange(periods, dtype=np.float64) * 3600,
+            'open': close + np.random.normal(0, 20, periods),
+            'high': close + np.random.uniform(0, 200, periods),
+            'low': close - np.random.uniform(0, 200, periods),
+            'close': close,
+            'volume': np.random.uniform(100, 1000, periods)
+        })
+
+    @pytest.mark.parametrize("indicator", sorted(STREAMING_INDICATORS))
+    def test_candle_updates_match_batch(self, sample_data, indicator):
+        """Test candle-by-candle updates reproduce the batch series."""
+        expected = _batch_outputs(sample_data)[indicator]
+        streaming = STREAMING_INDICATORS[indicator]()
+
+        outputs = {}
+        for candle in sample_data.to_dict('records'):
+            for key, value in streaming.update(candle).items():
+                outputs.setdefault(key, []).append(value)
+
+        assert set(outputs) == set(expected)
+        for key, values in outputs.items():
+            _assert_identical(expected[key], values)
+
+    @pytest.mark.parametrize("indicator", sorted(STREAMING_INDICATORS))
+    def test_warm_up_then_update(self, sample_data, indicator):
+        """Test bulk warm-up followed by live updates ends on the batch value."""
+        expected = _batch_outputs(sample_data)[indicator]
+        streaming = STREAMING_INDICATORS[indicator]()
+
+        streaming.warm_up(sample_data.iloc[:250])
+        for candle in sample_data.iloc[250:].to_dict('records'):
+            streaming.update(candle)
+
+        assert streaming.count == len(sample_data)
+        for key, value in streaming.values.items():
+            _assert_identical([expected[key].iloc[-1]], [value])
+
+    def test_custom_parameters(self, sample_data):
+        """Test non-default parameters follow the batch calculation."""
+        calculator = IndicatorCalculator()
+        streaming = StreamingBollingerBands({'period': 10, 'std_dev': 1.5})
+        streaming.warm_up(sample_data)
+
+        expected = calculator.bollinger_bands(sample_data['close'], period=10, std_dev=1.5)
+        for key, value in streaming.values.items():
+            _assert_identical([expected[key].iloc[-1]], [value])
+
+    def test_is_ready(self, sample_data):
+        """Test readiness only after the warm-up window is filled."""
+        streaming = StreamingRSI({'period': 14})
+        streaming.warm_up(sample_data.iloc[:10])
+        assert not streaming.is_ready
+
+        streaming.warm_up(sample_data.iloc[10:20])
+        assert streaming.is_ready
+
+
+class TestStreamingIndicatorEngine:
+    """Test cases for the streaming indicator registry."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample OHLCV data for testing."""
+        np.random.seed(7)
+        periods = 120
+        close = 3000 + np.cumsum(np.random.normal(0, 10, periods))
+        return pd.DataFrame({
+            'timestamp': np.arange(periods, dtype=np.float64) * 60,
+            'open': close,
+            'high': close + np.random.uniform(0, 20, periods),
+            'low': close - np.random.uniform(0, 20, periods),
+            'close': close,
+            'volume': np.random.uniform(10, 100, periods)
+        })
+
+    def test_states_are_per_series(self, sample_data):
+        """Test each symbol/timeframe keeps independent state."""
+        engine = StreamingIndicatorEngine()
+        engine.warm_up("ETH/USDT", "1h", sample_data, ['rsi'])
+        engine.warm_up("ETH/USDT", "4h", sample_data.iloc[:60], ['rsi'])
+
+        hourly = engine.get_values("ETH/USDT", "1h")['rsi']['rsi']
+        four_hourly = engine.get_values("ETH/USDT", "4h")['rsi']['rsi']
+
+        assert hourly != four_hourly
+        assert engine.get_stats()['tracked_series'] == 2
+
+    def test_parameter_variants_are_tracked_separately(self, sample_data):
+        """Test the same indicator with different parameters keeps separate state."""
+        engine = StreamingIndicatorEngine()
+        engine.warm_up("BTC/USDT", "1h", sample_data, ['rsi'])
+        engine.register("BTC/USDT", "1h", 'rsi', {'period': 7}).warm_up(sample_data)
+
+        values = engine.get_values("BTC/USDT", "1h")
+        assert set(values) == {'rsi', 'rsi(period=7)'}
+
+    def test_stale_candles_are_skipped(self, sample_data):
+        """Test re-delivered candles do not advance the state."""
+        engine = StreamingIndicatorEngine()
+        engine.warm_up("BTC/USDT", "1m", sample_data.iloc[:100], ['atr'])
+
+        next_candle = sample_data.iloc[100].to_dict()
+        first = engine.update("BTC/USDT", "1m", next_candle)
+        second = engine.update("BTC/USDT", "1m", next_candle)
+
+        assert first == second
+        assert engine.get_stats()['skipped_updates'] == 1
+
+    def test_malformed_candle_leaves_state_untouched(self, sample_data):
+        """Test a candle missing a field can be retried once corrected."""
+        engine = StreamingIndicatorEngine()
+        engine.warm_up("BTC/USDT", "1m", sample_data.iloc[:100], ['rsi', 'obv'])
+        before = engine.get_values("BTC/USDT", "1m")
+
+        candle = sample_data.iloc[100].to_dict()
+        broken = {key: value for key, value in candle.items() if key != 'volume'}
+        with pytest.raises(KeyError):
+            engine.update("BTC/USDT", "1m", broken)
+        assert engine.get_values("BTC/USDT", "1m") == before
+
+        reference = StreamingIndicatorEngine()
+        reference.warm_up("BTC/USDT", "1m", sample_data.iloc[:100], ['rsi', 'obv'])
+
+        assert engine.update("BTC/USDT", "1m", candle) == reference.update("BTC/USDT", "1m", candle)
+        assert engine.get_stats()['skipped_updates'] == 0
+
+    def test_unknown_indicator(self):
+        """Test unknown indicators are rejected."""
+        engine = StreamingIndicatorEngine()
+        with pytest.raises(ValueError):
+            engine.register("BTC/USDT", "1h", 'unknown')
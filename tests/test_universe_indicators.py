@@ -0,0 +1,141 @@
+"""
+Test suite for cross-symbol indicator calculation.
+
+Validates that IndicatorEngine.calculate_universe evaluates indicators on
+an aligned (symbols x bars) panel, matches the per-symbol calculators
+exactly and hands out per-symbol Series views of the panel results.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from long_analyst.indicators.indicator_engine import IndicatorEngine, IndicatorConfig
+from long_analyst.indicators.universe import UniversePanel
+
+
+INDICATORS = ['rsi', 'macd', 'bollinger_bands', 'atr']
+
+
+class TestUniverseIndicators:
+    """Test cases for universe-wide indicator calculation."""
+
+    @pytest.fixture
+    def frames(self):
+        """Create OHLCV frames for several symbols, one with a shorter history."""
+        np.random.seed(42)
+        dates = pd.date_range(start='2024-01-01', periods=300, freq='1h')
+        frames = {}
+        for i, symbol in enumerate(['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'XRP/USDT']):
+            close = 100 * (i + 1) + np.cumsum(np.random.normal(0, 1, 300))
+            frames[symbol] = pd.DataFrame({
+                'open': close,
+                'high': close + np.random.uniform(0, 1, 300),
+                'low': close - np.random.uniform(0, 1, 300),
+                'close': close,
+                'volume': np.random.uniform(100, 1000, 300)
+            }, index=dates)
+        frames['SOL/USDT'] = frames['SOL/USDT'].iloc[60:]
+        return frames
+
+    @pytest.fixture
+    def engine(self):
+        """Create an engine without external caches."""
+        return IndicatorEngine(IndicatorConfig(
+            enable_redis_cache=False,
+            enable_memory_cache=False,
+            default_executor='inline'
+        ))
+
+    def test_panel_from_frames(self, frames):
+        """Test frames are aligned on a shared index with leading NaN for short histories."""
+        panel = UniversePanel.from_frames(frames)
+
+        assert panel.shape == (4, 300)
+        assert panel.symbols == list(frames)
+        assert np.isnan(panel.close[2, :60]).all()
+        np.testing.assert_array_equal(panel.close[2, 60:], frames['SOL/USDT']['close'].to_numpy())
+        assert panel.bar_counts().tolist() == [300, 300, 240, 300]
+
+    def test_panel_shape_validation(self):
+        """Test mismatched matrices are rejected."""
+        with pytest.raises(ValueError):
+            UniversePanel(symbols=['A', 'B'], close=np.zeros((3, 10)))
+        with pytest.raises(ValueError):
+            UniversePanel(symbols=['A'], close=np.zeros((1, 10)), high=np.zeros((1, 9)))
+
+    @pytest.mark.asyncio
+    async def test_matches_per_symbol_calculators(self, engine, frames):
+        """Test every symbol's results equal the single-frame calculators."""
+        results = await engine.calculate_universe(INDICATORS, UniversePanel.from_frames(frames))
+
+        assert set(results) == set(frames)
+        for symbol, frame in frames.items():
+            for name in INDICATORS:
+                expected = await engine.calculators[name].calculate(frame)
+                actual = results[symbol][name]
+                for key, value in expected.values.items():
+                    if isinstance(value, pd.Series):
+                        pd.testing.assert_series_equal(actual.values[key].loc[value.index], value,
+                                                       check_names=False, check_freq=False)
+                    elif isinstance(value, str):
+                        assert actual.values[key] == value
+                    else:
+                        assert actual.values[key] == pytest.approx(value, nan_ok=True)
+                assert actual.quality_score == pytest.approx(expected.quality_score)
+                assert actual.data_points_used == expected.data_points_used
+
+    @pytest.mark.asyncio
+    async def test_results_are_views(self, engine, frames):
+        """Test per-symbol series are views into one panel-wide array."""
+        results = await engine.calculate_universe(['rsi'], UniversePanel.from_frames(frames))
+
+        btc = results['BTC/USDT']['rsi'].values['rsi'].to_numpy()
+        eth = results['ETH/USDT']['rsi'].values['rsi'].to_numpy()
+        assert btc.base is not None
+        assert btc.base is eth.base
+
+    @pytest.mark.asyncio
+    async def test_skips_short_symbols_and_failed_indicators(self, engine, frames):
+        """Test symbols without enough data and failing indicators are left out."""
+        frames['XRP/USDT'] = frames['XRP/USDT'].iloc[-20:]
+        panel = UniversePanel.from_frames({symbol: frame[['close']] for symbol, frame in frames.items()})
+
+        results = await engine.calculate_universe(['rsi', 'atr', 'unknown'], panel)
+
+        assert set(results) == {'BTC/USDT', 'ETH/USDT', 'SOL/USDT'}
+        assert all(set(symbol_results) == {'rsi'} for symbol_results in results.values())
+
+    @pytest.mark.asyncio
+    async def test_default_panel_path_matches_per_symbol(self, engine, frames):
+        """Test calculators without a panel kernel fall back to per-symbol frames."""
+        results = await engine.calculate_universe(['support_resistance'], UniversePanel.from_frames(frames))
+
+        assert set(results) == set(frames)
+        for symbol, frame in frames.items():
+            expected = await engine.calculators['support_resistance'].calculate(frame)
+            actual = results[symbol]['support_resistance']
+            assert ([level.price for level in actual.values['levels']] ==
+                    [level.price for level in expected.values['levels']])
+            assert actual.data_points_used == len(frame)
+
+    @pytest.mark.asyncio
+    async def test_macd_flags_only_crossovers(self, engine, frames):
+        """Test the crossover score marks the bar MACD crosses above its signal line."""
+        frame = frames['BTC/USDT']
+        panel_result = (await engine.calculate_universe(['macd'], UniversePanel.from_frames(frames)))['BTC/USDT']['macd']
+        frame_result = await engine.calculators['macd'].calculate(frame)
+
+        for result in (panel_result, frame_result):
+            values = result.values
+            above = values['macd'] > values['signal']
+            crossover = above & ~above.shift(1, fill_value=False)
+            scores = values['long_signals']
+            # Later rules override the crossover score, so check bars they leave alone
+            untouched = ~(values['macd'] > 0) & ~(values['histogram'] > values['histogram'].shift(1))
+            assert (scores[untouched & crossover] == 1.0).all()
+            assert (scores[untouched & above & ~crossover] == 0.0).all()